@@ -0,0 +1,61 @@
+import argparse
+import json
+import sys
+
+from src.benchmarks.casos_motor import ASIENTOS_POR_DEFECTO, CASOS, medir_casos
+from src.benchmarks.medicion import (
+    UMBRAL_POR_DEFECTO,
+    a_diccionario,
+    cargar_mediciones,
+    comparar,
+    guardar_mediciones,
+)
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Mide los caminos calientes del motor de Dudo y los compara con una base."
+    )
+    parser.add_argument(
+        "--casos", nargs="+", default=list(CASOS), choices=list(CASOS), help="Casos a medir"
+    )
+    parser.add_argument(
+        "--asientos",
+        type=int,
+        nargs="+",
+        default=list(ASIENTOS_POR_DEFECTO),
+        help="Cantidades de jugadores de la mesa",
+    )
+    parser.add_argument("--muestras", type=int, default=30, help="Muestras por medicion")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla de las entradas")
+    parser.add_argument("--salida", default=None, help="Archivo JSON donde guardar las mediciones")
+    parser.add_argument("--base", default=None, help="Archivo JSON de mediciones a comparar")
+    parser.add_argument(
+        "--umbral",
+        type=float,
+        default=UMBRAL_POR_DEFECTO,
+        help="Fraccion de operaciones por segundo que se puede perder respecto de la base",
+    )
+    return parser
+
+
+def main() -> int:
+    argumentos = crear_parser().parse_args()
+    mediciones = medir_casos(
+        argumentos.casos, argumentos.asientos, argumentos.semilla, argumentos.muestras
+    )
+    informe = a_diccionario(mediciones)
+
+    regresiones = []
+    if argumentos.base is not None:
+        regresiones = comparar(mediciones, cargar_mediciones(argumentos.base), argumentos.umbral)
+        informe["regresiones"] = [regresion._asdict() for regresion in regresiones]
+    if argumentos.salida is not None:
+        guardar_mediciones(argumentos.salida, mediciones)
+
+    print(json.dumps(informe, indent=2))
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+import argparse
+import json
+import os
+
+from src.game.estrategias_bot import ESTRATEGIAS
+from src.services.simulador_torneo import ConfiguracionTorneo, ResultadosTorneo, simular_torneo
+
+# Las estrategias de busqueda (mcts) son mucho mas lentas y se piden explicitamente
+ESTRATEGIAS_POR_DEFECTO = ["aleatoria", "conservadora"]
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Simula partidas automaticas de Dudo usando todos los procesadores."
+    )
+    parser.add_argument("--partidas", type=int, default=1000, help="Partidas a simular")
+    parser.add_argument(
+        "--procesos", type=int, default=os.cpu_count() or 1, help="Procesos trabajadores"
+    )
+    parser.add_argument(
+        "--asientos", type=int, nargs="+", default=[4], help="Cantidades de jugadores a rotar"
+    )
+    parser.add_argument(
+        "--estrategias",
+        nargs="+",
+        default=ESTRATEGIAS_POR_DEFECTO,
+        choices=sorted(ESTRATEGIAS),
+        help="Estrategias que se reparten entre los asientos",
+    )
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla maestra")
+    parser.add_argument("--bloque", type=int, default=100, help="Partidas por bloque de trabajo")
+    parser.add_argument(
+        "--exportar", default=None, help="Directorio donde exportar una fila por decision"
+    )
+    parser.add_argument(
+        "--base-datos", default=None, help="Archivo SQLite donde guardar cada partida"
+    )
+    parser.add_argument(
+        "--registro", default=None, help="Directorio donde guardar el registro binario por bloque"
+    )
+    return parser
+
+
+def main():
+    argumentos = crear_parser().parse_args()
+    configuracion = ConfiguracionTorneo(
+        partidas=argumentos.partidas,
+        asientos=argumentos.asientos,
+        estrategias=argumentos.estrategias,
+        semilla=argumentos.semilla,
+    )
+
+    def informar(parcial: ResultadosTorneo):
+        progreso = {"partidas": parcial.partidas, "tasas_victoria": parcial.tasas_victoria()}
+        print(json.dumps(progreso), flush=True)
+
+    resultados = simular_torneo(
+        configuracion,
+        procesos=argumentos.procesos,
+        tamano_bloque=argumentos.bloque,
+        al_combinar=informar,
+        exportar=argumentos.exportar,
+        base_datos=argumentos.base_datos,
+        registro=argumentos.registro,
+    )
+    print(json.dumps(resultados.a_diccionario(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Módulo con los casos de benchmark de los caminos calientes del motor de Dudo.
+
+Cada caso prepara, a partir de la cantidad de asientos y un generador con semilla, una mesa
+de jugadores automaticos ya agitada y retorna la operacion a medir. Las entradas que varian
+entre llamadas (apuestas, partidas) se generan antes de medir, de modo que dos ejecuciones
+con la misma semilla miden exactamente el mismo trabajo.
+"""
+
+from itertools import count, cycle
+from typing import Callable, NamedTuple
+
+from src.benchmarks.medicion import Medicion, medir
+from src.game.arbitro_ronda import ArbitroRonda
+from src.game.contador_pintas import ContadorPintas
+from src.game.dado import NombreDado
+from src.game.estrategias_bot import EstrategiaAleatoria
+from src.game.gestor_partida import GestorPartida
+from src.game.jugada import Jugada
+from src.game.validador_apuesta import Apuesta, ValidadorApuesta
+from src.services.generador_aleatorio import DADOS_POR_CACHO, GeneradorAleatorio
+
+# Cantidades de asientos medidas por defecto: mano a mano, mesa habitual y mesa grande
+ASIENTOS_POR_DEFECTO = (2, 6, 50)
+
+# Entradas distintas que se recorren en ciclo en los casos de apuestas
+ENTRADAS_POR_CASO = 256
+
+# Prepara la operacion a medir para (asientos, generador)
+Preparador = Callable[[int, GeneradorAleatorio], Callable[[], object]]
+
+
+class CasoBenchmark(NamedTuple):
+    """Operacion del motor a medir y cuantas veces se llama por muestra."""
+
+    preparar: Preparador
+    repeticiones: int
+    # Muestras del caso si no se usa la cantidad general (las partidas largas son lentas)
+    muestras: int | None = None
+
+
+def preparar_mesa(asientos: int, generador: GeneradorAleatorio) -> GestorPartida:
+    """Partida de jugadores aleatorios con los cachos agitados, sin terminal."""
+    estrategias = [EstrategiaAleatoria(generador.derivar(asiento)) for asiento in range(asientos)]
+    gestor = GestorPartida(asientos, list(estrategias), generador=generador)
+    gestor._turno_actual = 0
+    gestor.agitar_cachos()
+    return gestor
+
+
+def _subidas(asientos: int, generador: GeneradorAleatorio) -> list[Jugada]:
+    """Subidas al azar con cantidades entre 1 y los dados de la mesa."""
+    cantidades = generador.enteros(asientos * DADOS_POR_CACHO, ENTRADAS_POR_CASO) + 1
+    pintas = generador.enteros(len(NombreDado), ENTRADAS_POR_CASO) + 1
+    return [Jugada.subir(int(cantidad), int(pinta)) for cantidad, pinta in zip(cantidades, pintas)]
+
+
+def _agitar(asientos: int, generador: GeneradorAleatorio) -> Callable[[], object]:
+    """Agita cada cacho de la mesa con Cacho.agitar."""
+    gestor = preparar_mesa(asientos, generador)
+    cachos = [(jugador._cacho, jugador._dados_en_posecion) for jugador in gestor._jugadores]
+
+    def operacion():
+        for cacho, cantidad in cachos:
+            cacho.agitar(cantidad)
+
+    return operacion
+
+
+def _contar_pintas(asientos: int, generador: GeneradorAleatorio) -> Callable[[], object]:
+    """Cuenta las pintas de la mesa con ContadorPintas.contar_pintas."""
+    gestor = preparar_mesa(asientos, generador)
+    contador = ContadorPintas()
+    jugadores = gestor._jugadores
+    return lambda: contador.contar_pintas(jugadores)
+
+
+def _puede_subir(asientos: int, generador: GeneradorAleatorio) -> Callable[[], object]:
+    """Valida subidas entre pares de apuestas al azar con ValidadorApuesta.puede_subir."""
+    apuestas = [subida.a_apuesta() for subida in _subidas(asientos, generador)]
+    pares: cycle[tuple[Apuesta, Apuesta]] = cycle(zip(apuestas, apuestas[1:] + apuestas[:1]))
+
+    def operacion():
+        actual, nueva = next(pares)
+        return ValidadorApuesta.puede_subir(actual, nueva)
+
+    return operacion
+
+
+def _dudar(asientos: int, generador: GeneradorAleatorio) -> Callable[[], object]:
+    """Resuelve un dudar contando la mesa, sin histogramas ya calculados."""
+    gestor = preparar_mesa(asientos, generador)
+    jugadores = gestor._jugadores
+    subidas = cycle(_subidas(asientos, generador))
+    return lambda: ArbitroRonda.procesar_apuesta_dudar(next(subidas), jugadores, False, 0)
+
+
+def _calzar(asientos: int, generador: GeneradorAleatorio) -> Callable[[], object]:
+    """Resuelve un calzar contando la mesa, sin histogramas ya calculados."""
+    gestor = preparar_mesa(asientos, generador)
+    jugadores = gestor._jugadores
+    subidas = cycle(_subidas(asientos, generador))
+    return lambda: ArbitroRonda.procesar_apuesta_calzar(None, next(subidas), jugadores, False)
+
+
+def _calcular_turno(asientos: int, generador: GeneradorAleatorio) -> Callable[[], object]:
+    """Calcula el siguiente turno hacia la izquierda, el camino con mas ramas."""
+    gestor = preparar_mesa(asientos, generador)
+    return lambda: gestor.calcular_turno(False)
+
+
+def _dados_en_juego(asientos: int, generador: GeneradorAleatorio) -> Callable[[], object]:
+    """Suma los dados de la mesa con GestorPartida.dados_en_juego."""
+    gestor = preparar_mesa(asientos, generador)
+    return gestor.dados_en_juego
+
+
+def _partida(asientos: int, generador: GeneradorAleatorio) -> Callable[[], object]:
+    """Juega una partida completa sin terminal; cada llamada juega la siguiente semilla."""
+    partidas = count()
+
+    def operacion():
+        semillas = generador.derivar(next(partidas))
+        estrategias = [
+            EstrategiaAleatoria(semillas.derivar(asiento)) for asiento in range(asientos)
+        ]
+        return GestorPartida(asientos, list(estrategias), generador=semillas).juego()
+
+    return operacion
+
+
+CASOS: dict[str, CasoBenchmark] = {
+    "agitar": CasoBenchmark(_agitar, 200),
+    "contar_pintas": CasoBenchmark(_contar_pintas, 200),
+    "puede_subir": CasoBenchmark(_puede_subir, 2000),
+    "dudar": CasoBenchmark(_dudar, 200),
+    "calzar": CasoBenchmark(_calzar, 200),
+    "calcular_turno": CasoBenchmark(_calcular_turno, 5000),
+    "dados_en_juego": CasoBenchmark(_dados_en_juego, 2000),
+    "partida": CasoBenchmark(_partida, 1, muestras=5),
+}
+
+
+def medir_casos(
+    casos: list[str],
+    asientos: list[int],
+    semilla: int = 0,
+    muestras: int = 30,
+) -> list[Medicion]:
+    """Mide cada caso con cada cantidad de asientos.
+
+    La semilla de cada medicion se deriva del nombre del caso y los asientos, por lo que no
+    depende de que otros casos se midan.
+    """
+    for nombre in casos:
+        if nombre not in CASOS:
+            raise ValueError(f"Caso de benchmark desconocido: {nombre}")
+    if not asientos or min(asientos) < 2:
+        raise ValueError("Cada medicion necesita al menos 2 asientos")
+
+    mediciones = []
+    for nombre in casos:
+        caso = CASOS[nombre]
+        for cantidad in asientos:
+            generador = GeneradorAleatorio(semilla).derivar(list(CASOS).index(nombre), cantidad)
+            operacion = caso.preparar(cantidad, generador)
+            muestras_caso = min(muestras, caso.muestras) if caso.muestras else muestras
+            mediciones.append(medir(nombre, cantidad, operacion, caso.repeticiones, muestras_caso))
+    return mediciones
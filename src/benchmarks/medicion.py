@@ -0,0 +1,131 @@
+"""Módulo que mide operaciones del motor y las compara con una medicion base.
+
+Cada muestra ejecuta la operacion 'repeticiones' veces y se cronometra con perf_counter_ns;
+los percentiles son del tiempo por operacion entre muestras. Las operaciones por segundo
+salen de la mediana, que es menos sensible que el promedio a una muestra interrumpida por
+el sistema operativo. Las mediciones se guardan en JSON para usarlas como base de la
+siguiente ejecucion.
+"""
+
+import json
+import platform
+import time
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple
+
+import numpy as np
+
+# Percentiles informados del tiempo por operacion
+PERCENTILES = (50, 90, 99)
+
+# Fraccion de operaciones por segundo que se puede perder sin considerarlo una regresion
+UMBRAL_POR_DEFECTO = 0.10
+
+
+class Medicion(NamedTuple):
+    """Resultado de medir un caso con una cantidad de asientos.
+
+    Los percentiles son nanosegundos por operacion.
+    """
+
+    caso: str
+    asientos: int
+    operaciones_por_segundo: float
+    p50: float
+    p90: float
+    p99: float
+    muestras: int
+    repeticiones: int
+
+
+class Regresion(NamedTuple):
+    """Caso cuyas operaciones por segundo cayeron mas que el umbral respecto de la base."""
+
+    caso: str
+    asientos: int
+    base: float
+    actual: float
+    # Cambio relativo de operaciones por segundo, negativo si empeoro
+    cambio: float
+
+
+def medir(
+    caso: str,
+    asientos: int,
+    operacion: Callable[[], object],
+    repeticiones: int,
+    muestras: int,
+    calentamiento: int = 1,
+) -> Medicion:
+    """Mide 'operacion' en 'muestras' muestras de 'repeticiones' llamadas cada una.
+
+    Las primeras 'calentamiento' muestras se descartan.
+    """
+    if repeticiones < 1 or muestras < 1:
+        raise ValueError("Las repeticiones y las muestras deben ser positivas")
+    if calentamiento < 0:
+        raise ValueError("El calentamiento no puede ser negativo")
+
+    llamadas = range(repeticiones)
+    tiempos = np.empty(muestras, dtype=np.float64)
+    for muestra in range(-calentamiento, muestras):
+        inicio = time.perf_counter_ns()
+        for _ in llamadas:
+            operacion()
+        transcurrido = time.perf_counter_ns() - inicio
+        if muestra >= 0:
+            tiempos[muestra] = transcurrido / repeticiones
+
+    p50, p90, p99 = (float(valor) for valor in np.percentile(tiempos, PERCENTILES))
+    # Una operacion mas rapida que la resolucion del reloj no debe dividir por cero
+    operaciones = 1e9 / max(p50, 1.0)
+    return Medicion(caso, asientos, operaciones, p50, p90, p99, muestras, repeticiones)
+
+
+def comparar(
+    actuales: Iterable[Medicion], base: Iterable[Medicion], umbral: float = UMBRAL_POR_DEFECTO
+) -> list[Regresion]:
+    """Casos de 'actuales' que perdieron mas de 'umbral' de sus operaciones por segundo.
+
+    Los casos que no estan en la base no se comparan.
+    """
+    if not 0 <= umbral < 1:
+        raise ValueError("El umbral debe estar entre 0 y 1")
+    referencia = {(medicion.caso, medicion.asientos): medicion for medicion in base}
+    regresiones = []
+    for medicion in actuales:
+        anterior = referencia.get((medicion.caso, medicion.asientos))
+        if anterior is None:
+            continue
+        cambio = medicion.operaciones_por_segundo / anterior.operaciones_por_segundo - 1
+        if cambio < -umbral:
+            regresiones.append(
+                Regresion(
+                    medicion.caso,
+                    medicion.asientos,
+                    anterior.operaciones_por_segundo,
+                    medicion.operaciones_por_segundo,
+                    cambio,
+                )
+            )
+    return regresiones
+
+
+def a_diccionario(mediciones: Iterable[Medicion]) -> dict:
+    """Mediciones en un diccionario serializable a JSON, con el interprete usado."""
+    return {
+        "python": platform.python_version(),
+        "maquina": platform.machine(),
+        "mediciones": [medicion._asdict() for medicion in mediciones],
+    }
+
+
+def guardar_mediciones(ruta: str | Path, mediciones: Iterable[Medicion]):
+    """Escribe las mediciones en 'ruta' como JSON."""
+    Path(ruta).write_text(json.dumps(a_diccionario(mediciones), indent=2) + "\n")
+
+
+def cargar_mediciones(ruta: str | Path) -> list[Medicion]:
+    """Lee mediciones guardadas con guardar_mediciones."""
+    datos = json.loads(Path(ruta).read_text())
+    return [Medicion(**medicion) for medicion in datos["mediciones"]]
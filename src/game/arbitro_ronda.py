@@ -1,8 +1,18 @@
 """Módulo que contiene la clase ArbitroRonda para gestionar la ronda del juego Dudo."""
 
+import numpy as np
+
+from src.game.codigos_mano import es_pase_valido, pases_validos_lote
 from src.game.contador_pintas import ContadorPintas
 from src.game.dado import NombreDado
-from src.game.jugador import Jugador, TipoApuesta
+from src.game.jugada import (
+    CODIGO_CALZAR,
+    CODIGO_DUDAR,
+    Jugada,
+    TipoApuesta,
+    apuesta_de_referencia,
+)
+from src.game.jugador import Jugador
 
 
 class ArbitroRonda:
@@ -10,112 +20,142 @@ class ArbitroRonda:
 
     @staticmethod
     def procesar_apuesta(
-        apuesta_anterior: str,
-        apuesta_actual: str,
-        apuesta_nueva: str,
+        apuesta_anterior: Jugada | None,
+        apuesta_actual: Jugada | None,
+        apuesta_nueva: Jugada,
         jugadores: list[Jugador],
         es_ronda_especial: bool,
         turno_anterior: int,
+        histograma: list[int] | None = None,
+        histograma_anterior: list[int] | None = None,
     ) -> bool:
-        """Procesa una apuesta durante la ronda."""
-        if apuesta_nueva == str(TipoApuesta.DUDAR):
+        """Procesa una apuesta durante la ronda.
+
+        Si se entregan los histogramas ya contados de la mesa y del jugador anterior no
+        se vuelven a contar los dados.
+        """
+        if apuesta_nueva.tipo is TipoApuesta.DUDAR:
             return ArbitroRonda.procesar_apuesta_dudar(
-                apuesta_actual, jugadores, es_ronda_especial, turno_anterior
+                apuesta_actual,
+                jugadores,
+                es_ronda_especial,
+                turno_anterior,
+                histograma,
+                histograma_anterior,
             )
         else:
             return ArbitroRonda.procesar_apuesta_calzar(
-                apuesta_anterior, apuesta_actual, jugadores, es_ronda_especial
+                apuesta_anterior, apuesta_actual, jugadores, es_ronda_especial, histograma
             )
 
+    @staticmethod
+    def contar_apuesta(histograma: list[int], pinta: int, es_ronda_especial: bool) -> int:
+        """Cantidad de dados que cuentan para 'pinta'; fuera de ronda especial los As suman."""
+        if es_ronda_especial or pinta == NombreDado.AS.value:
+            return histograma[pinta]
+        return histograma[pinta] + histograma[NombreDado.AS.value]
+
     @staticmethod
     def procesar_apuesta_dudar(
-        apuesta_actual: str, jugadores: list[Jugador], es_ronda_especial: bool, turno_anterior: int
+        apuesta_actual: Jugada | None,
+        jugadores: list[Jugador],
+        es_ronda_especial: bool,
+        turno_anterior: int,
+        histograma: list[int] | None = None,
+        histograma_anterior: list[int] | None = None,
     ) -> bool:
         """Resuelve una acción 'dudar' contra la apuesta vigente.
 
         En ronda especial los As no son comodín; en normal sí.
         Retorna True si pierde el jugador anterior, False si pierde quien dudó.
         """
-        contador_pintas = ContadorPintas()
-        cantidad_pintas: dict[str, int] = contador_pintas.contar_pintas(jugadores=jugadores)
-
-        cantidad_pinta_apuesta = 0
-
-        apuesta_tokenizada = apuesta_actual.split(" ")
-
-        if apuesta_tokenizada[0] == str(TipoApuesta.SUBIR):
-            pinta_objetivo = apuesta_tokenizada[2]
-            if es_ronda_especial:
-                cantidad_pinta_apuesta = cantidad_pintas[pinta_objetivo]
-            else:
-                cantidad_pinta_apuesta = cantidad_pintas[str(NombreDado.AS).lower()]
-                if pinta_objetivo != str(NombreDado.AS).lower():
-                    cantidad_pinta_apuesta += cantidad_pintas[pinta_objetivo]
+        if apuesta_actual is None:
+            raise ValueError("No hay una apuesta vigente")
+
+        if apuesta_actual.tipo is TipoApuesta.SUBIR:
+            if histograma is None:
+                histograma = ContadorPintas.histograma(jugadores)
+            cantidad_pinta_apuesta = ArbitroRonda.contar_apuesta(
+                histograma, apuesta_actual.pinta, es_ronda_especial
+            )
 
-            if cantidad_pinta_apuesta >= int(apuesta_tokenizada[1]):
+            if cantidad_pinta_apuesta >= apuesta_actual.cantidad:
                 return False
             else:
                 return True
         else:
-            conteo_de_pintas = contador_pintas.contar_pintas([jugadores[turno_anterior]])
-
-            cantidad_2 = 0
-            cantidad_3 = 0
-            cantidad_5 = 0
-            todos_diferentes = True
-            for pinta in conteo_de_pintas:
-                if conteo_de_pintas[pinta] == 2:
-                    cantidad_2 += 1
-                    todos_diferentes = False
-                elif conteo_de_pintas[pinta] == 3:
-                    cantidad_3 += 1
-                    todos_diferentes = False
-                elif conteo_de_pintas[pinta] == 4:
-                    todos_diferentes = False
-                elif conteo_de_pintas[pinta] == 5:
-                    cantidad_5 += 1
-                    todos_diferentes = False
-
-            # Exite una pinta que tiene 3 apariciones y otra con 2, existe una pinta con 5 apariciones o todas las pintas son diferentes
-            if (cantidad_3 == 1 and cantidad_2 == 1) or cantidad_5 == 1 or todos_diferentes:
-                return False
-            else:
-                return True
+            conteo_de_pintas = histograma_anterior
+            if conteo_de_pintas is None:
+                conteo_de_pintas = ContadorPintas.histograma([jugadores[turno_anterior]])
+
+            # Un full, cinco iguales o todas distintas respaldan el pase
+            return not es_pase_valido(conteo_de_pintas)
 
     @staticmethod
     def procesar_apuesta_calzar(
-        apuesta_anterior: str,
-        apuesta_actual: str,
+        apuesta_anterior: Jugada | None,
+        apuesta_actual: Jugada | None,
         jugadores: list[Jugador],
         es_ronda_especial: bool,
+        histograma: list[int] | None = None,
     ) -> bool:
         """Evalúa un 'calzar' verificando coincidencia exacta con la apuesta.
 
         Usa la apuesta actual si es 'subir'; en caso contrario, la apuesta anterior.
         En ronda especial los As no son comodín; en normal sí.
         """
-        contador_pintas = ContadorPintas()
-        cantidad_pintas: dict[str, int] = contador_pintas.contar_pintas(jugadores=jugadores)
-        prev = apuesta_actual.split(" ")
-
         # Elige la apuesta actual o la anterior dependiendo si la actual es pasar
-        if prev[0] == str(TipoApuesta.SUBIR):
-            cantidad_objetivo = int(prev[1])
-            pinta_objetivo = prev[2]
-        else:
-            prev = apuesta_anterior.split(" ")
-            cantidad_objetivo = int(prev[1])
-            pinta_objetivo = prev[2]
+        objetivo = apuesta_de_referencia(apuesta_anterior, apuesta_actual)
+        if objetivo is None:
+            raise ValueError("No hay una apuesta vigente")
 
-        cantidad = 0
-        if es_ronda_especial:
-            cantidad = cantidad_pintas[pinta_objetivo]
-        else:
-            cantidad = cantidad_pintas[str(NombreDado.AS).lower()]
-            if pinta_objetivo != str(NombreDado.AS).lower():
-                cantidad += cantidad_pintas[pinta_objetivo]
+        if histograma is None:
+            histograma = ContadorPintas.histograma(jugadores)
+        cantidad = ArbitroRonda.contar_apuesta(histograma, objetivo.pinta, es_ronda_especial)
 
-        if cantidad == cantidad_objetivo:
+        if cantidad == objetivo.cantidad:
             return True
         else:
             return False
+
+    @staticmethod
+    def resolver_lote(
+        histogramas: np.ndarray,
+        cantidades: np.ndarray,
+        pintas: np.ndarray,
+        rondas_especiales: np.ndarray,
+        acciones: np.ndarray,
+        pases: np.ndarray | None = None,
+        manos_anteriores: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Resuelve a la vez el 'dudar' o 'calzar' de muchas partidas independientes.
+
+        'histogramas' tiene forma (partidas, 7) con los dados de cada mesa; 'cantidades' y
+        'pintas' son la apuesta de referencia de cada partida y 'acciones' tiene
+        CODIGO_DUDAR o CODIGO_CALZAR. Las partidas que dudan de un pasar se marcan en
+        'pases' junto al codigo de la mano del jugador anterior en 'manos_anteriores'.
+
+        Retorna un arreglo booleano con el mismo significado que procesar_apuesta: para
+        dudar, True si pierde el jugador anterior; para calzar, True si la apuesta es exacta.
+        """
+        histogramas = np.asarray(histogramas)
+        cantidades = np.asarray(cantidades)
+        pintas = np.asarray(pintas)
+        acciones = np.asarray(acciones)
+        if not np.all((acciones == CODIGO_DUDAR) | (acciones == CODIGO_CALZAR)):
+            raise ValueError("Solo se pueden resolver acciones de dudar o calzar")
+
+        filas = np.arange(len(histogramas))
+        conteo = histogramas[filas, pintas]
+        comodin = ~np.asarray(rondas_especiales, dtype=bool) & (pintas != NombreDado.AS.value)
+        conteo = conteo + np.where(comodin, histogramas[:, NombreDado.AS.value], 0)
+
+        dudar = acciones == CODIGO_DUDAR
+        resultado = np.where(dudar, conteo < cantidades, conteo == cantidades)
+
+        if pases is not None:
+            if manos_anteriores is None:
+                raise ValueError("Dudar de un pasar requiere la mano del jugador anterior")
+            pase_falso = ~pases_validos_lote(np.asarray(manos_anteriores))
+            resultado = np.where(dudar & np.asarray(pases, dtype=bool), pase_falso, resultado)
+        return resultado
@@ -1,46 +1,65 @@
 """Módulo que contiene la clase Cacho para gestionar los dados del jugador en Dudo."""
 
-from src.game.dado import Dado
+from typing import Sequence
+
+from src.game.dado import NOMBRES_CARAS
+from src.services.generador_aleatorio import DADOS_POR_CACHO, GENERADOR_GLOBAL, GeneradorAleatorio
 
 
 class Cacho:
-    """Clase que representa el cacho de un jugador en Dudo."""
+    """Clase que representa el cacho de un jugador en Dudo.
+
+    Las caras se guardan como enteros en un bytearray; 0 indica un dado sin agitar.
+    """
+
+    __slots__ = ("_caras", "_cantidad_agitada", "_oculto", "_generador")
 
-    _dados: list[Dado]
+    _caras: bytearray
     _cantidad_agitada: int
     _oculto: bool
+    _generador: GeneradorAleatorio
 
-    """Módulo que contiene la clase Cacho para gestionar los dados del jugador en Dudo."""
-
-    def __init__(self):
+    def __init__(self, generador: GeneradorAleatorio | None = None):
         """Inicializa el cacho con 5 dados y lo deja visible."""
         self._oculto = False
         self._cantidad_agitada = 0
-        self._dados = []
-        for _ in range(5):  # Se crean la cantidad maxima de dados que pueden haber dentro del cacho
-            self._dados.append(Dado())
+        self._generador = generador if generador is not None else GENERADOR_GLOBAL
+        # Espacio para la cantidad maxima de dados que pueden haber dentro del cacho
+        self._caras = bytearray(DADOS_POR_CACHO)
 
     def agitar(self, cantidad: int):
         """Agita el cacho con la cantidad de dados indicada."""
         if cantidad < 0:
             raise ValueError("Cantidad a agitar invalida")
 
-        cantidad = min(cantidad, 5)
+        cantidad = min(cantidad, DADOS_POR_CACHO)
 
         self._cantidad_agitada = cantidad
+        self._caras[:] = self._generador.lanzar_dados(cantidad) + bytes(DADOS_POR_CACHO - cantidad)
 
-        for i in range(cantidad):
-            self._dados[i].generar_numero()
+    @staticmethod
+    def agitar_mesa(
+        cachos: Sequence["Cacho"], cantidades: Sequence[int], generador: GeneradorAleatorio
+    ):
+        """Agita todos los cachos de la mesa con un unico lanzamiento del generador."""
+        mesa = generador.lanzar_mesa(cantidades).tobytes()
+        inicio = 0
+        for cacho, cantidad in zip(cachos, cantidades):
+            fin = inicio + DADOS_POR_CACHO
+            cacho._caras[:] = mesa[inicio:fin]
+            cacho._cantidad_agitada = min(cantidad, DADOS_POR_CACHO)
+            inicio = fin
 
     def get_resultados(self) -> list[str] | None:
         """Devuelve los resultados de los dados agitados si el cacho está visible."""
         if self._oculto:
             return None
 
-        resultados = []
-        for i in range(self._cantidad_agitada):
-            resultados.append(self._dados[i].get_valor())
-        return resultados
+        return [NOMBRES_CARAS[cara] for cara in self._caras[: self._cantidad_agitada]]
+
+    def get_caras(self) -> bytes:
+        """Devuelve los valores numericos de los dados agitados, sin importar si esta oculto."""
+        return bytes(self._caras[: self._cantidad_agitada])
 
     def ocultar(self):
         """Oculta el cacho del jugador."""
@@ -0,0 +1,85 @@
+"""Módulo que codifica las manos de un cacho como enteros y precalcula sus propiedades.
+
+Una mano es el multiconjunto de caras de un cacho (de 0 a 5 dados, 462 manos distintas).
+Su codigo es el histograma empaquetado en base 6: sum(histograma[cara] * 6 ** (cara - 1)).
+Las propiedades de cada mano se guardan en tablas de bytes indexadas por ese codigo, por
+lo que consultarlas es una sola lectura y se puede hacer para muchas manos con numpy.
+"""
+
+from itertools import combinations_with_replacement
+
+import numpy as np
+
+from src.services.generador_aleatorio import DADOS_POR_CACHO
+
+CARAS = 6
+
+# Peso de cada cara (indices 1..6) en el codigo de la mano; el indice 0 no se usa
+POTENCIAS = (0,) + tuple(CARAS**cara for cara in range(CARAS))
+
+# Cantidad de codigos posibles, incluidos los que no corresponden a ninguna mano
+TOTAL_CODIGOS = CARAS**CARAS
+
+
+def codigo_mano(histograma: list[int]) -> int:
+    """Codigo de la mano a partir de su histograma indexado por cara (1..6)."""
+    return (
+        histograma[1]
+        + histograma[2] * 6
+        + histograma[3] * 36
+        + histograma[4] * 216
+        + histograma[5] * 1296
+        + histograma[6] * 7776
+    )
+
+
+def histograma_de_codigo(codigo: int) -> list[int]:
+    """Histograma indexado por cara (1..6) de la mano con ese codigo."""
+    histograma = [0] * (CARAS + 1)
+    for cara in range(1, CARAS + 1):
+        codigo, histograma[cara] = divmod(codigo, CARAS)
+    return histograma
+
+
+def _es_pase_valido(histograma: list[int]) -> bool:
+    """Un pase es valido con un full (3 y 2), cinco iguales o todas las caras distintas."""
+    repeticiones = sorted(cuenta for cuenta in histograma[1:] if cuenta)
+    return repeticiones in ([2, 3], [5]) or all(cuenta == 1 for cuenta in repeticiones)
+
+
+def _construir_tablas() -> tuple[tuple[int, ...], bytes, bytes, bytes]:
+    """Enumera las manos de 0 a 5 dados y arma las tablas de sus propiedades."""
+    manos = []
+    pase_valido = bytearray(TOTAL_CODIGOS)
+    cantidad_dados = bytearray(TOTAL_CODIGOS)
+    maxima_repeticion = bytearray(TOTAL_CODIGOS)
+    for dados in range(DADOS_POR_CACHO + 1):
+        for caras in combinations_with_replacement(range(1, CARAS + 1), dados):
+            histograma = [0] * (CARAS + 1)
+            for cara in caras:
+                histograma[cara] += 1
+            codigo = codigo_mano(histograma)
+            manos.append(codigo)
+            pase_valido[codigo] = _es_pase_valido(histograma)
+            cantidad_dados[codigo] = dados
+            maxima_repeticion[codigo] = max(histograma)
+    return tuple(sorted(manos)), bytes(pase_valido), bytes(cantidad_dados), bytes(maxima_repeticion)
+
+
+# Codigos de todas las manos posibles y tablas de propiedades indexadas por codigo
+MANOS, ES_PASE_VALIDO, CANTIDAD_DADOS, MAXIMA_REPETICION = _construir_tablas()
+
+
+def es_pase_valido(histograma: list[int]) -> bool:
+    """Indica si la mano del histograma respalda un 'pasar'."""
+    return ES_PASE_VALIDO[codigo_mano(histograma)] == 1
+
+
+def codigos_lote(histogramas: np.ndarray) -> np.ndarray:
+    """Codigos de muchas manos a la vez; 'histogramas' tiene forma (manos, 7)."""
+    return np.asarray(histogramas, dtype=np.int64) @ np.asarray(POTENCIAS, dtype=np.int64)
+
+
+def pases_validos_lote(codigos: np.ndarray) -> np.ndarray:
+    """Arreglo booleano con la validez del pase de cada codigo."""
+    return np.frombuffer(ES_PASE_VALIDO, dtype=np.uint8)[codigos].astype(bool)
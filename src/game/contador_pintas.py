@@ -1,8 +1,15 @@
 """Módulo para contar pintas en el juego Dudo."""
 
+import math
+
+import numpy as np
+
 from src.game.dado import NombreDado
 from src.game.jugador import Jugador
 
+# Largo de un histograma de pintas: el indice es la cara y el indice 0 no se usa
+LARGO_HISTOGRAMA = 7
+
 
 class ContadorPintas:
     """Clase para contar pintas en el juego Dudo."""
@@ -11,22 +18,37 @@ class ContadorPintas:
 
     def __init__(self):
         """Inicia los nombres de las caras de los Dados a contar."""
-        self.nombres_dados = [
-            str(NombreDado.AS).lower(),
-            str(NombreDado.TONTO).lower(),
-            str(NombreDado.TREN).lower(),
-            str(NombreDado.CUADRA).lower(),
-            str(NombreDado.QUINA).lower(),
-            str(NombreDado.SEXTO).lower(),
-        ]
+        self.nombres_dados = [str(pinta).lower() for pinta in NombreDado]
 
-    def contar_pintas(self, jugadores: list[Jugador]) -> dict[str, int]:
-        """Cuenta la cantidad de pintas de todos los dados de los jugadores."""
-        cantidad_pintas = {nombre: 0 for nombre in self.nombres_dados}
+    @staticmethod
+    def histograma(jugadores: list[Jugador]) -> list[int]:
+        """Cuenta las caras de los jugadores en una lista indexada por cara (1..6)."""
+        caras = bytearray()
         for jugador in jugadores:
-            dados_jugador = jugador.ver_cacho()
-            if dados_jugador is None:
+            if jugador._cacho._oculto:
                 raise ValueError("Error en dados de jugador")
-            for dado in dados_jugador:
-                cantidad_pintas[dado.lower()] += 1
-        return cantidad_pintas
+            caras += jugador._cacho.get_caras()
+
+        histograma = [caras.count(cara) for cara in range(LARGO_HISTOGRAMA)]
+        histograma[0] = 0
+        return histograma
+
+    @staticmethod
+    def histogramas_lote(caras: np.ndarray) -> np.ndarray:
+        """Cuenta muchas mesas a la vez con una sola llamada a numpy.bincount.
+
+        'caras' tiene forma (mesas, dados) con 0 en los dados vacios; retorna un arreglo
+        (mesas, 7) con el histograma de cada mesa.
+        """
+        # Con 0 mesas reshape no puede deducir el largo con -1
+        mesas = caras.reshape(len(caras), math.prod(caras.shape[1:])).astype(np.int64)
+        desplazadas = mesas + LARGO_HISTOGRAMA * np.arange(len(mesas))[:, None]
+        histogramas = np.bincount(desplazadas.ravel(), minlength=LARGO_HISTOGRAMA * len(mesas))
+        histogramas = histogramas.reshape(len(mesas), LARGO_HISTOGRAMA)
+        histogramas[:, 0] = 0
+        return histogramas
+
+    def contar_pintas(self, jugadores: list[Jugador]) -> dict[str, int]:
+        """Cuenta la cantidad de pintas de todos los dados de los jugadores."""
+        histograma = self.histograma(jugadores)
+        return {nombre: histograma[i + 1] for i, nombre in enumerate(self.nombres_dados)}
@@ -1,8 +1,12 @@
 """Módulo que contiene la clase Dado y NombreDado para el juego Dudo."""
 
-import random
 from enum import Enum
 
+from src.services.generador_aleatorio import GENERADOR_GLOBAL, GeneradorAleatorio
+
+# Nombre de cada cara indexado por su valor; el indice 0 no es una cara
+NOMBRES_CARAS: tuple[str, ...] = ("", "As", "Tonto", "Tren", "Cuadra", "Quina", "Sexto")
+
 
 class NombreDado(Enum):
     """Enumeración de los nombres posibles de los dados en Dudo."""
@@ -16,15 +20,7 @@ class NombreDado(Enum):
 
     def __str__(self) -> str:
         """Devuelve el nombre del dado como cadena."""
-        nombres = {
-            NombreDado.AS: "As",
-            NombreDado.TONTO: "Tonto",
-            NombreDado.TREN: "Tren",
-            NombreDado.CUADRA: "Cuadra",
-            NombreDado.QUINA: "Quina",
-            NombreDado.SEXTO: "Sexto",
-        }
-        return nombres[self]
+        return NOMBRES_CARAS[self.value]
 
     @staticmethod
     def a_enum(pinta: str) -> "NombreDado":
@@ -33,47 +29,44 @@ class NombreDado(Enum):
 
         Lanza ValueError si no existe.
         """
-        traduccion = {
-            str(NombreDado.AS).lower(): NombreDado.AS,
-            str(NombreDado.TONTO).lower(): NombreDado.TONTO,
-            str(NombreDado.TREN).lower(): NombreDado.TREN,
-            str(NombreDado.CUADRA).lower(): NombreDado.CUADRA,
-            str(NombreDado.QUINA).lower(): NombreDado.QUINA,
-            str(NombreDado.SEXTO).lower(): NombreDado.SEXTO,
-        }
         pinta_normalizada = pinta.strip().lower()
         try:
-            return traduccion[pinta_normalizada]
+            return _PINTAS_POR_NOMBRE[pinta_normalizada]
         except KeyError:
             raise ValueError(f"Pinta inválida: {pinta}")
 
 
+_PINTAS_POR_NOMBRE: dict[str, NombreDado] = {str(pinta).lower(): pinta for pinta in NombreDado}
+
+
 class Dado:
     """Clase que representa un dado en el juego Dudo."""
 
+    __slots__ = ("_valor", "_generador")
+
     _valor: int | None
+    _generador: GeneradorAleatorio
 
-    def __init__(self):
+    def __init__(self, generador: GeneradorAleatorio | None = None):
         """Inicializa el dado sin valor asignado."""
         self._valor = None
+        self._generador = generador if generador is not None else GENERADOR_GLOBAL
 
     def generar_numero(self):
         """Genera un número aleatorio entre 1 y 6 para el dado."""
-        self._valor = random.randint(1, 6)
+        self._valor = self._generador.lanzar_dado()
 
     def numero_a_nombre(self, numero: int) -> str:
         """Convierte un número en el nombre correspondiente del dado."""
-        try:
-            nombre_enum = NombreDado(numero)
-            return str(nombre_enum)
-        except ValueError as exc:
-            raise ValueError("Número inválido") from exc
+        if not 1 <= numero <= 6:
+            raise ValueError("Número inválido")
+        return NOMBRES_CARAS[numero]
 
     def get_valor(self) -> str:
         """Devuelve el nombre del valor actual del dado."""
         if self._valor is None:
             raise ValueError("No se ha generado ningún valor todavía")
-        return self.numero_a_nombre(self._valor)
+        return NOMBRES_CARAS[self._valor]
 
     def get_valor_numerico(self):
         """Devuelve el valor numérico actual del dado."""
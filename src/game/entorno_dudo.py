@@ -0,0 +1,217 @@
+"""Módulo con entornos de Dudo con la interfaz reset/step de Gymnasium.
+
+Los entornos exponen las reglas de LotePartidas a un agente que controla todos los
+asientos: cada paso recibe la accion del jugador en turno (ver LotePartidas para la
+codificacion) y entrega la observacion del siguiente jugador en decidir, junto con la
+mascara de sus acciones legales. Las observaciones tienen forma fija y se escriben en
+arreglos reservados una sola vez, por lo que un paso no crea objetos por partida.
+
+Recompensas: un asiento recibe -1 cuando queda sin dados y el ganador +1 al terminar.
+"""
+
+import numpy as np
+
+from src.game.indice_apuestas import CARAS
+from src.game.jugada import CODIGO_PASAR, CODIGO_SUBIR
+from src.game.lote_partidas import (
+    FASE_RONDA_ESPECIAL,
+    MODO_ABIERTA,
+    MODO_CERRADA,
+    MODO_SIN_ESPECIAL,
+    LotePartidas,
+)
+from src.services.generador_aleatorio import GeneradorAleatorio
+
+# Posiciones fijas al inicio de la observacion; luego vienen dados y obligar por asiento
+OBS_HISTOGRAMA = slice(0, CARAS)
+OBS_CANTIDAD = CARAS
+OBS_PINTA = CARAS + 1
+OBS_ES_PASAR = CARAS + 2
+OBS_MODO = CARAS + 3
+OBS_RONDA_ESPECIAL = CARAS + 4
+OBS_ELIGE_RONDA = CARAS + 5
+OBS_DIRECCION = CARAS + 6
+OBS_DADOS_OCULTOS = CARAS + 7
+OBS_DADOS_EN_JUEGO = CARAS + 8
+OBS_DADOS_ASIENTOS = CARAS + 9
+
+
+def largo_observacion(jugadores: int) -> int:
+    """Largo del vector de observacion para partidas de 'jugadores' jugadores."""
+    return OBS_DADOS_ASIENTOS + 2 * jugadores
+
+
+def observar(lote: LotePartidas, salida: np.ndarray) -> np.ndarray:
+    """Escribe en 'salida' (partidas, largo) lo que ve el jugador que decide en cada partida.
+
+    Contenido, en el orden de las constantes OBS_*:
+    - dados visibles por cara (1..6) segun el modo de la ronda;
+    - cantidad y pinta de la apuesta de referencia (0 si no hay) y si la vigente es pasar;
+    - modo de ronda (0 normal, 1 cerrada, 2 abierta), si es especial, si el jugador debe
+      elegir la ronda y la direccion del juego;
+    - dados ocultos para el jugador y dados en juego;
+    - dados y 'obligar' usado de cada asiento, partiendo por el propio y en orden de asiento.
+    """
+    jugadores = lote.jugadores
+    filas = np.arange(lote.partidas)
+    asiento = lote.jugador_en_turno()
+    modo = lote.modo_especial
+
+    ve_propio = (modo == MODO_SIN_ESPECIAL) | ((modo == MODO_CERRADA) & (asiento == lote.obligador))
+    ve_ajenos = modo == MODO_ABIERTA
+    propio = lote.histogramas[filas, asiento, 1:]
+    ajenos = lote.histograma_mesa[:, 1:] - propio
+    visibles = propio * ve_propio[:, None] + ajenos * ve_ajenos[:, None]
+    salida[:, OBS_HISTOGRAMA] = visibles
+
+    referencia = np.where(
+        lote.apuesta_actual == CODIGO_PASAR, lote.apuesta_anterior, lote.apuesta_actual
+    )
+    hay_subida = referencia >= CODIGO_SUBIR
+    rango = np.maximum(referencia - CODIGO_SUBIR, 0)
+    salida[:, OBS_CANTIDAD] = np.where(hay_subida, rango // CARAS + 1, 0)
+    salida[:, OBS_PINTA] = np.where(hay_subida, rango % CARAS + 1, 0)
+    salida[:, OBS_ES_PASAR] = lote.apuesta_actual == CODIGO_PASAR
+    salida[:, OBS_MODO] = modo
+    salida[:, OBS_RONDA_ESPECIAL] = lote.ronda_especial
+    salida[:, OBS_ELIGE_RONDA] = lote.fase == FASE_RONDA_ESPECIAL
+    salida[:, OBS_DIRECCION] = lote.direccion
+    salida[:, OBS_DADOS_OCULTOS] = lote.histograma_mesa[:, 1:].sum(axis=1) - visibles.sum(axis=1)
+    salida[:, OBS_DADOS_EN_JUEGO] = lote.dados_en_juego()
+
+    orden = (asiento[:, None] + np.arange(jugadores)) % jugadores
+    dados = slice(OBS_DADOS_ASIENTOS, OBS_DADOS_ASIENTOS + jugadores)
+    obligar = slice(OBS_DADOS_ASIENTOS + jugadores, OBS_DADOS_ASIENTOS + 2 * jugadores)
+    salida[:, dados] = lote.dados[filas[:, None], orden]
+    salida[:, obligar] = lote.obligar_usado[filas[:, None], orden]
+    return salida
+
+
+class VectorEntornoDudo:
+    """Muchas partidas que avanzan juntas; con 'autoreiniciar' las terminadas vuelven a partir.
+
+    step() retorna (observaciones, recompensas, terminadas, truncadas, info). Las
+    recompensas son del jugador que acaba de actuar; info["recompensas_asientos"] trae las
+    de todos los asientos, info["mascara"] las acciones legales e info["jugador"] el asiento
+    que decide. Los arreglos retornados se reutilizan en el siguiente paso.
+    """
+
+    partidas: int
+    jugadores: int
+    total_acciones: int
+    largo_observacion: int
+    autoreiniciar: bool
+    lote: LotePartidas
+    _observaciones: np.ndarray
+    _recompensas: np.ndarray
+    _recompensas_asientos: np.ndarray
+    _truncadas: np.ndarray
+
+    def __init__(
+        self,
+        partidas: int,
+        jugadores: int = 2,
+        generador: GeneradorAleatorio | None = None,
+        autoreiniciar: bool = True,
+    ):
+        """Crea las partidas y reserva los arreglos de salida."""
+        self.autoreiniciar = autoreiniciar
+        self.lote = LotePartidas(partidas, jugadores, generador)
+        self.partidas = partidas
+        self.jugadores = jugadores
+        self.total_acciones = self.lote.total_acciones
+        self.largo_observacion = largo_observacion(jugadores)
+        self._observaciones = np.zeros((partidas, self.largo_observacion), dtype=np.float32)
+        self._recompensas = np.zeros(partidas, dtype=np.float32)
+        self._recompensas_asientos = np.zeros((partidas, jugadores), dtype=np.float32)
+        self._truncadas = np.zeros(partidas, dtype=bool)
+
+    def reset(self, semilla: int | None = None) -> tuple[np.ndarray, dict]:
+        """Reinicia todas las partidas; con 'semilla' se usa un generador nuevo sembrado."""
+        if semilla is not None:
+            self.lote._generador = GeneradorAleatorio(semilla)
+        self.lote.reiniciar()
+        return observar(self.lote, self._observaciones), self._info()
+
+    def step(
+        self, acciones: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]:
+        """Aplica la accion del jugador en turno de cada partida."""
+        lote = self.lote
+        actores = lote.jugador_en_turno()
+        lote.paso(acciones)
+
+        filas = np.arange(self.partidas)
+        recompensas = self._recompensas_asientos
+        recompensas[:] = 0
+        perdieron = lote.perdio_dado >= 0
+        eliminados = perdieron & (lote.dados[filas, np.maximum(lote.perdio_dado, 0)] == 0)
+        recompensas[eliminados, lote.perdio_dado[eliminados]] = -1
+        terminadas = lote.terminadas() & lote.fin_ronda
+        recompensas[terminadas, lote.ganador[terminadas]] = 1
+        self._recompensas[:] = recompensas[filas, actores]
+
+        if self.autoreiniciar:
+            lote.reiniciar_partidas(np.flatnonzero(terminadas))
+        observar(lote, self._observaciones)
+        return self._observaciones, self._recompensas, terminadas, self._truncadas, self._info()
+
+    def _info(self) -> dict:
+        """Datos auxiliares del paso: mascara legal, asiento en turno y recompensas."""
+        return {
+            "mascara": self.lote.mascara_legal(),
+            "jugador": self.lote.jugador_en_turno(),
+            "recompensas_asientos": self._recompensas_asientos,
+        }
+
+
+class EntornoDudo:
+    """Una partida con la interfaz reset/step de Gymnasium, sobre un lote de tamaño 1.
+
+    Al terminar la partida, step() retorna terminada=True y hay que llamar a reset().
+    """
+
+    jugadores: int
+    total_acciones: int
+    largo_observacion: int
+    _vector: VectorEntornoDudo
+    _terminada: bool
+
+    def __init__(self, jugadores: int = 2, generador: GeneradorAleatorio | None = None):
+        """Crea la partida."""
+        self._vector = VectorEntornoDudo(1, jugadores, generador, autoreiniciar=False)
+        self.jugadores = jugadores
+        self.total_acciones = self._vector.total_acciones
+        self.largo_observacion = self._vector.largo_observacion
+        self._terminada = False
+
+    def reset(self, semilla: int | None = None) -> tuple[np.ndarray, dict]:
+        """Comienza una partida nueva."""
+        observaciones, info = self._vector.reset(semilla)
+        self._terminada = False
+        return observaciones[0].copy(), self._info_partida(info)
+
+    def step(self, accion: int) -> tuple[np.ndarray, float, bool, bool, dict]:
+        """Aplica la accion del jugador en turno."""
+        if self._terminada:
+            raise ValueError("La partida termino; se debe llamar a reset()")
+        observaciones, recompensas, terminadas, truncadas, info = self._vector.step(
+            np.array([accion])
+        )
+        self._terminada = bool(terminadas[0])
+        return (
+            observaciones[0].copy(),
+            float(recompensas[0]),
+            self._terminada,
+            bool(truncadas[0]),
+            self._info_partida(info),
+        )
+
+    @staticmethod
+    def _info_partida(info: dict) -> dict:
+        """Toma la fila de la unica partida de cada dato del info vectorial."""
+        return {
+            "mascara": info["mascara"][0],
+            "jugador": int(info["jugador"][0]),
+            "recompensas_asientos": info["recompensas_asientos"][0].copy(),
+        }
@@ -0,0 +1,66 @@
+"""Módulo con una foto inmutable del estado de una partida de Dudo.
+
+GestorPartida reparte su estado entre jugadores, cachos, conjuntos y diccionarios; copiarlo
+en profundidad para explorar jugadas es lento. EstadoPartida guarda lo mismo en tuplas
+inmutables: se captura y restaura en microsegundos, se puede usar como clave de una tabla
+de transposicion y los estados hijos comparten con el padre todo lo que no cambia.
+"""
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from src.game.jugada import Jugada, TipoApuesta
+
+if TYPE_CHECKING:
+    from src.game.gestor_partida import DireccionJuego, TipoRondaEspecial
+
+
+class EstadoJugador(NamedTuple):
+    """Estado de un jugador: sus dados, sus caras agitadas y si ya obligo."""
+
+    nombre: str
+    dados: int
+    dados_perdidos: int
+    caras: bytes
+    obligar_usado: bool
+
+
+class EstadoPartida(NamedTuple):
+    """Estado completo de una partida, con los jugadores que siguen en juego en orden."""
+
+    jugadores: tuple[EstadoJugador, ...]
+    turno: int
+    direccion: "DireccionJuego | None"
+    apuesta_anterior: Jugada | None
+    apuesta_actual: Jugada | None
+    ronda_especial: bool
+    modo_especial: "TipoRondaEspecial | None"
+    ver_propios: frozenset[str]
+    ver_ajenos: frozenset[str]
+    rondas_jugadas: int
+    rondas_especiales: int
+
+    def jugador_en_turno(self) -> EstadoJugador:
+        """Estado del jugador que debe decidir."""
+        return self.jugadores[self.turno]
+
+    def dados_en_juego(self) -> int:
+        """Total de dados de los jugadores en juego."""
+        return sum(jugador.dados for jugador in self.jugadores)
+
+    def avanzar(self, jugada: Jugada) -> "EstadoPartida":
+        """Estado tras un 'subir' o 'pasar' ya validado, como en GestorPartida.procesar_apuesta.
+
+        El hijo comparte con este estado la tupla de jugadores. Dudar y calzar cambian los
+        dados y se resuelven en el gestor.
+        """
+        if jugada.tipo is not TipoApuesta.SUBIR and jugada.tipo is not TipoApuesta.PASAR:
+            raise ValueError(f"Solo se puede avanzar con subir o pasar: {jugada}")
+        if self.direccion is None:
+            raise ValueError("Debe definirse la direccion de Juego")
+
+        paso = 1 if self.direccion.value["bool"] else -1
+        return self._replace(
+            apuesta_anterior=self.apuesta_actual,
+            apuesta_actual=jugada,
+            turno=(self.turno + paso) % len(self.jugadores),
+        )
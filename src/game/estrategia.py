@@ -0,0 +1,99 @@
+"""Módulo que define el contrato de las estrategias automaticas del juego Dudo."""
+
+from typing import TYPE_CHECKING, Protocol
+
+from src.game.jugada import Jugada
+
+if TYPE_CHECKING:
+    from src.game.gestor_partida import DireccionJuego, TipoRondaEspecial
+
+
+class ContextoApuesta:
+    """Informacion visible para un jugador al momento de decidir."""
+
+    __slots__ = (
+        "nombre",
+        "apuesta_anterior",
+        "apuesta_actual",
+        "primer_apuesta",
+        "caras_propias",
+        "caras_ajenas_visibles",
+        "dados_ocultos",
+        "dados_propios",
+        "dados_en_juego",
+        "dados_maximos",
+        "ronda_especial",
+        "modo_especial",
+        "puede_calzar",
+        "puede_partir_con_ases",
+        "histograma_visible",
+        "jugadores_en_juego",
+        "dados_rivales",
+    )
+
+    def __init__(
+        self,
+        nombre: str,
+        apuesta_anterior: Jugada | None,
+        apuesta_actual: Jugada | None,
+        primer_apuesta: bool,
+        caras_propias: bytes | None,
+        caras_ajenas_visibles: bytes,
+        dados_ocultos: int,
+        dados_propios: int,
+        dados_en_juego: int,
+        dados_maximos: int,
+        ronda_especial: bool,
+        modo_especial: "TipoRondaEspecial | None",
+        puede_calzar: bool,
+        puede_partir_con_ases: bool,
+        histograma_visible: list[int] | None = None,
+        jugadores_en_juego: int | None = None,
+        dados_rivales: tuple[int, ...] | None = None,
+    ):
+        """Inicializa el contexto; caras_propias es None si el jugador no ve su cacho.
+
+        'histograma_visible' cuenta por cara todos los dados que el jugador ve; si no se
+        entrega se calcula a partir de las caras visibles. 'jugadores_en_juego' es None si
+        quien arma el contexto no lo informa. 'dados_rivales' son los dados de cada rival en
+        el orden en que juegan a partir del siguiente, el mismo orden en que van sus caras
+        en 'caras_ajenas_visibles'; es None si no se informa.
+        """
+        self.nombre = nombre
+        self.apuesta_anterior = apuesta_anterior
+        self.apuesta_actual = apuesta_actual
+        self.primer_apuesta = primer_apuesta
+        self.caras_propias = caras_propias
+        self.caras_ajenas_visibles = caras_ajenas_visibles
+        self.dados_ocultos = dados_ocultos
+        self.dados_propios = dados_propios
+        self.dados_en_juego = dados_en_juego
+        self.dados_maximos = dados_maximos
+        self.ronda_especial = ronda_especial
+        self.modo_especial = modo_especial
+        self.puede_calzar = puede_calzar
+        self.puede_partir_con_ases = puede_partir_con_ases
+        if histograma_visible is None:
+            vistos = caras_ajenas_visibles + (caras_propias or b"")
+            # Indexado por cara (1..6), igual que ContadorPintas.histograma
+            histograma_visible = [vistos.count(cara) for cara in range(7)]
+            histograma_visible[0] = 0
+        self.histograma_visible = histograma_visible
+        self.jugadores_en_juego = jugadores_en_juego
+        self.dados_rivales = dados_rivales
+
+
+class Estrategia(Protocol):
+    """Decisiones que reemplazan al input() de un jugador humano."""
+
+    def decidir_apuesta(self, contexto: ContextoApuesta) -> Jugada:
+        """Retorna la jugada, igual que Jugador.realizar_apuesta."""
+        ...
+
+    def decidir_ronda_especial(self, contexto: ContextoApuesta) -> "TipoRondaEspecial":
+        """Elige el tipo de ronda cuando el jugador puede obligar."""
+        ...
+
+    def decidir_direccion(self) -> "DireccionJuego":
+        """Elige la direccion del juego al iniciar la partida."""
+        ...
@@ -0,0 +1,319 @@
+"""Módulo con la abstraccion, la tabla y la estrategia de CFR para el juego Dudo.
+
+El juego completo tiene demasiados estados para guardar una estrategia por cada uno. La
+abstraccion resume lo que ve el jugador en pocas caracteristicas discretas (que tan lejos
+esta la apuesta de lo esperado, la fuerza de su mejor pinta, sus dados y los ocultos, el
+tipo de ronda) cuyo indice mixto identifica el conjunto de informacion. Las acciones se
+reducen a seis abstractas que se traducen a una jugada concreta legal segun la situacion.
+
+La tabla entrenada (ver src.services.entrenador_cfr) guarda una fila de probabilidades
+cuantizadas por conjunto de informacion, por lo que decidir es calcular un indice y leer
+una fila.
+"""
+
+import json
+from bisect import bisect_left
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from src.game.codigos_mano import es_pase_valido
+from src.game.estrategia import ContextoApuesta
+from src.game.gestor_partida import DireccionJuego, TipoRondaEspecial
+from src.game.indice_apuestas import CARAS, IMPOSIBLE, minimos_subida, modo_subida, rango_apuesta
+from src.game.jugada import (
+    CODIGO_CALZAR,
+    CODIGO_DUDAR,
+    CODIGO_PASAR,
+    CODIGO_SUBIR,
+    Jugada,
+    TipoApuesta,
+    apuesta_de_referencia,
+    jugada_de_codigo,
+)
+from src.game.oraculo_apuestas import PROBABILIDAD_COMODIN, PROBABILIDAD_PINTA, es_comodin
+from src.services.generador_aleatorio import DADOS_POR_CACHO, GeneradorAleatorio
+
+# Acciones abstractas
+ACCION_DUDAR = 0
+ACCION_CALZAR = 1
+ACCION_PASAR = 2
+ACCION_SUBIR_MISMA = 3
+ACCION_SUBIR_MEJOR = 4
+ACCION_SUBIR_ESPERADA = 5
+TOTAL_ACCIONES_CFR = 6
+
+# Codigo de una accion abstracta que no es legal en la situacion
+SIN_ACCION = -1
+
+# Modo de visibilidad de la ronda
+RONDA_NORMAL = 0
+RONDA_CERRADA = 1
+RONDA_ABIERTA = 2
+
+# Tipos de decision: partir la ronda, responder a una subida o a un pasar
+_APERTURA = 0
+_SUBIDA = 1
+_PASAR = 2
+
+_FUERZAS = 3
+_PASES = 3
+_MODOS_RONDA = 3
+
+_AS = 1
+_PINTAS = range(1, CARAS + 1)
+
+
+class SituacionCFR(NamedTuple):
+    """Lo que ve el jugador que decide, con lo necesario para la abstraccion.
+
+    'referencia' es la (cantidad, pinta) vigente, None al partir la ronda; 'pase_propio'
+    es None si el jugador no ve su cacho.
+    """
+
+    histograma_visible: tuple[int, ...]
+    dados_ocultos: int
+    dados_propios: int
+    dados_maximos: int
+    referencia: tuple[int, int] | None
+    es_pasar: bool
+    pase_propio: bool | None
+    ronda_especial: bool
+    modo_ronda: int
+    puede_calzar: bool
+    puede_partir_con_ases: bool
+
+    @staticmethod
+    def desde_contexto(contexto: ContextoApuesta) -> "SituacionCFR":
+        """Situacion del contexto de GestorPartida."""
+        referencia = None
+        if not contexto.primer_apuesta:
+            vigente = apuesta_de_referencia(contexto.apuesta_anterior, contexto.apuesta_actual)
+            if vigente is None:
+                raise ValueError("No hay una apuesta vigente")
+            referencia = (vigente.cantidad, vigente.pinta)
+        pase_propio = None
+        if contexto.caras_propias is not None:
+            propio = [contexto.caras_propias.count(cara) for cara in range(CARAS + 1)]
+            pase_propio = es_pase_valido(propio)
+        modo_ronda = RONDA_NORMAL
+        if contexto.modo_especial == TipoRondaEspecial.CERRADA:
+            modo_ronda = RONDA_CERRADA
+        elif contexto.modo_especial == TipoRondaEspecial.ABIERTA:
+            modo_ronda = RONDA_ABIERTA
+        actual = contexto.apuesta_actual
+        return SituacionCFR(
+            tuple(contexto.histograma_visible),
+            contexto.dados_ocultos,
+            contexto.dados_propios,
+            contexto.dados_maximos,
+            referencia,
+            referencia is not None and actual is not None and actual.tipo == TipoApuesta.PASAR,
+            pase_propio,
+            contexto.ronda_especial,
+            modo_ronda,
+            contexto.puede_calzar,
+            contexto.puede_partir_con_ases,
+        )
+
+    def esperadas(self) -> list[float]:
+        """Cantidad esperada de cada pinta (indices 1..6) sumando vistos y ocultos."""
+        esperadas = [0.0] * (CARAS + 1)
+        for pinta in _PINTAS:
+            comodin = es_comodin(pinta, self.ronda_especial)
+            vistos = self.histograma_visible[pinta]
+            if comodin:
+                vistos += self.histograma_visible[_AS]
+            probabilidad = PROBABILIDAD_COMODIN if comodin else PROBABILIDAD_PINTA
+            esperadas[pinta] = vistos + self.dados_ocultos * probabilidad
+        return esperadas
+
+
+class AbstraccionCFR(NamedTuple):
+    """Parametros de la abstraccion de estados.
+
+    'desviacion_maxima' acota en dados la distancia entre la apuesta y lo esperado;
+    'limites_ocultos' son los cortes de las cubetas de dados ocultos.
+    """
+
+    desviacion_maxima: int = 3
+    limites_ocultos: tuple[int, ...] = (2, 5, 10, 20)
+
+    def total_infosets(self) -> int:
+        """Cantidad de conjuntos de informacion de la abstraccion."""
+        return (
+            3
+            * (2 * self.desviacion_maxima + 1)
+            * _FUERZAS
+            * _PASES
+            * DADOS_POR_CACHO
+            * (len(self.limites_ocultos) + 1)
+            * _MODOS_RONDA
+            * 2
+        )
+
+    def indice(self, situacion: SituacionCFR) -> int:
+        """Indice del conjunto de informacion de la situacion."""
+        esperadas = situacion.esperadas()
+        mejor = max(esperadas[1:])
+        if situacion.referencia is None:
+            tipo = _APERTURA
+            desviacion = 0
+            # Sin apuesta, la fuerza compara la mejor pinta con lo esperado sin ver dados
+            vistos = sum(situacion.histograma_visible[1:])
+            fuerza = mejor - (vistos + situacion.dados_ocultos) * PROBABILIDAD_COMODIN
+        else:
+            tipo = _PASAR if situacion.es_pasar else _SUBIDA
+            cantidad, pinta = situacion.referencia
+            desviacion = round(cantidad - esperadas[pinta])
+            fuerza = mejor - esperadas[pinta]
+        maxima = self.desviacion_maxima
+        desviacion = min(max(desviacion, -maxima), maxima) + maxima
+        fuerza_cubeta = min(max(int(fuerza), 0), _FUERZAS - 1)
+        pase = 0 if situacion.pase_propio is None else 1 + situacion.pase_propio
+
+        indice = tipo
+        indice = indice * (2 * maxima + 1) + desviacion
+        indice = indice * _FUERZAS + fuerza_cubeta
+        indice = indice * _PASES + pase
+        indice = indice * DADOS_POR_CACHO + min(situacion.dados_propios, DADOS_POR_CACHO) - 1
+        indice = indice * (len(self.limites_ocultos) + 1) + bisect_left(
+            self.limites_ocultos, situacion.dados_ocultos
+        )
+        indice = indice * _MODOS_RONDA + situacion.modo_ronda
+        return indice * 2 + situacion.puede_calzar
+
+
+def acciones_concretas(situacion: SituacionCFR) -> tuple[int, ...]:
+    """Codigo de jugada de cada accion abstracta, o SIN_ACCION si no es legal.
+
+    'misma' sube lo minimo en la pinta vigente, 'mejor' cambia a la pinta de mayor
+    cantidad esperada con lo minimo y 'esperada' apuesta esa pinta en su cantidad esperada.
+    """
+    acciones = [SIN_ACCION] * TOTAL_ACCIONES_CFR
+    if situacion.referencia is None:
+        minimos = [1] * (CARAS + 1)
+        if not situacion.puede_partir_con_ases:
+            minimos[_AS] = IMPOSIBLE
+        vigente = 0
+    else:
+        cantidad, vigente = situacion.referencia
+        modo = modo_subida(situacion.ronda_especial, situacion.dados_propios == 1)
+        minimos = list(minimos_subida(cantidad, vigente, modo))
+        acciones[ACCION_DUDAR] = CODIGO_DUDAR
+        if situacion.puede_calzar:
+            acciones[ACCION_CALZAR] = CODIGO_CALZAR
+        if not situacion.es_pasar:
+            acciones[ACCION_PASAR] = CODIGO_PASAR
+
+    maxima = situacion.dados_maximos
+    legales = [pinta for pinta in _PINTAS if minimos[pinta] <= maxima]
+    if not legales:
+        return tuple(acciones)
+    esperadas = situacion.esperadas()
+    if vigente in legales:
+        acciones[ACCION_SUBIR_MISMA] = CODIGO_SUBIR + rango_apuesta(minimos[vigente], vigente)
+    otras = [pinta for pinta in legales if pinta != vigente]
+    if otras:
+        mejor = max(otras, key=lambda pinta: (esperadas[pinta], pinta))
+        acciones[ACCION_SUBIR_MEJOR] = CODIGO_SUBIR + rango_apuesta(minimos[mejor], mejor)
+    mejor = max(legales, key=lambda pinta: (esperadas[pinta], pinta))
+    cantidad = max(minimos[mejor], min(round(esperadas[mejor]), maxima))
+    acciones[ACCION_SUBIR_ESPERADA] = CODIGO_SUBIR + rango_apuesta(cantidad, mejor)
+    return tuple(acciones)
+
+
+class TablaCFR:
+    """Estrategia promedio por conjunto de informacion, cuantizada en uint8 o float16.
+
+    Cada fila guarda pesos proporcionales a la probabilidad de cada accion abstracta; las
+    filas no visitadas durante el entrenamiento quedan uniformes.
+    """
+
+    __slots__ = ("abstraccion", "pesos")
+
+    abstraccion: AbstraccionCFR
+    pesos: np.ndarray
+
+    def __init__(self, abstraccion: AbstraccionCFR, pesos: np.ndarray):
+        """Agrupa la abstraccion y sus pesos ya cuantizados."""
+        if pesos.shape != (abstraccion.total_infosets(), TOTAL_ACCIONES_CFR):
+            raise ValueError("Los pesos no corresponden a la abstraccion")
+        self.abstraccion = abstraccion
+        self.pesos = pesos
+
+    @classmethod
+    def desde_sumas(
+        cls, abstraccion: AbstraccionCFR, sumas: np.ndarray, tipo: type = np.uint8
+    ) -> "TablaCFR":
+        """Normaliza las sumas de estrategia y las cuantiza a 'tipo' (uint8 o float16)."""
+        totales = sumas.sum(axis=1, keepdims=True)
+        probabilidades = np.where(
+            totales > 0, sumas / np.where(totales > 0, totales, 1.0), 1.0 / TOTAL_ACCIONES_CFR
+        )
+        if tipo is np.uint8:
+            pesos = np.rint(probabilidades * np.iinfo(np.uint8).max).astype(np.uint8)
+        elif tipo is np.float16:
+            pesos = probabilidades.astype(np.float16)
+        else:
+            raise ValueError(f"Tipo de cuantizacion no soportado: {tipo}")
+        return cls(abstraccion, pesos)
+
+    @classmethod
+    def cargar(cls, ruta: str | Path) -> "TablaCFR":
+        """Abre la tabla guardada en 'ruta' (.npy y .json) mapeada en memoria."""
+        ruta = Path(ruta)
+        with open(ruta.with_suffix(".json"), encoding="utf-8") as archivo:
+            parametros = json.load(archivo)
+        abstraccion = AbstraccionCFR(
+            parametros["desviacion_maxima"], tuple(parametros["limites_ocultos"])
+        )
+        return cls(abstraccion, np.load(ruta.with_suffix(".npy"), mmap_mode="r"))
+
+    def guardar(self, ruta: str | Path):
+        """Guarda los pesos en 'ruta'.npy y la abstraccion en 'ruta'.json."""
+        ruta = Path(ruta)
+        np.save(ruta.with_suffix(".npy"), np.asarray(self.pesos))
+        with open(ruta.with_suffix(".json"), "w", encoding="utf-8") as archivo:
+            json.dump(self.abstraccion._asdict(), archivo)
+
+    def fila(self, situacion: SituacionCFR) -> np.ndarray:
+        """Pesos de las acciones abstractas en la situacion."""
+        return self.pesos[self.abstraccion.indice(situacion)]
+
+
+class EstrategiaCFR:
+    """Estrategia que sortea la accion abstracta segun la tabla entrenada con CFR."""
+
+    _tabla: TablaCFR
+    _generador: GeneradorAleatorio
+
+    def __init__(self, tabla: TablaCFR, generador: GeneradorAleatorio | None = None):
+        """Inicializa la estrategia con la tabla ya cargada."""
+        self._tabla = tabla
+        self._generador = generador if generador is not None else GeneradorAleatorio()
+
+    def decidir_apuesta(self, contexto: ContextoApuesta) -> Jugada:
+        """Sortea entre las acciones legales con los pesos de la tabla."""
+        situacion = SituacionCFR.desde_contexto(contexto)
+        codigos = acciones_concretas(situacion)
+        pesos = self._tabla.fila(situacion)
+        legales = [accion for accion, codigo in enumerate(codigos) if codigo != SIN_ACCION]
+        total = sum(float(pesos[accion]) for accion in legales)
+        if total <= 0:
+            return jugada_de_codigo(codigos[self._generador.elegir(legales)])
+        sorteo = self._generador.aleatorio() * total
+        for accion in legales:
+            sorteo -= float(pesos[accion])
+            if sorteo < 0:
+                break
+        return jugada_de_codigo(codigos[accion])
+
+    def decidir_ronda_especial(self, contexto: ContextoApuesta) -> TipoRondaEspecial:
+        """Obliga en ronda cerrada, donde solo el obligador ve su dado."""
+        return TipoRondaEspecial.CERRADA
+
+    def decidir_direccion(self) -> DireccionJuego:
+        """Elige al azar la direccion del juego."""
+        return self._generador.elegir(list(DireccionJuego))
@@ -0,0 +1,491 @@
+"""Módulo con una estrategia de busqueda de Monte Carlo en arbol (MCTS) para el juego Dudo.
+
+Cada decision busca sobre el resto de la ronda, modelada entre el jugador y un rival que
+representa al siguiente en turno: gana quien hace perder un dado al otro o acierta un
+calzar. En cada simulacion se determinizan los dados ocultos lanzandolos al azar, cacho por
+cacho segun los dados de cada rival; la mano del rival es la del siguiente en turno (la
+visible en ronda abierta) y el rival responde con una politica simple segun lo que el ve.
+Las estadisticas de las decisiones propias se guardan en una tabla de transposicion acotada,
+indexada por lo que ve el jugador y las apuestas vigentes, por lo que los subarboles se
+reutilizan entre turnos de la misma ronda.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+from src.game.codigos_mano import es_pase_valido
+from src.game.estrategia import ContextoApuesta
+from src.game.gestor_partida import DireccionJuego, TipoRondaEspecial
+from src.game.indice_apuestas import CARAS, MODO_ESPECIAL, MODO_NORMAL, modo_subida
+from src.game.jugada import (
+    CODIGO_CALZAR,
+    CODIGO_DUDAR,
+    CODIGO_PASAR,
+    CODIGO_SUBIR,
+    Jugada,
+    codigo_jugada,
+    jugada_de_codigo,
+)
+from src.game.lote_partidas import SIN_APUESTA
+from src.game.mascaras_legales import tabla_mascaras
+from src.game.oraculo_apuestas import (
+    PROBABILIDAD_COMODIN,
+    PROBABILIDAD_PINTA,
+    cuenta_conocida,
+    es_comodin,
+    probabilidades_apuesta,
+)
+from src.services.generador_aleatorio import DADOS_POR_CACHO, GeneradorAleatorio
+
+# Quien decide en cada paso de la simulacion
+YO = 0
+RIVAL = 1
+
+# Cantidades que se consideran por pinta por sobre la minima legal
+SUBIDAS_POR_PINTA = 2
+
+_AS = 1
+
+
+class NodoMCTS:
+    """Estadisticas de las acciones de una decision propia."""
+
+    __slots__ = ("acciones", "visitas", "valores", "total")
+
+    acciones: tuple[int, ...]
+    visitas: list[int]
+    valores: list[float]
+    total: int
+
+    def __init__(self, acciones: tuple[int, ...]):
+        """Crea el nodo sin visitas."""
+        self.acciones = acciones
+        self.visitas = [0] * len(acciones)
+        self.valores = [0.0] * len(acciones)
+        self.total = 0
+
+    def elegir(self, exploracion: float) -> int:
+        """Indice de la accion a explorar: primero las no visitadas, luego por UCT."""
+        mejor = 0
+        mejor_puntaje = -math.inf
+        logaritmo = math.log(self.total + 1)
+        for indice, visitas in enumerate(self.visitas):
+            if visitas == 0:
+                return indice
+            puntaje = self.valores[indice] / visitas + exploracion * math.sqrt(logaritmo / visitas)
+            if puntaje > mejor_puntaje:
+                mejor = indice
+                mejor_puntaje = puntaje
+        return mejor
+
+    def actualizar(self, indice: int, valor: float):
+        """Suma el resultado de una simulacion a la accion 'indice'."""
+        self.visitas[indice] += 1
+        self.valores[indice] += valor
+        self.total += 1
+
+    def mas_visitada(self) -> int:
+        """Accion con mas visitas."""
+        return self.acciones[max(range(len(self.acciones)), key=self.visitas.__getitem__)]
+
+
+class TablaTransposicion:
+    """Nodos indexados por estado, con capacidad acotada y desalojo del menos usado."""
+
+    __slots__ = ("capacidad", "desalojados", "_nodos")
+
+    capacidad: int
+    desalojados: int
+    _nodos: OrderedDict[tuple, NodoMCTS]
+
+    def __init__(self, capacidad: int):
+        """Crea la tabla vacia."""
+        if capacidad < 1:
+            raise ValueError("La capacidad de la tabla debe ser positiva")
+        self.capacidad = capacidad
+        self.desalojados = 0
+        self._nodos = OrderedDict()
+
+    def __len__(self) -> int:
+        """Cantidad de nodos guardados."""
+        return len(self._nodos)
+
+    def obtener(self, clave: tuple) -> NodoMCTS | None:
+        """Nodo del estado, marcandolo como recien usado; None si no esta."""
+        nodo = self._nodos.get(clave)
+        if nodo is not None:
+            self._nodos.move_to_end(clave)
+        return nodo
+
+    def guardar(self, clave: tuple, nodo: NodoMCTS):
+        """Guarda el nodo y desaloja el menos usado si se supera la capacidad."""
+        self._nodos[clave] = nodo
+        if len(self._nodos) > self.capacidad:
+            self._nodos.popitem(last=False)
+            self.desalojados += 1
+
+
+@lru_cache(maxsize=65536)
+def acciones_busqueda(
+    dados_maximos: int,
+    dados_en_juego: int,
+    referencia: int,
+    es_pasar: bool,
+    modo: int,
+    puede_calzar: bool,
+    puede_pasar: bool,
+) -> tuple[int, ...]:
+    """Codigos de las acciones que se exploran sobre la subida de codigo 'referencia'.
+
+    De cada pinta solo se consideran las SUBIDAS_POR_PINTA cantidades legales mas bajas,
+    sin superar los dados en juego: las demas casi nunca son mejores y multiplican el arbol.
+    """
+    mascara = tabla_mascaras(dados_maximos).mascara(
+        referencia - CODIGO_SUBIR, es_pasar, modo, puede_calzar
+    )
+    acciones = [CODIGO_DUDAR]
+    if mascara[CODIGO_CALZAR]:
+        acciones.append(CODIGO_CALZAR)
+    if mascara[CODIGO_PASAR] and puede_pasar:
+        acciones.append(CODIGO_PASAR)
+    por_pinta = [0] * (CARAS + 1)
+    for rango in np.flatnonzero(mascara[CODIGO_SUBIR:]).tolist():
+        cantidad, pinta = divmod(rango, CARAS)
+        if cantidad < dados_en_juego and por_pinta[pinta + 1] < SUBIDAS_POR_PINTA:
+            por_pinta[pinta + 1] += 1
+            acciones.append(CODIGO_SUBIR + rango)
+    return tuple(acciones)
+
+
+class EstrategiaMCTS:
+    """Estrategia que decide con MCTS dentro de un presupuesto de simulaciones o de tiempo.
+
+    'playouts' limita las simulaciones por decision y 'tiempo' los segundos de reloj; si
+    se indican ambos se detiene con el primero que se cumpla. Con solo 'playouts' y un
+    generador sembrado las decisiones son reproducibles.
+    """
+
+    _generador: GeneradorAleatorio
+    _playouts: int | None
+    _tiempo: float | None
+    _exploracion: float
+    tabla: TablaTransposicion
+
+    def __init__(
+        self,
+        generador: GeneradorAleatorio | None = None,
+        playouts: int | None = 200,
+        tiempo: float | None = None,
+        exploracion: float = 1.0,
+        capacidad: int = 50_000,
+    ):
+        """Inicializa la estrategia con su fuente de azar y su presupuesto."""
+        if playouts is None and tiempo is None:
+            raise ValueError("Se debe indicar un limite de playouts o de tiempo")
+        if (playouts is not None and playouts < 1) or (tiempo is not None and tiempo <= 0):
+            raise ValueError("El presupuesto de la busqueda debe ser positivo")
+        self._generador = generador if generador is not None else GeneradorAleatorio()
+        self._playouts = playouts
+        self._tiempo = tiempo
+        self._exploracion = exploracion
+        self.tabla = TablaTransposicion(capacidad)
+
+    def decidir_apuesta(self, contexto: ContextoApuesta) -> Jugada:
+        """Busca la mejor jugada desde el contexto y retorna la mas visitada."""
+        busqueda = _Busqueda(contexto, self._generador, self.tabla, self._exploracion)
+        fin = None if self._tiempo is None else time.perf_counter() + self._tiempo
+        playouts = 0
+        while self._playouts is None or playouts < self._playouts:
+            if fin is not None and time.perf_counter() >= fin:
+                break
+            busqueda.simular()
+            playouts += 1
+        return jugada_de_codigo(busqueda.mejor_accion())
+
+    def decidir_ronda_especial(self, contexto: ContextoApuesta) -> TipoRondaEspecial:
+        """Obliga en ronda cerrada, donde solo el obligador ve su dado."""
+        return TipoRondaEspecial.CERRADA
+
+    def decidir_direccion(self) -> DireccionJuego:
+        """Elige al azar la direccion del juego."""
+        return self._generador.elegir(list(DireccionJuego))
+
+
+class _Busqueda:
+    """Estado de la busqueda de una decision: lo que ve el jugador y la raiz."""
+
+    __slots__ = (
+        "_contexto",
+        "_generador",
+        "_tabla",
+        "_exploracion",
+        "_visible",
+        "_base",
+        "_raiz",
+        "_mi_pase_valido",
+        "_mitad",
+        "_especial",
+        "_mis_esperadas",
+        "_cacho_rival",
+        "_dados_rival",
+        "_mano_rival",
+    )
+
+    _contexto: ContextoApuesta
+    _generador: GeneradorAleatorio
+    _tabla: TablaTransposicion
+    _exploracion: float
+    _visible: list[int]
+    _base: tuple
+    _raiz: tuple[int, int]
+    _mi_pase_valido: bool | None
+    _mitad: int
+    _especial: bool
+    _mis_esperadas: list[float]
+    _cacho_rival: slice
+    _dados_rival: int
+    _mano_rival: list[int] | None
+
+    def __init__(
+        self,
+        contexto: ContextoApuesta,
+        generador: GeneradorAleatorio,
+        tabla: TablaTransposicion,
+        exploracion: float,
+    ):
+        """Prepara la raiz a partir del contexto."""
+        self._contexto = contexto
+        self._generador = generador
+        self._tabla = tabla
+        self._exploracion = exploracion
+        self._visible = list(contexto.histograma_visible)
+        self._mitad = (contexto.dados_maximos + 1) // 2
+        self._especial = contexto.ronda_especial
+        self._mis_esperadas = _esperadas(self._visible, contexto.dados_ocultos, self._especial)
+        # El pase propio solo se puede evaluar si el jugador ve su cacho
+        self._mi_pase_valido = None
+        if contexto.caras_propias is not None:
+            propio = [contexto.caras_propias.count(cara) for cara in range(CARAS + 1)]
+            self._mi_pase_valido = es_pase_valido(propio)
+        # Sin los dados de cada rival se supone un cacho completo para el siguiente
+        rivales = contexto.dados_rivales or (
+            min(DADOS_POR_CACHO, contexto.dados_en_juego - contexto.dados_propios),
+        )
+        self._dados_rival = rivales[0]
+        self._mano_rival = None
+        if contexto.caras_ajenas_visibles:
+            # Las caras visibles van en orden de turno: las primeras son del siguiente
+            visibles = contexto.caras_ajenas_visibles[: self._dados_rival]
+            self._mano_rival = [visibles.count(cara) for cara in range(CARAS + 1)]
+        # Los ocultos se lanzan con los propios primero y luego los rivales en orden de turno
+        inicio = 0 if contexto.caras_propias is not None else contexto.dados_propios
+        self._cacho_rival = slice(inicio, inicio + self._dados_rival)
+        self._base = (
+            tuple(self._visible),
+            contexto.dados_ocultos,
+            contexto.dados_en_juego,
+            contexto.dados_maximos,
+            contexto.ronda_especial,
+            contexto.dados_propios == 1,
+            contexto.puede_calzar,
+        )
+        anterior = _codigo(contexto.apuesta_anterior)
+        actual = _codigo(contexto.apuesta_actual)
+        if contexto.primer_apuesta:
+            anterior = actual = SIN_APUESTA
+        self._raiz = (anterior, actual)
+        if self._tabla.obtener(self._clave(anterior, actual)) is None:
+            self._tabla.guardar(
+                self._clave(anterior, actual), NodoMCTS(self._acciones(anterior, actual, YO))
+            )
+
+    def mejor_accion(self) -> int:
+        """Accion mas visitada de la raiz."""
+        nodo = self._tabla.obtener(self._clave(*self._raiz))
+        if nodo is None:
+            # La raiz pudo ser desalojada por una tabla muy pequeña
+            nodo = NodoMCTS(self._acciones(*self._raiz, YO))
+        return nodo.mas_visitada()
+
+    def simular(self):
+        """Una simulacion: determiniza, baja por el arbol, expande un nodo y termina la ronda.
+
+        Solo las decisiones propias forman el arbol; el rival responde con la politica
+        simple segun su mano determinizada.
+        """
+        ocultos = self._generador.lanzar_dados(self._contexto.dados_ocultos)
+        mesa = list(self._visible)
+        for cara in ocultos:
+            mesa[cara] += 1
+        mano_rival = self._mano_rival
+        if mano_rival is None:
+            mano_rival = [0] * (CARAS + 1)
+            for cara in ocultos[self._cacho_rival]:
+                mano_rival[cara] += 1
+        pase_rival = es_pase_valido(mano_rival)
+        esperadas = (self._mis_esperadas, self._esperadas_rival(mesa, mano_rival))
+
+        anterior, actual = self._raiz
+        quien = YO
+        camino = []
+        expandido = False
+        valor = None
+        while valor is None:
+            if quien == RIVAL:
+                accion = self._politica(anterior, actual, quien, esperadas[quien])
+            else:
+                clave = self._clave(anterior, actual)
+                nodo = self._tabla.obtener(clave)
+                if nodo is None:
+                    if expandido:
+                        break
+                    nodo = NodoMCTS(self._acciones(anterior, actual, quien))
+                    self._tabla.guardar(clave, nodo)
+                    expandido = True
+                indice = nodo.elegir(self._exploracion)
+                camino.append((nodo, indice))
+                accion = nodo.acciones[indice]
+            valor = self._resolver(accion, quien, anterior, actual, mesa, pase_rival)
+            anterior, actual, quien = actual, accion, 1 - quien
+
+        if valor is None:
+            valor = self._terminar_ronda(anterior, actual, quien, mesa, pase_rival, esperadas)
+        for nodo, indice in camino:
+            nodo.actualizar(indice, valor)
+
+    def _esperadas_rival(self, mesa: list[int], mano_rival: list[int]) -> list[float]:
+        """Cantidades esperadas segun lo que ve el rival en la mesa determinizada.
+
+        En ronda abierta ve todos los cachos menos el suyo; en cerrada no ve ninguno.
+        """
+        modo = self._contexto.modo_especial
+        dados_en_juego = self._contexto.dados_en_juego
+        if modo == TipoRondaEspecial.ABIERTA:
+            conocidos = [total - propios for total, propios in zip(mesa, mano_rival)]
+            return _esperadas(conocidos, self._dados_rival, self._especial)
+        if modo == TipoRondaEspecial.CERRADA:
+            return _esperadas([0] * (CARAS + 1), dados_en_juego, self._especial)
+        return _esperadas(mano_rival, dados_en_juego - self._dados_rival, self._especial)
+
+    def _terminar_ronda(
+        self,
+        anterior: int,
+        actual: int,
+        quien: int,
+        mesa: list[int],
+        pase_rival: bool,
+        esperadas: tuple[list[float], list[float]],
+    ) -> float:
+        """Juega el resto de la ronda con la politica simple y retorna su valor."""
+        while True:
+            accion = self._politica(anterior, actual, quien, esperadas[quien])
+            valor = self._resolver(accion, quien, anterior, actual, mesa, pase_rival)
+            if valor is not None:
+                return valor
+            anterior, actual, quien = actual, accion, 1 - quien
+
+    def _politica(self, anterior: int, actual: int, quien: int, esperada: list[float]) -> int:
+        """Duda si la apuesta supera la cantidad esperada y si no sube a una que no la supere."""
+        referencia = anterior if actual == CODIGO_PASAR else actual
+        cantidad, pinta = divmod(referencia - CODIGO_SUBIR, CARAS)
+        if cantidad + 1 > esperada[pinta + 1]:
+            return CODIGO_DUDAR
+        creibles = [
+            subida
+            for subida in self._acciones(anterior, actual, quien)
+            if subida >= CODIGO_SUBIR
+            and (subida - CODIGO_SUBIR) // CARAS + 1
+            <= esperada[(subida - CODIGO_SUBIR) % CARAS + 1]
+        ]
+        if not creibles:
+            return CODIGO_DUDAR
+        return self._generador.elegir(creibles)
+
+    def _resolver(
+        self,
+        accion: int,
+        quien: int,
+        anterior: int,
+        actual: int,
+        mesa: list[int],
+        pase_rival: bool,
+    ) -> float | None:
+        """Valor para el jugador si la accion termina la ronda, None si la ronda sigue."""
+        if accion != CODIGO_DUDAR and accion != CODIGO_CALZAR:
+            return None
+        signo = 1.0 if quien == YO else -1.0
+        if actual == CODIGO_PASAR:
+            # Se duda el pase de quien aposto; calzar compara contra la subida anterior
+            if accion == CODIGO_DUDAR:
+                pase_valido = self._mi_pase_valido if quien == RIVAL else pase_rival
+                return -signo if pase_valido else signo
+            actual = anterior
+        cantidad, pinta = divmod(actual - CODIGO_SUBIR, CARAS)
+        cantidad += 1
+        pinta += 1
+        cuenta = mesa[pinta]
+        if es_comodin(pinta, self._especial):
+            cuenta += mesa[_AS]
+        if accion == CODIGO_DUDAR:
+            return -signo if cuenta >= cantidad else signo
+        return signo if cuenta == cantidad else -signo
+
+    def _acciones(self, anterior: int, actual: int, quien: int) -> tuple[int, ...]:
+        """Acciones que se exploran para quien decide en ese estado."""
+        contexto = self._contexto
+        if actual == SIN_APUESTA:
+            return _aperturas(contexto)
+        referencia = anterior if actual == CODIGO_PASAR else actual
+        if quien == YO:
+            modo = modo_subida(contexto.ronda_especial, contexto.dados_propios == 1)
+            puede_calzar = contexto.puede_calzar
+            puede_pasar = self._mi_pase_valido is not None
+        else:
+            modo = MODO_ESPECIAL if contexto.ronda_especial else MODO_NORMAL
+            puede_calzar = contexto.dados_en_juego >= self._mitad
+            puede_pasar = True
+        return acciones_busqueda(
+            contexto.dados_maximos,
+            contexto.dados_en_juego,
+            referencia,
+            actual == CODIGO_PASAR,
+            modo,
+            puede_calzar,
+            puede_pasar,
+        )
+
+    def _clave(self, anterior: int, actual: int) -> tuple:
+        """Clave en la tabla de transposicion de un estado en que decide el jugador."""
+        return (self._base, anterior, actual)
+
+
+def _codigo(jugada: Jugada | None) -> int:
+    """Codigo entero de la jugada, SIN_APUESTA si no hay."""
+    return SIN_APUESTA if jugada is None else codigo_jugada(jugada)
+
+
+def _aperturas(contexto: ContextoApuesta) -> tuple[int, ...]:
+    """Aperturas que se exploran: de cada pinta, hasta una mas que la cantidad esperada."""
+    tabla = tabla_mascaras(contexto.dados_maximos)
+    mascara = tabla.mascara(None, con_ases=contexto.puede_partir_con_ases)
+    acciones = []
+    for rango in np.flatnonzero(mascara[CODIGO_SUBIR:]).tolist():
+        cantidad, pinta = divmod(rango, CARAS)
+        esperada = probabilidades_apuesta(contexto, pinta + 1).esperada()
+        if cantidad < max(1.0, esperada + 1) and cantidad < contexto.dados_en_juego:
+            acciones.append(CODIGO_SUBIR + rango)
+    return tuple(acciones)
+
+
+def _esperadas(conocidos: list[int], ocultos: int, ronda_especial: bool) -> list[float]:
+    """Cantidad esperada de cada pinta (indice 1..6) para quien conoce 'conocidos'."""
+    esperadas = [0.0] * (CARAS + 1)
+    for pinta in range(1, CARAS + 1):
+        comodin = es_comodin(pinta, ronda_especial)
+        probabilidad = PROBABILIDAD_COMODIN if comodin else PROBABILIDAD_PINTA
+        esperadas[pinta] = cuenta_conocida(conocidos, pinta, comodin) + ocultos * probabilidad
+    return esperadas
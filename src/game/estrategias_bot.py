@@ -0,0 +1,142 @@
+"""Módulo con estrategias automaticas simples para jugar partidas sin terminal."""
+
+from functools import lru_cache
+from typing import Callable
+
+from src.game.estrategia import ContextoApuesta, Estrategia
+from src.game.estrategia_mcts import EstrategiaMCTS
+from src.game.gestor_partida import DireccionJuego, TipoRondaEspecial
+from src.game.indice_apuestas import apuesta_de_rango, modo_subida, rango_apuesta, tabla_apuestas
+from src.game.jugada import (
+    JUGADA_CALZAR,
+    JUGADA_DUDAR,
+    JUGADA_PASAR,
+    Jugada,
+    apuesta_de_referencia,
+)
+from src.game.oraculo_apuestas import probabilidades_apuesta
+from src.services.generador_aleatorio import GeneradorAleatorio
+
+
+@lru_cache(maxsize=None)
+def jugada_de_rango(rango: int) -> Jugada:
+    """Subida correspondiente al rango, creada una sola vez."""
+    return Jugada.subir(*apuesta_de_rango(rango))
+
+
+def subidas_legales(contexto: ContextoApuesta) -> list[Jugada]:
+    """Lista las subidas validas en el contexto, hasta la cantidad de dados en juego.
+
+    Las subidas se leen de la tabla precalculada y quedan ordenadas por rango, es decir
+    por cantidad y luego por pinta.
+    """
+    tabla = tabla_apuestas(max(contexto.dados_en_juego, 1))
+
+    if contexto.primer_apuesta:
+        rangos = tabla.aperturas(contexto.puede_partir_con_ases)
+    else:
+        referencia = apuesta_de_referencia(contexto.apuesta_anterior, contexto.apuesta_actual)
+        if referencia is None:
+            raise ValueError("No hay una apuesta vigente")
+        modo = modo_subida(contexto.ronda_especial, contexto.dados_propios == 1)
+        rangos = tabla.subidas_legales(rango_apuesta(referencia.cantidad, referencia.pinta), modo)
+
+    return [jugada_de_rango(rango) for rango in rangos]
+
+
+class EstrategiaAleatoria:
+    """Estrategia que elige al azar entre las jugadas validas."""
+
+    _generador: GeneradorAleatorio
+    _probabilidad_dudar: float
+
+    def __init__(
+        self, generador: GeneradorAleatorio | None = None, probabilidad_dudar: float = 0.3
+    ):
+        """Inicializa la estrategia con su propia fuente de azar."""
+        self._generador = generador if generador is not None else GeneradorAleatorio()
+        self._probabilidad_dudar = probabilidad_dudar
+
+    def decidir_apuesta(self, contexto: ContextoApuesta) -> Jugada:
+        """Sube al azar o, con cierta probabilidad, duda, pasa o calza."""
+        subidas = subidas_legales(contexto)
+        if contexto.primer_apuesta:
+            # Se evita partir con apuestas absurdas para que las rondas sean realistas
+            cantidad_razonable = max(1, contexto.dados_en_juego // 3)
+            razonables = [s for s in subidas if s.cantidad <= cantidad_razonable]
+            return self._generador.elegir(razonables or subidas)
+
+        if not subidas or self._generador.aleatorio() < self._probabilidad_dudar:
+            alternativas = [JUGADA_DUDAR]
+            if contexto.puede_calzar:
+                alternativas.append(JUGADA_CALZAR)
+            if contexto.apuesta_actual != JUGADA_PASAR:
+                alternativas.append(JUGADA_PASAR)
+            return self._generador.elegir(alternativas)
+
+        # Las subidas mas bajas son las mas probables de ser ciertas
+        minima = min(subidas, key=lambda s: s.cantidad)
+        cercanas = [s for s in subidas if s.cantidad <= minima.cantidad + 1]
+        return self._generador.elegir(cercanas)
+
+    def decidir_ronda_especial(self, contexto: ContextoApuesta) -> TipoRondaEspecial:
+        """Elige al azar el tipo de ronda al poder obligar."""
+        return self._generador.elegir(list(TipoRondaEspecial))
+
+    def decidir_direccion(self) -> DireccionJuego:
+        """Elige al azar la direccion del juego."""
+        return self._generador.elegir(list(DireccionJuego))
+
+
+class EstrategiaConservadora:
+    """Estrategia que juega segun la probabilidad de que cada apuesta sea cierta."""
+
+    _generador: GeneradorAleatorio
+    _umbral: float
+
+    def __init__(self, generador: GeneradorAleatorio | None = None, umbral: float = 0.5):
+        """Inicializa la estrategia; una apuesta es creible si su probabilidad alcanza el umbral."""
+        self._generador = generador if generador is not None else GeneradorAleatorio()
+        self._umbral = umbral
+
+    def decidir_apuesta(self, contexto: ContextoApuesta) -> Jugada:
+        """Calza si lo exacto es lo mas probable, duda si no es creible, si no sube lo minimo."""
+        subidas = subidas_legales(contexto)
+        referencia = apuesta_de_referencia(contexto.apuesta_anterior, contexto.apuesta_actual)
+        if not contexto.primer_apuesta and referencia is not None:
+            tabla = probabilidades_apuesta(contexto, referencia.pinta)
+            al_menos = tabla.al_menos(referencia.cantidad)
+            exacta = tabla.exacta(referencia.cantidad)
+            if contexto.puede_calzar and exacta > max(1 - al_menos, self._umbral):
+                return JUGADA_CALZAR
+            if al_menos < self._umbral:
+                return JUGADA_DUDAR
+
+        creibles = [
+            s
+            for s in subidas
+            if probabilidades_apuesta(contexto, s.pinta).al_menos(s.cantidad) >= self._umbral
+        ]
+        if not creibles:
+            if contexto.primer_apuesta:
+                return subidas[0]
+            return JUGADA_DUDAR
+
+        menor = creibles[0].cantidad
+        return self._generador.elegir([s for s in creibles if s.cantidad == menor])
+
+    def decidir_ronda_especial(self, contexto: ContextoApuesta) -> TipoRondaEspecial:
+        """Obliga en ronda cerrada, donde solo el obligador ve su dado."""
+        return TipoRondaEspecial.CERRADA
+
+    def decidir_direccion(self) -> DireccionJuego:
+        """Elige al azar la direccion del juego."""
+        return self._generador.elegir(list(DireccionJuego))
+
+
+# Estrategias disponibles por nombre, cada una se crea a partir de su fuente de azar
+ESTRATEGIAS: dict[str, Callable[[GeneradorAleatorio], Estrategia]] = {
+    "aleatoria": EstrategiaAleatoria,
+    "conservadora": EstrategiaConservadora,
+    "mcts": EstrategiaMCTS,
+}
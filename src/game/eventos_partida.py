@@ -0,0 +1,72 @@
+"""Módulo con los eventos que GestorPartida informa a un registro de la partida.
+
+Cada evento es (tipo, asiento, valor): el asiento es la posicion inicial del jugador en la
+partida y el significado del valor depende del tipo.
+"""
+
+from typing import Callable, NamedTuple
+
+EVENTO_INICIO = 0  # asiento: primer jugador; valor: cantidad de jugadores
+EVENTO_DIRECCION = 1  # valor: 1 hacia la derecha, -1 hacia la izquierda
+EVENTO_AGITAR = 2  # valor: caras del cacho empaquetadas con empaquetar_caras
+EVENTO_RONDA_ESPECIAL = 3  # asiento: obligador; valor: TipoRondaEspecial elegido, como int
+EVENTO_SUBIR = 4  # valor: rango de la apuesta (ver indice_apuestas)
+EVENTO_PASAR = 5
+EVENTO_DUDAR = 6  # valor: 1 si pierde el jugador anterior, 0 si pierde quien duda
+EVENTO_CALZAR = 7  # valor: 1 si calzo exitosamente
+EVENTO_PIERDE_DADO = 8  # valor: dados que le quedan
+EVENTO_GANA_DADO = 9  # valor: dados que le quedan
+EVENTO_ELIMINADO = 10
+EVENTO_FIN = 11  # asiento: ganador; valor: rondas jugadas
+EVENTO_RONDA = 12  # al iniciar cada ronda, antes de agitar; valor: rondas ya jugadas
+
+# Recibe (tipo, asiento, valor) de cada evento de la partida
+RegistroEventos = Callable[[int, int, int], None]
+
+# Las caras van de 1 a 6, por lo que caben en 3 bits y el 0 marca el fin del cacho
+BITS_CARA = 3
+
+
+class EventoPartida(NamedTuple):
+    """Un evento de la partida tal como se informo al registro."""
+
+    tipo: int
+    asiento: int
+    valor: int
+
+
+def combinar_registros(*registros: RegistroEventos | None) -> RegistroEventos | None:
+    """Registro que reenvia cada evento a todos los 'registros' indicados, en orden.
+
+    Los None se ignoran; sin registros retorna None y con uno solo lo retorna tal cual.
+    """
+    activos = [registro for registro in registros if registro is not None]
+    if not activos:
+        return None
+    if len(activos) == 1:
+        return activos[0]
+
+    def registrar(tipo: int, asiento: int, valor: int):
+        """Reenvia el evento a cada registro."""
+        for registro in activos:
+            registro(tipo, asiento, valor)
+
+    return registrar
+
+
+def empaquetar_caras(caras: bytes) -> int:
+    """Caras de un cacho en un entero; los 5 dados de un cacho caben en 15 bits."""
+    valor = 0
+    for posicion, cara in enumerate(caras):
+        valor |= cara << (BITS_CARA * posicion)
+    return valor
+
+
+def desempaquetar_caras(valor: int) -> bytes:
+    """Caras empaquetadas por empaquetar_caras."""
+    caras = bytearray()
+    mascara = (1 << BITS_CARA) - 1
+    while valor:
+        caras.append(valor & mascara)
+        valor >>= BITS_CARA
+    return bytes(caras)
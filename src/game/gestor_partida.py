@@ -5,10 +5,34 @@ import platform
 from enum import Enum
 
 from src.game.arbitro_ronda import ArbitroRonda
-from src.game.contador_pintas import ContadorPintas
+from src.game.cacho import Cacho
+from src.game.contador_pintas import LARGO_HISTOGRAMA, ContadorPintas
 from src.game.dado import Dado, NombreDado
-from src.game.jugador import Jugador, TipoApuesta
-from src.game.validador_apuesta import Apuesta, ValidadorApuesta
+from src.game.estado_partida import EstadoJugador, EstadoPartida
+from src.game.estrategia import ContextoApuesta, Estrategia
+from src.game.eventos_partida import (
+    EVENTO_AGITAR,
+    EVENTO_CALZAR,
+    EVENTO_DIRECCION,
+    EVENTO_DUDAR,
+    EVENTO_ELIMINADO,
+    EVENTO_FIN,
+    EVENTO_GANA_DADO,
+    EVENTO_INICIO,
+    EVENTO_PASAR,
+    EVENTO_PIERDE_DADO,
+    EVENTO_RONDA,
+    EVENTO_RONDA_ESPECIAL,
+    EVENTO_SUBIR,
+    RegistroEventos,
+    empaquetar_caras,
+)
+from src.game.indice_apuestas import es_subida_legal, modo_subida, rango_apuesta
+from src.game.jugada import Jugada, TipoApuesta, apuesta_de_referencia
+from src.game.jugador import Jugador
+from src.game.salida import Salida, salida_nula
+from src.game.validador_apuesta import ValidadorApuesta
+from src.services.generador_aleatorio import GENERADOR_GLOBAL, GeneradorAleatorio
 
 # Constantes de retorno
 STR_BREAK: str = "break"
@@ -58,8 +82,8 @@ class GestorPartida:
     _jugadores: list[Jugador]
     _direccion_juego: DireccionJuego | None
     _turno_actual: int
-    _apuesta_anterior: str
-    _apuesta_actual: str
+    _apuesta_anterior: Jugada | None
+    _apuesta_actual: Jugada | None
     _contador_pintas: ContadorPintas
     _ronda_especial: bool
     _obligar_usado: dict[str, bool]
@@ -67,55 +91,122 @@ class GestorPartida:
     _ver_propios: set
     _ver_ajenos: set
     _total_dados_iniciales: int
+    _interactivo: bool
+    _salida: Salida
+    _rondas_jugadas: int
+    _rondas_especiales: int
+    _generador: GeneradorAleatorio
+    _histograma_mesa: list[int] | None
+    _histogramas_jugadores: list[list[int]] | None
+    _jugadores_por_nombre: dict[str, Jugador]
+    _registro: RegistroEventos | None
+    _asientos: dict[str, int]
+
+    def __init__(
+        self,
+        cantidad_jugadores: int,
+        estrategias: list[Estrategia | None] | None = None,
+        salida: Salida | None = None,
+        generador: GeneradorAleatorio | None = None,
+        registro: RegistroEventos | None = None,
+    ):
+        """Inicializa el gestor de partida con la cantidad de jugadores indicada.
+
+        Cada estrategia reemplaza al input() del jugador en esa posicion; None indica un
+        jugador humano. Si todos son automaticos la partida no usa la terminal y la salida
+        por defecto descarta los mensajes. Todos los dados de la partida usan 'generador'.
+        Si se indica 'registro', recibe cada evento de la partida (ver eventos_partida).
+        """
+        if estrategias is None:
+            estrategias = [None] * cantidad_jugadores
+        if len(estrategias) != cantidad_jugadores:
+            raise ValueError("Debe haber una estrategia por jugador")
 
-    def __init__(self, cantidad_jugadores: int):
-        """Inicializa el gestor de partida con la cantidad de jugadores indicada."""
         self._jugadores = []
         self._direccion_juego = None
         self._turno_actual = -1
-        self._apuesta_anterior = ""
-        self._apuesta_actual = ""
+        self._apuesta_anterior = None
+        self._apuesta_actual = None
         self._ronda_especial = False
         self._obligar_usado = {j._nombre: False for j in self._jugadores}
         self._modo_especial = None
         self._ver_propios = set()
         self._ver_ajenos = set()
         self._total_dados_iniciales = 5 * cantidad_jugadores
+        self._rondas_jugadas = 0
+        self._rondas_especiales = 0
+        self._generador = generador if generador is not None else GENERADOR_GLOBAL
+        self._histograma_mesa = None
+        self._histogramas_jugadores = None
+        self._registro = registro
 
         self._contador_pintas = ContadorPintas()
 
-        for _ in range(cantidad_jugadores):
-            nombre = input(f"\nIngrese el nombre del jugador {_ + 1}: ")
-            self._jugadores.append(Jugador(nombre))
+        self._interactivo = any(estrategia is None for estrategia in estrategias)
+        if salida is None:
+            salida = print if self._interactivo else salida_nula
+        self._salida = salida
 
-    def juego(self):
-        """Ejecuta el bucle principal del juego hasta que exista un ganador."""
+        for i, estrategia in enumerate(estrategias):
+            if estrategia is None:
+                nombre = input(f"\nIngrese el nombre del jugador {i + 1}: ")
+            else:
+                nombre = f"Jugador {i + 1}"
+            self._jugadores.append(Jugador(nombre, estrategia, salida, self._generador))
+        # Permite restaurar estados en los que siguen jugadores ya eliminados
+        self._jugadores_por_nombre = {jugador._nombre: jugador for jugador in self._jugadores}
+        self._asientos = {jugador._nombre: i for i, jugador in enumerate(self._jugadores)}
+
+    def juego(self) -> Jugador:
+        """Ejecuta el bucle principal del juego hasta que exista un ganador y lo retorna."""
         self.definir_primer_jugador()
         self.definir_direccion_juego()
+        if self._registro is not None:
+            primero = self._jugadores[self._turno_actual]
+            direccion = 1 if self._direccion_juego is DireccionJuego.Derecha else -1
+            self._registrar(EVENTO_INICIO, primero, len(self._jugadores))
+            self._registrar(EVENTO_DIRECCION, primero, direccion)
+        return self.continuar_juego()
 
+    def continuar_juego(self) -> Jugador:
+        """Juega rondas desde el estado actual hasta que exista un ganador y lo retorna.
+
+        Permite retomar una partida restaurada entre dos rondas.
+        """
         while True:
             resultado = self.jugar_ronda()
-            if resultado["accion"] == str(TipoApuesta.DUDAR):
+            self._rondas_jugadas += 1
+            if resultado["accion"] is TipoApuesta.DUDAR:
                 if self.accion_dudar(resultado=resultado["resultado"]):
                     break
             else:
                 if resultado["resultado"]:
                     jugador_ganador = self._jugadores[self._turno_actual]
-                    print(f"¡{jugador_ganador._nombre} calzo exitosamente y gano un dado!\n")
+                    self._salida(f"¡{jugador_ganador._nombre} calzo exitosamente y gano un dado!\n")
                 else:
                     jugador_perdedor = self._jugadores[self._turno_actual]
-                    print(f"¡{jugador_perdedor._nombre} calzo erroneamente y pierde un dado!\n")
+                    self._salida(
+                        f"¡{jugador_perdedor._nombre} calzo erroneamente y pierde un dado!\n"
+                    )
                     if jugador_perdedor.get_cantidad_dados() == 0:
                         self.eliminar_jugador(self._turno_actual)
-                        print(
+                        self._salida(
                             f"{jugador_perdedor._nombre} se ha quedado sin dados ¡Jugador eliminado!\n"
                         )
                         if len(self._jugadores) == 1:
-                            print(
+                            self._salida(
                                 f"El juego a finalizado ¡{self._jugadores[0]._nombre} es el ganador!\n"
                             )
                             break
 
+        self._registrar(EVENTO_FIN, self._jugadores[0], self._rondas_jugadas)
+        return self._jugadores[0]
+
+    def _registrar(self, tipo: int, jugador: Jugador, valor: int = 0):
+        """Informa un evento de 'jugador' al registro de la partida, si lo hay."""
+        if self._registro is not None:
+            self._registro(tipo, self._asientos[jugador._nombre], valor)
+
     def accion_dudar(self, resultado: bool) -> bool:
         """Resuelve los efectos de 'dudar' y actualiza turnos/estado.
 
@@ -132,70 +223,87 @@ class GestorPartida:
 
             indice_jugador = self.calcular_turno(not direccion_juego.value["bool"])
             jugador_perdedor = self._jugadores[indice_jugador]
-            print(
+            self._salida(
                 f"¡{self._jugadores[self._turno_actual]._nombre} dudo exitosamente!\n"
                 f"¡{jugador_perdedor._nombre} pierde un dado!\n"
             )
 
             if jugador_perdedor.get_cantidad_dados() == 0:
                 self.eliminar_jugador(indice_jugador)
-                print(f"{jugador_perdedor._nombre} se ha quedado sin dados ¡Jugador eliminado!\n")
+                self._salida(
+                    f"{jugador_perdedor._nombre} se ha quedado sin dados ¡Jugador eliminado!\n"
+                )
                 if len(self._jugadores) == 1:
-                    print(f"El juego a finalizado ¡{self._jugadores[0]._nombre} es el ganador!\n")
+                    self._salida(
+                        f"El juego a finalizado ¡{self._jugadores[0]._nombre} es el ganador!\n"
+                    )
                     return True
 
-            self._turno_actual = indice_jugador
+            # Si el perdedor fue eliminado parte el siguiente en la lista
+            self._turno_actual = indice_jugador % len(self._jugadores)
         else:
             jugador_perdedor = self._jugadores[self._turno_actual]
-            print(f"¡{jugador_perdedor._nombre} dudo erroneamente y pierde un dado!\n")
+            self._salida(f"¡{jugador_perdedor._nombre} dudo erroneamente y pierde un dado!\n")
 
             if jugador_perdedor.get_cantidad_dados() == 0:
                 self.eliminar_jugador(self._turno_actual)
-                print(f"{jugador_perdedor._nombre} se ha quedado sin dados ¡Jugador eliminado!\n")
+                self._salida(
+                    f"{jugador_perdedor._nombre} se ha quedado sin dados ¡Jugador eliminado!\n"
+                )
                 if len(self._jugadores) == 1:
-                    print(f"El juego a finalizado ¡{self._jugadores[0]._nombre} es el ganador!\n")
+                    self._salida(
+                        f"El juego a finalizado ¡{self._jugadores[0]._nombre} es el ganador!\n"
+                    )
                     return True
 
         return False
 
     def jugar_ronda(self):
-        """Juega una ronda, termina al dudar o calzar."""
+        """Juega una ronda, termina al dudar o calzar.
+
+        La ronda se abre subiendo: sin apuesta vigente no hay nada que dudar, calzar ni
+        pasar. Tampoco se puede pasar sobre un pase, porque el calzar siguiente no tendria
+        una subida de referencia. A un jugador humano se le vuelve a pedir la jugada; uno
+        automatico lanza ValueError.
+        """
         if self._direccion_juego is None:
             raise ValueError("Debe definirse la direccion de Juego")
 
-        for jugador in self._jugadores:
-            jugador.agitar_cacho()
+        self._registrar(EVENTO_RONDA, self._jugadores[self._turno_actual], self._rondas_jugadas)
+        self.agitar_cachos()
 
         self.hay_un_dado()
 
         primer_apuesta = True
         while True:
-            apuesta = self.solicitar_apuesta_a_jugador()
-            apuesta_tokenizada = apuesta.split(" ")
+            apuesta = self.solicitar_apuesta_a_jugador(primer_apuesta)
             while True:
-                if apuesta_tokenizada[0] == str(TipoApuesta.SUBIR):
-                    retorno = self.validar_apuesta_subir(primer_apuesta, apuesta_tokenizada)
+                if apuesta.tipo is TipoApuesta.SUBIR:
+                    retorno = self.validar_apuesta_subir(primer_apuesta, apuesta)
 
                     if retorno == STR_BREAK:
                         break
-                    elif retorno == STR_CONTINUE:
-                        continue
 
-                elif apuesta_tokenizada[0] == str(TipoApuesta.CALZAR):
+                elif self._apuesta_actual is None:
+                    # Sin apuesta vigente solo se puede subir
+                    pass
+                elif apuesta.tipo is TipoApuesta.CALZAR:
                     if ValidadorApuesta.puede_calzar(
                         dados_en_juego=self.dados_en_juego(),
                         dados_maximos=self._total_dados_iniciales,
                         dados_del_jugador=self._jugadores[self._turno_actual].get_cantidad_dados(),
                     ):
                         break
-                    continue
-                elif apuesta_tokenizada[0] == str(TipoApuesta.PASAR):
-                    break
+                elif apuesta.tipo is TipoApuesta.PASAR:
+                    if self._apuesta_actual.tipo is not TipoApuesta.PASAR:
+                        break
                 else:
                     break
-                print("\nLa jugada ingresada no es valida, ingrese una nueva jugada.")
-                apuesta = self.solicitar_apuesta_a_jugador()
-                apuesta_tokenizada = apuesta.split(" ")
+                if self._jugadores[self._turno_actual].es_automatico():
+                    # Una estrategia que repite la misma jugada invalida nunca terminaria
+                    raise ValueError(f"Jugada invalida de un jugador automatico: {apuesta}")
+                self._salida("\nLa jugada ingresada no es valida, ingrese una nueva jugada.")
+                apuesta = self.solicitar_apuesta_a_jugador(primer_apuesta)
 
             primer_apuesta = False
 
@@ -205,14 +313,54 @@ class GestorPartida:
             else:
                 return resultado
 
-    def procesar_apuesta(self, apuesta: str):
+    def agitar_cachos(self):
+        """Agita los cachos de todos los jugadores con un solo lanzamiento de la mesa."""
+        Cacho.agitar_mesa(
+            [jugador._cacho for jugador in self._jugadores],
+            [jugador.get_cantidad_dados() for jugador in self._jugadores],
+            self._generador,
+        )
+        for jugador in self._jugadores:
+            jugador._salida("Cacho Agitado")
+        if self._registro is not None:
+            for jugador in self._jugadores:
+                self._registrar(
+                    EVENTO_AGITAR, jugador, empaquetar_caras(jugador._cacho.get_caras())
+                )
+
+        self._calcular_histogramas()
+
+    def _calcular_histogramas(self):
+        """Cuenta una sola vez los dados de cada jugador y de la mesa."""
+        self._histogramas_jugadores = [
+            ContadorPintas.histograma([jugador]) for jugador in self._jugadores
+        ]
+        self._histograma_mesa = [sum(cuentas) for cuentas in zip(*self._histogramas_jugadores)]
+
+    def histograma_mesa(self) -> list[int]:
+        """Histograma de todos los dados en juego, valido hasta que se vuelva a agitar."""
+        if self._histograma_mesa is None:
+            self._calcular_histogramas()
+        assert self._histograma_mesa is not None
+        return self._histograma_mesa
+
+    def histograma_jugador(self, indice_jugador: int) -> list[int]:
+        """Histograma de los dados del jugador en 'indice_jugador'."""
+        if self._histogramas_jugadores is None:
+            self._calcular_histogramas()
+        assert self._histogramas_jugadores is not None
+        return self._histogramas_jugadores[indice_jugador]
+
+    def procesar_apuesta(self, apuesta: Jugada):
         """Procesa una apuesta y, si corresponde, finaliza la ronda.
 
         Para 'subir' y 'pasar' avanza el turno y la ronda continúa (retorna False).
         Para 'dudar' y 'calzar' resuelve el resultado y retorna un diccionario con:
         {'accion', 'termino': bool, 'resultado': bool}.
         """
-        if apuesta.startswith(str(TipoApuesta.SUBIR)):
+        jugador = self._jugadores[self._turno_actual]
+        if apuesta.tipo is TipoApuesta.SUBIR:
+            self._registrar(EVENTO_SUBIR, jugador, rango_apuesta(apuesta.cantidad, apuesta.pinta))
             self._apuesta_anterior = self._apuesta_actual
             self._apuesta_actual = apuesta
             if self._direccion_juego is None:
@@ -220,7 +368,7 @@ class GestorPartida:
             self._turno_actual = self.calcular_turno(self._direccion_juego.value["bool"])
             return False
 
-        elif apuesta == str(TipoApuesta.DUDAR):
+        elif apuesta.tipo is TipoApuesta.DUDAR:
             if self._direccion_juego is None:
                 raise ValueError("Debe definirse la direccion de Juego")
             turno_anterior = self.calcular_turno(not self._direccion_juego.value["bool"])
@@ -231,18 +379,20 @@ class GestorPartida:
                 self._jugadores,
                 self._ronda_especial,
                 turno_anterior,
+                self.histograma_mesa(),
+                self.histograma_jugador(turno_anterior),
             )
 
-            if resultado:
-                self._jugadores[turno_anterior].perder_dado()
-            else:
-                self._jugadores[self._turno_actual].perder_dado()
+            self._registrar(EVENTO_DUDAR, jugador, int(resultado))
+            perdedor = self._jugadores[turno_anterior] if resultado else jugador
+            perdedor.perder_dado()
+            self._registrar(EVENTO_PIERDE_DADO, perdedor, perdedor.get_cantidad_dados())
 
             self.resetear_atributos()
 
-            return {"accion": str(TipoApuesta.DUDAR), "termino": True, "resultado": resultado}
+            return {"accion": TipoApuesta.DUDAR, "termino": True, "resultado": resultado}
 
-        elif apuesta == str(TipoApuesta.CALZAR):
+        elif apuesta.tipo is TipoApuesta.CALZAR:
             resultado = ArbitroRonda.procesar_apuesta(
                 self._apuesta_anterior,
                 self._apuesta_actual,
@@ -250,18 +400,23 @@ class GestorPartida:
                 self._jugadores,
                 self._ronda_especial,
                 -1,
+                self.histograma_mesa(),
             )
 
+            self._registrar(EVENTO_CALZAR, jugador, int(resultado))
             if resultado:
-                self._jugadores[self._turno_actual].ganar_dado()
+                jugador.ganar_dado()
+                self._registrar(EVENTO_GANA_DADO, jugador, jugador.get_cantidad_dados())
             else:
-                self._jugadores[self._turno_actual].perder_dado()
+                jugador.perder_dado()
+                self._registrar(EVENTO_PIERDE_DADO, jugador, jugador.get_cantidad_dados())
 
             self.resetear_atributos()
 
-            return {"accion": str(TipoApuesta.CALZAR), "termino": True, "resultado": resultado}
+            return {"accion": TipoApuesta.CALZAR, "termino": True, "resultado": resultado}
 
-        elif apuesta == str(TipoApuesta.PASAR):
+        elif apuesta.tipo is TipoApuesta.PASAR:
+            self._registrar(EVENTO_PASAR, jugador)
             self._apuesta_anterior = self._apuesta_actual
             self._apuesta_actual = apuesta
             if self._direccion_juego is None:
@@ -269,14 +424,70 @@ class GestorPartida:
             self._turno_actual = self.calcular_turno(self._direccion_juego.value["bool"])
             return False
 
+    def capturar(self) -> EstadoPartida:
+        """Foto inmutable y hasheable del estado de la partida."""
+        return EstadoPartida(
+            jugadores=tuple(
+                EstadoJugador(
+                    jugador._nombre,
+                    jugador._dados_en_posecion,
+                    jugador._dados_perdidos,
+                    jugador._cacho.get_caras(),
+                    self._obligar_usado.get(jugador._nombre, False),
+                )
+                for jugador in self._jugadores
+            ),
+            turno=self._turno_actual,
+            direccion=self._direccion_juego,
+            apuesta_anterior=self._apuesta_anterior,
+            apuesta_actual=self._apuesta_actual,
+            ronda_especial=self._ronda_especial,
+            modo_especial=self._modo_especial,
+            ver_propios=frozenset(self._ver_propios),
+            ver_ajenos=frozenset(self._ver_ajenos),
+            rondas_jugadas=self._rondas_jugadas,
+            rondas_especiales=self._rondas_especiales,
+        )
+
+    def restaurar(self, estado: EstadoPartida):
+        """Vuelve la partida al estado capturado, reutilizando los jugadores existentes."""
+        self._jugadores = []
+        self._obligar_usado = {}
+        for estado_jugador in estado.jugadores:
+            jugador = self._jugadores_por_nombre[estado_jugador.nombre]
+            jugador._dados_en_posecion = estado_jugador.dados
+            jugador._dados_perdidos = estado_jugador.dados_perdidos
+            caras = estado_jugador.caras
+            jugador._cacho._caras[:] = caras + bytes(len(jugador._cacho._caras) - len(caras))
+            jugador._cacho._cantidad_agitada = len(caras)
+            if estado_jugador.obligar_usado:
+                self._obligar_usado[estado_jugador.nombre] = True
+            self._jugadores.append(jugador)
+
+        self._turno_actual = estado.turno
+        self._direccion_juego = estado.direccion
+        self._apuesta_anterior = estado.apuesta_anterior
+        self._apuesta_actual = estado.apuesta_actual
+        self._ronda_especial = estado.ronda_especial
+        self._modo_especial = estado.modo_especial
+        self._ver_propios = set(estado.ver_propios)
+        self._ver_ajenos = set(estado.ver_ajenos)
+        self._rondas_jugadas = estado.rondas_jugadas
+        self._rondas_especiales = estado.rondas_especiales
+        self._histograma_mesa = None
+        self._histogramas_jugadores = None
+
     def resetear_atributos(self):
         """Restablece flags y estado temporal al terminar una ronda."""
-        self._apuesta_actual = ""
-        self._apuesta_anterior = ""
+        self._apuesta_actual = None
+        self._apuesta_anterior = None
         self._ronda_especial = False
         self._modo_especial = None
         self._ver_propios.clear()
         self._ver_ajenos.clear()
+        # En la siguiente ronda se vuelven a agitar los cachos
+        self._histograma_mesa = None
+        self._histogramas_jugadores = None
 
     def hay_un_dado(self):
         """Activa ronda especial (abierta/cerrada) si un jugador puede 'obligar'.
@@ -292,29 +503,22 @@ class GestorPartida:
                 break
 
         if obligador:
-            eleccion = input(
-                f"{obligador._nombre}, elige si quieres jugar ronda especial o no:\n"
-                "(5) obligar cerrada\n(6) obligar abierta\n(7) Jugar ronda normal\n\nR: "
-            )
-            while eleccion not in (
-                TipoRondaEspecial.CERRADA.value,
-                TipoRondaEspecial.ABIERTA.value,
-                TipoRondaEspecial.NORMAL.value,
-            ):
-                limpiar_terminal()
-                print("\nOpción incorrecta.\n")
-                eleccion = input(
-                    f"{obligador._nombre}, elige si quieres jugar ronda especial o no:\n"
-                    "(5) obligar cerrada\n(6) obligar abierta\n(7) Jugar ronda normal\n\nR: "
-                )
+            if obligador._estrategia is not None:
+                eleccion = obligador._estrategia.decidir_ronda_especial(
+                    self.crear_contexto(obligador, primer_apuesta=True)
+                ).value
+            else:
+                eleccion = self._pedir_ronda_especial(obligador)
 
             if not hasattr(self, "_obligar_usado"):
                 self._obligar_usado = {}
             self._obligar_usado[obligador._nombre] = True
+            self._registrar(EVENTO_RONDA_ESPECIAL, obligador, int(eleccion))
             if eleccion == TipoRondaEspecial.NORMAL.value:
                 return
 
             self._ronda_especial = True
+            self._rondas_especiales += 1
 
             if eleccion == TipoRondaEspecial.CERRADA.value:
                 self._modo_especial = TipoRondaEspecial.CERRADA
@@ -325,18 +529,43 @@ class GestorPartida:
                 self._ver_propios = set()
                 self._ver_ajenos = {j._nombre for j in self._jugadores}
 
+    def _pedir_ronda_especial(self, obligador: Jugador) -> str:
+        """Pide por terminal el tipo de ronda al jugador que puede obligar."""
+        eleccion = input(
+            f"{obligador._nombre}, elige si quieres jugar ronda especial o no:\n"
+            "(5) obligar cerrada\n(6) obligar abierta\n(7) Jugar ronda normal\n\nR: "
+        )
+        while eleccion not in (
+            TipoRondaEspecial.CERRADA.value,
+            TipoRondaEspecial.ABIERTA.value,
+            TipoRondaEspecial.NORMAL.value,
+        ):
+            self._limpiar_terminal()
+            self._salida("\nOpción incorrecta.\n")
+            eleccion = input(
+                f"{obligador._nombre}, elige si quieres jugar ronda especial o no:\n"
+                "(5) obligar cerrada\n(6) obligar abierta\n(7) Jugar ronda normal\n\nR: "
+            )
+        return eleccion
+
+    def _limpiar_terminal(self):
+        """Limpia la terminal solo si la partida tiene jugadores humanos."""
+        if self._interactivo:
+            limpiar_terminal()
+
     def definir_primer_jugador(self):
         """Define el primer jugador que inicia la partida lanzando el dado."""
-        limpiar_terminal()
-        print("\nSe definirá el jugador que iniciará la primera ronda.\n")
+        self._limpiar_terminal()
+        self._salida("\nSe definirá el jugador que iniciará la primera ronda.\n")
 
-        dado = Dado()
+        dado = Dado(self._generador)
         numeros = []
         for i, jugador in enumerate(self._jugadores):
-            input(f"{jugador._nombre}, presiona enter para lanzar un dado...\n")
+            if not jugador.es_automatico():
+                input(f"{jugador._nombre}, presiona enter para lanzar un dado...\n")
             dado.generar_numero()
             numeros.append([i, dado.get_valor_numerico()])
-            print(f"Obtuviste un {numeros[i][1]}\n")
+            self._salida(f"Obtuviste un {numeros[i][1]}\n")
 
         while True:
             repeticiones = 1
@@ -353,27 +582,33 @@ class GestorPartida:
             if repeticiones == 1:
                 break
 
-            print("Ocurrio un empate.\n")
+            self._salida("Ocurrio un empate.\n")
             numeros_aux = []
             i = 0
             for num in numeros:
                 if num[1] == numero_mayor:
-                    input(
-                        f"{self._jugadores[num[0]]._nombre}, "
-                        "presiona enter para volver a lanzar tu dado...\n"
-                    )
+                    if not self._jugadores[num[0]].es_automatico():
+                        input(
+                            f"{self._jugadores[num[0]]._nombre}, "
+                            "presiona enter para volver a lanzar tu dado...\n"
+                        )
                     dado.generar_numero()
                     numeros_aux.append([num[0], dado.get_valor_numerico()])
-                    print(f"Obtuviste un {numeros_aux[i][1]}\n")
+                    self._salida(f"Obtuviste un {numeros_aux[i][1]}\n")
                     i += 1
 
             numeros = numeros_aux
 
         self._turno_actual = indice_numero_mayor
-        print(f"{self._jugadores[indice_numero_mayor]._nombre} iniciará la primera ronda.\n")
+        self._salida(f"{self._jugadores[indice_numero_mayor]._nombre} iniciará la primera ronda.\n")
 
     def definir_direccion_juego(self):
         """Permite al jugador actual elegir la dirección del juego."""
+        estrategia = self._jugadores[self._turno_actual]._estrategia
+        if estrategia is not None:
+            self._direccion_juego = estrategia.decidir_direccion()
+            return
+
         direccion = ""
         while (
             direccion.lower() != DireccionJuego.Derecha.value["Numero_str"]
@@ -393,20 +628,82 @@ class GestorPartida:
         else:
             self._direccion_juego = DireccionJuego.Izquierda
 
-    def solicitar_apuesta_a_jugador(self) -> str:
+    def solicitar_apuesta_a_jugador(self, primer_apuesta: bool = False) -> Jugada:
         """Solicita al Jugador actual que realize su apuesta."""
-        apuesta: str = self._jugadores[self._turno_actual].realizar_apuesta(
-            self._apuesta_anterior, self._apuesta_actual
+        jugador = self._jugadores[self._turno_actual]
+        contexto = None
+        if jugador.es_automatico():
+            contexto = self.crear_contexto(jugador, primer_apuesta)
+        return jugador.realizar_apuesta(self._apuesta_anterior, self._apuesta_actual, contexto)
+
+    def crear_contexto(self, jugador: Jugador, primer_apuesta: bool) -> ContextoApuesta:
+        """Construye lo que 'jugador' puede ver de la mesa para tomar una decision."""
+        modo = self._modo_especial
+        caras_propias = None
+        if modo is None or (
+            modo == TipoRondaEspecial.CERRADA and jugador._nombre in self._ver_propios
+        ):
+            caras_propias = jugador._cacho.get_caras()
+
+        caras_ajenas = bytearray()
+        dados_rivales = []
+        dados_ocultos = 0 if caras_propias is not None else jugador._cacho._cantidad_agitada
+        # Se suman los histogramas ya contados de los cachos que el jugador puede ver
+        histograma_visible = [0] * LARGO_HISTOGRAMA
+        # Los rivales se recorren en el orden en que juegan a partir del siguiente
+        paso = -1 if self._direccion_juego is DireccionJuego.Izquierda else 1
+        posicion = self._jugadores.index(jugador)
+        for desplazamiento in range(len(self._jugadores)):
+            indice = (posicion + paso * desplazamiento) % len(self._jugadores)
+            otro = self._jugadores[indice]
+            if otro is jugador:
+                visible = caras_propias is not None
+            else:
+                dados_rivales.append(otro._cacho._cantidad_agitada)
+                visible = modo == TipoRondaEspecial.ABIERTA and jugador._nombre in self._ver_ajenos
+                if visible:
+                    caras_ajenas.extend(otro._cacho.get_caras())
+                else:
+                    dados_ocultos += otro._cacho._cantidad_agitada
+            if visible:
+                cuentas = self.histograma_jugador(indice)
+                histograma_visible = [a + b for a, b in zip(histograma_visible, cuentas)]
+
+        dados_propios = jugador.get_cantidad_dados()
+        dados_en_juego = self.dados_en_juego()
+        return ContextoApuesta(
+            nombre=jugador._nombre,
+            apuesta_anterior=self._apuesta_anterior,
+            apuesta_actual=self._apuesta_actual,
+            primer_apuesta=primer_apuesta,
+            caras_propias=caras_propias,
+            caras_ajenas_visibles=bytes(caras_ajenas),
+            dados_ocultos=dados_ocultos,
+            dados_propios=dados_propios,
+            dados_en_juego=dados_en_juego,
+            dados_maximos=self._total_dados_iniciales,
+            ronda_especial=self._ronda_especial,
+            modo_especial=modo,
+            puede_calzar=ValidadorApuesta.puede_calzar(
+                dados_en_juego=dados_en_juego,
+                dados_maximos=self._total_dados_iniciales,
+                dados_del_jugador=dados_propios,
+            ),
+            puede_partir_con_ases=ValidadorApuesta.puede_partir_con_ases(
+                dados_propios, self._obligar_usado.get(jugador._nombre, False)
+            ),
+            histograma_visible=histograma_visible,
+            jugadores_en_juego=len(self._jugadores),
+            dados_rivales=tuple(dados_rivales),
         )
-        return apuesta
 
-    def validar_apuesta_subir(self, primer_apuesta: bool, apuesta_tokenizada) -> str:
+    def validar_apuesta_subir(self, primer_apuesta: bool, apuesta: Jugada) -> str:
         """Valida 'subir' en el contexto actual y guía el bucle de entrada.
 
         Devuelve STR_BREAK para aceptar la jugada o STR_CONTINUE para solicitar otra.
         """
         if primer_apuesta:
-            if apuesta_tokenizada[2] == str(NombreDado.AS).lower():
+            if apuesta.pinta == NombreDado.AS.value:
                 if ValidadorApuesta.puede_partir_con_ases(
                     self._jugadores[self._turno_actual]._dados_en_posecion,
                     self._obligar_usado.get(self._jugadores[self._turno_actual]._nombre, False),
@@ -416,31 +713,31 @@ class GestorPartida:
                     return STR_CONTINUE
             else:
                 return STR_BREAK
-        elif self._apuesta_actual == str(TipoApuesta.PASAR):
-            apuesta_anterior = self._apuesta_anterior.split(" ")
-            if ValidadorApuesta.puede_subir(
-                Apuesta(int(apuesta_anterior[1]), NombreDado.a_enum(apuesta_anterior[2])),
-                Apuesta(int(apuesta_tokenizada[1]), NombreDado.a_enum(apuesta_tokenizada[2])),
-                self._ronda_especial,
-                self._jugadores[self._turno_actual].get_cantidad_dados() == 1,
-            ):
-                return STR_BREAK
-            return STR_CONTINUE
-        else:
-            apuesta_actual = self._apuesta_actual.split(" ")
-            if ValidadorApuesta.puede_subir(
-                Apuesta(int(apuesta_actual[1]), NombreDado.a_enum(apuesta_actual[2])),
-                Apuesta(int(apuesta_tokenizada[1]), NombreDado.a_enum(apuesta_tokenizada[2])),
-                self._ronda_especial,
-                self._jugadores[self._turno_actual].get_cantidad_dados() == 1,
-            ):
-                return STR_BREAK
-            return STR_CONTINUE
+
+        # Tras un pasar se compara contra la apuesta anterior
+        referencia = apuesta_de_referencia(self._apuesta_anterior, self._apuesta_actual)
+        if referencia is None:
+            return STR_BREAK
+        modo = modo_subida(
+            self._ronda_especial, self._jugadores[self._turno_actual].get_cantidad_dados() == 1
+        )
+        if es_subida_legal(
+            referencia.cantidad, referencia.pinta, apuesta.cantidad, apuesta.pinta, modo
+        ):
+            return STR_BREAK
+        return STR_CONTINUE
 
     def eliminar_jugador(self, indice_jugador: int):
         """Elimina a un Jugador de los Jugadores en Juego."""
         if self._jugadores[indice_jugador].get_cantidad_dados() == 0:
+            self._registrar(EVENTO_ELIMINADO, self._jugadores[indice_jugador])
             self._jugadores.pop(indice_jugador)
+            self._histogramas_jugadores = None
+            self._histograma_mesa = None
+            if indice_jugador < self._turno_actual:
+                self._turno_actual -= 1
+            if self._turno_actual >= len(self._jugadores):
+                self._turno_actual = 0
 
     def calcular_turno(self, direccion_derecha: bool):
         """Calcula el turno del jugador actual."""
@@ -0,0 +1,152 @@
+"""Módulo que indexa las apuestas del juego Dudo y precalcula las subidas legales.
+
+Cada apuesta (cantidad, pinta) tiene un rango entero denso: (cantidad - 1) * 6 + (pinta - 1).
+Para cada apuesta vigente y modo de ronda se guarda la cantidad minima legal por pinta, de
+modo que validar una subida es una comparacion y listar las subidas es leer una tupla.
+"""
+
+from functools import lru_cache
+
+CARAS = 6
+
+# Cantidad minima usada para las pintas a las que no se puede cambiar
+IMPOSIBLE = 1 << 30
+
+# Modos de subida: ronda normal, ronda especial y ronda especial con un solo dado
+MODO_NORMAL = 0
+MODO_ESPECIAL = 1
+MODO_ESPECIAL_UN_DADO = 2
+MODOS = (MODO_NORMAL, MODO_ESPECIAL, MODO_ESPECIAL_UN_DADO)
+
+_AS = 1
+
+
+def modo_subida(ronda_especial: bool, con_un_dado: bool) -> int:
+    """Modo de subida segun el tipo de ronda y si quien sube tiene un solo dado."""
+    if not ronda_especial:
+        return MODO_NORMAL
+    return MODO_ESPECIAL_UN_DADO if con_un_dado else MODO_ESPECIAL
+
+
+def rango_apuesta(cantidad: int, pinta: int) -> int:
+    """Rango denso de la apuesta; crece con la cantidad y luego con la pinta."""
+    return (cantidad - 1) * CARAS + (pinta - 1)
+
+
+def apuesta_de_rango(rango: int) -> tuple[int, int]:
+    """Retorna la (cantidad, pinta) del rango."""
+    cantidad, pinta = divmod(rango, CARAS)
+    return cantidad + 1, pinta + 1
+
+
+def minimo_cambio_a_ases(cantidad: int) -> int:
+    """Cantidad minima de ases al cambiar desde otra pinta: la mitad mas uno."""
+    return cantidad // 2 + 1
+
+
+def minimo_desde_ases(cantidad: int) -> int:
+    """Cantidad minima de otra pinta al dejar los ases: el doble mas uno."""
+    return cantidad * 2 + 1
+
+
+@lru_cache(maxsize=4096)
+def minimos_subida(cantidad: int, pinta: int, modo: int) -> tuple[int, ...]:
+    """Cantidad minima legal de cada pinta (indice 1..6) para subir sobre la apuesta."""
+    minimos = [IMPOSIBLE] * (CARAS + 1)
+    for nueva in range(1, CARAS + 1):
+        if modo == MODO_NORMAL:
+            if nueva == _AS and pinta != _AS:
+                minimos[nueva] = minimo_cambio_a_ases(cantidad)
+            elif pinta == _AS and nueva != _AS:
+                minimos[nueva] = minimo_desde_ases(cantidad)
+            elif nueva > pinta:
+                minimos[nueva] = cantidad
+            else:
+                minimos[nueva] = cantidad + 1
+        elif nueva == pinta or modo == MODO_ESPECIAL_UN_DADO:
+            # En ronda especial solo se sube la cantidad, y la pinta queda fija
+            minimos[nueva] = cantidad + 1
+    return tuple(minimos)
+
+
+def es_subida_legal(
+    cantidad_actual: int, pinta_actual: int, cantidad_nueva: int, pinta_nueva: int, modo: int
+) -> bool:
+    """Indica si (cantidad_nueva, pinta_nueva) puede subir sobre la apuesta actual."""
+    return cantidad_nueva >= minimos_subida(cantidad_actual, pinta_actual, modo)[pinta_nueva]
+
+
+class TablaApuestas:
+    """Subidas legales de todas las apuestas hasta 'cantidad_maxima' dados."""
+
+    __slots__ = ("cantidad_maxima", "_minimos", "_subidas", "_aperturas")
+
+    cantidad_maxima: int
+    _minimos: tuple[tuple[tuple[int, ...], ...], ...]
+    _subidas: dict[tuple[int, int], tuple[int, ...]]
+    _aperturas: tuple[tuple[int, ...], tuple[int, ...]]
+
+    def __init__(self, cantidad_maxima: int):
+        """Precalcula los minimos por modo y rango; cada lista de subidas se arma una vez."""
+        if cantidad_maxima < 1:
+            raise ValueError("La cantidad maxima debe ser positiva")
+
+        self.cantidad_maxima = cantidad_maxima
+        todas = tuple(range(self.total_rangos()))
+        self._minimos = tuple(
+            tuple(minimos_subida(*apuesta_de_rango(rango), modo) for rango in todas)
+            for modo in MODOS
+        )
+        self._subidas = {}
+        sin_ases = tuple(rango for rango in todas if rango % CARAS != _AS - 1)
+        self._aperturas = (sin_ases, todas)
+
+    def total_rangos(self) -> int:
+        """Cantidad de apuestas distintas de la tabla."""
+        return self.cantidad_maxima * CARAS
+
+    def aperturas(self, con_ases: bool) -> tuple[int, ...]:
+        """Rangos con los que se puede partir la ronda, ordenados."""
+        return self._aperturas[con_ases]
+
+    def minimos(self, rango: int, modo: int) -> tuple[int, ...]:
+        """Cantidad minima legal de cada pinta para subir sobre la apuesta 'rango'."""
+        if rango < self.total_rangos():
+            return self._minimos[modo][rango]
+        return minimos_subida(*apuesta_de_rango(rango), modo)
+
+    def es_subida_legal(self, rango_actual: int, rango_nuevo: int, modo: int) -> bool:
+        """Indica si la apuesta 'rango_nuevo' puede subir sobre 'rango_actual'."""
+        cantidad, pinta = divmod(rango_nuevo, CARAS)
+        return cantidad + 1 >= self.minimos(rango_actual, modo)[pinta + 1]
+
+    def subidas_legales(self, rango: int, modo: int) -> tuple[int, ...]:
+        """Rangos ordenados de las subidas legales sobre la apuesta 'rango'.
+
+        La apuesta vigente puede superar la cantidad maxima; desde ella aun se puede
+        cambiar a ases.
+        """
+        clave = (rango, modo)
+        subidas = self._subidas.get(clave)
+        if subidas is None:
+            minimos = self.minimos(rango, modo)
+            subidas = tuple(
+                sorted(
+                    rango_apuesta(cantidad, pinta)
+                    for pinta in range(1, CARAS + 1)
+                    for cantidad in range(minimos[pinta], self.cantidad_maxima + 1)
+                )
+            )
+            self._subidas[clave] = subidas
+        return subidas
+
+    def subida_minima(self, rango: int, modo: int) -> int | None:
+        """Rango de la subida legal mas baja, None si no queda ninguna."""
+        subidas = self.subidas_legales(rango, modo)
+        return subidas[0] if subidas else None
+
+
+@lru_cache(maxsize=64)
+def tabla_apuestas(cantidad_maxima: int) -> TablaApuestas:
+    """Tabla compartida para la cantidad maxima de dados dada."""
+    return TablaApuestas(cantidad_maxima)
@@ -0,0 +1,119 @@
+"""Módulo que contiene la representacion tipada de las jugadas del juego Dudo."""
+
+from enum import Enum
+from typing import NamedTuple
+
+from src.game.dado import NombreDado
+from src.game.indice_apuestas import apuesta_de_rango, rango_apuesta
+from src.game.validador_apuesta import Apuesta
+
+
+class TipoApuesta(Enum):
+    """
+    Enumeracion que posee los Tipos de Apuestas Validas en el Juego Dudo.
+
+    El value asignado es un numero en string el cual indica que numero de opcion es.
+    """
+
+    SUBIR = "1"
+    PASAR = "2"
+    DUDAR = "3"
+    CALZAR = "4"
+
+    def __str__(self):
+        """Al usar str() se retorna el Tipo de Apuesta pero en minusculas."""
+        return _NOMBRES_TIPO[self]
+
+
+_NOMBRES_TIPO = {
+    TipoApuesta.SUBIR: "subir",
+    TipoApuesta.PASAR: "pasar",
+    TipoApuesta.DUDAR: "dudar",
+    TipoApuesta.CALZAR: "calzar",
+}
+_TIPOS_POR_NOMBRE = {nombre: tipo for tipo, nombre in _NOMBRES_TIPO.items()}
+
+
+class Jugada(NamedTuple):
+    """Jugada inmutable; 'cantidad' y 'pinta' (cara 1..6) solo tienen sentido al subir.
+
+    Circula asi por Jugador, GestorPartida y ArbitroRonda; el texto solo se usa para
+    mostrarla o leerla en la terminal.
+    """
+
+    tipo: TipoApuesta
+    cantidad: int = 0
+    pinta: int = 0
+
+    @staticmethod
+    def subir(cantidad: int, pinta: int | NombreDado) -> "Jugada":
+        """Crea una subida de 'cantidad' dados de 'pinta'."""
+        if isinstance(pinta, NombreDado):
+            pinta = pinta.value
+        return Jugada(TipoApuesta.SUBIR, cantidad, pinta)
+
+    @staticmethod
+    def desde_texto(texto: str) -> "Jugada":
+        """Lee una jugada escrita como 'subir 3 tren', 'pasar', 'dudar' o 'calzar'."""
+        tokens = texto.lower().split(" ")
+        tipo = _TIPOS_POR_NOMBRE.get(tokens[0])
+        if tipo is None or (tipo == TipoApuesta.SUBIR) != (len(tokens) == 3):
+            raise ValueError(f"Jugada inválida: {texto}")
+        if tipo != TipoApuesta.SUBIR:
+            return Jugada(tipo)
+        if not tokens[1].isdigit():
+            raise ValueError(f"Jugada inválida: {texto}")
+        return Jugada.subir(int(tokens[1]), NombreDado.a_enum(tokens[2]))
+
+    def es_subida(self) -> bool:
+        """Indica si la jugada es una subida."""
+        return self.tipo is TipoApuesta.SUBIR
+
+    def a_apuesta(self) -> Apuesta:
+        """Convierte una subida en la Apuesta que usa ValidadorApuesta."""
+        return Apuesta(self.cantidad, NombreDado(self.pinta))
+
+    def __str__(self):
+        """Texto de la jugada tal como se muestra en la terminal (Ej: 'subir 3 tren')."""
+        if self.tipo is not TipoApuesta.SUBIR:
+            return _NOMBRES_TIPO[self.tipo]
+        return f"subir {self.cantidad} {str(NombreDado(self.pinta)).lower()}"
+
+
+JUGADA_PASAR = Jugada(TipoApuesta.PASAR)
+JUGADA_DUDAR = Jugada(TipoApuesta.DUDAR)
+JUGADA_CALZAR = Jugada(TipoApuesta.CALZAR)
+
+# Codigos enteros de las jugadas para los motores por lotes; subir usa 3 + rango
+CODIGO_DUDAR = 0
+CODIGO_CALZAR = 1
+CODIGO_PASAR = 2
+CODIGO_SUBIR = 3
+
+_JUGADAS_SIN_SUBIR = (JUGADA_DUDAR, JUGADA_CALZAR, JUGADA_PASAR)
+_CODIGOS_SIN_SUBIR = {jugada.tipo: codigo for codigo, jugada in enumerate(_JUGADAS_SIN_SUBIR)}
+
+
+def codigo_jugada(jugada: Jugada) -> int:
+    """Codigo entero de la jugada."""
+    if jugada.tipo is TipoApuesta.SUBIR:
+        return CODIGO_SUBIR + rango_apuesta(jugada.cantidad, jugada.pinta)
+    return _CODIGOS_SIN_SUBIR[jugada.tipo]
+
+
+def jugada_de_codigo(codigo: int) -> Jugada:
+    """Jugada correspondiente al codigo entero."""
+    if codigo < 0:
+        raise ValueError(f"Codigo de jugada inválido: {codigo}")
+    if codigo < CODIGO_SUBIR:
+        return _JUGADAS_SIN_SUBIR[codigo]
+    return Jugada(TipoApuesta.SUBIR, *apuesta_de_rango(codigo - CODIGO_SUBIR))
+
+
+def apuesta_de_referencia(
+    apuesta_anterior: Jugada | None, apuesta_actual: Jugada | None
+) -> Jugada | None:
+    """Subida contra la que se comparan las jugadas: tras un pasar es la anterior."""
+    if apuesta_actual is not None and apuesta_actual.tipo is TipoApuesta.PASAR:
+        return apuesta_anterior
+    return apuesta_actual
@@ -1,32 +1,15 @@
 """Módulo que contiene la clase Jugador para el juego Dudo."""
 
-from enum import Enum
+from typing import TYPE_CHECKING
 
 from src.game.cacho import Cacho
 from src.game.dado import NombreDado
+from src.game.jugada import JUGADA_CALZAR, JUGADA_DUDAR, JUGADA_PASAR, Jugada, TipoApuesta
+from src.game.salida import Salida
+from src.services.generador_aleatorio import GeneradorAleatorio
 
-
-class TipoApuesta(Enum):
-    """
-    Enumeracion que posee los Tipos de Apuestas Validas en el Juego Dudo.
-
-    El value asignado es un numero en string el cual indica que numero de opcion es.
-    """
-
-    SUBIR = "1"
-    PASAR = "2"
-    DUDAR = "3"
-    CALZAR = "4"
-
-    def __str__(self):
-        """Al usar str() se retorna el Tipo de Apuesta pero en minusculas."""
-        traduccion = {
-            TipoApuesta.SUBIR: "subir",
-            TipoApuesta.PASAR: "pasar",
-            TipoApuesta.DUDAR: "dudar",
-            TipoApuesta.CALZAR: "calzar",
-        }
-        return traduccion[self]
+if TYPE_CHECKING:
+    from src.game.estrategia import ContextoApuesta, Estrategia
 
 
 class Jugador:
@@ -35,41 +18,73 @@ class Jugador:
     _cacho: Cacho
     _dados_en_posecion: int
     _nombre: str
-
-    def __init__(self, nombre):
-        """Inicializa el jugador con un cacho y 5 dados en posesión."""
+    _estrategia: "Estrategia | None"
+    _salida: Salida
+    _dados_perdidos: int
+
+    def __init__(
+        self,
+        nombre,
+        estrategia: "Estrategia | None" = None,
+        salida: Salida = print,
+        generador: GeneradorAleatorio | None = None,
+    ):
+        """Inicializa el jugador con un cacho y 5 dados en posesión.
+
+        Si recibe una estrategia sus decisiones no se piden por terminal.
+        """
         self._nombre = nombre
-        self._cacho = Cacho()
+        self._cacho = Cacho(generador)
         self._dados_en_posecion = 5
+        self._estrategia = estrategia
+        self._salida = salida
+        self._dados_perdidos = 0
+
+    def es_automatico(self) -> bool:
+        """Indica si las decisiones del jugador las toma una estrategia."""
+        return self._estrategia is not None
 
     def agitar_cacho(self):
         """Agita el cacho del jugador con la cantidad de dados en posesión."""
         self._cacho.agitar(cantidad=self._dados_en_posecion)
-        print("Cacho Agitado")
+        self._salida("Cacho Agitado")
 
     def ver_cacho(self):
         """Muestra los resultados de los dados en el cacho del jugador."""
-        print("Tu cacho:")
+        self._salida("Tu cacho:")
 
         resultados = self._cacho.get_resultados()
 
         if resultados is None:
-            print("\tEsta Oculto, no puedes ver el contenido")
+            self._salida("\tEsta Oculto, no puedes ver el contenido")
             return
 
         if len(resultados) == 0:
-            print("\tNo tienes dados para ver, tu cacho esta vacio")
+            self._salida("\tNo tienes dados para ver, tu cacho esta vacio")
             return
 
         for i, resultado in enumerate(resultados):
-            print(f"\tDado {i + 1}: {resultado}")
+            self._salida(f"\tDado {i + 1}: {resultado}")
 
         return resultados
 
-    def realizar_apuesta(self, apuesta_anterior: str, apuesta_actual: str) -> str:
-        """Permite al Jugador realizar una apuesta."""
-        hay_apuesta_anterior: bool = apuesta_anterior != ""
-        hay_apuesta_actual: bool = apuesta_actual != ""
+    def realizar_apuesta(
+        self,
+        apuesta_anterior: Jugada | None,
+        apuesta_actual: Jugada | None,
+        contexto: "ContextoApuesta | None" = None,
+    ) -> Jugada:
+        """Permite al Jugador realizar una apuesta.
+
+        Los jugadores automaticos delegan en su estrategia, que requiere el contexto.
+        """
+        if self._estrategia is not None:
+            if contexto is None:
+                raise ValueError("Un jugador automatico necesita el contexto de la apuesta")
+            return self._estrategia.decidir_apuesta(contexto)
+
+        hay_apuesta_anterior: bool = apuesta_anterior is not None
+        hay_apuesta_actual: bool = apuesta_actual is not None
         indicaciones = "\n"
         numeros_validos = ["1"]
 
@@ -85,7 +100,7 @@ class Jugador:
             "Ingrese el número correspondiente a la apuesta que quiere realizar:\n1: Subir\n"
         )
         if hay_apuesta_actual:
-            if apuesta_actual != str(TipoApuesta.PASAR):
+            if apuesta_actual != JUGADA_PASAR:
                 indicaciones += "2: Pasar\n"
                 numeros_validos.append("2")
 
@@ -98,7 +113,7 @@ class Jugador:
 
         apuesta = input(indicaciones)
         while apuesta not in numeros_validos:
-            print("\nLa jugada ingresada no es valida, ingrese una nueva jugada.")
+            self._salida("\nLa jugada ingresada no es valida, ingrese una nueva jugada.")
             apuesta = input(indicaciones)
 
         if apuesta == TipoApuesta.SUBIR.value:
@@ -113,13 +128,14 @@ class Jugador:
                     "\nIngrese la cantidad de dados seguido de la pinta a estimar "
                     "separados por un espacio (Ej: 5 tren):\n\nR: "
                 )
-            return f"{TipoApuesta.SUBIR} " + apuesta
+            cantidad, pinta = apuesta.split(" ")
+            return Jugada.subir(int(cantidad), NombreDado.a_enum(pinta))
         elif apuesta == TipoApuesta.PASAR.value:
-            return str(TipoApuesta.PASAR)
+            return JUGADA_PASAR
         elif apuesta == TipoApuesta.DUDAR.value:
-            return str(TipoApuesta.DUDAR)
+            return JUGADA_DUDAR
         else:
-            return str(TipoApuesta.CALZAR)
+            return JUGADA_CALZAR
 
     def get_cantidad_dados(self) -> int:
         """Retorna la cantidad de dados en posecion."""
@@ -128,6 +144,7 @@ class Jugador:
     def perder_dado(self):
         """Resta un dado al jugador."""
         self._dados_en_posecion -= 1
+        self._dados_perdidos += 1
 
     def ganar_dado(self):
         """Suma un dado al jugador."""
@@ -0,0 +1,333 @@
+"""Módulo con un motor que juega muchas partidas de Dudo a la vez en arreglos paralelos.
+
+Cada atributo de LotePartidas es un arreglo cuya primera dimension es la partida, por lo
+que un paso avanza todas las partidas con operaciones de numpy en vez de recorrer un
+GestorPartida por partida. Las reglas son las mismas de GestorPartida, ValidadorApuesta y
+ArbitroRonda; las jugadas usan los codigos enteros de src.game.jugada.
+"""
+
+import numpy as np
+
+from src.game.arbitro_ronda import ArbitroRonda
+from src.game.codigos_mano import codigos_lote
+from src.game.contador_pintas import LARGO_HISTOGRAMA, ContadorPintas
+from src.game.gestor_partida import TipoRondaEspecial
+from src.game.indice_apuestas import (
+    CARAS,
+    MODO_ESPECIAL,
+    MODO_ESPECIAL_UN_DADO,
+    MODO_NORMAL,
+)
+from src.game.jugada import CODIGO_CALZAR, CODIGO_DUDAR, CODIGO_PASAR, CODIGO_SUBIR
+from src.game.mascaras_legales import TablaMascaras, tabla_mascaras
+from src.services.generador_aleatorio import (
+    DADOS_POR_CACHO,
+    GENERADOR_GLOBAL,
+    GeneradorAleatorio,
+)
+
+# Fases en las que puede estar cada partida
+FASE_RONDA_ESPECIAL = 0
+FASE_APUESTA = 1
+FASE_TERMINADA = 2
+
+# Valor de la apuesta vigente al iniciar una ronda
+SIN_APUESTA = -1
+
+# Eleccion del obligador, en el orden de sus acciones despues de las apuestas
+ELECCIONES_ESPECIALES = (
+    TipoRondaEspecial.CERRADA,
+    TipoRondaEspecial.ABIERTA,
+    TipoRondaEspecial.NORMAL,
+)
+
+# Modo de visibilidad de la ronda: 0 sin ronda especial, 1 cerrada y 2 abierta
+MODO_SIN_ESPECIAL = 0
+MODO_CERRADA = 1
+MODO_ABIERTA = 2
+
+
+class LotePartidas:
+    """Estado de muchas partidas independientes con la misma cantidad de jugadores.
+
+    Las acciones de apuesta son CODIGO_DUDAR, CODIGO_CALZAR, CODIGO_PASAR y CODIGO_SUBIR
+    + rango, con cantidades hasta el total de dados iniciales. Les siguen las tres
+    elecciones del obligador en el orden de ELECCIONES_ESPECIALES.
+    """
+
+    partidas: int
+    jugadores: int
+    cantidad_maxima: int
+    total_acciones: int
+    primera_accion_especial: int
+    dados: np.ndarray
+    caras: np.ndarray
+    histogramas: np.ndarray
+    histograma_mesa: np.ndarray
+    turno: np.ndarray
+    direccion: np.ndarray
+    apuesta_actual: np.ndarray
+    apuesta_anterior: np.ndarray
+    ronda_especial: np.ndarray
+    modo_especial: np.ndarray
+    obligar_usado: np.ndarray
+    obligador: np.ndarray
+    fase: np.ndarray
+    ganador: np.ndarray
+    rondas: np.ndarray
+    dados_perdidos: np.ndarray
+    perdio_dado: np.ndarray
+    gano_dado: np.ndarray
+    fin_ronda: np.ndarray
+    _generador: GeneradorAleatorio
+    _mascaras: TablaMascaras
+
+    def __init__(self, partidas: int, jugadores: int, generador: GeneradorAleatorio | None = None):
+        """Crea las partidas y deja cada una esperando su primera decision."""
+        if partidas < 1:
+            raise ValueError("Debe haber al menos una partida")
+        if jugadores < 2:
+            raise ValueError("Cada partida necesita al menos 2 jugadores")
+
+        self.partidas = partidas
+        self.jugadores = jugadores
+        self.cantidad_maxima = DADOS_POR_CACHO * jugadores
+        self._mascaras = tabla_mascaras(self.cantidad_maxima)
+        self.primera_accion_especial = self._mascaras.total_acciones
+        self.total_acciones = self.primera_accion_especial + len(ELECCIONES_ESPECIALES)
+        self._generador = generador if generador is not None else GENERADOR_GLOBAL
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Vuelve todas las partidas al inicio con 5 dados por jugador."""
+        forma = (self.partidas, self.jugadores)
+        self.dados = np.zeros(forma, dtype=np.int64)
+        self.caras = np.zeros(forma + (DADOS_POR_CACHO,), dtype=np.uint8)
+        self.histogramas = np.zeros(forma + (LARGO_HISTOGRAMA,), dtype=np.int64)
+        self.histograma_mesa = np.zeros((self.partidas, LARGO_HISTOGRAMA), dtype=np.int64)
+        self.turno = np.zeros(self.partidas, dtype=np.int64)
+        self.direccion = np.ones(self.partidas, dtype=np.int64)
+        self.apuesta_actual = np.zeros(self.partidas, dtype=np.int64)
+        self.apuesta_anterior = np.zeros(self.partidas, dtype=np.int64)
+        self.ronda_especial = np.zeros(self.partidas, dtype=bool)
+        self.modo_especial = np.zeros(self.partidas, dtype=np.int64)
+        self.obligar_usado = np.zeros(forma, dtype=bool)
+        self.obligador = np.zeros(self.partidas, dtype=np.int64)
+        self.fase = np.zeros(self.partidas, dtype=np.int64)
+        self.ganador = np.zeros(self.partidas, dtype=np.int64)
+        self.rondas = np.zeros(self.partidas, dtype=np.int64)
+        self.dados_perdidos = np.zeros(forma, dtype=np.int64)
+        self.perdio_dado = np.full(self.partidas, -1, dtype=np.int64)
+        self.gano_dado = np.full(self.partidas, -1, dtype=np.int64)
+        self.fin_ronda = np.zeros(self.partidas, dtype=bool)
+        self.reiniciar_partidas(np.arange(self.partidas))
+
+    def reiniciar_partidas(self, indices: np.ndarray):
+        """Vuelve al inicio solo las partidas indicadas, sin tocar las demas."""
+        indices = np.asarray(indices, dtype=np.int64)
+        if not indices.size:
+            return
+        self.dados[indices] = DADOS_POR_CACHO
+        self.apuesta_actual[indices] = SIN_APUESTA
+        self.apuesta_anterior[indices] = SIN_APUESTA
+        self.ronda_especial[indices] = False
+        self.modo_especial[indices] = MODO_SIN_ESPECIAL
+        self.obligar_usado[indices] = False
+        self.ganador[indices] = -1
+        self.rondas[indices] = 0
+        self.dados_perdidos[indices] = 0
+
+        # Ganar el lanzamiento inicial, repitiendo los empates, es uniforme entre jugadores
+        self.turno[indices] = self._generador.enteros(self.jugadores, len(indices))
+        self.direccion[indices] = np.where(self._generador.enteros(2, len(indices)) == 0, 1, -1)
+        self._iniciar_rondas(indices)
+
+    def terminadas(self) -> np.ndarray:
+        """Arreglo booleano con las partidas que ya tienen ganador."""
+        return self.fase == FASE_TERMINADA
+
+    def jugador_en_turno(self) -> np.ndarray:
+        """Asiento que debe decidir en cada partida: el obligador o el jugador en turno."""
+        return np.where(self.fase == FASE_RONDA_ESPECIAL, self.obligador, self.turno)
+
+    def dados_en_juego(self) -> np.ndarray:
+        """Total de dados de cada partida."""
+        return self.dados.sum(axis=1)
+
+    def mascara_legal(self) -> np.ndarray:
+        """Arreglo (partidas, total_acciones) con las acciones legales de cada partida."""
+        filas = np.arange(self.partidas)
+        mascara = np.zeros((self.partidas, self.total_acciones), dtype=bool)
+        especiales = slice(self.primera_accion_especial, None)
+        mascara[self.fase == FASE_RONDA_ESPECIAL, especiales] = True
+
+        apostando = self.fase == FASE_APUESTA
+        dados_actor = self.dados[filas, self.turno]
+        hay_apuesta = self.apuesta_actual != SIN_APUESTA
+        mitad = (self.cantidad_maxima + 1) // 2
+        filas_mascara = self._mascaras.filas_lote(
+            np.where(hay_apuesta, self._referencia() - CODIGO_SUBIR, -1),
+            self.apuesta_actual == CODIGO_PASAR,
+            self._modos(dados_actor),
+            (dados_actor == 1) | (self.dados_en_juego() >= mitad),
+            (dados_actor == 1) & ~self.obligar_usado[filas, self.turno],
+        )
+        apuestas = slice(0, self.primera_accion_especial)
+        mascara[apostando, apuestas] = self._mascaras.mascaras[filas_mascara[apostando]]
+        return mascara
+
+    def paso(self, acciones: np.ndarray):
+        """Aplica la accion de cada partida en curso; las partidas terminadas la ignoran.
+
+        Tras el paso, perdio_dado y gano_dado tienen el asiento afectado (-1 si ninguno) y
+        fin_ronda marca las rondas resueltas. Las rondas nuevas se agitan de inmediato.
+        """
+        acciones = np.asarray(acciones, dtype=np.int64)
+        en_rango = (acciones >= 0) & (acciones < self.total_acciones)
+        legales = self.mascara_legal()[np.arange(self.partidas), np.where(en_rango, acciones, 0)]
+        invalidas = (self.fase != FASE_TERMINADA) & ~(en_rango & legales)
+        if invalidas.any():
+            raise ValueError(
+                f"Jugada invalida en las partidas: {np.flatnonzero(invalidas).tolist()}"
+            )
+
+        self.perdio_dado[:] = -1
+        self.gano_dado[:] = -1
+        self.fin_ronda[:] = False
+        fase = self.fase.copy()
+
+        especiales = np.flatnonzero(fase == FASE_RONDA_ESPECIAL)
+        if especiales.size:
+            self._elegir_ronda_especial(especiales, acciones[especiales])
+
+        apostando = np.flatnonzero(fase == FASE_APUESTA)
+        acciones_apuesta = acciones[apostando]
+        avanzan = apostando[(acciones_apuesta >= CODIGO_SUBIR) | (acciones_apuesta == CODIGO_PASAR)]
+        if avanzan.size:
+            self.apuesta_anterior[avanzan] = self.apuesta_actual[avanzan]
+            self.apuesta_actual[avanzan] = acciones[avanzan]
+            self.turno[avanzan] = self._siguientes_vivos(
+                avanzan, self.turno[avanzan], self.direccion[avanzan]
+            )
+
+        dudan = apostando[acciones_apuesta == CODIGO_DUDAR]
+        calzan = apostando[acciones_apuesta == CODIGO_CALZAR]
+        iniciadores = np.concatenate([self._dudar(dudan), self._calzar(calzan)])
+        self._terminar_rondas(np.concatenate([dudan, calzan]), iniciadores)
+
+    def _elegir_ronda_especial(self, indices: np.ndarray, acciones: np.ndarray):
+        """Aplica la eleccion del obligador y pasa a la fase de apuestas."""
+        eleccion = acciones - self.primera_accion_especial
+        self.obligar_usado[indices, self.obligador[indices]] = True
+        especial = eleccion != ELECCIONES_ESPECIALES.index(TipoRondaEspecial.NORMAL)
+        self.ronda_especial[indices] = especial
+        self.modo_especial[indices] = np.where(especial, eleccion + 1, MODO_SIN_ESPECIAL)
+        self.fase[indices] = FASE_APUESTA
+
+    def _dudar(self, indices: np.ndarray) -> np.ndarray:
+        """Resuelve los 'dudar' y retorna el asiento que pierde el dado en cada partida."""
+        if not indices.size:
+            return indices
+        turno = self.turno[indices]
+        anterior = self._siguientes_vivos(indices, turno, -self.direccion[indices])
+        pases = self.apuesta_actual[indices] == CODIGO_PASAR
+        rangos = np.maximum(self.apuesta_actual[indices] - CODIGO_SUBIR, 0)
+        pierde_anterior = ArbitroRonda.resolver_lote(
+            self.histograma_mesa[indices],
+            rangos // CARAS + 1,
+            rangos % CARAS + 1,
+            self.ronda_especial[indices],
+            np.full(len(indices), CODIGO_DUDAR),
+            pases=pases,
+            manos_anteriores=codigos_lote(self.histogramas[indices, anterior]),
+        )
+        perdedores = np.where(pierde_anterior, anterior, turno)
+        self._quitar_dado(indices, perdedores)
+        return perdedores
+
+    def _calzar(self, indices: np.ndarray) -> np.ndarray:
+        """Resuelve los 'calzar'; quien calza gana un dado si acierta y si no lo pierde."""
+        if not indices.size:
+            return indices
+        turno = self.turno[indices]
+        rangos = self._referencia()[indices] - CODIGO_SUBIR
+        exacto = ArbitroRonda.resolver_lote(
+            self.histograma_mesa[indices],
+            rangos // CARAS + 1,
+            rangos % CARAS + 1,
+            self.ronda_especial[indices],
+            np.full(len(indices), CODIGO_CALZAR),
+        )
+        self.dados[indices[exacto], turno[exacto]] += 1
+        self.gano_dado[indices[exacto]] = turno[exacto]
+        self._quitar_dado(indices[~exacto], turno[~exacto])
+        return turno
+
+    def _quitar_dado(self, indices: np.ndarray, asientos: np.ndarray):
+        """Quita un dado al asiento indicado de cada partida."""
+        self.dados[indices, asientos] -= 1
+        self.dados_perdidos[indices, asientos] += 1
+        self.perdio_dado[indices] = asientos
+
+    def _terminar_rondas(self, indices: np.ndarray, iniciadores: np.ndarray):
+        """Cierra las rondas resueltas y agita la siguiente en las partidas que siguen.
+
+        Parte quien perdio o calzo; si quedo sin dados parte el siguiente en el orden de
+        los asientos, como al eliminar un jugador en GestorPartida.
+        """
+        if not indices.size:
+            return
+        self.fin_ronda[indices] = True
+        self.rondas[indices] += 1
+        sigue_vivo = self.dados[indices, iniciadores] > 0
+        siguientes = self._siguientes_vivos(indices, iniciadores, np.ones_like(iniciadores))
+        self.turno[indices] = np.where(sigue_vivo, iniciadores, siguientes)
+        self.apuesta_actual[indices] = SIN_APUESTA
+        self.apuesta_anterior[indices] = SIN_APUESTA
+        self.ronda_especial[indices] = False
+        self.modo_especial[indices] = MODO_SIN_ESPECIAL
+
+        vivos = self.dados[indices] > 0
+        terminan = vivos.sum(axis=1) == 1
+        self.fase[indices[terminan]] = FASE_TERMINADA
+        self.ganador[indices[terminan]] = vivos[terminan].argmax(axis=1)
+        self._iniciar_rondas(indices[~terminan])
+
+    def _iniciar_rondas(self, indices: np.ndarray):
+        """Agita los cachos, cuenta los histogramas y busca a quien puede obligar."""
+        if not indices.size:
+            return
+        cantidades = self.dados[indices]
+        caras = self._generador.lanzar_mesa(cantidades.ravel())
+        caras = caras.reshape(len(indices), self.jugadores, DADOS_POR_CACHO)
+        self.caras[indices] = caras
+        histogramas = ContadorPintas.histogramas_lote(caras.reshape(-1, DADOS_POR_CACHO))
+        histogramas = histogramas.reshape(len(indices), self.jugadores, LARGO_HISTOGRAMA)
+        self.histogramas[indices] = histogramas
+        self.histograma_mesa[indices] = histogramas.sum(axis=1)
+
+        # Obliga el primero, en el orden de los asientos, con un dado y sin haber obligado
+        candidatos = (cantidades == 1) & ~self.obligar_usado[indices]
+        hay_obligador = candidatos.any(axis=1)
+        self.obligador[indices] = np.where(hay_obligador, candidatos.argmax(axis=1), -1)
+        self.fase[indices] = np.where(hay_obligador, FASE_RONDA_ESPECIAL, FASE_APUESTA)
+
+    def _referencia(self) -> np.ndarray:
+        """Codigo de la subida vigente de cada partida; tras un pasar es la anterior."""
+        return np.where(
+            self.apuesta_actual == CODIGO_PASAR, self.apuesta_anterior, self.apuesta_actual
+        )
+
+    def _modos(self, dados_actor: np.ndarray) -> np.ndarray:
+        """Modo de subida de cada partida segun su ronda y los dados de quien sube."""
+        especial = np.where(dados_actor == 1, MODO_ESPECIAL_UN_DADO, MODO_ESPECIAL)
+        return np.where(self.ronda_especial, especial, MODO_NORMAL)
+
+    def _siguientes_vivos(
+        self, indices: np.ndarray, asientos: np.ndarray, pasos: np.ndarray
+    ) -> np.ndarray:
+        """Primer asiento con dados despues de 'asientos', avanzando en 'pasos' (1 o -1)."""
+        desplazamientos = np.arange(1, self.jugadores + 1)
+        candidatos = (asientos[:, None] + pasos[:, None] * desplazamientos) % self.jugadores
+        vivos = self.dados[indices[:, None], candidatos] > 0
+        return candidatos[np.arange(len(indices)), vivos.argmax(axis=1)]
@@ -0,0 +1,157 @@
+"""Módulo con las mascaras de acciones legales del juego Dudo, precalculadas por estado.
+
+Las acciones legales de un turno solo dependen de la apuesta de referencia, de si la
+vigente es un 'pasar', del modo de subida, de si el jugador puede calzar y, al partir la
+ronda, de si puede partir con ases. Para cada combinacion se guarda una mascara booleana de
+solo lectura sobre los codigos de src.game.jugada, de modo que obtenerla es leer una fila.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from src.game.estrategia import ContextoApuesta
+from src.game.indice_apuestas import CARAS, MODOS, modo_subida, rango_apuesta, tabla_apuestas
+from src.game.jugada import (
+    CODIGO_CALZAR,
+    CODIGO_DUDAR,
+    CODIGO_PASAR,
+    CODIGO_SUBIR,
+    TipoApuesta,
+    apuesta_de_referencia,
+)
+
+# Filas de las aperturas: sin y con ases
+FILAS_APERTURA = 2
+
+# Mascaras ya armadas por otro proceso, por cantidad maxima (ver usar_mascaras_externas)
+_MASCARAS_EXTERNAS: dict[int, np.ndarray] = {}
+
+
+class TablaMascaras:
+    """Mascaras legales de todas las situaciones de una partida con 'cantidad_maxima' dados.
+
+    La fila de una apertura es 'con_ases'; las demas siguen a las aperturas ordenadas por
+    (rango de referencia, es pasar, modo, puede calzar).
+    """
+
+    __slots__ = ("cantidad_maxima", "total_acciones", "mascaras", "_cantidades", "_pintas")
+
+    cantidad_maxima: int
+    total_acciones: int
+    mascaras: np.ndarray
+    _cantidades: np.ndarray
+    _pintas: np.ndarray
+
+    def __init__(self, cantidad_maxima: int, mascaras: np.ndarray | None = None):
+        """Arma todas las mascaras y las deja de solo lectura.
+
+        Si se entregan 'mascaras' ya armadas (por ejemplo, una vista de memoria compartida)
+        solo se valida su forma y se usan sin copiarlas.
+        """
+        tabla = tabla_apuestas(cantidad_maxima)
+        total_rangos = tabla.total_rangos()
+        rangos = np.arange(total_rangos)
+        self.cantidad_maxima = cantidad_maxima
+        self.total_acciones = CODIGO_SUBIR + total_rangos
+        self._cantidades = rangos // CARAS + 1
+        self._pintas = rangos % CARAS + 1
+
+        filas = FILAS_APERTURA + total_rangos * 2 * len(MODOS) * 2
+        if mascaras is not None:
+            if mascaras.shape != (filas, self.total_acciones) or mascaras.dtype != bool:
+                raise ValueError("Las mascaras no corresponden a la cantidad maxima de dados")
+            self.mascaras = mascaras
+            return
+
+        mascaras = np.zeros((filas, self.total_acciones), dtype=bool)
+        for con_ases in (False, True):
+            mascaras[int(con_ases), CODIGO_SUBIR + np.array(tabla.aperturas(con_ases))] = True
+        for rango in range(total_rangos):
+            for es_pasar in (False, True):
+                for modo in MODOS:
+                    for puede_calzar in (False, True):
+                        fila = self.fila(rango, es_pasar, modo, puede_calzar)
+                        mascaras[fila] = self._armar(rango, es_pasar, modo, puede_calzar)
+        mascaras.flags.writeable = False
+        self.mascaras = mascaras
+
+    def fila(self, rango: int, es_pasar: bool, modo: int, puede_calzar: bool) -> int:
+        """Fila de la situacion con una apuesta de referencia de rango 'rango'."""
+        return FILAS_APERTURA + ((rango * 2 + es_pasar) * len(MODOS) + modo) * 2 + puede_calzar
+
+    def filas_lote(
+        self,
+        rangos: np.ndarray,
+        pases: np.ndarray,
+        modos: np.ndarray,
+        calzar: np.ndarray,
+        aperturas_con_ases: np.ndarray,
+    ) -> np.ndarray:
+        """Filas de muchas situaciones a la vez; un rango negativo indica una apertura."""
+        filas = FILAS_APERTURA + ((rangos * 2 + pases) * len(MODOS) + modos) * 2 + calzar
+        return np.where(rangos < 0, aperturas_con_ases.astype(np.int64), filas)
+
+    def mascara(
+        self,
+        rango: int | None,
+        es_pasar: bool = False,
+        modo: int = MODOS[0],
+        puede_calzar: bool = False,
+        con_ases: bool = False,
+    ) -> np.ndarray:
+        """Mascara de solo lectura de la situacion; rango None indica una apertura.
+
+        Si la referencia supera la tabla la mascara se calcula en el momento.
+        """
+        if rango is None:
+            return self.mascaras[int(con_ases)]
+        if rango < self.cantidad_maxima * CARAS:
+            return self.mascaras[self.fila(rango, es_pasar, modo, puede_calzar)]
+        mascara = self._armar(rango, es_pasar, modo, puede_calzar)
+        mascara.flags.writeable = False
+        return mascara
+
+    def _armar(self, rango: int, es_pasar: bool, modo: int, puede_calzar: bool) -> np.ndarray:
+        """Calcula la mascara de una situacion con apuesta de referencia."""
+        mascara = np.zeros(self.total_acciones, dtype=bool)
+        mascara[CODIGO_DUDAR] = True
+        mascara[CODIGO_CALZAR] = puede_calzar
+        mascara[CODIGO_PASAR] = not es_pasar
+        minimos = np.array(tabla_apuestas(self.cantidad_maxima).minimos(rango, modo))
+        mascara[CODIGO_SUBIR:] = self._cantidades >= minimos[self._pintas]
+        return mascara
+
+
+@lru_cache(maxsize=64)
+def tabla_mascaras(cantidad_maxima: int) -> TablaMascaras:
+    """Tabla compartida para la cantidad maxima de dados dada."""
+    return TablaMascaras(cantidad_maxima, _MASCARAS_EXTERNAS.get(cantidad_maxima))
+
+
+def usar_mascaras_externas(mascaras: dict[int, np.ndarray]):
+    """Hace que tabla_mascaras use mascaras ya armadas, indexadas por cantidad maxima."""
+    _MASCARAS_EXTERNAS.update(mascaras)
+    tabla_mascaras.cache_clear()
+
+
+def mascara_contexto(contexto: ContextoApuesta) -> np.ndarray:
+    """Mascara de las acciones legales del jugador del contexto.
+
+    Las subidas llegan hasta los dados iniciales de la partida, por lo que el largo de la
+    mascara es fijo durante toda la partida.
+    """
+    tabla = tabla_mascaras(contexto.dados_maximos)
+    if contexto.primer_apuesta:
+        return tabla.mascara(None, con_ases=contexto.puede_partir_con_ases)
+
+    referencia = apuesta_de_referencia(contexto.apuesta_anterior, contexto.apuesta_actual)
+    if referencia is None:
+        raise ValueError("No hay una apuesta vigente")
+    actual = contexto.apuesta_actual
+    return tabla.mascara(
+        rango_apuesta(referencia.cantidad, referencia.pinta),
+        es_pasar=actual is not None and actual.tipo == TipoApuesta.PASAR,
+        modo=modo_subida(contexto.ronda_especial, contexto.dados_propios == 1),
+        puede_calzar=contexto.puede_calzar,
+    )
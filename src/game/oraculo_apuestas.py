@@ -0,0 +1,104 @@
+"""Módulo que calcula la probabilidad de que una apuesta del juego Dudo sea cierta.
+
+Los dados que un jugador no ve siguen una binomial: cada uno es de la pinta con
+probabilidad 1/6, o 1/3 si los ases son comodin. Las colas de esa binomial se precalculan
+una vez por (dados ocultos, comodin, dados conocidos) y se guardan en un cache LRU.
+"""
+
+from functools import lru_cache
+from math import comb
+
+from src.game.estrategia import ContextoApuesta
+
+_AS = 1
+
+PROBABILIDAD_PINTA = 1 / 6
+PROBABILIDAD_COMODIN = 1 / 3
+
+
+def es_comodin(pinta: int, ronda_especial: bool) -> bool:
+    """Indica si los ases cuentan para 'pinta': fuera de ronda especial y si no es As."""
+    return not ronda_especial and pinta != _AS
+
+
+def cuenta_conocida(histograma: list[int], pinta: int, comodin: bool) -> int:
+    """Dados vistos que cuentan para 'pinta' segun el histograma."""
+    if comodin:
+        return histograma[pinta] + histograma[_AS]
+    return histograma[pinta]
+
+
+@lru_cache(maxsize=256)
+def tabla_binomial(ocultos: int, comodin: bool) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Probabilidades exactas y colas 'al menos k' para k = 0..ocultos de los dados ocultos."""
+    if ocultos < 0:
+        raise ValueError("La cantidad de dados ocultos no puede ser negativa")
+
+    probabilidad = PROBABILIDAD_COMODIN if comodin else PROBABILIDAD_PINTA
+    exactas = tuple(
+        comb(ocultos, k) * probabilidad**k * (1 - probabilidad) ** (ocultos - k)
+        for k in range(ocultos + 1)
+    )
+    colas = [0.0] * (ocultos + 1)
+    acumulada = 0.0
+    for k in range(ocultos, -1, -1):
+        acumulada += exactas[k]
+        colas[k] = min(acumulada, 1.0)
+    colas[0] = 1.0
+    return exactas, tuple(colas)
+
+
+class TablaProbabilidades:
+    """Probabilidades de cada cantidad total de una pinta, ya desplazadas por los conocidos."""
+
+    __slots__ = ("conocidos", "ocultos", "probabilidad", "_exactas", "_colas")
+
+    conocidos: int
+    ocultos: int
+    probabilidad: float
+    _exactas: tuple[float, ...]
+    _colas: tuple[float, ...]
+
+    def __init__(self, ocultos: int, comodin: bool, conocidos: int):
+        """Arma la tabla a partir de la binomial de los dados ocultos."""
+        self.conocidos = conocidos
+        self.ocultos = ocultos
+        self.probabilidad = PROBABILIDAD_COMODIN if comodin else PROBABILIDAD_PINTA
+        self._exactas, self._colas = tabla_binomial(ocultos, comodin)
+
+    def al_menos(self, cantidad: int) -> float:
+        """Probabilidad de que existan al menos 'cantidad' dados de la pinta."""
+        faltantes = cantidad - self.conocidos
+        if faltantes <= 0:
+            return 1.0
+        if faltantes > self.ocultos:
+            return 0.0
+        return self._colas[faltantes]
+
+    def exacta(self, cantidad: int) -> float:
+        """Probabilidad de que existan exactamente 'cantidad' dados de la pinta."""
+        faltantes = cantidad - self.conocidos
+        if faltantes < 0 or faltantes > self.ocultos:
+            return 0.0
+        return self._exactas[faltantes]
+
+    def esperada(self) -> float:
+        """Cantidad esperada de dados de la pinta."""
+        return self.conocidos + self.ocultos * self.probabilidad
+
+
+@lru_cache(maxsize=4096)
+def tabla_probabilidades(ocultos: int, comodin: bool, conocidos: int) -> TablaProbabilidades:
+    """Tabla compartida para los dados ocultos, el comodin y los dados conocidos dados."""
+    return TablaProbabilidades(ocultos, comodin, conocidos)
+
+
+def probabilidades_apuesta(contexto: ContextoApuesta, pinta: int) -> TablaProbabilidades:
+    """Tabla de la pinta segun lo que ve el jugador del contexto.
+
+    El modo de ronda especial ya esta aplicado en el contexto: define que dados entran en
+    el histograma visible y cuales en los ocultos, y si los ases son comodin.
+    """
+    comodin = es_comodin(pinta, contexto.ronda_especial)
+    conocidos = cuenta_conocida(contexto.histograma_visible, pinta, comodin)
+    return tabla_probabilidades(contexto.dados_ocultos, comodin, conocidos)
@@ -0,0 +1,10 @@
+"""Módulo con los destinos de salida de texto del juego Dudo."""
+
+from typing import Callable
+
+# Recibe cada mensaje que el juego mostraria por terminal
+Salida = Callable[[str], None]
+
+
+def salida_nula(mensaje: str) -> None:
+    """Descarta el mensaje, se usa en las partidas sin terminal."""
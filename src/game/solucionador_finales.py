@@ -0,0 +1,601 @@
+"""Módulo que resuelve los finales de partida del juego Dudo y guarda sus tablas en disco.
+
+Un final es una ronda entre dos jugadores con pocos dados cada uno, normal o especial
+(cerrada o abierta, como las activa GestorPartida.hay_un_dado). Cada final se resuelve una
+vez con CFR+ enumerando exactamente todas las manos posibles; el objetivo de la ronda es
+hacer perder un dado al rival o acertar un calzar. El resultado es la estrategia promedio
+de equilibrio de quien decide, indexada por (apuesta de referencia, es pasar, mano vista)
+y guardada como un arreglo .npy por final. Al cargar las tablas se abren con mmap, de modo
+que consultar una decision es leer una fila sin cargar el resto en memoria.
+
+La estrategia solo se condiciona en la apuesta vigente y no en toda la historia de la
+ronda, y no distingue quien partio la ronda: el equilibrio se calcula con quien parte
+elegido al azar. Es la abstraccion que mantiene las tablas pequeñas y de consulta directa.
+"""
+
+import json
+import math
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from src.game.codigos_mano import ES_PASE_VALIDO, codigo_mano, codigos_lote
+from src.game.estrategia import ContextoApuesta, Estrategia
+from src.game.gestor_partida import DireccionJuego, TipoRondaEspecial
+from src.game.indice_apuestas import CARAS, modo_subida, rango_apuesta
+from src.game.jugada import (
+    CODIGO_CALZAR,
+    CODIGO_PASAR,
+    CODIGO_SUBIR,
+    Jugada,
+    TipoApuesta,
+    apuesta_de_referencia,
+    jugada_de_codigo,
+)
+from src.game.mascaras_legales import mascara_contexto, tabla_mascaras
+from src.services.generador_aleatorio import DADOS_POR_CACHO, GeneradorAleatorio
+
+# Tipos de final segun lo que ve cada jugador
+FINAL_NORMAL = 0
+FINAL_CERRADA_PROPIA = 1
+FINAL_CERRADA_RIVAL = 2
+FINAL_ABIERTA = 3
+TIPOS_FINAL = (FINAL_NORMAL, FINAL_CERRADA_PROPIA, FINAL_CERRADA_RIVAL, FINAL_ABIERTA)
+
+# Dados por jugador hasta los que se resuelven los finales por omision
+MAXIMO_DADOS_FINAL = 3
+
+ARCHIVO_INDICE = "indice.json"
+
+# Eje de las manos conjuntas (mano propia, mano rival) que ve cada jugador en cada tipo de
+# final; None si no ve ningun cacho
+_EJES_VISTA = {
+    FINAL_NORMAL: (0, 1),
+    FINAL_CERRADA_PROPIA: (0, None),
+    FINAL_CERRADA_RIVAL: (None, 1),
+    FINAL_ABIERTA: (1, 0),
+}
+
+_AS = 1
+_PINTAS_CON_COMODIN = slice(_AS + 1, None)
+_YO = 0
+_RIVAL = 1
+
+
+class ConfiguracionFinal(NamedTuple):
+    """Final visto por quien decide: sus dados, los del rival y lo que puede hacer.
+
+    'partir_con_ases' solo importa si el jugador parte la ronda; 'calzar_libre' indica si
+    hay en juego al menos la mitad de los dados iniciales, caso en que ambos pueden calzar.
+    """
+
+    mis_dados: int
+    dados_rival: int
+    tipo: int
+    partir_con_ases: bool = False
+    calzar_libre: bool = False
+
+    def nombre(self) -> str:
+        """Nombre del archivo de la tabla, sin extension."""
+        return (
+            f"final_{self.mis_dados}_{self.dados_rival}_{self.tipo}"
+            f"_{int(self.partir_con_ases)}_{int(self.calzar_libre)}"
+        )
+
+    def es_valida(self) -> bool:
+        """Indica si el final puede darse en una partida."""
+        if self.mis_dados < 1 or self.dados_rival < 1 or self.tipo not in TIPOS_FINAL:
+            return False
+        if self.partir_con_ases and (self.mis_dados != 1 or self.tipo == FINAL_CERRADA_PROPIA):
+            # Quien obliga ya uso su opcion de partir con ases
+            return False
+        if self.calzar_libre and self.mis_dados + self.dados_rival < DADOS_POR_CACHO:
+            return False
+        if self.tipo == FINAL_CERRADA_PROPIA:
+            return self.mis_dados == 1
+        if self.tipo == FINAL_CERRADA_RIVAL:
+            return self.dados_rival == 1
+        if self.tipo == FINAL_ABIERTA:
+            return self.mis_dados == 1 or self.dados_rival == 1
+        return True
+
+    @staticmethod
+    def desde_contexto(contexto: ContextoApuesta) -> "ConfiguracionFinal | None":
+        """Final del contexto; None si no es una ronda de dos jugadores."""
+        if contexto.jugadores_en_juego != 2:
+            return None
+        if contexto.modo_especial == TipoRondaEspecial.CERRADA:
+            tipo = (
+                FINAL_CERRADA_PROPIA if contexto.caras_propias is not None else FINAL_CERRADA_RIVAL
+            )
+        elif contexto.modo_especial == TipoRondaEspecial.ABIERTA:
+            tipo = FINAL_ABIERTA
+        else:
+            tipo = FINAL_NORMAL
+        return ConfiguracionFinal(
+            contexto.dados_propios,
+            contexto.dados_en_juego - contexto.dados_propios,
+            tipo,
+            contexto.puede_partir_con_ases and contexto.dados_propios == 1,
+            contexto.dados_en_juego >= (contexto.dados_maximos + 1) // 2,
+        )
+
+
+def configuraciones_finales(maximo_dados: int = MAXIMO_DADOS_FINAL) -> list[ConfiguracionFinal]:
+    """Todos los finales validos con hasta 'maximo_dados' dados por jugador."""
+    return [
+        configuracion
+        for mis_dados in range(1, maximo_dados + 1)
+        for dados_rival in range(1, maximo_dados + 1)
+        for tipo in TIPOS_FINAL
+        for partir_con_ases in (False, True)
+        for calzar_libre in (False, True)
+        if (
+            configuracion := ConfiguracionFinal(
+                mis_dados, dados_rival, tipo, partir_con_ases, calzar_libre
+            )
+        ).es_valida()
+    ]
+
+
+@lru_cache(maxsize=DADOS_POR_CACHO + 1)
+def manos_final(dados: int) -> tuple[np.ndarray, np.ndarray, dict[int, int]]:
+    """Histogramas (manos, 7), probabilidades y posicion por codigo de las manos de 'dados'."""
+    combinaciones = list(combinations_with_replacement(range(1, CARAS + 1), dados))
+    histogramas = np.zeros((len(combinaciones), CARAS + 1), dtype=np.int64)
+    probabilidades = np.empty(len(combinaciones))
+    for indice, caras in enumerate(combinaciones):
+        for cara in caras:
+            histogramas[indice, cara] += 1
+        # Multinomial: ordenes distintos de la misma mano sobre 6 ** dados tiradas
+        ordenes = math.factorial(dados)
+        for cuenta in histogramas[indice, 1:]:
+            ordenes //= math.factorial(int(cuenta))
+        probabilidades[indice] = ordenes / CARAS**dados
+    posiciones = {int(codigo): indice for indice, codigo in enumerate(codigos_lote(histogramas))}
+    histogramas.flags.writeable = False
+    probabilidades.flags.writeable = False
+    return histogramas, probabilidades, posiciones
+
+
+class _RondaFinal:
+    """Ronda de un final como grafo de situaciones (referencia, es pasar, quien decide).
+
+    Las manos de ambos jugadores se enumeran como pares (mano propia, mano rival); cada
+    situacion guarda sus acciones legales, la situacion a la que lleva cada una (-1 si
+    termina la ronda) y el valor para el jugador propio de dudar y calzar en cada par.
+    """
+
+    __slots__ = (
+        "configuracion",
+        "total_rangos",
+        "azar",
+        "ejes",
+        "vistas",
+        "situaciones",
+        "acciones",
+        "hijos",
+        "finales",
+    )
+
+    configuracion: ConfiguracionFinal
+    total_rangos: int
+    azar: np.ndarray
+    ejes: tuple[int | None, int | None]
+    vistas: tuple[int, int]
+    situaciones: list[int]
+    acciones: dict[int, np.ndarray]
+    hijos: dict[int, list[int]]
+    finales: dict[int, list[np.ndarray]]
+
+    def __init__(self, configuracion: ConfiguracionFinal):
+        """Arma el grafo de la ronda y los valores de sus acciones terminales."""
+        if not configuracion.es_valida():
+            raise ValueError(f"Final invalido: {configuracion}")
+        self.configuracion = configuracion
+        dados = (configuracion.mis_dados, configuracion.dados_rival)
+        total_dados = sum(dados)
+        self.total_rangos = total_dados * CARAS
+        manos = [manos_final(cantidad) for cantidad in dados]
+        self.azar = np.outer(manos[_YO][1], manos[_RIVAL][1])
+        self.ejes = _EJES_VISTA[configuracion.tipo]
+        vista_propia, vista_rival = (1 if eje is None else len(manos[eje][1]) for eje in self.ejes)
+        self.vistas = (vista_propia, vista_rival)
+
+        especial = configuracion.tipo != FINAL_NORMAL
+        # Cuenta de cada pinta en cada par de manos, con los ases como comodin si corresponde
+        cuentas = manos[_YO][0][:, None, :] + manos[_RIVAL][0][None, :, :]
+        if not especial:
+            cuentas[:, :, _PINTAS_CON_COMODIN] += cuentas[:, :, [_AS]]
+        pases = [
+            np.frombuffer(ES_PASE_VALIDO, dtype=np.uint8)[codigos_lote(manos[quien][0])] == 1
+            for quien in (_YO, _RIVAL)
+        ]
+        pase_rival_valido = np.broadcast_to(pases[_RIVAL][None, :], self.azar.shape)
+        pase_propio_valido = np.broadcast_to(pases[_YO][:, None], self.azar.shape)
+
+        tabla = tabla_mascaras(total_dados)
+        ases = (configuracion.partir_con_ases, False)
+        calzar = [configuracion.calzar_libre or cantidad == 1 for cantidad in dados]
+        modos = [modo_subida(especial, cantidad == 1) for cantidad in dados]
+
+        self.situaciones = []
+        self.acciones = {}
+        self.hijos = {}
+        self.finales = {}
+        for referencia in range(-1, self.total_rangos):
+            for es_pasar in (False, True):
+                if referencia < 0 and es_pasar:
+                    continue
+                for quien in (_YO, _RIVAL):
+                    situacion = indice_situacion(referencia, es_pasar, quien)
+                    if referencia < 0:
+                        mascara = tabla.mascara(None, con_ases=ases[quien])
+                    else:
+                        mascara = tabla.mascara(referencia, es_pasar, modos[quien], calzar[quien])
+                    acciones = np.flatnonzero(mascara)
+                    hijos = []
+                    finales = []
+                    for accion in acciones.tolist():
+                        if accion == CODIGO_PASAR:
+                            hijos.append(indice_situacion(referencia, True, 1 - quien))
+                        elif accion >= CODIGO_SUBIR:
+                            hijos.append(indice_situacion(accion - CODIGO_SUBIR, False, 1 - quien))
+                        else:
+                            hijos.append(-1)
+                            cantidad, pinta = divmod(referencia, CARAS)
+                            cuenta = cuentas[:, :, pinta + 1]
+                            if accion == CODIGO_CALZAR:
+                                gana = cuenta == cantidad + 1
+                            elif es_pasar:
+                                # Se duda el pase de quien acaba de jugar
+                                pase = pase_rival_valido if quien == _YO else pase_propio_valido
+                                gana = ~pase
+                            else:
+                                gana = cuenta < cantidad + 1
+                            valor = np.where(gana, 1.0, -1.0)
+                            finales.append(valor if quien == _YO else -valor)
+                    self.situaciones.append(situacion)
+                    self.acciones[situacion] = acciones
+                    self.hijos[situacion] = hijos
+                    self.finales[situacion] = finales
+        self.situaciones = self._orden_topologico()
+
+    def _orden_topologico(self) -> list[int]:
+        """Situaciones ordenadas de modo que cada una aparece antes que sus hijos.
+
+        El rango no sirve de orden: cambiar a ases es subir a un rango menor.
+        """
+        entrantes = dict.fromkeys(self.situaciones, 0)
+        for situacion in self.situaciones:
+            for hijo in self.hijos[situacion]:
+                if hijo >= 0:
+                    entrantes[hijo] += 1
+        pendientes = [situacion for situacion, cuenta in entrantes.items() if cuenta == 0]
+        orden = []
+        while pendientes:
+            situacion = pendientes.pop()
+            orden.append(situacion)
+            for hijo in self.hijos[situacion]:
+                if hijo >= 0:
+                    entrantes[hijo] -= 1
+                    if entrantes[hijo] == 0:
+                        pendientes.append(hijo)
+        return orden
+
+    def raices(self) -> tuple[int, int]:
+        """Situaciones de apertura con cada jugador partiendo la ronda."""
+        return indice_situacion(-1, False, _YO), indice_situacion(-1, False, _RIVAL)
+
+    def expandir(self, estrategia: np.ndarray, quien: int) -> np.ndarray:
+        """Estrategia por mano vista llevada a todos los pares de manos."""
+        if self.ejes[quien] == 0:
+            return estrategia[:, None, :]
+        return estrategia[None, :, :]
+
+    def reducir(self, valores: np.ndarray, quien: int) -> np.ndarray:
+        """Suma por mano vista de valores dados por par de manos."""
+        eje = self.ejes[quien]
+        if eje is None:
+            return valores.sum(axis=(0, 1))[None, :]
+        return valores.sum(axis=1 - eje)
+
+    def valores_acciones(self, situacion: int, valores: dict[int, np.ndarray]) -> np.ndarray:
+        """Valor para el jugador propio de cada accion de la situacion, por par de manos."""
+        hijos = self.hijos[situacion]
+        finales = self.finales[situacion]
+        columnas = []
+        terminal = 0
+        for hijo in hijos:
+            if hijo < 0:
+                columnas.append(finales[terminal])
+                terminal += 1
+            else:
+                columnas.append(valores[hijo])
+        return np.stack(columnas, axis=-1)
+
+    def evaluar(
+        self, estrategias: dict[int, np.ndarray]
+    ) -> tuple[dict[int, np.ndarray], dict[int, np.ndarray]]:
+        """Valor de cada situacion y de sus acciones para el jugador propio, por par de manos."""
+        valores: dict[int, np.ndarray] = {}
+        acciones: dict[int, np.ndarray] = {}
+        for situacion in reversed(self.situaciones):
+            quien = situacion % 2
+            valores_accion = self.valores_acciones(situacion, valores)
+            politica = self.expandir(estrategias[situacion], quien)
+            valores[situacion] = (politica * valores_accion).sum(axis=-1)
+            acciones[situacion] = valores_accion
+        return valores, acciones
+
+    def valor(self, estrategias: dict[int, np.ndarray]) -> float:
+        """Valor esperado de la ronda para el jugador propio, con quien parte al azar."""
+        valores, _ = self.evaluar(estrategias)
+        return float(sum((self.azar * valores[raiz]).sum() for raiz in self.raices()) / 2)
+
+
+def indice_situacion(referencia: int, es_pasar: bool, quien: int) -> int:
+    """Indice de una situacion; referencia -1 indica la apertura."""
+    return ((referencia + 1) * 2 + es_pasar) * 2 + quien
+
+
+def _regret_matching(regrets: np.ndarray) -> np.ndarray:
+    """Estrategia proporcional a los arrepentimientos positivos, o uniforme si no hay."""
+    total = regrets.sum(axis=-1, keepdims=True)
+    uniforme = np.full_like(regrets, 1.0 / regrets.shape[-1])
+    return np.where(total > 0, regrets / np.where(total > 0, total, 1.0), uniforme)
+
+
+def resolver_final(
+    configuracion: ConfiguracionFinal, iteraciones: int = 400
+) -> tuple[np.ndarray, float]:
+    """Resuelve el final con CFR+ y retorna la tabla del jugador propio y el valor de la ronda.
+
+    La tabla tiene forma (referencia + 1, es pasar, mano vista, codigo de accion) y guarda
+    la probabilidad de cada accion; las acciones ilegales y las situaciones del rival
+    quedan en cero.
+    """
+    if iteraciones < 1:
+        raise ValueError("Se necesita al menos una iteracion")
+    ronda = _RondaFinal(configuracion)
+    regrets = {
+        situacion: np.zeros((ronda.vistas[situacion % 2], len(ronda.acciones[situacion])))
+        for situacion in ronda.situaciones
+    }
+    sumas = {situacion: np.zeros_like(regret) for situacion, regret in regrets.items()}
+
+    for iteracion in range(1, iteraciones + 1):
+        estrategias = {situacion: _regret_matching(r) for situacion, r in regrets.items()}
+        # Alcance de cada situacion por las acciones de cada jugador, sumado sobre caminos
+        alcances = {
+            situacion: [np.zeros_like(ronda.azar), np.zeros_like(ronda.azar)]
+            for situacion in ronda.situaciones
+        }
+        for raiz in ronda.raices():
+            alcances[raiz] = [np.ones_like(ronda.azar), np.ones_like(ronda.azar)]
+        for situacion in ronda.situaciones:
+            quien = situacion % 2
+            propio, ajeno = alcances[situacion][quien], alcances[situacion][1 - quien]
+            politica = ronda.expandir(estrategias[situacion], quien)
+            for columna, hijo in enumerate(ronda.hijos[situacion]):
+                if hijo >= 0:
+                    alcances[hijo][quien] += propio * politica[:, :, columna]
+                    alcances[hijo][1 - quien] += ajeno
+
+        valores, valores_accion = ronda.evaluar(estrategias)
+        for situacion in ronda.situaciones:
+            quien = situacion % 2
+            if quien != iteracion % 2:
+                continue
+            signo = 1.0 if quien == _YO else -1.0
+            propio, ajeno = alcances[situacion][quien], alcances[situacion][1 - quien]
+            ventaja = valores_accion[situacion] - valores[situacion][:, :, None]
+            peso = (ronda.azar * ajeno)[:, :, None]
+            regrets[situacion] = np.maximum(
+                regrets[situacion] + signo * ronda.reducir(peso * ventaja, quien), 0.0
+            )
+            politica = ronda.expandir(estrategias[situacion], quien)
+            alcance = (ronda.azar * propio)[:, :, None] * politica
+            sumas[situacion] += iteracion * ronda.reducir(alcance, quien)
+
+    promedio = {situacion: _regret_matching(suma) for situacion, suma in sumas.items()}
+    tabla = np.zeros(
+        (ronda.total_rangos + 1, 2, ronda.vistas[_YO], CODIGO_SUBIR + ronda.total_rangos),
+        dtype=np.float32,
+    )
+    for situacion in ronda.situaciones:
+        if situacion % 2 == _YO:
+            referencia, es_pasar = divmod(situacion // 2, 2)
+            tabla[referencia, es_pasar][:, ronda.acciones[situacion]] = promedio[situacion]
+    return tabla, ronda.valor(promedio)
+
+
+class TablasFinales:
+    """Tablas de estrategia de los finales resueltos, con su valor para quien decide."""
+
+    __slots__ = ("_tablas", "_valores")
+
+    _tablas: dict[ConfiguracionFinal, np.ndarray]
+    _valores: dict[ConfiguracionFinal, float]
+
+    def __init__(
+        self,
+        tablas: dict[ConfiguracionFinal, np.ndarray],
+        valores: dict[ConfiguracionFinal, float],
+    ):
+        """Agrupa tablas ya calculadas o cargadas."""
+        self._tablas = tablas
+        self._valores = valores
+
+    def __len__(self) -> int:
+        """Cantidad de finales con tabla."""
+        return len(self._tablas)
+
+    def __contains__(self, configuracion: object) -> bool:
+        """Indica si el final tiene tabla."""
+        return configuracion in self._tablas
+
+    @classmethod
+    def calcular(
+        cls, maximo_dados: int = MAXIMO_DADOS_FINAL, iteraciones: int = 400
+    ) -> "TablasFinales":
+        """Resuelve todos los finales con hasta 'maximo_dados' dados por jugador."""
+        tablas = {}
+        valores = {}
+        for configuracion in configuraciones_finales(maximo_dados):
+            tablas[configuracion], valores[configuracion] = resolver_final(
+                configuracion, iteraciones
+            )
+        return cls(tablas, valores)
+
+    @classmethod
+    def cargar(cls, directorio: str | Path) -> "TablasFinales":
+        """Abre las tablas guardadas en 'directorio' mapeadas en memoria, de solo lectura."""
+        directorio = Path(directorio)
+        with open(directorio / ARCHIVO_INDICE, encoding="utf-8") as archivo:
+            indice = json.load(archivo)
+        tablas = {}
+        valores = {}
+        for entrada in indice:
+            configuracion = ConfiguracionFinal(*entrada["configuracion"])
+            tablas[configuracion] = np.load(directorio / entrada["archivo"], mmap_mode="r")
+            valores[configuracion] = entrada["valor"]
+        return cls(tablas, valores)
+
+    @classmethod
+    def cargar_o_calcular(
+        cls,
+        directorio: str | Path,
+        maximo_dados: int = MAXIMO_DADOS_FINAL,
+        iteraciones: int = 400,
+    ) -> "TablasFinales":
+        """Carga las tablas de 'directorio'; si no existen las resuelve y las guarda primero."""
+        if not (Path(directorio) / ARCHIVO_INDICE).exists():
+            cls.calcular(maximo_dados, iteraciones).guardar(directorio)
+        return cls.cargar(directorio)
+
+    def guardar(self, directorio: str | Path):
+        """Guarda un .npy por final y un indice JSON con sus configuraciones y valores."""
+        directorio = Path(directorio)
+        directorio.mkdir(parents=True, exist_ok=True)
+        indice = []
+        for configuracion, tabla in self._tablas.items():
+            nombre = f"{configuracion.nombre()}.npy"
+            np.save(directorio / nombre, tabla)
+            indice.append(
+                {
+                    "configuracion": list(configuracion),
+                    "archivo": nombre,
+                    "valor": self._valores[configuracion],
+                }
+            )
+        # El indice se escribe al final: si existe, las tablas estan completas
+        with open(directorio / ARCHIVO_INDICE, "w", encoding="utf-8") as archivo:
+            json.dump(indice, archivo, indent=1)
+
+    def valor(self, configuracion: ConfiguracionFinal) -> float | None:
+        """Valor esperado de la ronda para quien decide; None si el final no tiene tabla."""
+        return self._valores.get(configuracion)
+
+    def distribucion(self, contexto: ContextoApuesta) -> np.ndarray | None:
+        """Probabilidad de cada codigo de accion en el contexto; None si no hay tabla.
+
+        El largo es el de las acciones del final, menor o igual al de mascara_contexto.
+        """
+        configuracion = ConfiguracionFinal.desde_contexto(contexto)
+        tabla = None if configuracion is None else self._tablas.get(configuracion)
+        if configuracion is None or tabla is None:
+            return None
+        vista = _vista(contexto, configuracion)
+        if vista is None:
+            return None
+        if contexto.primer_apuesta:
+            return tabla[0, 0, vista]
+
+        referencia = apuesta_de_referencia(contexto.apuesta_anterior, contexto.apuesta_actual)
+        if referencia is None:
+            return None
+        rango = rango_apuesta(referencia.cantidad, referencia.pinta)
+        if rango + 1 >= tabla.shape[0]:
+            # Una apuesta mayor que los dados en juego queda fuera del final
+            return None
+        actual = contexto.apuesta_actual
+        es_pasar = actual is not None and actual.tipo == TipoApuesta.PASAR
+        return tabla[rango + 1, int(es_pasar), vista]
+
+
+def _vista(contexto: ContextoApuesta, configuracion: ConfiguracionFinal) -> int | None:
+    """Posicion de la mano que ve quien decide, o 0 si no ve ninguna."""
+    eje = _EJES_VISTA[configuracion.tipo][_YO]
+    if eje is None:
+        return 0
+    if eje == 0:
+        caras, dados = contexto.caras_propias, configuracion.mis_dados
+    else:
+        caras, dados = contexto.caras_ajenas_visibles, configuracion.dados_rival
+    if caras is None or len(caras) != dados:
+        return None
+    histograma = [caras.count(cara) for cara in range(CARAS + 1)]
+    return manos_final(dados)[2].get(codigo_mano(histograma))
+
+
+class EstrategiaFinales:
+    """Estrategia que juega los finales con las tablas y delega el resto de la partida.
+
+    Como obligador elige el tipo de ronda de mayor valor segun las tablas. Fuera de los
+    finales resueltos decide 'respaldo'; por omision una EstrategiaMCTS.
+    """
+
+    _tablas: TablasFinales
+    _respaldo: Estrategia
+    _generador: GeneradorAleatorio
+
+    def __init__(
+        self,
+        tablas: TablasFinales,
+        respaldo: Estrategia | None = None,
+        generador: GeneradorAleatorio | None = None,
+    ):
+        """Inicializa la estrategia con las tablas ya cargadas."""
+        self._generador = generador if generador is not None else GeneradorAleatorio()
+        if respaldo is None:
+            from src.game.estrategia_mcts import EstrategiaMCTS
+
+            respaldo = EstrategiaMCTS(self._generador)
+        self._tablas = tablas
+        self._respaldo = respaldo
+
+    def decidir_apuesta(self, contexto: ContextoApuesta) -> Jugada:
+        """Sortea la accion segun la tabla del final, o delega si no hay tabla."""
+        distribucion = self._tablas.distribucion(contexto)
+        if distribucion is not None:
+            pesos = distribucion * mascara_contexto(contexto)[: len(distribucion)]
+            acumulados = np.cumsum(pesos)
+            if acumulados[-1] > 0:
+                sorteo = self._generador.aleatorio() * acumulados[-1]
+                codigo = int(np.searchsorted(acumulados, sorteo, side="right"))
+                return jugada_de_codigo(min(codigo, len(acumulados) - 1))
+        return self._respaldo.decidir_apuesta(contexto)
+
+    def decidir_ronda_especial(self, contexto: ContextoApuesta) -> TipoRondaEspecial:
+        """Elige el tipo de ronda de mayor valor si los tres tienen tabla."""
+        base = ConfiguracionFinal.desde_contexto(contexto)
+        if base is not None:
+            # Al obligar se pierde la opcion de partir con ases
+            base = base._replace(partir_con_ases=False)
+            opciones = {
+                TipoRondaEspecial.NORMAL: base._replace(tipo=FINAL_NORMAL),
+                TipoRondaEspecial.CERRADA: base._replace(tipo=FINAL_CERRADA_PROPIA),
+                TipoRondaEspecial.ABIERTA: base._replace(tipo=FINAL_ABIERTA),
+            }
+            valores = {tipo: self._tablas.valor(final) for tipo, final in opciones.items()}
+            if all(valor is not None for valor in valores.values()):
+                return max(valores, key=lambda tipo: valores[tipo] or 0.0)
+        return self._respaldo.decidir_ronda_especial(contexto)
+
+    def decidir_direccion(self) -> DireccionJuego:
+        """Delega la direccion del juego."""
+        return self._respaldo.decidir_direccion()
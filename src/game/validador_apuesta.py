@@ -1,6 +1,7 @@
 """Módulo que contiene las clases Apuesta y ValidadorApuesta para el juego Dudo."""
 
 from src.game.dado import NombreDado
+from src.game.indice_apuestas import es_subida_legal, modo_subida
 
 
 class Apuesta:
@@ -28,39 +29,13 @@ class ValidadorApuesta:
         actual: Apuesta, nueva: Apuesta, ronda_especial: bool = False, con_un_dado: bool = False
     ) -> bool:
         """Valida si una nueva apuesta es válida respecto a la actual."""
-        if actual.pinta != NombreDado.AS and nueva.pinta == NombreDado.AS and not ronda_especial:
-            return ValidadorApuesta._validar_cambio_a_ases(actual.cantidad, nueva.cantidad)
-
-        if actual.pinta == NombreDado.AS and nueva.pinta != NombreDado.AS and not ronda_especial:
-            return ValidadorApuesta._validar_desde_ases(actual.cantidad, nueva.cantidad)
-
-        if nueva.cantidad > actual.cantidad:
-            if (not ronda_especial or con_un_dado) or nueva.pinta.value == actual.pinta.value:
-                return True
-            else:
-                return False
-
-        if nueva.cantidad < actual.cantidad or (
-            nueva.cantidad == actual.cantidad and ronda_especial
-        ):
-            return False
-
-        return nueva.pinta.value > actual.pinta.value
-
-    @staticmethod
-    def _validar_cambio_a_ases(cantidad_actual: int, cantidad_nueva: int) -> bool:
-        """Valida el cambio de una apuesta normal a Ases."""
-        if cantidad_actual % 2 == 0:
-            minimo = (cantidad_actual // 2) + 1
-        else:
-            minimo = (cantidad_actual + 1) // 2
-        return cantidad_nueva >= minimo
-
-    @staticmethod
-    def _validar_desde_ases(cantidad_actual: int, cantidad_nueva: int) -> bool:
-        """Valida el cambio desde Ases hacia otra pinta."""
-        minimo = (cantidad_actual * 2) + 1
-        return cantidad_nueva >= minimo
+        return es_subida_legal(
+            actual.cantidad,
+            actual.pinta.value,
+            nueva.cantidad,
+            nueva.pinta.value,
+            modo_subida(ronda_especial, con_un_dado),
+        )
 
     @staticmethod
     def puede_calzar(dados_en_juego: int, dados_maximos: int, dados_del_jugador: int) -> bool:
@@ -0,0 +1,293 @@
+"""Módulo con el almacen SQLite de resultados de torneos de Dudo.
+
+Guarda una fila por partida, una por asiento y una por cada par ordenado de estrategias
+distintas que se enfrentaron. La tabla de enfrentamientos esta ordenada por (estrategia,
+rival, asientos), por lo que la tasa de victoria de A contra B con N asientos se lee de un
+rango contiguo sin recorrer el resto.
+
+La base usa WAL: un solo escritor inserta por lotes, cada lote en una transaccion, mientras
+otros procesos consultan.
+"""
+
+import sqlite3
+from itertools import permutations
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS partidas (
+    torneo INTEGER NOT NULL,
+    indice INTEGER NOT NULL,
+    semilla INTEGER NOT NULL,
+    asientos INTEGER NOT NULL,
+    ganador INTEGER NOT NULL,
+    estrategia_ganadora TEXT NOT NULL,
+    rondas INTEGER NOT NULL,
+    rondas_especiales INTEGER NOT NULL,
+    PRIMARY KEY (torneo, indice)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS jugadores (
+    torneo INTEGER NOT NULL,
+    indice INTEGER NOT NULL,
+    asiento INTEGER NOT NULL,
+    estrategia TEXT NOT NULL,
+    dados_perdidos INTEGER NOT NULL,
+    gano INTEGER NOT NULL,
+    PRIMARY KEY (torneo, indice, asiento)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS enfrentamientos (
+    estrategia TEXT NOT NULL,
+    rival TEXT NOT NULL,
+    asientos INTEGER NOT NULL,
+    torneo INTEGER NOT NULL,
+    indice INTEGER NOT NULL,
+    gano INTEGER NOT NULL,
+    PRIMARY KEY (estrategia, rival, asientos, torneo, indice)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS partidas_asientos ON partidas (asientos);
+CREATE INDEX IF NOT EXISTS jugadores_estrategia ON jugadores (estrategia, gano);
+"""
+
+# SQLite guarda enteros de 64 bits con signo; las semillas derivadas no tienen signo
+_DESPLAZAMIENTO_SEMILLA = 1 << 64
+_MAXIMO_CON_SIGNO = 1 << 63
+
+
+class ResultadoPartida(NamedTuple):
+    """Resultado de una partida de un torneo, tal como se guarda en el almacen."""
+
+    torneo: int
+    indice: int
+    semilla: int
+    estrategias: tuple[str, ...]
+    ganador: int
+    rondas: int
+    rondas_especiales: int
+    dados_perdidos: tuple[int, ...]
+
+
+def conectar(ruta: str | Path) -> sqlite3.Connection:
+    """Abre la base en modo WAL y crea las tablas que falten."""
+    conexion = sqlite3.connect(ruta)
+    conexion.execute("PRAGMA journal_mode=WAL")
+    # Con WAL basta sincronizar en los checkpoints; un corte no corrompe la base
+    conexion.execute("PRAGMA synchronous=NORMAL")
+    conexion.executescript(ESQUEMA)
+    return conexion
+
+
+def _semilla_con_signo(semilla: int) -> int:
+    """Semilla sin signo de 64 bits como entero con signo de SQLite."""
+    return semilla - _DESPLAZAMIENTO_SEMILLA if semilla >= _MAXIMO_CON_SIGNO else semilla
+
+
+def _semilla_sin_signo(semilla: int) -> int:
+    """Inversa de _semilla_con_signo."""
+    return semilla + _DESPLAZAMIENTO_SEMILLA if semilla < 0 else semilla
+
+
+class EscritorResultados:
+    """Unico escritor del almacen: acumula resultados y los inserta por lotes.
+
+    Volver a guardar una partida (mismo torneo e indice) reemplaza la anterior.
+    """
+
+    __slots__ = ("_conexion", "_pendientes", "_tamano_lote")
+
+    _conexion: sqlite3.Connection
+    _pendientes: list[ResultadoPartida]
+    _tamano_lote: int
+
+    def __init__(self, ruta: str | Path, tamano_lote: int = 5000):
+        """Abre o crea el almacen en 'ruta'."""
+        if tamano_lote < 1:
+            raise ValueError("El tamaño del lote debe ser positivo")
+        self._conexion = conectar(ruta)
+        self._pendientes = []
+        self._tamano_lote = tamano_lote
+
+    def agregar(self, resultados: Iterable[ResultadoPartida]):
+        """Agrega resultados; se insertan al completar un lote."""
+        self._pendientes.extend(resultados)
+        if len(self._pendientes) >= self._tamano_lote:
+            self.vaciar()
+
+    def vaciar(self):
+        """Inserta los resultados pendientes en una sola transaccion."""
+        if not self._pendientes:
+            return
+        # Si una partida se agrego dos veces en el lote vale la ultima
+        self._pendientes = list(
+            {
+                (resultado.torneo, resultado.indice): resultado for resultado in self._pendientes
+            }.values()
+        )
+        partidas = []
+        jugadores = []
+        enfrentamientos = []
+        for resultado in self._pendientes:
+            torneo, indice = resultado.torneo, resultado.indice
+            ganadora = resultado.estrategias[resultado.ganador]
+            asientos = len(resultado.estrategias)
+            partidas.append(
+                (
+                    torneo,
+                    indice,
+                    _semilla_con_signo(resultado.semilla),
+                    asientos,
+                    resultado.ganador,
+                    ganadora,
+                    resultado.rondas,
+                    resultado.rondas_especiales,
+                )
+            )
+            for asiento, (estrategia, perdidos) in enumerate(
+                zip(resultado.estrategias, resultado.dados_perdidos)
+            ):
+                gano = asiento == resultado.ganador
+                jugadores.append((torneo, indice, asiento, estrategia, perdidos, gano))
+            for estrategia, rival in permutations(sorted(set(resultado.estrategias)), 2):
+                gano = estrategia == ganadora
+                enfrentamientos.append((estrategia, rival, asientos, torneo, indice, gano))
+
+        with self._conexion:
+            self._borrar_anteriores()
+            self._conexion.executemany(
+                "INSERT OR REPLACE INTO partidas VALUES (?, ?, ?, ?, ?, ?, ?, ?)", partidas
+            )
+            self._conexion.executemany(
+                "INSERT OR REPLACE INTO jugadores VALUES (?, ?, ?, ?, ?, ?)", jugadores
+            )
+            self._conexion.executemany(
+                "INSERT OR REPLACE INTO enfrentamientos VALUES (?, ?, ?, ?, ?, ?)",
+                enfrentamientos,
+            )
+        self._pendientes = []
+
+    def _borrar_anteriores(self):
+        """Borra los jugadores y enfrentamientos de las partidas pendientes ya guardadas.
+
+        Una partida guardada antes con otros asientos o estrategias dejaria filas que el
+        reemplazo no pisa. Los enfrentamientos se borran por su clave completa, armada con
+        las estrategias guardadas, para no recorrer la tabla.
+        """
+        jugadores = []
+        enfrentamientos = []
+        for resultado in self._pendientes:
+            clave = (resultado.torneo, resultado.indice)
+            estrategias = [
+                estrategia
+                for (estrategia,) in self._conexion.execute(
+                    "SELECT estrategia FROM jugadores WHERE torneo = ? AND indice = ?", clave
+                )
+            ]
+            if not estrategias:
+                continue
+            jugadores.append(clave)
+            for estrategia, rival in permutations(sorted(set(estrategias)), 2):
+                enfrentamientos.append((estrategia, rival, len(estrategias), *clave))
+        self._conexion.executemany(
+            "DELETE FROM jugadores WHERE torneo = ? AND indice = ?", jugadores
+        )
+        self._conexion.executemany(
+            "DELETE FROM enfrentamientos "
+            "WHERE estrategia = ? AND rival = ? AND asientos = ? AND torneo = ? AND indice = ?",
+            enfrentamientos,
+        )
+
+    def cerrar(self):
+        """Inserta lo pendiente y cierra la conexion."""
+        self.vaciar()
+        self._conexion.close()
+
+    def __enter__(self) -> "EscritorResultados":
+        """Permite usar el escritor con 'with'."""
+        return self
+
+    def __exit__(self, *excepcion):
+        """Cierra el escritor al salir del bloque."""
+        self.cerrar()
+
+
+class ConsultaResultados:
+    """Consultas sobre un almacen de resultados, que puede estar recibiendo inserciones."""
+
+    __slots__ = ("_conexion",)
+
+    _conexion: sqlite3.Connection
+
+    def __init__(self, ruta: str | Path):
+        """Abre el almacen en 'ruta'."""
+        self._conexion = conectar(ruta)
+
+    def partidas(self, asientos: int | None = None) -> int:
+        """Cantidad de partidas guardadas, opcionalmente solo las de 'asientos' asientos."""
+        if asientos is None:
+            fila = self._conexion.execute("SELECT COUNT(*) FROM partidas").fetchone()
+        else:
+            fila = self._conexion.execute(
+                "SELECT COUNT(*) FROM partidas WHERE asientos = ?", (asientos,)
+            ).fetchone()
+        return fila[0]
+
+    def victorias_contra(
+        self, estrategia: str, rival: str, asientos: int | None = None
+    ) -> tuple[int, int]:
+        """(victorias de 'estrategia', partidas en que enfrento a 'rival')."""
+        consulta = (
+            "SELECT COALESCE(SUM(gano), 0), COUNT(*) FROM enfrentamientos "
+            "WHERE estrategia = ? AND rival = ?"
+        )
+        parametros: tuple = (estrategia, rival)
+        if asientos is not None:
+            consulta += " AND asientos = ?"
+            parametros += (asientos,)
+        victorias, partidas = self._conexion.execute(consulta, parametros).fetchone()
+        return victorias, partidas
+
+    def tasa_victoria_contra(
+        self, estrategia: str, rival: str, asientos: int | None = None
+    ) -> float:
+        """Fraccion de las partidas contra 'rival' que gano 'estrategia'."""
+        victorias, partidas = self.victorias_contra(estrategia, rival, asientos)
+        return victorias / partidas if partidas else 0.0
+
+    def tasas_victoria(self, asientos: int | None = None) -> dict[str, float]:
+        """Victorias sobre asientos jugados por estrategia, como ResultadosTorneo."""
+        consulta = "SELECT estrategia, AVG(gano) FROM jugadores"
+        parametros: tuple = ()
+        if asientos is not None:
+            consulta += " JOIN partidas USING (torneo, indice) WHERE asientos = ?"
+            parametros = (asientos,)
+        consulta += " GROUP BY estrategia"
+        return dict(self._conexion.execute(consulta, parametros).fetchall())
+
+    def partida(self, torneo: int, indice: int) -> ResultadoPartida | None:
+        """Resultado guardado de la partida, o None si no esta."""
+        fila = self._conexion.execute(
+            "SELECT semilla, ganador, rondas, rondas_especiales FROM partidas "
+            "WHERE torneo = ? AND indice = ?",
+            (torneo, indice),
+        ).fetchone()
+        if fila is None:
+            return None
+        semilla, ganador, rondas, especiales = fila
+        jugadores = self._conexion.execute(
+            "SELECT estrategia, dados_perdidos FROM jugadores "
+            "WHERE torneo = ? AND indice = ? ORDER BY asiento",
+            (torneo, indice),
+        ).fetchall()
+        return ResultadoPartida(
+            torneo,
+            indice,
+            _semilla_sin_signo(semilla),
+            tuple(estrategia for estrategia, _ in jugadores),
+            ganador,
+            rondas,
+            especiales,
+            tuple(perdidos for _, perdidos in jugadores),
+        )
+
+    def cerrar(self):
+        """Cierra la conexion."""
+        self._conexion.close()
@@ -0,0 +1,170 @@
+"""Módulo con un almacen de tablas NumPy compartidas entre procesos sin copiarlas.
+
+El proceso principal escribe una sola vez todas las tablas en un archivo, alineadas a 64
+bytes, y reparte un descriptor pequeño con el nombre, tipo, forma y posicion de cada una.
+Cada trabajador abre el archivo con mmap y arma vistas de solo lectura sobre el: no
+recalcula ni deserializa nada, y las paginas fisicas las comparte el sistema operativo. Si
+no se indica ruta el archivo se crea en /dev/shm, que vive en memoria.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+ALINEACION = 64
+
+_MEMORIA_COMPARTIDA = "/dev/shm"
+
+
+class EntradaTabla(NamedTuple):
+    """Ubicacion de una tabla dentro del archivo."""
+
+    nombre: str
+    tipo: str
+    forma: tuple[int, ...]
+    desplazamiento: int
+
+
+class DescriptorTablas(NamedTuple):
+    """Lo necesario para adjuntar el almacen desde otro proceso; se serializa con pickle."""
+
+    ruta: str
+    entradas: tuple[EntradaTabla, ...]
+
+
+class AlmacenTablas:
+    """Vistas de solo lectura sobre las tablas de un archivo mapeado en memoria.
+
+    Quien publica es dueño del archivo temporal y lo borra al liberar; quien adjunta solo
+    cierra su mapeo.
+    """
+
+    __slots__ = ("descriptor", "_mapa", "_vistas", "_propietario")
+
+    descriptor: DescriptorTablas
+    _mapa: np.memmap | None
+    _vistas: dict[str, np.ndarray]
+    _propietario: bool
+
+    def __init__(self, descriptor: DescriptorTablas, propietario: bool = False):
+        """Mapea el archivo del descriptor y arma una vista por tabla."""
+        self.descriptor = descriptor
+        self._propietario = propietario
+        self._mapa = None
+        self._vistas = {}
+        if os.path.getsize(descriptor.ruta) > 0:
+            self._mapa = np.memmap(descriptor.ruta, dtype=np.uint8, mode="r")
+        for entrada in descriptor.entradas:
+            tipo = np.dtype(entrada.tipo)
+            largo = int(np.prod(entrada.forma, dtype=np.int64)) * tipo.itemsize
+            if largo == 0 or self._mapa is None:
+                vista = np.zeros(entrada.forma, dtype=tipo)
+                vista.flags.writeable = False
+            else:
+                bytes_tabla = slice(entrada.desplazamiento, entrada.desplazamiento + largo)
+                vista = self._mapa[bytes_tabla].view(tipo).reshape(entrada.forma)
+            self._vistas[entrada.nombre] = vista
+
+    @classmethod
+    def publicar(
+        cls, tablas: dict[str, np.ndarray], ruta: str | Path | None = None
+    ) -> "AlmacenTablas":
+        """Escribe las tablas una vez y retorna el almacen del proceso dueño.
+
+        Sin 'ruta' se usa un archivo temporal que se borra al liberar; con 'ruta' el archivo
+        queda junto a su indice JSON y se puede volver a abrir con abrir().
+        """
+        propietario = ruta is None
+        if ruta is None:
+            directorio = _MEMORIA_COMPARTIDA if os.access(_MEMORIA_COMPARTIDA, os.W_OK) else None
+            descriptor_archivo, nombre = tempfile.mkstemp(
+                prefix="dudo_tablas_", suffix=".bin", dir=directorio
+            )
+            os.close(descriptor_archivo)
+            ruta = nombre
+
+        entradas = []
+        desplazamiento = 0
+        with open(ruta, "wb") as archivo:
+            for nombre, tabla in tablas.items():
+                contigua = np.ascontiguousarray(tabla)
+                relleno = -desplazamiento % ALINEACION
+                archivo.write(bytes(relleno))
+                desplazamiento += relleno
+                entradas.append(
+                    EntradaTabla(nombre, contigua.dtype.str, contigua.shape, desplazamiento)
+                )
+                archivo.write(contigua.data)
+                desplazamiento += contigua.nbytes
+
+        descriptor = DescriptorTablas(str(ruta), tuple(entradas))
+        if not propietario:
+            with open(_ruta_indice(ruta), "w", encoding="utf-8") as archivo:
+                json.dump([entrada._asdict() for entrada in entradas], archivo)
+        return cls(descriptor, propietario)
+
+    @classmethod
+    def adjuntar(cls, descriptor: DescriptorTablas) -> "AlmacenTablas":
+        """Almacen de un trabajador a partir del descriptor del proceso dueño."""
+        return cls(descriptor)
+
+    @classmethod
+    def abrir(cls, ruta: str | Path) -> "AlmacenTablas":
+        """Almacen publicado antes en 'ruta', a partir de su indice JSON."""
+        with open(_ruta_indice(ruta), encoding="utf-8") as archivo:
+            entradas = tuple(
+                EntradaTabla(
+                    entrada["nombre"],
+                    entrada["tipo"],
+                    tuple(entrada["forma"]),
+                    entrada["desplazamiento"],
+                )
+                for entrada in json.load(archivo)
+            )
+        return cls(DescriptorTablas(str(ruta), entradas))
+
+    def __enter__(self) -> "AlmacenTablas":
+        """Permite usar el almacen con 'with'."""
+        return self
+
+    def __exit__(self, *excepcion):
+        """Libera el almacen al salir del bloque."""
+        self.liberar()
+
+    def __len__(self) -> int:
+        """Cantidad de tablas."""
+        return len(self._vistas)
+
+    def __contains__(self, nombre: object) -> bool:
+        """Indica si hay una tabla con ese nombre."""
+        return nombre in self._vistas
+
+    def __getitem__(self, nombre: str) -> np.ndarray:
+        """Vista de solo lectura de la tabla."""
+        return self._vistas[nombre]
+
+    def nombres(self) -> list[str]:
+        """Nombres de las tablas en el orden en que se publicaron."""
+        return list(self._vistas)
+
+    def cerrar(self):
+        """Suelta el mapeo; las vistas que sigan en uso lo mantienen abierto."""
+        self._vistas = {}
+        self._mapa = None
+
+    def liberar(self):
+        """Cierra el almacen y, si es el dueño del archivo temporal, lo borra."""
+        self.cerrar()
+        if self._propietario:
+            self._propietario = False
+            # En POSIX los trabajadores que ya mapearon el archivo lo siguen leyendo
+            Path(self.descriptor.ruta).unlink(missing_ok=True)
+
+
+def _ruta_indice(ruta: str | Path) -> Path:
+    """Ruta del indice JSON de un almacen publicado en 'ruta'."""
+    return Path(f"{ruta}.json")
@@ -0,0 +1,381 @@
+"""Módulo que entrena la estrategia de CFR del juego Dudo con MCCFR en varios procesos.
+
+Cada iteracion reparte una ronda al azar (cantidad de jugadores, dados de cada uno y tipo
+de ronda) y la juega con muestreo de resultados (outcome sampling): quien se entrena explora
+con probabilidad 'exploracion' y los demas siguen la estrategia actual. El valor de la
+ronda es -1 para quien pierde un dado y +1 para quien acierta un calzar.
+
+Los bloques de iteraciones de una sincronizacion se entrenan en paralelo desde los mismos
+arrepentimientos y el entrenador suma lo que cada uno aprendio; entre sincronizaciones se
+puede guardar un checkpoint y retomar el entrenamiento desde el.
+"""
+
+import json
+import multiprocessing
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from src.game.arbitro_ronda import ArbitroRonda
+from src.game.codigos_mano import es_pase_valido
+from src.game.estrategia_cfr import (
+    RONDA_ABIERTA,
+    RONDA_CERRADA,
+    RONDA_NORMAL,
+    SIN_ACCION,
+    TOTAL_ACCIONES_CFR,
+    AbstraccionCFR,
+    SituacionCFR,
+    TablaCFR,
+    acciones_concretas,
+)
+from src.game.indice_apuestas import CARAS, apuesta_de_rango
+from src.game.jugada import CODIGO_CALZAR, CODIGO_DUDAR, CODIGO_PASAR, CODIGO_SUBIR
+from src.services.generador_aleatorio import DADOS_POR_CACHO, GeneradorAleatorio, derivar_semilla
+
+
+class ConfiguracionCFR:
+    """Parametros del entrenamiento: rondas que se reparten, abstraccion y exploracion."""
+
+    asientos: list[int]
+    abstraccion: AbstraccionCFR
+    exploracion: float
+    probabilidad_especial: float
+    semilla: int
+
+    def __init__(
+        self,
+        asientos: list[int],
+        abstraccion: AbstraccionCFR | None = None,
+        exploracion: float = 0.6,
+        probabilidad_especial: float = 0.3,
+        semilla: int = 0,
+    ):
+        """Valida e inicializa la configuracion."""
+        if not asientos or min(asientos) < 2:
+            raise ValueError("Cada ronda necesita al menos 2 asientos")
+        if not 0 < exploracion <= 1:
+            raise ValueError("La exploracion debe estar en (0, 1]")
+        if not 0 <= probabilidad_especial <= 1:
+            raise ValueError("La probabilidad de ronda especial debe estar en [0, 1]")
+        self.asientos = asientos
+        self.abstraccion = abstraccion if abstraccion is not None else AbstraccionCFR()
+        self.exploracion = exploracion
+        self.probabilidad_especial = probabilidad_especial
+        self.semilla = semilla
+
+    def a_diccionario(self) -> dict:
+        """Configuracion serializable a JSON."""
+        return {
+            "asientos": self.asientos,
+            "abstraccion": self.abstraccion._asdict(),
+            "exploracion": self.exploracion,
+            "probabilidad_especial": self.probabilidad_especial,
+            "semilla": self.semilla,
+        }
+
+    @staticmethod
+    def desde_diccionario(datos: dict) -> "ConfiguracionCFR":
+        """Configuracion guardada con a_diccionario."""
+        abstraccion = datos["abstraccion"]
+        return ConfiguracionCFR(
+            datos["asientos"],
+            AbstraccionCFR(abstraccion["desviacion_maxima"], tuple(abstraccion["limites_ocultos"])),
+            datos["exploracion"],
+            datos["probabilidad_especial"],
+            datos["semilla"],
+        )
+
+
+class _Ronda:
+    """Ronda repartida: manos, lo que ve cada asiento y las reglas de la ronda."""
+
+    __slots__ = ("jugadores", "mesa", "manos", "especial", "situaciones")
+
+    jugadores: int
+    mesa: list[int]
+    manos: list[list[int]]
+    especial: bool
+    situaciones: list[SituacionCFR]
+
+    def __init__(self, configuracion: ConfiguracionCFR, generador: GeneradorAleatorio):
+        """Reparte dados al azar y, si alguien tiene un dado, a veces una ronda especial."""
+        self.jugadores = generador.elegir(configuracion.asientos)
+        dados = [int(generador.aleatorio() * DADOS_POR_CACHO) + 1 for _ in range(self.jugadores)]
+        self.manos = []
+        for cantidad in dados:
+            mano = [0] * (CARAS + 1)
+            for cara in generador.lanzar_dados(cantidad):
+                mano[cara] += 1
+            self.manos.append(mano)
+        self.mesa = [sum(mano[cara] for mano in self.manos) for cara in range(CARAS + 1)]
+
+        obligador = dados.index(1) if 1 in dados else None
+        modo_ronda = RONDA_NORMAL
+        if obligador is not None and generador.aleatorio() < configuracion.probabilidad_especial:
+            modo_ronda = generador.elegir((RONDA_CERRADA, RONDA_ABIERTA))
+        self.especial = modo_ronda != RONDA_NORMAL
+
+        total = sum(dados)
+        dados_maximos = DADOS_POR_CACHO * self.jugadores
+        self.situaciones = []
+        for asiento, (mano, cantidad) in enumerate(zip(self.manos, dados)):
+            ve_propio = modo_ronda == RONDA_NORMAL or (
+                modo_ronda == RONDA_CERRADA and asiento == obligador
+            )
+            if ve_propio:
+                visible = mano
+            elif modo_ronda == RONDA_ABIERTA:
+                visible = [a - b for a, b in zip(self.mesa, mano)]
+            else:
+                visible = [0] * (CARAS + 1)
+            self.situaciones.append(
+                SituacionCFR(
+                    tuple(visible),
+                    total - sum(visible[1:]),
+                    cantidad,
+                    dados_maximos,
+                    None,
+                    False,
+                    es_pase_valido(mano) if ve_propio else None,
+                    self.especial,
+                    modo_ronda,
+                    cantidad == 1 or total >= (dados_maximos + 1) // 2,
+                    cantidad == 1 and asiento != obligador and generador.aleatorio() < 0.5,
+                )
+            )
+
+
+class MuestreoCFR:
+    """MCCFR con muestreo de resultados sobre arrepentimientos y sumas propios."""
+
+    __slots__ = ("configuracion", "regrets", "sumas", "_generador")
+
+    configuracion: ConfiguracionCFR
+    regrets: np.ndarray
+    sumas: np.ndarray
+    _generador: GeneradorAleatorio
+
+    def __init__(
+        self,
+        configuracion: ConfiguracionCFR,
+        regrets: np.ndarray,
+        generador: GeneradorAleatorio,
+    ):
+        """Parte desde 'regrets', que se modifica en el lugar, y con sumas en cero."""
+        self.configuracion = configuracion
+        self.regrets = regrets
+        self.sumas = np.zeros_like(regrets)
+        self._generador = generador
+
+    def iterar(self):
+        """Juega una ronda repartida al azar y actualiza los arrepentimientos de un asiento."""
+        generador = self._generador
+        abstraccion = self.configuracion.abstraccion
+        exploracion = self.configuracion.exploracion
+        ronda = _Ronda(self.configuracion, generador)
+        entrenado = int(generador.aleatorio() * ronda.jugadores)
+        turno = int(generador.aleatorio() * ronda.jugadores)
+        referencia = None
+        es_pasar = False
+        anterior = turno
+        camino = []
+        muestreo = 1.0
+
+        while True:
+            situacion = ronda.situaciones[turno]._replace(referencia=referencia, es_pasar=es_pasar)
+            indice = abstraccion.indice(situacion)
+            codigos = acciones_concretas(situacion)
+            legales = [accion for accion, codigo in enumerate(codigos) if codigo != SIN_ACCION]
+            politica = _regret_matching(self.regrets[indice, legales])
+            if turno == entrenado:
+                probabilidades = exploracion / len(legales) + (1 - exploracion) * politica
+                elegida = _sortear(probabilidades, generador.aleatorio())
+                muestreo *= probabilidades[elegida]
+                camino.append((indice, legales, politica, elegida))
+            else:
+                elegida = _sortear(politica, generador.aleatorio())
+                self.sumas[indice, legales] += politica
+
+            codigo = codigos[legales[elegida]]
+            if codigo == CODIGO_DUDAR or codigo == CODIGO_CALZAR:
+                utilidad = self._resolver(ronda, codigo, turno, anterior, referencia, es_pasar)
+                break
+            if codigo == CODIGO_PASAR:
+                es_pasar = True
+            else:
+                referencia = apuesta_de_rango(codigo - CODIGO_SUBIR)
+                es_pasar = False
+            anterior = turno
+            turno = (turno + 1) % ronda.jugadores
+
+        valor = utilidad[entrenado] / muestreo
+        cola = 1.0
+        for indice, legales, politica, elegida in reversed(camino):
+            # Arrepentimiento muestreado: W * (pi(z|ha) - pi(z|h)) para cada accion a
+            ajuste = -valor * cola * politica[elegida] * np.ones(len(legales))
+            ajuste[elegida] = valor * cola * (1 - politica[elegida])
+            self.regrets[indice, legales] += ajuste
+            cola *= politica[elegida]
+
+    @staticmethod
+    def _resolver(
+        ronda: _Ronda,
+        codigo: int,
+        turno: int,
+        anterior: int,
+        referencia: tuple[int, int] | None,
+        es_pasar: bool,
+    ) -> list[float]:
+        """Valor de la ronda para cada asiento tras un dudar o un calzar."""
+        utilidad = [0.0] * ronda.jugadores
+        if referencia is None:
+            raise ValueError("No hay una apuesta vigente")
+        cantidad, pinta = referencia
+        cuenta = ArbitroRonda.contar_apuesta(ronda.mesa, pinta, ronda.especial)
+        if codigo == CODIGO_CALZAR:
+            utilidad[turno] = 1.0 if cuenta == cantidad else -1.0
+            return utilidad
+        if es_pasar:
+            pierde_anterior = not es_pase_valido(ronda.manos[anterior])
+        else:
+            pierde_anterior = cuenta < cantidad
+        utilidad[anterior if pierde_anterior else turno] = -1.0
+        return utilidad
+
+
+def _regret_matching(regrets: np.ndarray) -> np.ndarray:
+    """Estrategia proporcional a los arrepentimientos positivos, o uniforme si no hay."""
+    positivos = np.maximum(regrets, 0.0)
+    total = positivos.sum()
+    if total <= 0:
+        return np.full(len(regrets), 1.0 / len(regrets))
+    return positivos / total
+
+
+def _sortear(probabilidades: np.ndarray, aleatorio: float) -> int:
+    """Indice sorteado segun 'probabilidades' con el numero uniforme 'aleatorio'."""
+    indice = int(np.searchsorted(np.cumsum(probabilidades), aleatorio, side="right"))
+    return min(indice, len(probabilidades) - 1)
+
+
+def entrenar_bloque(
+    argumentos: tuple[ConfiguracionCFR, np.ndarray, int, int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Entrena 'iteraciones' desde 'regrets' y retorna el cambio de arrepentimientos y las sumas."""
+    configuracion, regrets, iteraciones, semilla = argumentos
+    muestreo = MuestreoCFR(configuracion, regrets.copy(), GeneradorAleatorio(semilla))
+    for _ in range(iteraciones):
+        muestreo.iterar()
+    return muestreo.regrets - regrets, muestreo.sumas
+
+
+class EntrenadorCFR:
+    """Arrepentimientos y sumas de estrategia acumulados, entrenables en varios procesos."""
+
+    configuracion: ConfiguracionCFR
+    regrets: np.ndarray
+    sumas: np.ndarray
+    iteraciones: int
+    sincronizaciones: int
+
+    def __init__(self, configuracion: ConfiguracionCFR):
+        """Parte con arrepentimientos y sumas en cero."""
+        forma = (configuracion.abstraccion.total_infosets(), TOTAL_ACCIONES_CFR)
+        self.configuracion = configuracion
+        self.regrets = np.zeros(forma)
+        self.sumas = np.zeros(forma)
+        self.iteraciones = 0
+        self.sincronizaciones = 0
+
+    def entrenar(
+        self,
+        iteraciones: int,
+        procesos: int = 1,
+        tamano_bloque: int = 5000,
+        bloques_paralelos: int = 4,
+        checkpoint: str | Path | None = None,
+        al_sincronizar: Callable[["EntrenadorCFR"], None] | None = None,
+    ):
+        """Entrena 'iteraciones' en bloques de hasta 'tamano_bloque' iteraciones.
+
+        Cada sincronizacion entrena 'bloques_paralelos' bloques desde los mismos
+        arrepentimientos, repartidos entre 'procesos' trabajadores, y suma sus resultados;
+        luego guarda el checkpoint si se indico y llama a 'al_sincronizar'. El resultado
+        depende de la semilla y de los bloques, no de la cantidad de procesos.
+        """
+        if iteraciones < 0:
+            raise ValueError("La cantidad de iteraciones no puede ser negativa")
+        if procesos < 1 or tamano_bloque < 1 or bloques_paralelos < 1:
+            raise ValueError("Los procesos y el tamaño de los bloques deben ser positivos")
+
+        pool = multiprocessing.Pool(procesos) if procesos > 1 else None
+        try:
+            restantes = iteraciones
+            while restantes > 0:
+                cantidades = []
+                for _ in range(bloques_paralelos):
+                    cantidad = min(tamano_bloque, restantes)
+                    if cantidad > 0:
+                        cantidades.append(cantidad)
+                        restantes -= cantidad
+                tareas = [
+                    (
+                        self.configuracion,
+                        self.regrets,
+                        cantidad,
+                        derivar_semilla(self.configuracion.semilla, self.sincronizaciones, bloque),
+                    )
+                    for bloque, cantidad in enumerate(cantidades)
+                ]
+                if pool is None:
+                    resultados = [entrenar_bloque(tarea) for tarea in tareas]
+                else:
+                    resultados = pool.map(entrenar_bloque, tareas)
+                for cambio, sumas in resultados:
+                    self.regrets += cambio
+                    self.sumas += sumas
+                self.iteraciones += sum(cantidades)
+                self.sincronizaciones += 1
+                if checkpoint is not None:
+                    self.guardar_checkpoint(checkpoint)
+                if al_sincronizar is not None:
+                    al_sincronizar(self)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    def tabla(self, tipo: type = np.uint8) -> TablaCFR:
+        """Estrategia promedio empaquetada para jugar."""
+        return TablaCFR.desde_sumas(self.configuracion.abstraccion, self.sumas, tipo)
+
+    def guardar_checkpoint(self, ruta: str | Path):
+        """Guarda arrepentimientos, sumas, contadores y configuracion en un .npz."""
+        ruta = Path(ruta)
+        temporal = ruta.with_name(ruta.name + ".tmp.npz")
+        np.savez(
+            temporal,
+            regrets=self.regrets,
+            sumas=self.sumas,
+            contadores=np.array([self.iteraciones, self.sincronizaciones]),
+            configuracion=np.array(json.dumps(self.configuracion.a_diccionario())),
+        )
+        # Se reemplaza de una vez para no dejar un checkpoint a medio escribir
+        temporal.replace(ruta)
+
+    @classmethod
+    def cargar_checkpoint(cls, ruta: str | Path) -> "EntrenadorCFR":
+        """Entrenador en el punto guardado por guardar_checkpoint."""
+        with np.load(ruta) as datos:
+            configuracion = ConfiguracionCFR.desde_diccionario(
+                json.loads(str(datos["configuracion"]))
+            )
+            entrenador = cls(configuracion)
+            entrenador.regrets = datos["regrets"].copy()
+            entrenador.sumas = datos["sumas"].copy()
+            entrenador.iteraciones, entrenador.sincronizaciones = (
+                int(x) for x in datos["contadores"]
+            )
+        return entrenador
@@ -0,0 +1,301 @@
+"""Módulo que exporta las decisiones de partidas simuladas a archivos columnares.
+
+Cada apuesta decidida por un jugador automatico es una fila con lo que veia (como en
+ContextoApuesta), la jugada elegida y como se resolvio su ronda segun ArbitroRonda. Las
+filas se acumulan hasta completar un fragmento y se escriben de una vez: con pyarrow
+instalado cada fragmento es un archivo Parquet; sin el, una carpeta con un .npy por columna
+que se abre con mmap. La memoria usada depende del tamaño del fragmento, no de la cantidad
+de partidas.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from src.game.arbitro_ronda import ArbitroRonda
+from src.game.estrategia import ContextoApuesta, Estrategia
+from src.game.eventos_partida import EVENTO_CALZAR, EVENTO_DUDAR, EVENTO_RONDA
+from src.game.gestor_partida import DireccionJuego, GestorPartida, TipoRondaEspecial
+from src.game.jugada import (
+    CODIGO_CALZAR,
+    CODIGO_DUDAR,
+    Jugada,
+    TipoApuesta,
+    apuesta_de_referencia,
+    codigo_jugada,
+)
+from src.game.lote_partidas import MODO_ABIERTA, MODO_CERRADA, MODO_SIN_ESPECIAL
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+FORMATO_NPY = "npy"
+FORMATO_PARQUET = "parquet"
+
+# Columnas de cada fila, en orden
+COLUMNAS = np.dtype(
+    [
+        ("partida", np.int64),
+        ("ronda", np.int16),
+        ("asiento", np.int8),
+        ("jugadores", np.int8),
+        *((f"visibles_{cara}", np.int16) for cara in range(1, 7)),
+        ("dados_ocultos", np.int16),
+        ("dados_propios", np.int8),
+        ("dados_en_juego", np.int16),
+        ("cantidad_referencia", np.int16),
+        ("pinta_referencia", np.int8),
+        ("es_pasar", np.bool_),
+        ("modo", np.int8),
+        ("puede_calzar", np.bool_),
+        ("puede_partir_con_ases", np.bool_),
+        ("accion", np.int32),
+        # Dados reales de la pinta en juego tras la decision (-1 si no hay apuesta)
+        ("conteo", np.int16),
+        # Codigo de la jugada que cerro la ronda (dudar o calzar) y su resultado
+        ("cierre", np.int8),
+        ("resultado", np.bool_),
+    ]
+)
+
+NOMBRES_COLUMNAS: tuple[str, ...] = COLUMNAS.names or ()
+
+_MODOS = {
+    None: MODO_SIN_ESPECIAL,
+    TipoRondaEspecial.CERRADA: MODO_CERRADA,
+    TipoRondaEspecial.ABIERTA: MODO_ABIERTA,
+}
+
+
+def formato_por_defecto() -> str:
+    """Parquet si pyarrow esta instalado, si no .npy."""
+    return FORMATO_PARQUET if pyarrow is not None else FORMATO_NPY
+
+
+class EscritorColumnas:
+    """Escribe filas de COLUMNAS en fragmentos '<prefijo>-NNNNN' dentro de 'directorio'.
+
+    Cada fragmento se escribe con un nombre temporal y se renombra al terminar, de modo que
+    quien lee nunca ve uno a medias. Al crearse borra los fragmentos (y temporales) que
+    hayan quedado con el mismo prefijo, en cualquier formato: una nueva exportacion
+    reemplaza a la anterior en vez de mezclarse con ella.
+    """
+
+    __slots__ = ("directorio", "formato", "fragmentos", "_prefijo", "_filas", "_capacidad")
+
+    directorio: Path
+    formato: str
+    fragmentos: int
+    _prefijo: str
+    _filas: list[tuple]
+    _capacidad: int
+
+    def __init__(
+        self,
+        directorio: str | Path,
+        prefijo: str = "decisiones",
+        filas_por_fragmento: int = 1 << 16,
+        formato: str | None = None,
+    ):
+        """Crea 'directorio' si no existe; sin 'formato' se usa formato_por_defecto()."""
+        if filas_por_fragmento < 1:
+            raise ValueError("Las filas por fragmento deben ser positivas")
+        formato = formato_por_defecto() if formato is None else formato
+        if formato not in (FORMATO_NPY, FORMATO_PARQUET):
+            raise ValueError(f"Formato desconocido: {formato}")
+        if formato == FORMATO_PARQUET and pyarrow is None:
+            raise ValueError("Para escribir Parquet se necesita pyarrow")
+
+        self.directorio = Path(directorio)
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        _borrar_fragmentos(self.directorio, prefijo)
+        self.formato = formato
+        self.fragmentos = 0
+        self._prefijo = prefijo
+        self._filas = []
+        self._capacidad = filas_por_fragmento
+
+    def agregar(self, fila: tuple):
+        """Agrega una fila con los valores de COLUMNAS en orden."""
+        self._filas.append(fila)
+        if len(self._filas) >= self._capacidad:
+            self.vaciar()
+
+    def vaciar(self):
+        """Escribe las filas acumuladas como un nuevo fragmento."""
+        if not self._filas:
+            return
+        datos = np.array(self._filas, dtype=COLUMNAS)
+        self._filas = []
+        nombre = f"{self._prefijo}-{self.fragmentos:05d}"
+        if self.formato == FORMATO_PARQUET:
+            destino = self.directorio / f"{nombre}.parquet"
+            temporal = self.directorio / f".{nombre}.parquet"
+            tabla = pyarrow.table({columna: datos[columna] for columna in NOMBRES_COLUMNAS})
+            pyarrow.parquet.write_table(tabla, temporal)
+        else:
+            destino = self.directorio / nombre
+            temporal = self.directorio / f".{nombre}"
+            shutil.rmtree(temporal, ignore_errors=True)
+            temporal.mkdir()
+            for columna in NOMBRES_COLUMNAS:
+                np.save(temporal / f"{columna}.npy", np.ascontiguousarray(datos[columna]))
+        os.replace(temporal, destino)
+        self.fragmentos += 1
+
+    def cerrar(self):
+        """Escribe las filas que queden."""
+        self.vaciar()
+
+    def __enter__(self) -> "EscritorColumnas":
+        """Permite usar el escritor con 'with'."""
+        return self
+
+    def __exit__(self, *excepcion):
+        """Escribe lo pendiente al salir del bloque."""
+        self.cerrar()
+
+
+def _borrar_fragmentos(directorio: Path, prefijo: str):
+    """Borra los fragmentos '<prefijo>-NNNNN' de 'directorio', terminados o temporales."""
+    fragmento = f"{prefijo}-{'[0-9]' * 5}"
+    for patron in (fragmento, f"{fragmento}.parquet"):
+        for ruta in (*directorio.glob(patron), *directorio.glob(f".{patron}")):
+            if ruta.is_dir():
+                shutil.rmtree(ruta)
+            else:
+                ruta.unlink()
+
+
+def leer_decisiones(directorio: str | Path, prefijo: str = "decisiones") -> dict[str, np.ndarray]:
+    """Columnas de todos los fragmentos de 'directorio', en orden de nombre.
+
+    Los .npy se abren con mmap; solo se copian al unir varios fragmentos.
+    """
+    partes: dict[str, list[np.ndarray]] = {columna: [] for columna in NOMBRES_COLUMNAS}
+    for fragmento in sorted(Path(directorio).glob(f"{prefijo}-*")):
+        if fragmento.suffix == ".parquet":
+            if pyarrow is None:
+                raise ValueError("Para leer Parquet se necesita pyarrow")
+            tabla = pyarrow.parquet.read_table(fragmento)
+            for columna in NOMBRES_COLUMNAS:
+                partes[columna].append(tabla.column(columna).to_numpy())
+        else:
+            for columna in NOMBRES_COLUMNAS:
+                partes[columna].append(np.load(fragmento / f"{columna}.npy", mmap_mode="r"))
+
+    columnas = {}
+    for columna, arreglos in partes.items():
+        if len(arreglos) == 1:
+            columnas[columna] = arreglos[0]
+        elif arreglos:
+            columnas[columna] = np.concatenate(arreglos)
+        else:
+            columnas[columna] = np.zeros(0, dtype=COLUMNAS[columna])
+    return columnas
+
+
+class _EstrategiaRecolectada:
+    """Estrategia que anota cada apuesta de la estrategia envuelta."""
+
+    __slots__ = ("_estrategia", "_recolector")
+
+    _estrategia: Estrategia
+    _recolector: "RecolectorDecisiones"
+
+    def __init__(self, estrategia: Estrategia, recolector: "RecolectorDecisiones"):
+        """Envuelve 'estrategia'."""
+        self._estrategia = estrategia
+        self._recolector = recolector
+
+    def decidir_apuesta(self, contexto: ContextoApuesta) -> Jugada:
+        """Decide con la estrategia envuelta y anota la decision."""
+        jugada = self._estrategia.decidir_apuesta(contexto)
+        self._recolector.anotar(contexto, jugada)
+        return jugada
+
+    def decidir_ronda_especial(self, contexto: ContextoApuesta) -> TipoRondaEspecial:
+        """Delega en la estrategia envuelta."""
+        return self._estrategia.decidir_ronda_especial(contexto)
+
+    def decidir_direccion(self) -> DireccionJuego:
+        """Delega en la estrategia envuelta."""
+        return self._estrategia.decidir_direccion()
+
+
+class RecolectorDecisiones:
+    """Arma las filas de una partida y las entrega a un EscritorColumnas.
+
+    Envuelve las estrategias de la partida para ver cada decision y se pasa como
+    'registro' al GestorPartida para saber como termina cada ronda; 'gestor' debe
+    asignarse antes de jugar.
+    """
+
+    __slots__ = ("_escritor", "_partida", "_ronda", "_pendientes", "gestor")
+
+    _escritor: EscritorColumnas
+    _partida: int
+    _ronda: int
+    _pendientes: list[tuple[tuple, int]]
+    gestor: GestorPartida | None
+
+    def __init__(self, escritor: EscritorColumnas, partida: int):
+        """Recolector de la partida de indice 'partida'."""
+        self._escritor = escritor
+        self._partida = partida
+        self._ronda = 0
+        self._pendientes = []
+        self.gestor = None
+
+    def envolver(self, estrategias: list[Estrategia | None]) -> list[Estrategia | None]:
+        """Estrategias que anotan sus decisiones; los jugadores humanos no se anotan."""
+        return [
+            None if estrategia is None else _EstrategiaRecolectada(estrategia, self)
+            for estrategia in estrategias
+        ]
+
+    def anotar(self, contexto: ContextoApuesta, jugada: Jugada):
+        """Guarda la decision hasta que se resuelva su ronda."""
+        assert self.gestor is not None
+        referencia = None
+        if not contexto.primer_apuesta:
+            referencia = apuesta_de_referencia(contexto.apuesta_anterior, contexto.apuesta_actual)
+        en_juego = jugada if jugada.tipo is TipoApuesta.SUBIR else referencia
+        actual = contexto.apuesta_actual
+        fila = (
+            self._partida,
+            self._ronda,
+            self.gestor._asientos[contexto.nombre],
+            contexto.jugadores_en_juego,
+            *contexto.histograma_visible[1:7],
+            contexto.dados_ocultos,
+            contexto.dados_propios,
+            contexto.dados_en_juego,
+            referencia.cantidad if referencia is not None else 0,
+            referencia.pinta if referencia is not None else 0,
+            actual is not None and actual.tipo is TipoApuesta.PASAR,
+            _MODOS[contexto.modo_especial],
+            contexto.puede_calzar,
+            contexto.puede_partir_con_ases,
+            codigo_jugada(jugada),
+        )
+        self._pendientes.append((fila, en_juego.pinta if en_juego is not None else 0))
+
+    def __call__(self, tipo: int, asiento: int, valor: int):
+        """Recibe los eventos de la partida; al dudar o calzar escribe la ronda."""
+        if tipo == EVENTO_RONDA:
+            self._ronda = valor
+        elif tipo == EVENTO_DUDAR or tipo == EVENTO_CALZAR:
+            assert self.gestor is not None
+            histograma = self.gestor.histograma_mesa()
+            especial = self.gestor._ronda_especial
+            cierre = CODIGO_DUDAR if tipo == EVENTO_DUDAR else CODIGO_CALZAR
+            for fila, pinta in self._pendientes:
+                conteo = ArbitroRonda.contar_apuesta(histograma, pinta, especial) if pinta else -1
+                self._escritor.agregar((*fila, conteo, cierre, bool(valor)))
+            self._pendientes = []
@@ -1 +1,171 @@
 """Módulo que contiene la clase GeneradorAleatorio para el juego Dudo."""
+
+import random
+from typing import Any, Mapping, NamedTuple, Sequence, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+# Cantidad maxima de dados que se agitan en un cacho
+DADOS_POR_CACHO = 5
+
+# Tamaño por defecto del buffer de caras generadas de una vez
+TAMANO_BUFFER = 4096
+
+# Los bytes aleatorios 0..251 se reparten uniforme en 6 caras; 252..255 se descartan
+_BYTE_A_CARA = bytes((byte % 6) + 1 if byte < 252 else 0 for byte in range(256))
+_BYTES_DESCARTADOS = bytes(range(252, 256))
+
+
+def derivar_semilla(semilla: int, *indices: int) -> int:
+    """Deriva una semilla de 64 bits independiente para la ruta de indices dada."""
+    ruta = "-".join(str(indice) for indice in (semilla, *indices))
+    return random.Random(ruta).getrandbits(64)
+
+
+class EstadoGenerador(NamedTuple):
+    """Estado de un generador con semilla, para retomar su flujo mas tarde."""
+
+    random: tuple
+    numpy: Mapping[str, Any]
+    buffer: bytes
+    indice: int
+
+
+class GeneradorAleatorio:
+    """Fuente de azar inyectable del juego.
+
+    Sin semilla usa el estado global del modulo random, como el juego interactivo. Con
+    semilla tiene su propio estado reproducible y genera las caras por lotes en un buffer
+    que se rellena al agotarse.
+    """
+
+    _semilla: int | None
+    _random: random.Random | None
+    _numpy: np.random.Generator | None
+    _buffer: bytes
+    _indice: int
+    _tamano_buffer: int
+
+    def __init__(self, semilla: int | None = None, tamano_buffer: int = TAMANO_BUFFER):
+        """Inicializa el generador, con estado propio solo si recibe una semilla."""
+        if tamano_buffer < 1:
+            raise ValueError("El tamaño del buffer debe ser positivo")
+
+        self._semilla = semilla
+        self._random = random.Random(semilla) if semilla is not None else None
+        self._numpy = np.random.default_rng(semilla) if semilla is not None else None
+        self._buffer = b""
+        self._indice = 0
+        self._tamano_buffer = tamano_buffer
+
+    @property
+    def semilla(self) -> int | None:
+        """Semilla con la que se creo el generador, None si usa el estado global."""
+        return self._semilla
+
+    def derivar(self, *indices: int) -> "GeneradorAleatorio":
+        """Crea un generador independiente para la ruta dada (partida, proceso, asiento).
+
+        El flujo derivado depende solo de la semilla y la ruta, no de cuanto se haya usado
+        este generador.
+        """
+        semilla = self._semilla
+        if semilla is None:
+            semilla = random.getrandbits(64)
+        return GeneradorAleatorio(derivar_semilla(semilla, *indices), self._tamano_buffer)
+
+    def _rellenar(self):
+        """Genera un nuevo lote de caras en el buffer."""
+        assert self._random is not None
+        caras = b""
+        while len(caras) < self._tamano_buffer:
+            bytes_aleatorios = self._random.randbytes(self._tamano_buffer)
+            caras += bytes_aleatorios.translate(_BYTE_A_CARA, _BYTES_DESCARTADOS)
+        self._buffer = caras
+        self._indice = 0
+
+    def lanzar_dado(self) -> int:
+        """Retorna una cara entre 1 y 6."""
+        if self._random is None:
+            return random.randint(1, 6)
+
+        if self._indice >= len(self._buffer):
+            self._rellenar()
+        cara = self._buffer[self._indice]
+        self._indice += 1
+        return cara
+
+    def lanzar_dados(self, cantidad: int) -> bytes:
+        """Retorna 'cantidad' caras entre 1 y 6."""
+        if self._random is None:
+            return bytes(random.randint(1, 6) for _ in range(cantidad))
+
+        inicio = self._indice
+        fin = inicio + cantidad
+        if fin <= len(self._buffer):
+            self._indice = fin
+            return self._buffer[inicio:fin]
+        return bytes(self.lanzar_dado() for _ in range(cantidad))
+
+    def lanzar_mesa(self, cantidades: Sequence[int]) -> np.ndarray:
+        """Lanza los dados de toda la mesa en una sola operacion.
+
+        Retorna un arreglo uint8 de forma (jugadores, 5) donde la fila i tiene
+        cantidades[i] caras (como maximo 5) seguidas de ceros.
+        """
+        limites = np.minimum(np.asarray(cantidades, dtype=np.int64), DADOS_POR_CACHO)
+        if limites.size and limites.min() < 0:
+            raise ValueError("Cantidad a agitar invalida")
+        enmascarados = np.arange(DADOS_POR_CACHO) >= limites[:, None]
+
+        if self._numpy is None:
+            # Se respeta el orden jugador por jugador del estado global de random
+            caras = np.zeros((len(limites), DADOS_POR_CACHO), dtype=np.uint8)
+            for fila, limite in enumerate(limites):
+                caras[fila, :limite] = list(self.lanzar_dados(int(limite)))
+            return caras
+
+        caras = self._numpy.integers(1, 7, size=(len(limites), DADOS_POR_CACHO), dtype=np.uint8)
+        caras[enmascarados] = 0
+        return caras
+
+    def enteros(self, maximo: int, cantidad: int) -> np.ndarray:
+        """Retorna 'cantidad' enteros uniformes en [0, maximo)."""
+        if self._numpy is None:
+            return np.array([random.randrange(maximo) for _ in range(cantidad)], dtype=np.int64)
+        return self._numpy.integers(0, maximo, size=cantidad, dtype=np.int64)
+
+    def aleatorio(self) -> float:
+        """Retorna un numero real en [0, 1)."""
+        if self._random is None:
+            return random.random()
+        return self._random.random()
+
+    def elegir(self, opciones: Sequence[T]) -> T:
+        """Elige uniformemente un elemento de 'opciones'."""
+        if self._random is None:
+            return random.choice(opciones)
+        return self._random.choice(opciones)
+
+    def capturar(self) -> EstadoGenerador:
+        """Estado actual del generador; solo los generadores con semilla tienen uno propio."""
+        if self._random is None or self._numpy is None:
+            raise ValueError("Solo se puede capturar el estado de un generador con semilla")
+        return EstadoGenerador(
+            self._random.getstate(), self._numpy.bit_generator.state, self._buffer, self._indice
+        )
+
+    def restaurar(self, estado: EstadoGenerador):
+        """Vuelve al estado capturado: las siguientes caras son las mismas que entonces."""
+        if self._random is None or self._numpy is None:
+            raise ValueError("Solo se puede restaurar el estado de un generador con semilla")
+        self._random.setstate(estado.random)
+        self._numpy.bit_generator.state = estado.numpy
+        self._buffer = estado.buffer
+        self._indice = estado.indice
+
+
+# Generador compartido por los objetos creados sin un generador explicito
+GENERADOR_GLOBAL = GeneradorAleatorio()
@@ -0,0 +1,193 @@
+"""Módulo con el registro binario de partidas del juego Dudo.
+
+Cada evento ocupa 4 bytes (tipo u8, asiento u8, valor i16) y las subidas guardan la
+diferencia de rango con la subida anterior de la ronda, que casi siempre es pequeña. Los
+registros de las partidas van uno tras otro despues de una cabecera, y un archivo de indice
+'<ruta>.idx' guarda con int64 el registro en que termina cada partida: cualquier partida se
+lee con mmap sin recorrer las anteriores. Solo se indexan partidas completas; al reabrir un
+registro se descarta la partida que haya quedado a medias.
+"""
+
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from src.game.eventos_partida import EVENTO_AGITAR, EVENTO_FIN, EVENTO_SUBIR, EventoPartida
+
+CABECERA = b"DUDOREG\x01"
+
+REGISTRO = np.dtype([("tipo", "u1"), ("asiento", "u1"), ("valor", "<i2")])
+
+_FORMATO = struct.Struct("<BBh")
+
+_INDICE = np.dtype("<i8")
+
+
+def ruta_indice(ruta: str | Path) -> Path:
+    """Ruta del archivo de indice del registro en 'ruta'."""
+    return Path(f"{ruta}.idx")
+
+
+class EscritorRegistro:
+    """Registro de eventos que agrega partidas completas al final de un archivo.
+
+    Se pasa como 'registro' a GestorPartida; los eventos se acumulan en memoria y se
+    escriben al completar 'tamano_buffer' registros o al cerrar.
+    """
+
+    __slots__ = (
+        "_archivo",
+        "_indice",
+        "_buffer",
+        "_fin_buffer",
+        "_fines",
+        "_escritos",
+        "_limite",
+        "_ultimo_rango",
+        "partidas",
+    )
+
+    _buffer: bytearray
+    _fin_buffer: int
+    _fines: list[int]
+    _escritos: int
+    _limite: int
+    _ultimo_rango: int
+    partidas: int
+
+    def __init__(self, ruta: str | Path, tamano_buffer: int = 1 << 16):
+        """Abre o crea el registro en 'ruta' y su indice."""
+        if tamano_buffer < 1:
+            raise ValueError("El tamaño del buffer debe ser positivo")
+        ruta = Path(ruta)
+        if ruta.exists() and ruta.stat().st_size > 0:
+            _validar_cabecera(ruta)
+            fines = _leer_indice(ruta)
+            self._archivo = open(ruta, "r+b")
+        else:
+            fines = np.zeros(0, dtype=_INDICE)
+            self._archivo = open(ruta, "w+b")
+            self._archivo.write(CABECERA)
+
+        self._escritos = int(fines[-1]) if len(fines) else 0
+        # Los registros de una partida sin terminar se descartan
+        self._archivo.truncate(len(CABECERA) + self._escritos * REGISTRO.itemsize)
+        self._archivo.seek(0, 2)
+        self._indice = open(ruta_indice(ruta), "ab")
+        self._indice.truncate(len(fines) * _INDICE.itemsize)
+        self._buffer = bytearray()
+        self._fin_buffer = 0
+        self._fines = []
+        self._limite = tamano_buffer * REGISTRO.itemsize
+        self._ultimo_rango = 0
+        self.partidas = len(fines)
+
+    def __call__(self, tipo: int, asiento: int, valor: int):
+        """Agrega un evento; las subidas se guardan como diferencia de rango."""
+        if tipo == EVENTO_SUBIR:
+            valor, self._ultimo_rango = valor - self._ultimo_rango, valor
+        elif tipo == EVENTO_AGITAR:
+            self._ultimo_rango = 0
+        self._buffer += _FORMATO.pack(tipo, asiento, valor)
+        if tipo == EVENTO_FIN:
+            self._fin_buffer = len(self._buffer)
+            self._fines.append(self._escritos + self._fin_buffer // REGISTRO.itemsize)
+            self.partidas += 1
+            if self._fin_buffer >= self._limite:
+                self.vaciar()
+
+    def vaciar(self):
+        """Escribe las partidas completas acumuladas y luego su indice."""
+        if not self._fines:
+            return
+        self._archivo.write(self._buffer[: self._fin_buffer])
+        self._archivo.flush()
+        self._indice.write(np.array(self._fines, dtype=_INDICE).tobytes())
+        self._indice.flush()
+        self._escritos = self._fines[-1]
+        del self._buffer[: self._fin_buffer]
+        self._fin_buffer = 0
+        self._fines = []
+
+    def cerrar(self):
+        """Escribe lo pendiente y cierra los archivos."""
+        self.vaciar()
+        self._archivo.close()
+        self._indice.close()
+
+    def __enter__(self) -> "EscritorRegistro":
+        """Permite usar el escritor con 'with'."""
+        return self
+
+    def __exit__(self, *excepcion):
+        """Cierra el escritor al salir del bloque."""
+        self.cerrar()
+
+
+class LectorRegistro:
+    """Acceso aleatorio a las partidas de un registro, mapeado en memoria."""
+
+    __slots__ = ("_registros", "_fines")
+
+    _registros: np.ndarray
+    _fines: np.ndarray
+
+    def __init__(self, ruta: str | Path):
+        """Mapea el registro en 'ruta' y su indice sin leerlos completos."""
+        ruta = Path(ruta)
+        _validar_cabecera(ruta)
+        self._fines = _leer_indice(ruta)
+        total = int(self._fines[-1]) if len(self._fines) else 0
+        if total:
+            self._registros = np.memmap(
+                ruta, dtype=REGISTRO, mode="r", offset=len(CABECERA), shape=(total,)
+            )
+        else:
+            self._registros = np.zeros(0, dtype=REGISTRO)
+
+    def __len__(self) -> int:
+        """Cantidad de partidas completas."""
+        return len(self._fines)
+
+    def registros(self, partida: int) -> np.ndarray:
+        """Registros crudos de la partida, como vista del archivo."""
+        if not 0 <= partida < len(self._fines):
+            raise IndexError(f"No existe la partida {partida}")
+        inicio = int(self._fines[partida - 1]) if partida else 0
+        return self._registros[slice(inicio, int(self._fines[partida]))]
+
+    def eventos(self, partida: int) -> list[EventoPartida]:
+        """Eventos de la partida con los rangos de las subidas ya reconstruidos."""
+        return decodificar(self.registros(partida))
+
+
+def decodificar(registros: np.ndarray) -> list[EventoPartida]:
+    """Eventos de los registros de una partida, deshaciendo las diferencias de rango."""
+    eventos = []
+    ultimo_rango = 0
+    for tipo, asiento, valor in registros.tolist():
+        if tipo == EVENTO_SUBIR:
+            valor += ultimo_rango
+            ultimo_rango = valor
+        elif tipo == EVENTO_AGITAR:
+            ultimo_rango = 0
+        eventos.append(EventoPartida(tipo, asiento, valor))
+    return eventos
+
+
+def _validar_cabecera(ruta: Path):
+    """Verifica que 'ruta' sea un registro de partidas de esta version."""
+    with open(ruta, "rb") as archivo:
+        if archivo.read(len(CABECERA)) != CABECERA:
+            raise ValueError(f"{ruta} no es un registro de partidas valido")
+
+
+def _leer_indice(ruta: Path) -> np.ndarray:
+    """Fin de cada partida completa, mapeado en memoria si el indice existe."""
+    indice = ruta_indice(ruta)
+    # Una escritura interrumpida puede dejar un fin a medias, que se ignora
+    total = indice.stat().st_size // _INDICE.itemsize if indice.exists() else 0
+    if total == 0:
+        return np.zeros(0, dtype=_INDICE)
+    return np.memmap(indice, dtype=_INDICE, mode="r", shape=(total,))
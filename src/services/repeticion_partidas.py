@@ -0,0 +1,242 @@
+"""Módulo que reconstruye partidas registradas a partir de su semilla y sus eventos.
+
+Las caras solo dependen del generador de la partida, y las decisiones estan en el registro:
+basta repetir la partida con estrategias que leen el registro, sin pedir nada por terminal.
+Cada evento que la repeticion vuelve a producir se compara con el registrado, por lo que
+una semilla equivocada o un cambio de reglas se detecta en el primer evento distinto.
+
+Al iniciar cada 'intervalo' rondas se guarda un punto de control con el estado de la
+partida y del generador; buscar un turno parte del punto de control anterior mas cercano en
+vez de repetir desde el comienzo.
+"""
+
+from typing import NamedTuple, Sequence
+
+from src.game.estado_partida import EstadoPartida
+from src.game.estrategia import ContextoApuesta
+from src.game.eventos_partida import (
+    EVENTO_CALZAR,
+    EVENTO_DIRECCION,
+    EVENTO_DUDAR,
+    EVENTO_INICIO,
+    EVENTO_PASAR,
+    EVENTO_RONDA,
+    EVENTO_RONDA_ESPECIAL,
+    EVENTO_SUBIR,
+    EventoPartida,
+)
+from src.game.gestor_partida import DireccionJuego, GestorPartida, TipoRondaEspecial
+from src.game.jugada import (
+    CODIGO_SUBIR,
+    JUGADA_CALZAR,
+    JUGADA_DUDAR,
+    JUGADA_PASAR,
+    Jugada,
+    jugada_de_codigo,
+)
+from src.services.generador_aleatorio import EstadoGenerador, GeneradorAleatorio
+
+# Eventos que corresponden a una apuesta; el turno N es el estado antes de la apuesta N
+APUESTAS = (EVENTO_SUBIR, EVENTO_PASAR, EVENTO_DUDAR, EVENTO_CALZAR)
+
+# Eventos que provienen de una decision de un jugador
+DECISIONES = APUESTAS + (EVENTO_DIRECCION, EVENTO_RONDA_ESPECIAL)
+
+# Objetivo de una repeticion que llega hasta el final de la partida
+SIN_OBJETIVO = -1
+
+
+class PuntoControl(NamedTuple):
+    """Estado al iniciar una ronda, antes de agitar, desde el que se puede retomar."""
+
+    evento: int
+    turno: int
+    estado: EstadoPartida
+    generador: EstadoGenerador
+
+
+class _Detener(Exception):
+    """Corta la repeticion al llegar al turno buscado."""
+
+
+class _Guion:
+    """Registro de la partida repetida: entrega las decisiones y verifica los eventos."""
+
+    __slots__ = ("eventos", "posicion", "turno", "objetivo", "intervalo", "puntos", "gestor")
+
+    eventos: Sequence[EventoPartida]
+    posicion: int
+    turno: int
+    objetivo: int
+    intervalo: int
+    puntos: dict[int, PuntoControl]
+    gestor: GestorPartida | None
+
+    def __init__(
+        self,
+        eventos: Sequence[EventoPartida],
+        objetivo: int,
+        intervalo: int,
+        puntos: dict[int, PuntoControl],
+    ):
+        """Guion que se detiene antes de la apuesta 'objetivo'."""
+        self.eventos = eventos
+        self.posicion = 0
+        self.turno = 0
+        self.objetivo = objetivo
+        self.intervalo = intervalo
+        self.puntos = puntos
+        self.gestor = None
+
+    def __call__(self, tipo: int, asiento: int, valor: int):
+        """Compara el evento producido con el registrado y avanza."""
+        evento = EventoPartida(tipo, asiento, valor)
+        if (
+            tipo == EVENTO_RONDA
+            and valor % self.intervalo == 0
+            and self.posicion not in self.puntos
+        ):
+            assert self.gestor is not None
+            self.puntos[self.posicion] = PuntoControl(
+                self.posicion,
+                self.turno,
+                self.gestor.capturar(),
+                self.gestor._generador.capturar(),
+            )
+        esperado = self.eventos[self.posicion] if self.posicion < len(self.eventos) else None
+        if evento != esperado:
+            raise ValueError(
+                f"La repeticion se aparto del registro en el evento {self.posicion}: "
+                f"se esperaba {esperado} y ocurrio {evento}"
+            )
+        self.posicion += 1
+        if tipo in APUESTAS:
+            self.turno += 1
+
+    def decision(self, asiento: int, tipos: tuple[int, ...]) -> EventoPartida:
+        """Siguiente decision registrada, que debe ser de 'asiento' y de uno de 'tipos'."""
+        for posicion in range(self.posicion, len(self.eventos)):
+            evento = self.eventos[posicion]
+            if evento.tipo in DECISIONES:
+                if evento.tipo not in tipos or evento.asiento != asiento:
+                    raise ValueError(
+                        f"La repeticion se aparto del registro en el evento {posicion}: "
+                        f"se pidio una decision del asiento {asiento} y ocurrio {evento}"
+                    )
+                return evento
+        raise ValueError("El registro termina antes que la partida")
+
+
+class _EstrategiaGuion:
+    """Estrategia de un asiento que repite las decisiones del registro."""
+
+    __slots__ = ("_guion", "_asiento")
+
+    _guion: _Guion
+    _asiento: int
+
+    def __init__(self, guion: _Guion, asiento: int):
+        """Repite las decisiones de 'asiento'."""
+        self._guion = guion
+        self._asiento = asiento
+
+    def decidir_apuesta(self, contexto: ContextoApuesta) -> Jugada:
+        """Apuesta registrada, o se detiene si es la del turno buscado."""
+        if self._guion.turno == self._guion.objetivo:
+            raise _Detener
+        evento = self._guion.decision(self._asiento, APUESTAS)
+        if evento.tipo == EVENTO_SUBIR:
+            return jugada_de_codigo(CODIGO_SUBIR + evento.valor)
+        if evento.tipo == EVENTO_PASAR:
+            return JUGADA_PASAR
+        if evento.tipo == EVENTO_DUDAR:
+            return JUGADA_DUDAR
+        return JUGADA_CALZAR
+
+    def decidir_ronda_especial(self, contexto: ContextoApuesta) -> TipoRondaEspecial:
+        """Tipo de ronda registrado."""
+        evento = self._guion.decision(self._asiento, (EVENTO_RONDA_ESPECIAL,))
+        return TipoRondaEspecial(str(evento.valor))
+
+    def decidir_direccion(self) -> DireccionJuego:
+        """Direccion registrada."""
+        evento = self._guion.decision(self._asiento, (EVENTO_DIRECCION,))
+        return DireccionJuego.Derecha if evento.valor == 1 else DireccionJuego.Izquierda
+
+
+class RepeticionPartida:
+    """Reconstruye el estado de una partida registrada en cualquier turno.
+
+    'semilla' es la del generador con que se jugo la partida (en un torneo, la derivada
+    para su indice) y 'eventos' los de su registro, por ejemplo LectorRegistro.eventos().
+    """
+
+    __slots__ = ("_semilla", "_eventos", "_intervalo", "_puntos", "asientos", "total_turnos")
+
+    _semilla: int
+    _eventos: Sequence[EventoPartida]
+    _intervalo: int
+    _puntos: dict[int, PuntoControl]
+    asientos: int
+    total_turnos: int
+
+    def __init__(self, semilla: int, eventos: Sequence[EventoPartida], intervalo: int = 5):
+        """Prepara la repeticion; los puntos de control se guardan al ir repitiendo."""
+        if intervalo < 1:
+            raise ValueError("El intervalo de puntos de control debe ser positivo")
+        if not eventos or eventos[0].tipo != EVENTO_INICIO:
+            raise ValueError("El registro debe comenzar con el inicio de la partida")
+        self._semilla = semilla
+        self._eventos = eventos
+        self._intervalo = intervalo
+        self._puntos = {}
+        self.asientos = eventos[0].valor
+        self.total_turnos = sum(evento.tipo in APUESTAS for evento in eventos)
+
+    def puntos_control(self) -> list[PuntoControl]:
+        """Puntos de control guardados hasta ahora, en orden."""
+        return [self._puntos[evento] for evento in sorted(self._puntos)]
+
+    def verificar(self) -> EstadoPartida:
+        """Repite la partida completa, guardando todos sus puntos de control.
+
+        Retorna el estado final; falla si algun evento no coincide con el registro.
+        """
+        return self._repetir(None, SIN_OBJETIVO)
+
+    def estado_en(self, turno: int) -> EstadoPartida:
+        """Estado de la partida antes de la apuesta 'turno' (0 es la primera apuesta).
+
+        Con 'turno' igual a total_turnos retorna el estado final.
+        """
+        if not 0 <= turno <= self.total_turnos:
+            raise IndexError(f"La partida tiene {self.total_turnos} turnos")
+        anteriores = [punto for punto in self._puntos.values() if punto.turno <= turno]
+        punto = max(anteriores, key=lambda punto: punto.evento, default=None)
+        return self._repetir(punto, turno if turno < self.total_turnos else SIN_OBJETIVO)
+
+    def _repetir(self, punto: PuntoControl | None, objetivo: int) -> EstadoPartida:
+        """Repite desde 'punto' (o desde el comienzo) hasta antes de la apuesta 'objetivo'.
+
+        Con SIN_OBJETIVO se repite hasta el final y se exige consumir todo el registro.
+        """
+        guion = _Guion(self._eventos, objetivo, self._intervalo, self._puntos)
+        generador = GeneradorAleatorio(self._semilla)
+        estrategias = [_EstrategiaGuion(guion, asiento) for asiento in range(self.asientos)]
+        gestor = GestorPartida(self.asientos, list(estrategias), None, generador, guion)
+        guion.gestor = gestor
+        try:
+            if punto is None:
+                gestor.juego()
+            else:
+                gestor.restaurar(punto.estado)
+                generador.restaurar(punto.generador)
+                guion.posicion = punto.evento
+                guion.turno = punto.turno
+                gestor.continuar_juego()
+        except _Detener:
+            return gestor.capturar()
+
+        if guion.posicion != len(self._eventos):
+            raise ValueError("La partida termino antes que el registro")
+        return gestor.capturar()
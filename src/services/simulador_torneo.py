@@ -0,0 +1,335 @@
+"""Módulo que simula torneos de partidas automaticas de Dudo en varios procesos."""
+
+import multiprocessing
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Iterator, NamedTuple
+
+import numpy as np
+
+from src.game.estrategia import Estrategia
+from src.game.estrategias_bot import ESTRATEGIAS
+from src.game.eventos_partida import RegistroEventos, combinar_registros
+from src.game.gestor_partida import GestorPartida
+from src.game.mascaras_legales import tabla_mascaras, usar_mascaras_externas
+from src.services.almacen_resultados import EscritorResultados, ResultadoPartida
+from src.services.almacen_tablas import AlmacenTablas, DescriptorTablas
+from src.services.exportador_decisiones import EscritorColumnas, RecolectorDecisiones
+from src.services.generador_aleatorio import GeneradorAleatorio
+from src.services.registro_partidas import EscritorRegistro, ruta_indice
+
+# Dados con que parte cada asiento (ver GestorPartida)
+DADOS_POR_ASIENTO = 5
+
+# Prefijo de las mascaras legales publicadas para los trabajadores
+_PREFIJO_MASCARAS = "mascaras_"
+
+
+class ConfiguracionTorneo:
+    """Parametros de un torneo de partidas automaticas."""
+
+    partidas: int
+    asientos: list[int]
+    estrategias: list[str]
+    semilla: int
+
+    def __init__(self, partidas: int, asientos: list[int], estrategias: list[str], semilla: int):
+        """Valida e inicializa la configuracion del torneo."""
+        if partidas < 0:
+            raise ValueError("La cantidad de partidas no puede ser negativa")
+        if not asientos or min(asientos) < 2:
+            raise ValueError("Cada partida necesita al menos 2 asientos")
+        if not estrategias:
+            raise ValueError("Debe indicarse al menos una estrategia")
+        for nombre in estrategias:
+            if nombre not in ESTRATEGIAS:
+                raise ValueError(f"Estrategia desconocida: {nombre}")
+
+        self.partidas = partidas
+        self.asientos = asientos
+        self.estrategias = estrategias
+        self.semilla = semilla
+
+    def asientos_partida(self, indice: int) -> int:
+        """Cantidad de asientos de la partida 'indice'."""
+        return self.asientos[indice % len(self.asientos)]
+
+    def estrategias_partida(self, indice: int) -> list[str]:
+        """Nombres de estrategia por asiento; se rotan para no favorecer un asiento."""
+        return [
+            self.estrategias[(indice + asiento) % len(self.estrategias)]
+            for asiento in range(self.asientos_partida(indice))
+        ]
+
+
+class ResultadosTorneo:
+    """Agregados de un conjunto de partidas, combinables sin guardar cada partida.
+
+    Con 'detalle' tambien guarda el ResultadoPartida de cada partida jugada; combinar no
+    los junta, quien los recibe los escribe y los descarta.
+    """
+
+    partidas: int
+    victorias: Counter[str]
+    participaciones: Counter[str]
+    victorias_por_asiento: Counter[int]
+    rondas_por_partida: Counter[int]
+    dados_perdidos: dict[str, Counter[int]]
+    detalle: list[ResultadoPartida] | None
+
+    def __init__(self, detalle: bool = False):
+        """Inicializa los agregados vacios."""
+        self.partidas = 0
+        self.victorias = Counter()
+        self.participaciones = Counter()
+        self.victorias_por_asiento = Counter()
+        self.rondas_por_partida = Counter()
+        self.dados_perdidos = {}
+        self.detalle = [] if detalle else None
+
+    def registrar_partida(
+        self, estrategias: list[str], asiento_ganador: int, rondas: int, perdidos: list[int]
+    ):
+        """Suma una partida terminada; 'perdidos' tiene los dados perdidos por asiento."""
+        self.partidas += 1
+        self.victorias[estrategias[asiento_ganador]] += 1
+        self.victorias_por_asiento[asiento_ganador] += 1
+        self.rondas_por_partida[rondas] += 1
+        for nombre, cantidad in zip(estrategias, perdidos):
+            self.participaciones[nombre] += 1
+            self.dados_perdidos.setdefault(nombre, Counter())[cantidad] += 1
+
+    def combinar(self, otro: "ResultadosTorneo"):
+        """Suma los agregados de 'otro' a los propios."""
+        self.partidas += otro.partidas
+        self.victorias.update(otro.victorias)
+        self.participaciones.update(otro.participaciones)
+        self.victorias_por_asiento.update(otro.victorias_por_asiento)
+        self.rondas_por_partida.update(otro.rondas_por_partida)
+        for nombre, distribucion in otro.dados_perdidos.items():
+            self.dados_perdidos.setdefault(nombre, Counter()).update(distribucion)
+
+    def tasas_victoria(self) -> dict[str, float]:
+        """Fraccion de partidas ganadas por cada estrategia sobre las que jugo."""
+        return {
+            nombre: self.victorias[nombre] / participaciones
+            for nombre, participaciones in self.participaciones.items()
+        }
+
+    def rondas_promedio(self) -> float:
+        """Cantidad promedio de rondas por partida."""
+        if self.partidas == 0:
+            return 0.0
+        total = sum(rondas * veces for rondas, veces in self.rondas_por_partida.items())
+        return total / self.partidas
+
+    def a_diccionario(self) -> dict:
+        """Representacion serializable a JSON de los agregados."""
+        return {
+            "partidas": self.partidas,
+            "tasas_victoria": self.tasas_victoria(),
+            "victorias": dict(self.victorias),
+            "victorias_por_asiento": {str(k): v for k, v in self.victorias_por_asiento.items()},
+            "rondas_promedio": self.rondas_promedio(),
+            "rondas_por_partida": {str(k): v for k, v in sorted(self.rondas_por_partida.items())},
+            "dados_perdidos": {
+                nombre: {str(k): v for k, v in sorted(distribucion.items())}
+                for nombre, distribucion in self.dados_perdidos.items()
+            },
+        }
+
+
+def jugar_partida(
+    configuracion: ConfiguracionTorneo,
+    indice: int,
+    resultados: ResultadosTorneo,
+    escritor: EscritorColumnas | None = None,
+    registro: RegistroEventos | None = None,
+):
+    """Juega la partida 'indice' del torneo y la registra en 'resultados'.
+
+    Con 'escritor' tambien exporta una fila por cada decision de la partida; 'registro'
+    recibe sus eventos, por ejemplo un EscritorRegistro.
+    """
+    # Cada partida tiene su flujo, y dentro de ella cada asiento tiene el suyo
+    generador = GeneradorAleatorio(configuracion.semilla).derivar(indice)
+    nombres = configuracion.estrategias_partida(indice)
+    estrategias: list[Estrategia | None] = [
+        ESTRATEGIAS[nombre](generador.derivar(asiento)) for asiento, nombre in enumerate(nombres)
+    ]
+
+    recolector = None
+    if escritor is not None:
+        recolector = RecolectorDecisiones(escritor, indice)
+        estrategias = recolector.envolver(estrategias)
+
+    gestor = GestorPartida(
+        len(nombres),
+        estrategias,
+        generador=generador,
+        registro=combinar_registros(recolector, registro),
+    )
+    if recolector is not None:
+        recolector.gestor = gestor
+    jugadores = list(gestor._jugadores)
+    ganador = gestor.juego()
+
+    asiento_ganador = jugadores.index(ganador)
+    perdidos = [jugador._dados_perdidos for jugador in jugadores]
+    resultados.registrar_partida(nombres, asiento_ganador, gestor._rondas_jugadas, perdidos)
+    if resultados.detalle is not None:
+        assert generador.semilla is not None
+        resultados.detalle.append(
+            ResultadoPartida(
+                configuracion.semilla,
+                indice,
+                generador.semilla,
+                tuple(nombres),
+                asiento_ganador,
+                gestor._rondas_jugadas,
+                gestor._rondas_especiales,
+                tuple(perdidos),
+            )
+        )
+
+
+class BloqueTorneo(NamedTuple):
+    """Trabajo de un proceso: las partidas [inicio, fin) del torneo."""
+
+    configuracion: ConfiguracionTorneo
+    inicio: int
+    fin: int
+    # Directorio donde exportar las decisiones del bloque
+    exportar: Path | None = None
+    # Si se retorna el resultado de cada partida ademas de los agregados
+    detalle: bool = False
+    # Directorio donde guardar el registro binario de las partidas del bloque
+    registro: Path | None = None
+
+
+def simular_bloque(bloque: BloqueTorneo) -> ResultadosTorneo:
+    """Juega las partidas del bloque y retorna sus agregados.
+
+    Si se indica un directorio de exportacion, las decisiones del bloque se escriben en
+    fragmentos propios del bloque, sin pasar por el proceso principal. Lo mismo con el
+    directorio de registro: cada bloque escribe su archivo ruta_registro_bloque(), que
+    reemplaza al de una ejecucion anterior.
+    """
+    configuracion, inicio, fin, exportar, detalle, directorio_registro = bloque
+    escritor = None
+    if exportar is not None:
+        escritor = EscritorColumnas(exportar, f"decisiones-{inicio:010d}")
+    registro = None
+    if directorio_registro is not None:
+        directorio_registro.mkdir(parents=True, exist_ok=True)
+        ruta = ruta_registro_bloque(directorio_registro, inicio)
+        # EscritorRegistro agrega al final; repetir el bloque no debe duplicar partidas
+        ruta.unlink(missing_ok=True)
+        ruta_indice(ruta).unlink(missing_ok=True)
+        registro = EscritorRegistro(ruta)
+    resultados = ResultadosTorneo(detalle)
+    for indice in range(inicio, fin):
+        jugar_partida(configuracion, indice, resultados, escritor, registro)
+    if escritor is not None:
+        escritor.cerrar()
+    if registro is not None:
+        registro.cerrar()
+    return resultados
+
+
+def ruta_registro_bloque(directorio: Path, inicio: int) -> Path:
+    """Registro del bloque que empieza en la partida 'inicio'; su partida i es inicio + i."""
+    return directorio / f"partidas-{inicio:010d}.reg"
+
+
+def _bloques(
+    configuracion: ConfiguracionTorneo,
+    tamano_bloque: int,
+    exportar: Path | None,
+    detalle: bool,
+    registro: Path | None,
+) -> Iterator[BloqueTorneo]:
+    """Divide las partidas del torneo en bloques de indices consecutivos."""
+    for inicio in range(0, configuracion.partidas, tamano_bloque):
+        fin = min(inicio + tamano_bloque, configuracion.partidas)
+        yield BloqueTorneo(configuracion, inicio, fin, exportar, detalle, registro)
+
+
+def tablas_compartidas(configuracion: ConfiguracionTorneo) -> dict[str, np.ndarray]:
+    """Tablas que el proceso principal arma una vez y los trabajadores solo leen."""
+    return {
+        f"{_PREFIJO_MASCARAS}{cantidad}": tabla_mascaras(cantidad).mascaras
+        for cantidad in sorted(
+            {DADOS_POR_ASIENTO * asientos for asientos in configuracion.asientos}
+        )
+    }
+
+
+def iniciar_trabajador(descriptor: DescriptorTablas):
+    """Adjunta en el trabajador las tablas publicadas, sin copiarlas ni recalcularlas."""
+    almacen = AlmacenTablas.adjuntar(descriptor)
+    usar_mascaras_externas(
+        {
+            int(nombre.removeprefix(_PREFIJO_MASCARAS)): almacen[nombre]
+            for nombre in almacen.nombres()
+            if nombre.startswith(_PREFIJO_MASCARAS)
+        }
+    )
+
+
+def simular_torneo(
+    configuracion: ConfiguracionTorneo,
+    procesos: int = 1,
+    tamano_bloque: int = 100,
+    al_combinar: Callable[[ResultadosTorneo], None] | None = None,
+    exportar: str | Path | None = None,
+    base_datos: str | Path | None = None,
+    registro: str | Path | None = None,
+) -> ResultadosTorneo:
+    """Simula el torneo repartiendo bloques de partidas entre 'procesos' trabajadores.
+
+    Cada bloque llega como agregado y se combina apenas termina, por lo que la memoria no
+    depende de la cantidad de partidas. 'al_combinar' recibe el total acumulado tras cada
+    bloque. El resultado es el mismo sin importar la cantidad de procesos. Con varios
+    procesos las tablas de tablas_compartidas() se publican una vez en memoria compartida.
+    Con 'exportar' cada bloque escribe sus decisiones en ese directorio (ver
+    exportador_decisiones.leer_decisiones). Con 'base_datos' los bloques retornan ademas
+    cada partida y el proceso principal, unico escritor, las guarda en ese almacen SQLite
+    (ver almacen_resultados). Con 'registro' cada bloque guarda los eventos de sus partidas
+    en un registro binario de ese directorio (ver ruta_registro_bloque y LectorRegistro).
+    """
+    if procesos < 1 or tamano_bloque < 1:
+        raise ValueError("Los procesos y el tamaño de bloque deben ser positivos")
+
+    total = ResultadosTorneo()
+    directorio = None if exportar is None else Path(exportar)
+    directorio_registro = None if registro is None else Path(registro)
+    bloques = _bloques(
+        configuracion, tamano_bloque, directorio, base_datos is not None, directorio_registro
+    )
+    escritor = None if base_datos is None else EscritorResultados(base_datos)
+
+    def recibir(parcial: ResultadosTorneo):
+        """Combina un bloque terminado y guarda sus partidas."""
+        total.combinar(parcial)
+        if escritor is not None and parcial.detalle is not None:
+            escritor.agregar(parcial.detalle)
+        if al_combinar is not None:
+            al_combinar(total)
+
+    try:
+        if procesos == 1:
+            for bloque in bloques:
+                recibir(simular_bloque(bloque))
+            return total
+
+        with (
+            AlmacenTablas.publicar(tablas_compartidas(configuracion)) as tablas,
+            multiprocessing.Pool(procesos, iniciar_trabajador, (tablas.descriptor,)) as pool,
+        ):
+            for parcial in pool.imap_unordered(simular_bloque, bloques):
+                recibir(parcial)
+        return total
+    finally:
+        if escritor is not None:
+            escritor.cerrar()
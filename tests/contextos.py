@@ -0,0 +1,25 @@
+"""Contextos de apuesta de ejemplo compartidos por los tests de estrategias."""
+
+from src.game.estrategia import ContextoApuesta
+
+
+def crear_contexto(**cambios):
+    """Crea un contexto de apuesta con valores por defecto."""
+    valores = dict(
+        nombre="Bot",
+        apuesta_anterior=None,
+        apuesta_actual=None,
+        primer_apuesta=True,
+        caras_propias=bytes([1, 2, 3, 4, 5]),
+        caras_ajenas_visibles=b"",
+        dados_ocultos=5,
+        dados_propios=5,
+        dados_en_juego=10,
+        dados_maximos=10,
+        ronda_especial=False,
+        modo_especial=None,
+        puede_calzar=True,
+        puede_partir_con_ases=False,
+    )
+    valores.update(cambios)
+    return ContextoApuesta(**valores)
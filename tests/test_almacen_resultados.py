@@ -0,0 +1,123 @@
+"""Tests para el almacen SQLite de resultados de torneos."""
+
+import sqlite3
+
+import pytest
+
+from src.services.almacen_resultados import (
+    ConsultaResultados,
+    EscritorResultados,
+    ResultadoPartida,
+)
+from src.services.simulador_torneo import ConfiguracionTorneo, simular_torneo
+
+
+@pytest.fixture
+def configuracion():
+    """Torneo de dos estrategias con partidas de 2 y 4 asientos."""
+    return ConfiguracionTorneo(
+        partidas=30,
+        asientos=[2, 4],
+        estrategias=["aleatoria", "conservadora"],
+        semilla=8,
+    )
+
+
+def resultado(indice, estrategias, ganador, semilla=1):
+    """Resultado de partida con valores fijos salvo los indicados."""
+    return ResultadoPartida(0, indice, semilla, estrategias, ganador, 3, 0, (1,) * len(estrategias))
+
+
+class TestAlmacenResultados:
+    """Tests para EscritorResultados y ConsultaResultados."""
+
+    def test_torneo_coincide_con_los_agregados(self, configuracion, tmp_path):
+        """Las consultas reproducen los agregados del torneo."""
+        ruta = tmp_path / "resultados.db"
+        agregados = simular_torneo(configuracion, tamano_bloque=7, base_datos=ruta)
+        consulta = ConsultaResultados(ruta)
+        assert consulta.partidas() == 30
+        assert consulta.partidas(asientos=4) == 15
+        tasas = consulta.tasas_victoria()
+        for nombre, tasa in agregados.tasas_victoria().items():
+            assert tasas[nombre] == pytest.approx(tasa)
+
+        guardada = consulta.partida(8, 5)
+        assert guardada is not None
+        assert guardada.estrategias == tuple(configuracion.estrategias_partida(5))
+        assert guardada.dados_perdidos[guardada.ganador] < 5
+        consulta.cerrar()
+
+    def test_igual_con_varios_procesos(self, configuracion, tmp_path):
+        """El contenido no depende de la cantidad de procesos."""
+        simular_torneo(configuracion, tamano_bloque=4, base_datos=tmp_path / "uno.db")
+        simular_torneo(configuracion, procesos=2, tamano_bloque=4, base_datos=tmp_path / "dos.db")
+        uno = ConsultaResultados(tmp_path / "uno.db")
+        dos = ConsultaResultados(tmp_path / "dos.db")
+        for indice in range(30):
+            assert uno.partida(8, indice) == dos.partida(8, indice)
+
+    def test_enfrentamientos(self, tmp_path):
+        """La tasa contra un rival cuenta las partidas en que ambos jugaron."""
+        ruta = tmp_path / "resultados.db"
+        with EscritorResultados(ruta) as escritor:
+            escritor.agregar(
+                [
+                    resultado(0, ("a", "b"), 0),
+                    resultado(1, ("b", "a"), 0),
+                    resultado(2, ("a", "b", "a", "b"), 2),
+                    resultado(3, ("a", "c"), 1),
+                ]
+            )
+        consulta = ConsultaResultados(ruta)
+        assert consulta.victorias_contra("a", "b") == (2, 3)
+        assert consulta.victorias_contra("a", "b", asientos=2) == (1, 2)
+        assert consulta.tasa_victoria_contra("b", "a", asientos=4) == 0.0
+        assert consulta.tasa_victoria_contra("c", "a") == 1.0
+        assert consulta.tasa_victoria_contra("a", "z") == 0.0
+
+    def test_wal_lotes_y_reemplazo(self, tmp_path):
+        """La base usa WAL, inserta al completar un lote y reemplaza partidas repetidas."""
+        ruta = tmp_path / "resultados.db"
+        escritor = EscritorResultados(ruta, tamano_lote=2)
+        consulta = ConsultaResultados(ruta)
+        assert consulta._conexion.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        escritor.agregar([resultado(0, ("a", "b"), 0)])
+        assert consulta.partidas() == 0
+        escritor.agregar([resultado(1, ("a", "b"), 1)])
+        assert consulta.partidas() == 2
+        escritor.agregar([resultado(1, ("a", "b"), 0, semilla=2**64 - 1)])
+        escritor.cerrar()
+        assert consulta.partidas() == 2
+        assert consulta.partida(0, 1) == resultado(1, ("a", "b"), 0, semilla=2**64 - 1)
+        assert consulta.partida(0, 9) is None
+
+    def test_reemplazo_con_otros_asientos(self, tmp_path):
+        """Volver a guardar una partida con menos asientos no deja filas de la anterior."""
+        ruta = tmp_path / "resultados.db"
+        with EscritorResultados(ruta) as escritor:
+            escritor.agregar([resultado(0, ("a", "b", "c"), 1), resultado(1, ("a", "c"), 0)])
+        with EscritorResultados(ruta) as escritor:
+            escritor.agregar([resultado(0, ("c", "b", "c"), 0), resultado(0, ("a", "b"), 0)])
+        consulta = ConsultaResultados(ruta)
+        assert consulta.partida(0, 0) == resultado(0, ("a", "b"), 0)
+        assert consulta.victorias_contra("a", "c") == (1, 1)
+        assert consulta.victorias_contra("b", "a") == (0, 1)
+        assert consulta.partidas(asientos=3) == 0
+        assert consulta.tasas_victoria() == {"a": 1.0, "b": 0.0, "c": 0.0}
+
+    def test_consulta_usa_el_orden_de_enfrentamientos(self, tmp_path):
+        """La tasa contra un rival se busca por la clave, sin recorrer la tabla."""
+        ruta = tmp_path / "resultados.db"
+        EscritorResultados(ruta).cerrar()
+        plan = sqlite3.connect(ruta).execute(
+            "EXPLAIN QUERY PLAN SELECT SUM(gano), COUNT(*) FROM enfrentamientos "
+            "WHERE estrategia = ? AND rival = ? AND asientos = ?",
+            ("a", "b", 4),
+        )
+        assert "PRIMARY KEY" in " ".join(fila[-1] for fila in plan)
+
+    def test_lote_invalido(self, tmp_path):
+        """El lote debe tener tamaño positivo."""
+        with pytest.raises(ValueError):
+            EscritorResultados(tmp_path / "resultados.db", tamano_lote=0)
@@ -0,0 +1,82 @@
+"""Tests para el almacen de tablas compartidas entre procesos."""
+
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+from src.services.almacen_tablas import ALINEACION, AlmacenTablas
+
+
+def sumar_tabla(argumentos):
+    """Suma una tabla adjuntada desde otro proceso."""
+    descriptor, nombre = argumentos
+    almacen = AlmacenTablas.adjuntar(descriptor)
+    return float(almacen[nombre].sum())
+
+
+@pytest.fixture
+def tablas():
+    """Tablas de distintos tipos y formas, incluida una vacia."""
+    return {
+        "probabilidades": np.linspace(0, 1, 35, dtype=np.float32).reshape(5, 7),
+        "mascaras": np.eye(9, dtype=bool)[::2],
+        "pesos": np.arange(7, dtype=np.uint8),
+        "vacia": np.zeros((0, 3), dtype=np.int16),
+    }
+
+
+class TestAlmacenTablas:
+    """Tests para AlmacenTablas."""
+
+    def test_vistas_iguales_y_de_solo_lectura(self, tablas):
+        """Cada vista tiene el contenido, tipo y forma publicados y no se puede modificar."""
+        with AlmacenTablas.publicar(tablas) as almacen:
+            assert almacen.nombres() == list(tablas)
+            for nombre, tabla in tablas.items():
+                vista = almacen[nombre]
+                assert vista.dtype == tabla.dtype
+                assert np.array_equal(vista, tabla)
+                assert not vista.flags.writeable
+            assert "pesos" in almacen and "otra" not in almacen
+
+    def test_alineacion(self, tablas):
+        """Las tablas quedan alineadas dentro del archivo."""
+        with AlmacenTablas.publicar(tablas) as almacen:
+            for entrada in almacen.descriptor.entradas:
+                assert entrada.desplazamiento % ALINEACION == 0
+
+    def test_adjuntar_no_copia(self, tablas):
+        """Las vistas de un almacen adjuntado leen directo del mapa de memoria."""
+        with AlmacenTablas.publicar(tablas) as almacen:
+            adjunto = AlmacenTablas.adjuntar(almacen.descriptor)
+            vista = adjunto["probabilidades"]
+            assert not vista.flags.owndata
+            assert isinstance(vista.base, np.memmap)
+            adjunto.cerrar()
+            assert len(adjunto) == 0
+
+    def test_temporal_se_borra_al_liberar(self, tablas):
+        """El dueño borra el archivo temporal; las vistas ya tomadas siguen validas."""
+        almacen = AlmacenTablas.publicar(tablas)
+        vista = almacen["pesos"]
+        almacen.liberar()
+        assert not os.path.exists(almacen.descriptor.ruta)
+        assert vista.tolist() == list(range(7))
+
+    def test_publicar_en_ruta_y_abrir(self, tablas, tmp_path):
+        """Con ruta el archivo persiste y se vuelve a abrir desde su indice."""
+        ruta = tmp_path / "tablas.bin"
+        AlmacenTablas.publicar(tablas, ruta).liberar()
+        assert ruta.exists()
+        abierto = AlmacenTablas.abrir(ruta)
+        assert np.array_equal(abierto["mascaras"], tablas["mascaras"])
+        assert abierto["vacia"].shape == (0, 3)
+
+    def test_trabajadores_de_otro_proceso(self, tablas):
+        """Un proceso nuevo adjunta el almacen solo con el descriptor."""
+        contexto = multiprocessing.get_context("spawn")
+        with AlmacenTablas.publicar(tablas) as almacen, contexto.Pool(1) as pool:
+            sumas = pool.map(sumar_tabla, [(almacen.descriptor, nombre) for nombre in tablas])
+        assert sumas == [float(tabla.sum()) for tabla in tablas.values()]
@@ -1 +1,58 @@
 """Tests para la clase ArbitroRonda."""
+
+import numpy as np
+import pytest
+
+from src.game.arbitro_ronda import ArbitroRonda
+from src.game.codigos_mano import codigo_mano
+from src.game.contador_pintas import ContadorPintas
+from src.game.jugada import CODIGO_CALZAR, CODIGO_DUDAR, CODIGO_PASAR
+
+
+class TestResolverLote:
+    """Tests para la resolucion de muchas partidas a la vez."""
+
+    def test_coincide_con_la_resolucion_individual(self):
+        """Cada partida del lote se resuelve igual que con contar_apuesta."""
+        azar = np.random.default_rng(7)
+        partidas = 500
+        caras = azar.integers(1, 7, size=(partidas, 15))
+        histogramas = ContadorPintas.histogramas_lote(caras)
+        cantidades = azar.integers(1, 10, size=partidas)
+        pintas = azar.integers(1, 7, size=partidas)
+        especiales = azar.random(partidas) < 0.3
+        acciones = azar.choice([CODIGO_DUDAR, CODIGO_CALZAR], size=partidas)
+
+        resultado = ArbitroRonda.resolver_lote(
+            histogramas, cantidades, pintas, especiales, acciones
+        )
+
+        for i in range(partidas):
+            conteo = ArbitroRonda.contar_apuesta(
+                list(histogramas[i]), int(pintas[i]), bool(especiales[i])
+            )
+            esperado = (
+                conteo < cantidades[i] if acciones[i] == CODIGO_DUDAR else conteo == cantidades[i]
+            )
+            assert resultado[i] == esperado
+
+    def test_dudar_de_un_pasar_usa_la_mano_anterior(self):
+        """Al dudar de un pasar pierde el anterior solo si su mano no lo respalda."""
+        manos = np.array([codigo_mano([0, 2, 0, 3, 0, 0, 0]), codigo_mano([0, 2, 2, 1, 0, 0, 0])])
+        resultado = ArbitroRonda.resolver_lote(
+            np.zeros((2, 7), dtype=np.int64),
+            np.ones(2, dtype=np.int64),
+            np.ones(2, dtype=np.int64),
+            np.zeros(2, dtype=bool),
+            np.full(2, CODIGO_DUDAR),
+            pases=np.ones(2, dtype=bool),
+            manos_anteriores=manos,
+        )
+        assert list(resultado) == [False, True]
+
+    def test_accion_invalida(self):
+        """Solo se resuelven acciones de dudar o calzar."""
+        with pytest.raises(ValueError, match="Solo se pueden resolver"):
+            ArbitroRonda.resolver_lote(
+                np.zeros((1, 7), dtype=np.int64), [1], [2], [False], [CODIGO_PASAR]
+            )
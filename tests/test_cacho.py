@@ -18,13 +18,13 @@ class TestCacho:
         for cantidad in range(6):  # Pruebo desde 0 hasta 5 dados
             cacho = Cacho()
             cacho.agitar(cantidad=cantidad)
-            contador = sum(1 for dado in cacho._dados if dado._valor is not None)
+            contador = sum(1 for cara in cacho._caras if cara != 0)
             assert cantidad == contador, f"Deben de haber{cantidad} dados con valores asignados"
 
     def test_agitar_cantidad_superior_a_5(self, cacho):
         """Verifica que no se agiten más de 5 dados."""
         cacho.agitar(cantidad=6)
-        contador = sum(1 for dado in cacho._dados if dado._valor is not None)
+        contador = sum(1 for cara in cacho._caras if cara != 0)
         assert 5 == contador, "Solo deben agitarse 5 dados como máximo"
 
     def test_agitar_cantidad_invalida(self, cacho):
@@ -53,6 +53,27 @@ class TestCacho:
         cacho.ocultar()
         assert cacho.get_resultados() is None, "Si el cacho está oculto, debe retornar None"
 
+    def test_agitar_menos_dados_limpia_los_sobrantes(self, cacho):
+        """Al agitar menos dados que antes los sobrantes quedan sin valor."""
+        cacho.agitar(cantidad=5)
+        cacho.agitar(cantidad=2)
+        assert len(cacho.get_caras()) == 2
+        assert cacho._caras[2:] == bytearray(3)
+
+    def test_get_caras_son_enteros(self, cacho):
+        """Las caras numericas corresponden a los nombres de get_resultados."""
+        from src.game.dado import NOMBRES_CARAS
+
+        cacho.agitar(cantidad=4)
+        caras = cacho.get_caras()
+        assert all(1 <= cara <= 6 for cara in caras)
+        assert [NOMBRES_CARAS[cara] for cara in caras] == cacho.get_resultados()
+
+    def test_no_admite_atributos_nuevos(self, cacho):
+        """Cacho usa __slots__ y no crea un diccionario por instancia."""
+        with pytest.raises(AttributeError):
+            cacho.otro_atributo = 1
+
     def test_mostrar(self, cacho):
         """Verifica que mostrar el cacho lo haga visible nuevamente."""
         cacho.ocultar()
@@ -0,0 +1,37 @@
+"""Tests para los casos de benchmark del motor."""
+
+import pytest
+
+from src.benchmarks.casos_motor import CASOS, medir_casos, preparar_mesa
+from src.game.contador_pintas import ContadorPintas
+from src.services.generador_aleatorio import GeneradorAleatorio
+
+
+class TestCasosMotor:
+    """Tests para los casos y medir_casos."""
+
+    def test_mide_todos_los_casos(self):
+        """Hay una medicion por caso y cantidad de asientos."""
+        mediciones = medir_casos(list(CASOS), [2, 3], muestras=1)
+        assert [(m.caso, m.asientos) for m in mediciones] == [
+            (caso, asientos) for caso in CASOS for asientos in (2, 3)
+        ]
+        assert all(m.operaciones_por_segundo > 0 for m in mediciones)
+
+    def test_casos_reproducibles(self):
+        """La misma semilla prepara la misma mesa y juega las mismas partidas."""
+        mesas = [preparar_mesa(6, GeneradorAleatorio(3)) for _ in range(2)]
+        histogramas = [ContadorPintas.histograma(mesa._jugadores) for mesa in mesas]
+        assert histogramas[0] == histogramas[1]
+
+        partidas = [CASOS["partida"].preparar(3, GeneradorAleatorio(3)) for _ in range(2)]
+        ganadores = [[partida()._nombre for _ in range(4)] for partida in partidas]
+        assert ganadores[0] == ganadores[1]
+
+    @pytest.mark.parametrize(
+        "casos, asientos", [(["otro"], [2]), (["dudar"], []), (["dudar"], [1])]
+    )
+    def test_parametros_invalidos(self, casos, asientos):
+        """Los casos deben existir y las mesas tener al menos 2 asientos."""
+        with pytest.raises(ValueError):
+            medir_casos(casos, asientos)
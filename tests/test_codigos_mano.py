@@ -0,0 +1,57 @@
+"""Tests para los codigos de mano y sus tablas de propiedades."""
+
+import numpy as np
+
+from src.game.codigos_mano import (
+    CANTIDAD_DADOS,
+    MANOS,
+    MAXIMA_REPETICION,
+    codigo_mano,
+    codigos_lote,
+    es_pase_valido,
+    histograma_de_codigo,
+    pases_validos_lote,
+)
+
+
+def pase_valido_por_conteo(histograma):
+    """Regla del pase contando pares, trios y quinas como lo hacia el arbitro."""
+    pares = trios = quinas = 0
+    todos_diferentes = True
+    for cantidad in histograma:
+        if cantidad >= 2:
+            todos_diferentes = False
+        pares += cantidad == 2
+        trios += cantidad == 3
+        quinas += cantidad == 5
+    return (trios == 1 and pares == 1) or quinas == 1 or todos_diferentes
+
+
+class TestCodigosMano:
+    """Tests para la codificacion de manos."""
+
+    def test_hay_462_manos_de_hasta_cinco_dados(self):
+        """Las manos de 0 a 5 dados son 462 y sus codigos son distintos."""
+        assert len(MANOS) == len(set(MANOS)) == 462
+        assert sum(CANTIDAD_DADOS[codigo] == 5 for codigo in MANOS) == 252
+
+    def test_codigo_ida_y_vuelta(self):
+        """El histograma se recupera desde el codigo."""
+        histograma = [0, 1, 0, 3, 0, 0, 1]
+        assert histograma_de_codigo(codigo_mano(histograma)) == histograma
+        assert MAXIMA_REPETICION[codigo_mano(histograma)] == 3
+
+    def test_tabla_coincide_con_el_conteo(self):
+        """La tabla del pase da lo mismo que contar las repeticiones de cada mano."""
+        for codigo in MANOS:
+            histograma = histograma_de_codigo(codigo)
+            assert es_pase_valido(histograma) == pase_valido_por_conteo(histograma)
+
+    def test_lote(self):
+        """Los codigos y la validez del pase se calculan para muchas manos a la vez."""
+        histogramas = np.array(
+            [[0, 2, 0, 3, 0, 0, 0], [0, 1, 1, 1, 1, 1, 0], [0, 2, 2, 1, 0, 0, 0]]
+        )
+        codigos = codigos_lote(histogramas)
+        assert list(codigos) == [codigo_mano(list(h)) for h in histogramas]
+        assert list(pases_validos_lote(codigos)) == [True, True, False]
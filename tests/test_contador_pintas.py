@@ -1,5 +1,6 @@
 """Tests para la clase ContadorPintas del juego Dudo."""
 
+import numpy as np
 import pytest
 
 from src.game.contador_pintas import ContadorPintas
@@ -14,10 +15,53 @@ class TestContadorPintas:
         """Fixture que retorna ContadorPintas."""
         return ContadorPintas()
 
-    def test_contar_pintas_error_dados_jugador(self, mocker, contador_pintas):
+    def test_contar_pintas_error_dados_jugador(self, contador_pintas):
         """Test que valida que se lanze la excepcion cuando ocurre el error."""
         jugador = Jugador("Test")
-        mocker.patch.object(jugador, "ver_cacho", return_value=None)
+        jugador._cacho.ocultar()
 
         with pytest.raises(ValueError, match="Error en dados de jugador"):
             contador_pintas.contar_pintas([jugador])
+
+    def test_histograma_cuenta_por_cara(self, mocker):
+        """El histograma tiene 7 posiciones y cuenta cada cara en su indice."""
+        mocker.patch("random.randint", side_effect=[1, 1, 3, 6, 6, 6, 2])
+        a, b = Jugador("A"), Jugador("B")
+        a.agitar_cacho()
+        b._dados_en_posecion = 2
+        b.agitar_cacho()
+
+        assert ContadorPintas.histograma([a, b]) == [0, 2, 1, 1, 0, 0, 3]
+
+    def test_contar_pintas_no_imprime(self, capsys, contador_pintas):
+        """Contar no muestra los cachos de los jugadores."""
+        jugador = Jugador("Test")
+        jugador.agitar_cacho()
+        capsys.readouterr()
+
+        conteo = contador_pintas.contar_pintas([jugador])
+
+        assert capsys.readouterr().out == ""
+        assert sum(conteo.values()) == 5
+
+    def test_histogramas_lote(self):
+        """El conteo por lotes coincide con contar cada mesa por separado."""
+        caras = np.array([[1, 2, 2, 0, 0], [6, 6, 6, 6, 6], [0, 0, 0, 0, 0]], dtype=np.uint8)
+        histogramas = ContadorPintas.histogramas_lote(caras)
+
+        assert histogramas.tolist() == [
+            [0, 1, 2, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 5],
+            [0, 0, 0, 0, 0, 0, 0],
+        ]
+
+    def test_histogramas_lote_acepta_mesas_por_jugador(self):
+        """Las mesas con forma (mesas, jugadores, 5) se cuentan completas."""
+        caras = np.ones((4, 3, 5), dtype=np.uint8)
+        assert ContadorPintas.histogramas_lote(caras)[:, 1].tolist() == [15] * 4
+
+    def test_histogramas_lote_sin_mesas(self):
+        """Un lote sin mesas retorna un arreglo vacio de histogramas."""
+        for forma in [(0, 5), (0, 3, 5)]:
+            histogramas = ContadorPintas.histogramas_lote(np.zeros(forma, dtype=np.uint8))
+            assert histogramas.shape == (0, 7)
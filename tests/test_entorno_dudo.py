@@ -0,0 +1,120 @@
+"""Tests para los entornos reset/step del juego Dudo."""
+
+import numpy as np
+import pytest
+
+from src.game.entorno_dudo import (
+    OBS_CANTIDAD,
+    OBS_DADOS_ASIENTOS,
+    OBS_DADOS_OCULTOS,
+    OBS_ES_PASAR,
+    OBS_HISTOGRAMA,
+    OBS_PINTA,
+    EntornoDudo,
+    VectorEntornoDudo,
+    largo_observacion,
+)
+from src.game.jugada import CODIGO_PASAR, CODIGO_SUBIR
+from src.game.lote_partidas import MODO_ABIERTA, MODO_CERRADA
+from src.services.generador_aleatorio import GeneradorAleatorio
+
+
+def accion_al_azar(mascara, azar):
+    """Elige una accion legal por fila de la mascara."""
+    return (azar.random(mascara.shape) * mascara).argmax(axis=-1)
+
+
+class TestVectorEntornoDudo:
+    """Tests para VectorEntornoDudo."""
+
+    def test_reset_forma_fija(self):
+        """Las observaciones y mascaras tienen forma fija por partida."""
+        entorno = VectorEntornoDudo(8, 3, GeneradorAleatorio(0))
+        observaciones, info = entorno.reset()
+        assert observaciones.shape == (8, largo_observacion(3))
+        assert observaciones.dtype == np.float32
+        assert info["mascara"].shape == (8, entorno.total_acciones)
+        dados = slice(OBS_DADOS_ASIENTOS, OBS_DADOS_ASIENTOS + 3)
+        assert (observaciones[:, dados] == 5).all()
+
+    def test_reset_con_semilla_es_reproducible(self):
+        """La misma semilla produce la misma observacion inicial."""
+        entorno = VectorEntornoDudo(4, 2)
+        primera = entorno.reset(semilla=7)[0].copy()
+        assert (entorno.reset(semilla=7)[0] == primera).all()
+
+    def test_observa_apuesta_de_referencia(self):
+        """Tras un pasar se observa la subida anterior y el pasar vigente."""
+        entorno = VectorEntornoDudo(1, 2, GeneradorAleatorio(1))
+        entorno.reset()
+        entorno.step(np.array([CODIGO_SUBIR + 6 * 2 + 3]))
+        observaciones = entorno.step(np.array([CODIGO_PASAR]))[0]
+        assert observaciones[0, OBS_CANTIDAD] == 3
+        assert observaciones[0, OBS_PINTA] == 4
+        assert observaciones[0, OBS_ES_PASAR] == 1
+
+    def test_visibilidad_en_rondas_especiales(self):
+        """En ronda abierta se ven los cachos ajenos y en cerrada solo el obligador ve."""
+        entorno = VectorEntornoDudo(2, 2, GeneradorAleatorio(2))
+        entorno.reset()
+        lote = entorno.lote
+        asientos = lote.jugador_en_turno()
+        lote.modo_especial[:] = [MODO_ABIERTA, MODO_CERRADA]
+        lote.obligador[1] = 1 - asientos[1]
+        observaciones = entorno.step(np.full(2, CODIGO_SUBIR + 6 * 1 + 1))[0]
+
+        siguientes = lote.jugador_en_turno()
+        assert (siguientes == 1 - asientos).all()
+        ajenos = lote.histogramas[0, asientos[0], 1:]
+        assert (observaciones[0, OBS_HISTOGRAMA] == ajenos).all()
+        propios = lote.histogramas[1, siguientes[1], 1:]
+        assert (observaciones[1, OBS_HISTOGRAMA] == propios).all()
+
+        observaciones = entorno.step(np.full(2, CODIGO_SUBIR + 6 * 2 + 1))[0]
+        assert (observaciones[1, OBS_HISTOGRAMA] == 0).all()
+        assert observaciones[1, OBS_DADOS_OCULTOS] == 10
+
+    def test_partidas_terminadas_se_reinician(self):
+        """Las partidas terminadas reparten recompensas y vuelven a partir."""
+        entorno = VectorEntornoDudo(16, 3, GeneradorAleatorio(3))
+        _, info = entorno.reset()
+        azar = np.random.default_rng(3)
+        totales = np.zeros((16, 3))
+        terminadas_total = 0
+        for _ in range(400):
+            _, recompensas, terminadas, truncadas, info = entorno.step(
+                accion_al_azar(info["mascara"], azar)
+            )
+            assert not truncadas.any()
+            totales += info["recompensas_asientos"]
+            terminadas_total += terminadas.sum()
+            assert info["mascara"].any(axis=1).all()
+        assert terminadas_total > 0
+        # Cada partida terminada suma +1 del ganador y -1 por cada eliminado
+        assert totales.sum() <= -terminadas_total
+
+
+class TestEntornoDudo:
+    """Tests para EntornoDudo."""
+
+    def test_partida_completa(self):
+        """Una partida jugada al azar termina con un ganador que recibe +1."""
+        entorno = EntornoDudo(2, GeneradorAleatorio(4))
+        observacion, info = entorno.reset()
+        assert observacion.shape == (entorno.largo_observacion,)
+        azar = np.random.default_rng(4)
+        terminada = False
+        while not terminada:
+            observacion, recompensa, terminada, _, info = entorno.step(
+                int(accion_al_azar(info["mascara"], azar))
+            )
+        assert sorted(info["recompensas_asientos"]) == [-1, 1]
+        with pytest.raises(ValueError, match="reset"):
+            entorno.step(0)
+
+    def test_accion_ilegal(self):
+        """Una accion ilegal se rechaza."""
+        entorno = EntornoDudo(2, GeneradorAleatorio(5))
+        entorno.reset()
+        with pytest.raises(ValueError, match="Jugada invalida"):
+            entorno.step(0)
@@ -0,0 +1,91 @@
+"""Tests para el entrenador de MCCFR del juego Dudo."""
+
+import numpy as np
+import pytest
+
+from src.game.estrategia_cfr import TOTAL_ACCIONES_CFR, AbstraccionCFR
+from src.services.entrenador_cfr import ConfiguracionCFR, EntrenadorCFR
+
+
+@pytest.fixture
+def configuracion():
+    """Entrenamiento de rondas de 2 y 3 asientos con una abstraccion pequeña."""
+    return ConfiguracionCFR([2, 3], AbstraccionCFR(2, (3, 8)), semilla=5)
+
+
+class TestConfiguracionCFR:
+    """Tests para ConfiguracionCFR."""
+
+    @pytest.mark.parametrize(
+        "argumentos",
+        [
+            dict(asientos=[1]),
+            dict(asientos=[2], exploracion=0.0),
+            dict(asientos=[2], probabilidad_especial=2.0),
+        ],
+    )
+    def test_invalida(self, argumentos):
+        """Se validan asientos, exploracion y probabilidad de ronda especial."""
+        with pytest.raises(ValueError):
+            ConfiguracionCFR(**argumentos)
+
+    def test_ida_y_vuelta_diccionario(self, configuracion):
+        """La configuracion se recupera desde su diccionario."""
+        copia = ConfiguracionCFR.desde_diccionario(configuracion.a_diccionario())
+        assert copia.a_diccionario() == configuracion.a_diccionario()
+
+
+class TestEntrenadorCFR:
+    """Tests para EntrenadorCFR."""
+
+    def test_entrenar_acumula(self, configuracion):
+        """Entrenar cuenta las iteraciones y acumula arrepentimientos y estrategia."""
+        entrenador = EntrenadorCFR(configuracion)
+        avances = []
+        entrenador.entrenar(
+            300,
+            tamano_bloque=50,
+            bloques_paralelos=2,
+            al_sincronizar=lambda e: avances.append(e.iteraciones),
+        )
+        assert avances == [100, 200, 300]
+        assert entrenador.sumas.shape == (
+            configuracion.abstraccion.total_infosets(),
+            TOTAL_ACCIONES_CFR,
+        )
+        assert entrenador.sumas.sum() > 0
+        assert np.abs(entrenador.regrets).sum() > 0
+        pesos = entrenador.tabla().pesos
+        assert pesos.dtype == np.uint8
+
+    def test_reproducible_con_varios_procesos(self, configuracion):
+        """La semilla y los bloques determinan el resultado sin importar los procesos."""
+        secuencial = EntrenadorCFR(configuracion)
+        secuencial.entrenar(200, procesos=1, tamano_bloque=50, bloques_paralelos=2)
+        paralelo = EntrenadorCFR(configuracion)
+        paralelo.entrenar(200, procesos=2, tamano_bloque=50, bloques_paralelos=2)
+        assert np.allclose(secuencial.regrets, paralelo.regrets)
+        assert np.allclose(secuencial.sumas, paralelo.sumas)
+
+    def test_retomar_desde_checkpoint(self, configuracion, tmp_path):
+        """Entrenar, guardar y retomar equivale a entrenar de una vez."""
+        ruta = tmp_path / "cfr.npz"
+        completo = EntrenadorCFR(configuracion)
+        completo.entrenar(200, tamano_bloque=50, bloques_paralelos=2)
+
+        parcial = EntrenadorCFR(configuracion)
+        parcial.entrenar(100, tamano_bloque=50, bloques_paralelos=2, checkpoint=ruta)
+        retomado = EntrenadorCFR.cargar_checkpoint(ruta)
+        assert retomado.iteraciones == 100
+        assert retomado.configuracion.abstraccion == configuracion.abstraccion
+        retomado.entrenar(100, tamano_bloque=50, bloques_paralelos=2)
+        assert np.array_equal(retomado.regrets, completo.regrets)
+        assert np.array_equal(retomado.sumas, completo.sumas)
+
+    def test_iteraciones_invalidas(self, configuracion):
+        """No se entrena una cantidad negativa ni con bloques vacios."""
+        entrenador = EntrenadorCFR(configuracion)
+        with pytest.raises(ValueError):
+            entrenador.entrenar(-1)
+        with pytest.raises(ValueError):
+            entrenador.entrenar(10, tamano_bloque=0)
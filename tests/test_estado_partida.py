@@ -0,0 +1,93 @@
+"""Tests para la captura y restauracion del estado de una partida."""
+
+import pytest
+
+from src.game.dado import NombreDado
+from src.game.estrategias_bot import EstrategiaAleatoria
+from src.game.gestor_partida import DireccionJuego, GestorPartida, TipoRondaEspecial
+from src.game.jugada import JUGADA_DUDAR, JUGADA_PASAR, Jugada
+from src.services.generador_aleatorio import GeneradorAleatorio
+
+
+@pytest.fixture
+def gestor():
+    """Gestor de 3 bots con la ronda ya agitada."""
+    generador = GeneradorAleatorio(5)
+    gestor = GestorPartida(3, [EstrategiaAleatoria(generador) for _ in range(3)], None, generador)
+    gestor._turno_actual = 0
+    gestor._direccion_juego = DireccionJuego.Derecha
+    gestor.agitar_cachos()
+    return gestor
+
+
+class TestEstadoPartida:
+    """Tests para EstadoPartida y GestorPartida.capturar/restaurar."""
+
+    def test_restaurar_deshace_una_ronda(self, gestor):
+        """Tras resolver un dudar, restaurar vuelve exactamente al estado capturado."""
+        gestor.procesar_apuesta(Jugada.subir(3, NombreDado.TREN))
+        estado = gestor.capturar()
+        gestor.procesar_apuesta(JUGADA_DUDAR)
+        gestor.agitar_cachos()
+        assert gestor.capturar() != estado
+
+        gestor.restaurar(estado)
+        assert gestor.capturar() == estado
+        assert hash(gestor.capturar()) == hash(estado)
+        assert gestor.histograma_mesa()[1:] == [
+            sum(jugador.caras.count(cara) for jugador in estado.jugadores) for cara in range(1, 7)
+        ]
+
+    def test_restaurar_jugador_eliminado(self, gestor):
+        """Un jugador eliminado despues de la captura vuelve a la partida al restaurar."""
+        estado = gestor.capturar()
+        perdedor = gestor._jugadores[1]
+        perdedor._dados_en_posecion = 0
+        gestor.eliminar_jugador(1)
+        assert len(gestor._jugadores) == 2
+
+        gestor.restaurar(estado)
+        assert gestor._jugadores[1] is perdedor
+        assert perdedor.get_cantidad_dados() == 5
+
+    def test_ronda_especial_y_obligar(self, gestor):
+        """La visibilidad de la ronda especial y el uso de obligar se conservan."""
+        gestor._ronda_especial = True
+        gestor._modo_especial = TipoRondaEspecial.CERRADA
+        gestor._ver_propios = {"Jugador 2"}
+        gestor._obligar_usado = {"Jugador 2": True}
+        gestor._rondas_especiales = 2
+        estado = gestor.capturar()
+        gestor.resetear_atributos()
+        gestor._obligar_usado = {}
+        gestor._rondas_especiales = 0
+
+        gestor.restaurar(estado)
+        assert gestor._rondas_especiales == 2
+        assert gestor._modo_especial == TipoRondaEspecial.CERRADA
+        assert gestor._ver_propios == {"Jugador 2"}
+        assert gestor._obligar_usado.get("Jugador 2")
+        assert estado.jugadores[1].obligar_usado
+
+    def test_avanzar_comparte_jugadores(self, gestor):
+        """Avanzar un subir o pasar equivale a procesarlo en el gestor y comparte jugadores."""
+        estado = gestor.capturar()
+        subida = Jugada.subir(2, NombreDado.QUINA)
+        hijo = estado.avanzar(subida).avanzar(JUGADA_PASAR)
+        assert hijo.jugadores is estado.jugadores
+
+        gestor.procesar_apuesta(subida)
+        gestor.procesar_apuesta(JUGADA_PASAR)
+        assert gestor.capturar() == hijo
+        assert hijo.jugador_en_turno().nombre == "Jugador 3"
+        assert hijo.dados_en_juego() == 15
+
+    def test_avanzar_rechaza_dudar(self, gestor):
+        """Dudar no se puede avanzar sin el gestor."""
+        with pytest.raises(ValueError, match="Solo se puede avanzar"):
+            gestor.capturar().avanzar(JUGADA_DUDAR)
+
+    def test_sirve_como_clave(self, gestor):
+        """Estados iguales se encuentran en un diccionario."""
+        tabla = {gestor.capturar(): 1}
+        assert tabla[gestor.capturar()] == 1
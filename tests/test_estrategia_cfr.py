@@ -0,0 +1,201 @@
+"""Tests para la abstraccion, la tabla y la estrategia de CFR."""
+
+import numpy as np
+import pytest
+
+from src.game.dado import NombreDado
+from src.game.estrategia_cfr import (
+    ACCION_CALZAR,
+    ACCION_DUDAR,
+    ACCION_PASAR,
+    ACCION_SUBIR_ESPERADA,
+    ACCION_SUBIR_MEJOR,
+    ACCION_SUBIR_MISMA,
+    RONDA_ABIERTA,
+    SIN_ACCION,
+    TOTAL_ACCIONES_CFR,
+    AbstraccionCFR,
+    EstrategiaCFR,
+    SituacionCFR,
+    TablaCFR,
+    acciones_concretas,
+)
+from src.game.gestor_partida import GestorPartida, TipoRondaEspecial
+from src.game.jugada import (
+    CODIGO_DUDAR,
+    CODIGO_SUBIR,
+    JUGADA_DUDAR,
+    JUGADA_PASAR,
+    Jugada,
+    codigo_jugada,
+    jugada_de_codigo,
+)
+from src.game.mascaras_legales import mascara_contexto
+from src.services.generador_aleatorio import GeneradorAleatorio
+from tests.contextos import crear_contexto
+
+
+def tabla_con(accion):
+    """Tabla que en todo conjunto de informacion solo elige 'accion'."""
+    abstraccion = AbstraccionCFR()
+    sumas = np.zeros((abstraccion.total_infosets(), TOTAL_ACCIONES_CFR))
+    sumas[:, accion] = 1.0
+    return TablaCFR.desde_sumas(abstraccion, sumas)
+
+
+class TestAbstraccionCFR:
+    """Tests para SituacionCFR y AbstraccionCFR."""
+
+    def test_desde_contexto(self):
+        """La situacion toma la apuesta de referencia y el pase propio del contexto."""
+        contexto = crear_contexto(
+            primer_apuesta=False,
+            apuesta_anterior=Jugada.subir(3, NombreDado.TREN),
+            apuesta_actual=JUGADA_PASAR,
+            modo_especial=TipoRondaEspecial.ABIERTA,
+        )
+        situacion = SituacionCFR.desde_contexto(contexto)
+        assert situacion.referencia == (3, NombreDado.TREN.value)
+        assert situacion.es_pasar
+        assert situacion.pase_propio is True
+        assert situacion.modo_ronda == RONDA_ABIERTA
+
+    def test_indices_dentro_de_la_tabla(self):
+        """Toda situacion cae en un indice valido y las caracteristicas lo cambian."""
+        abstraccion = AbstraccionCFR()
+        generador = GeneradorAleatorio(0)
+        indices = set()
+        for _ in range(500):
+            histograma = [0] * 7
+            for cara in generador.lanzar_dados(int(generador.aleatorio() * 5) + 1):
+                histograma[cara] += 1
+            referencia = None
+            if generador.aleatorio() < 0.8:
+                referencia = (int(generador.aleatorio() * 12) + 1, generador.lanzar_dado())
+            situacion = SituacionCFR(
+                tuple(histograma),
+                int(generador.aleatorio() * 25),
+                sum(histograma),
+                30,
+                referencia,
+                referencia is not None and generador.aleatorio() < 0.3,
+                generador.aleatorio() < 0.5,
+                False,
+                0,
+                generador.aleatorio() < 0.5,
+                False,
+            )
+            indice = abstraccion.indice(situacion)
+            assert 0 <= indice < abstraccion.total_infosets()
+            indices.add(indice)
+        assert len(indices) > 100
+
+
+class TestAccionesConcretas:
+    """Tests para acciones_concretas."""
+
+    def test_apertura_solo_sube(self):
+        """Al partir no se duda, calza ni pasa, y sin permiso no se parte con ases."""
+        situacion = SituacionCFR.desde_contexto(crear_contexto())
+        acciones = acciones_concretas(situacion)
+        assert acciones[ACCION_DUDAR] == acciones[ACCION_CALZAR] == SIN_ACCION
+        assert acciones[ACCION_PASAR] == acciones[ACCION_SUBIR_MISMA] == SIN_ACCION
+        for accion in (ACCION_SUBIR_MEJOR, ACCION_SUBIR_ESPERADA):
+            assert jugada_de_codigo(acciones[accion]).pinta != NombreDado.AS.value
+
+    @pytest.mark.parametrize(
+        "cambios",
+        [
+            dict(apuesta_actual=Jugada.subir(3, NombreDado.QUINA)),
+            dict(apuesta_actual=Jugada.subir(2, NombreDado.AS), puede_calzar=False),
+            dict(apuesta_anterior=Jugada.subir(4, NombreDado.TONTO), apuesta_actual=JUGADA_PASAR),
+            dict(
+                apuesta_actual=Jugada.subir(4, NombreDado.TREN),
+                ronda_especial=True,
+                modo_especial=TipoRondaEspecial.CERRADA,
+            ),
+        ],
+    )
+    def test_acciones_legales(self, cambios):
+        """Cada accion concreta es legal segun la mascara del contexto."""
+        contexto = crear_contexto(primer_apuesta=False, **cambios)
+        mascara = mascara_contexto(contexto)
+        acciones = acciones_concretas(SituacionCFR.desde_contexto(contexto))
+        assert acciones[ACCION_DUDAR] == CODIGO_DUDAR
+        for codigo in acciones:
+            if codigo != SIN_ACCION:
+                assert mascara[codigo]
+
+    def test_misma_y_mejor(self):
+        """'misma' sube lo minimo en la pinta vigente y 'mejor' cambia de pinta."""
+        contexto = crear_contexto(
+            primer_apuesta=False,
+            caras_propias=bytes([5, 5, 5, 2, 3]),
+            apuesta_actual=Jugada.subir(3, NombreDado.CUADRA),
+        )
+        acciones = acciones_concretas(SituacionCFR.desde_contexto(contexto))
+        assert acciones[ACCION_SUBIR_MISMA] == codigo_jugada(Jugada.subir(4, NombreDado.CUADRA))
+        assert acciones[ACCION_SUBIR_MEJOR] == codigo_jugada(Jugada.subir(3, NombreDado.QUINA))
+        assert jugada_de_codigo(acciones[ACCION_SUBIR_ESPERADA]).pinta == NombreDado.QUINA.value
+
+
+class TestTablaCFR:
+    """Tests para TablaCFR."""
+
+    @pytest.mark.parametrize("tipo", [np.uint8, np.float16])
+    def test_cuantizacion(self, tipo):
+        """Las filas visitadas conservan sus proporciones y las demas quedan uniformes."""
+        abstraccion = AbstraccionCFR()
+        sumas = np.zeros((abstraccion.total_infosets(), TOTAL_ACCIONES_CFR))
+        sumas[7] = [3, 1, 0, 0, 0, 0]
+        tabla = TablaCFR.desde_sumas(abstraccion, sumas, tipo)
+        assert tabla.pesos.dtype == tipo
+        fila = tabla.pesos[7].astype(float)
+        assert fila[0] / fila.sum() == pytest.approx(0.75, abs=0.01)
+        assert len(set(tabla.pesos[0].tolist())) == 1
+
+    def test_tipo_y_forma_invalidos(self):
+        """Solo se cuantiza a uint8 o float16 y los pesos deben calzar con la abstraccion."""
+        abstraccion = AbstraccionCFR()
+        with pytest.raises(ValueError, match="cuantizacion"):
+            TablaCFR.desde_sumas(abstraccion, np.zeros((1, TOTAL_ACCIONES_CFR)), np.int32)
+        with pytest.raises(ValueError, match="abstraccion"):
+            TablaCFR(abstraccion, np.zeros((3, TOTAL_ACCIONES_CFR), dtype=np.uint8))
+
+    def test_guardar_y_cargar_con_mmap(self, tmp_path):
+        """La tabla cargada es un mapa de memoria con los mismos pesos y abstraccion."""
+        tabla = tabla_con(ACCION_DUDAR)
+        tabla.guardar(tmp_path / "cfr")
+        cargada = TablaCFR.cargar(tmp_path / "cfr")
+        assert isinstance(cargada.pesos, np.memmap)
+        assert cargada.abstraccion == tabla.abstraccion
+        assert np.array_equal(cargada.pesos, tabla.pesos)
+
+
+class TestEstrategiaCFR:
+    """Tests para EstrategiaCFR."""
+
+    def test_sigue_la_tabla(self):
+        """Con todo el peso en dudar, duda siempre que puede."""
+        estrategia = EstrategiaCFR(tabla_con(ACCION_DUDAR), GeneradorAleatorio(0))
+        contexto = crear_contexto(
+            primer_apuesta=False, apuesta_actual=Jugada.subir(2, NombreDado.SEXTO)
+        )
+        assert estrategia.decidir_apuesta(contexto) == JUGADA_DUDAR
+
+    def test_sin_peso_legal_elige_al_azar(self):
+        """Si la tabla solo pesa acciones ilegales, elige una legal al azar."""
+        estrategia = EstrategiaCFR(tabla_con(ACCION_DUDAR), GeneradorAleatorio(1))
+        jugada = estrategia.decidir_apuesta(crear_contexto())
+        assert codigo_jugada(jugada) >= CODIGO_SUBIR
+
+    def test_juega_partidas_completas(self):
+        """Las jugadas de la tabla siempre son aceptadas por GestorPartida."""
+        generador = GeneradorAleatorio(2)
+        tabla = TablaCFR(
+            AbstraccionCFR(),
+            np.full((AbstraccionCFR().total_infosets(), TOTAL_ACCIONES_CFR), 7, dtype=np.uint8),
+        )
+        estrategias = [EstrategiaCFR(tabla, generador.derivar(i)) for i in range(3)]
+        ganador = GestorPartida(3, estrategias, None, generador.derivar(9)).juego()
+        assert ganador.get_cantidad_dados() > 0
@@ -0,0 +1,144 @@
+"""Tests para la estrategia MCTS del juego Dudo."""
+
+import time
+
+import pytest
+
+from src.game.dado import NombreDado
+from src.game.estrategia_mcts import EstrategiaMCTS, NodoMCTS, TablaTransposicion
+from src.game.gestor_partida import GestorPartida, TipoRondaEspecial
+from src.game.jugada import JUGADA_CALZAR, JUGADA_DUDAR, JUGADA_PASAR, Jugada, TipoApuesta
+from src.services.generador_aleatorio import GeneradorAleatorio
+from tests.contextos import crear_contexto
+
+
+class TestTablaTransposicion:
+    """Tests para TablaTransposicion y NodoMCTS."""
+
+    def test_desaloja_el_menos_usado(self):
+        """Al superar la capacidad sale el nodo usado hace mas tiempo."""
+        tabla = TablaTransposicion(2)
+        tabla.guardar("a", NodoMCTS((0,)))
+        tabla.guardar("b", NodoMCTS((0,)))
+        tabla.obtener("a")
+        tabla.guardar("c", NodoMCTS((0,)))
+        assert len(tabla) == 2
+        assert tabla.obtener("b") is None
+        assert tabla.obtener("a") is not None
+        assert tabla.desalojados == 1
+
+    def test_capacidad_invalida(self):
+        """La capacidad debe ser positiva."""
+        with pytest.raises(ValueError, match="capacidad"):
+            TablaTransposicion(0)
+
+    def test_nodo_prueba_primero_lo_no_visitado(self):
+        """UCT elige primero las acciones sin visitas y luego la de mejor valor."""
+        nodo = NodoMCTS((0, 1, 5))
+        nodo.actualizar(0, 1.0)
+        assert nodo.elegir(1.0) == 1
+        nodo.actualizar(1, -1.0)
+        nodo.actualizar(2, -1.0)
+        nodo.actualizar(0, 1.0)
+        assert nodo.elegir(0.0) == 0
+        assert nodo.mas_visitada() == 0
+
+
+class TestEstrategiaMCTS:
+    """Tests para EstrategiaMCTS."""
+
+    def test_duda_una_apuesta_imposible(self):
+        """Una apuesta mayor que los dados que pueden existir se duda."""
+        estrategia = EstrategiaMCTS(GeneradorAleatorio(0), playouts=100)
+        contexto = crear_contexto(
+            primer_apuesta=False,
+            caras_propias=bytes([2, 2, 4, 5, 6]),
+            apuesta_actual=Jugada.subir(8, NombreDado.TREN),
+        )
+        assert estrategia.decidir_apuesta(contexto) == JUGADA_DUDAR
+
+    def test_calza_viendo_todos_los_dados(self):
+        """Si la cuenta exacta es segura, calzar es mejor que dudar."""
+        estrategia = EstrategiaMCTS(GeneradorAleatorio(1), playouts=200)
+        contexto = crear_contexto(
+            primer_apuesta=False,
+            caras_propias=bytes([3, 3, 2, 2, 5]),
+            caras_ajenas_visibles=bytes([3, 6, 6, 4, 4]),
+            dados_ocultos=0,
+            apuesta_actual=Jugada.subir(3, NombreDado.TREN),
+        )
+        assert estrategia.decidir_apuesta(contexto) == JUGADA_CALZAR
+
+    def test_ronda_abierta_usa_la_mano_visible_del_rival(self):
+        """En ronda abierta los ocultos son propios: se juzga el pase con la mano visible."""
+        contexto = crear_contexto(
+            primer_apuesta=False,
+            caras_propias=None,
+            caras_ajenas_visibles=bytes([3, 3, 3, 5, 5]),
+            dados_ocultos=5,
+            ronda_especial=True,
+            modo_especial=TipoRondaEspecial.ABIERTA,
+            apuesta_anterior=Jugada.subir(4, NombreDado.TREN),
+            apuesta_actual=JUGADA_PASAR,
+            dados_rivales=(5,),
+        )
+        estrategia = EstrategiaMCTS(GeneradorAleatorio(6), playouts=200)
+        assert estrategia.decidir_apuesta(contexto) != JUGADA_DUDAR
+
+    def test_mano_del_siguiente_segun_sus_dados(self):
+        """Con varios rivales el pase se juzga con el cacho del siguiente, no con 5 ocultos."""
+        contexto = crear_contexto(
+            primer_apuesta=False,
+            caras_propias=bytes([2, 2, 4, 5, 6]),
+            dados_ocultos=6,
+            dados_en_juego=11,
+            dados_maximos=15,
+            apuesta_anterior=Jugada.subir(2, NombreDado.TREN),
+            apuesta_actual=JUGADA_PASAR,
+            # Un solo dado siempre es un pase valido
+            dados_rivales=(1, 5),
+        )
+        estrategia = EstrategiaMCTS(GeneradorAleatorio(7), playouts=200)
+        assert estrategia.decidir_apuesta(contexto) != JUGADA_DUDAR
+
+    def test_reutiliza_la_tabla_entre_decisiones(self):
+        """La busqueda de un contexto ya visto parte con las estadisticas guardadas."""
+        estrategia = EstrategiaMCTS(GeneradorAleatorio(2), playouts=50)
+        contexto = crear_contexto()
+        estrategia.decidir_apuesta(contexto)
+        nodos = len(estrategia.tabla)
+        assert nodos > 1
+        estrategia.decidir_apuesta(contexto)
+        assert len(estrategia.tabla) >= nodos
+
+    def test_reproducible_con_semilla(self):
+        """Con presupuesto de playouts y la misma semilla se decide lo mismo."""
+        contexto = crear_contexto(
+            primer_apuesta=False, apuesta_actual=Jugada.subir(3, NombreDado.QUINA)
+        )
+        decisiones = {
+            EstrategiaMCTS(GeneradorAleatorio(3), playouts=80).decidir_apuesta(contexto)
+            for _ in range(3)
+        }
+        assert len(decisiones) == 1
+
+    def test_presupuesto_de_tiempo(self):
+        """Con solo un limite de tiempo la decision respeta el reloj."""
+        estrategia = EstrategiaMCTS(GeneradorAleatorio(4), playouts=None, tiempo=0.02)
+        inicio = time.perf_counter()
+        jugada = estrategia.decidir_apuesta(crear_contexto())
+        assert time.perf_counter() - inicio < 0.5
+        assert jugada.tipo is TipoApuesta.SUBIR
+
+    @pytest.mark.parametrize("playouts, tiempo", [(None, None), (0, None), (None, -1.0)])
+    def test_presupuesto_invalido(self, playouts, tiempo):
+        """Se necesita al menos un limite positivo."""
+        with pytest.raises(ValueError):
+            EstrategiaMCTS(playouts=playouts, tiempo=tiempo)
+
+    def test_juega_partidas_completas(self):
+        """Las jugadas de MCTS siempre son aceptadas por GestorPartida."""
+        generador = GeneradorAleatorio(5)
+        estrategias = [EstrategiaMCTS(generador.derivar(i), playouts=20) for i in range(3)]
+        ganador = GestorPartida(3, estrategias, None, generador.derivar(9)).juego()
+        assert ganador.get_cantidad_dados() > 0
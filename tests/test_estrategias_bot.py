@@ -0,0 +1,87 @@
+"""Tests para las estrategias automaticas del juego Dudo."""
+
+import pytest
+
+from src.game.dado import NombreDado
+from src.game.estrategias_bot import EstrategiaAleatoria, EstrategiaConservadora, subidas_legales
+from src.game.jugada import JUGADA_CALZAR, JUGADA_DUDAR, JUGADA_PASAR, Jugada, TipoApuesta
+from src.game.validador_apuesta import Apuesta, ValidadorApuesta
+from src.services.generador_aleatorio import GeneradorAleatorio
+from tests.contextos import crear_contexto
+
+
+class TestEstrategiaAleatoria:
+    """Tests para EstrategiaAleatoria."""
+
+    def test_primer_apuesta_no_parte_con_ases(self):
+        """Sin poder partir con ases la primera apuesta nunca es de ases."""
+        estrategia = EstrategiaAleatoria(GeneradorAleatorio(0))
+        for _ in range(200):
+            apuesta = estrategia.decidir_apuesta(crear_contexto())
+            assert apuesta.tipo is TipoApuesta.SUBIR
+            assert apuesta.pinta != NombreDado.AS.value
+
+    def test_subidas_legales_respetan_validador(self):
+        """Todas las subidas listadas son validas segun ValidadorApuesta."""
+        contexto = crear_contexto(
+            primer_apuesta=False, apuesta_actual=Jugada.subir(3, NombreDado.TREN)
+        )
+        subidas = subidas_legales(contexto)
+        assert subidas
+        for subida in subidas:
+            assert ValidadorApuesta.puede_subir(Apuesta(3, NombreDado.TREN), subida.a_apuesta())
+
+    def test_subidas_despues_de_pasar_usan_apuesta_anterior(self):
+        """Tras un pasar se compara contra la apuesta anterior."""
+        contexto = crear_contexto(
+            primer_apuesta=False,
+            apuesta_anterior=Jugada.subir(9, NombreDado.SEXTO),
+            apuesta_actual=JUGADA_PASAR,
+        )
+        subidas = subidas_legales(contexto)
+        assert all(s.cantidad == 10 or s.pinta == NombreDado.AS.value for s in subidas)
+
+    @pytest.mark.parametrize("semilla", range(20))
+    def test_sin_subidas_duda_o_calza(self, semilla):
+        """Si no quedan subidas posibles la estrategia no intenta subir."""
+        estrategia = EstrategiaAleatoria(GeneradorAleatorio(semilla))
+        contexto = crear_contexto(
+            primer_apuesta=False, apuesta_actual=Jugada.subir(10, NombreDado.AS), puede_calzar=False
+        )
+        assert estrategia.decidir_apuesta(contexto) in (
+            JUGADA_DUDAR,
+            JUGADA_PASAR,
+        )
+
+
+class TestEstrategiaConservadora:
+    """Tests para EstrategiaConservadora."""
+
+    def test_duda_de_una_apuesta_improbable(self):
+        """Una apuesta que casi no puede ser cierta se duda."""
+        estrategia = EstrategiaConservadora(GeneradorAleatorio(0))
+        contexto = crear_contexto(
+            primer_apuesta=False, apuesta_actual=Jugada.subir(9, NombreDado.SEXTO)
+        )
+        assert estrategia.decidir_apuesta(contexto) == JUGADA_DUDAR
+
+    def test_calza_si_ve_todos_los_dados(self):
+        """Sin dados ocultos y con la cantidad exacta, calza."""
+        estrategia = EstrategiaConservadora(GeneradorAleatorio(0))
+        contexto = crear_contexto(
+            primer_apuesta=False,
+            apuesta_actual=Jugada.subir(2, NombreDado.TREN),
+            caras_propias=bytes([1, 3, 4, 5, 6]),
+            dados_ocultos=0,
+        )
+        assert estrategia.decidir_apuesta(contexto) == JUGADA_CALZAR
+
+    def test_sube_lo_minimo_creible(self):
+        """Con una apuesta creible sube con la menor cantidad creible."""
+        estrategia = EstrategiaConservadora(GeneradorAleatorio(0))
+        contexto = crear_contexto(
+            primer_apuesta=False, apuesta_actual=Jugada.subir(2, NombreDado.TREN)
+        )
+        jugada = estrategia.decidir_apuesta(contexto)
+        assert jugada.es_subida()
+        assert min(s.cantidad for s in subidas_legales(contexto)) <= jugada.cantidad <= 4
@@ -0,0 +1,39 @@
+"""Tests para los eventos de la partida."""
+
+import pytest
+
+from src.game.eventos_partida import combinar_registros, desempaquetar_caras, empaquetar_caras
+
+
+class TestEmpaquetarCaras:
+    """Tests para empaquetar_caras y desempaquetar_caras."""
+
+    @pytest.mark.parametrize("caras", [b"", b"\x01", b"\x06\x06\x06\x06\x06", b"\x03\x01\x04"])
+    def test_ida_y_vuelta(self, caras):
+        """Las caras empaquetadas se recuperan y caben en un int16."""
+        valor = empaquetar_caras(caras)
+        assert 0 <= valor < 2**15
+        assert desempaquetar_caras(valor) == caras
+
+
+class TestCombinarRegistros:
+    """Tests para combinar_registros."""
+
+    def test_reenvia_a_todos_en_orden(self):
+        """Cada evento llega a todos los registros, en el orden indicado."""
+        recibidos = []
+        registro = combinar_registros(
+            lambda *evento: recibidos.append(("a", evento)),
+            None,
+            lambda *evento: recibidos.append(("b", evento)),
+        )
+        assert registro is not None
+        registro(4, 1, 7)
+        assert recibidos == [("a", (4, 1, 7)), ("b", (4, 1, 7))]
+
+    def test_sin_registros_o_uno_solo(self):
+        """Sin registros no hay registro; con uno solo se usa ese mismo."""
+        unico = print
+        assert combinar_registros() is None
+        assert combinar_registros(None, None) is None
+        assert combinar_registros(None, unico) is unico
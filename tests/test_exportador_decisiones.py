@@ -0,0 +1,128 @@
+"""Tests para la exportacion columnar de decisiones de partidas simuladas."""
+
+import numpy as np
+import pytest
+
+from src.game.jugada import CODIGO_CALZAR, CODIGO_DUDAR
+from src.services import exportador_decisiones
+from src.services.exportador_decisiones import (
+    FORMATO_NPY,
+    FORMATO_PARQUET,
+    NOMBRES_COLUMNAS,
+    EscritorColumnas,
+    leer_decisiones,
+)
+from src.services.simulador_torneo import ConfiguracionTorneo, simular_torneo
+
+
+@pytest.fixture
+def configuracion():
+    """Torneo pequeño de partidas de 2 y 4 asientos."""
+    return ConfiguracionTorneo(
+        partidas=6, asientos=[2, 4], estrategias=["aleatoria", "conservadora"], semilla=3
+    )
+
+
+def ordenar(columnas):
+    """Columnas ordenadas por partida, ronda y asiento para comparar exportaciones."""
+    orden = np.lexsort((columnas["asiento"], columnas["ronda"], columnas["partida"]))
+    return {nombre: np.asarray(columna)[orden] for nombre, columna in columnas.items()}
+
+
+class TestExportadorDecisiones:
+    """Tests para EscritorColumnas, RecolectorDecisiones y leer_decisiones."""
+
+    def test_torneo_exporta_todas_las_partidas(self, configuracion, tmp_path):
+        """Cada partida aporta filas y el cierre es coherente con el conteo real."""
+        simular_torneo(configuracion, tamano_bloque=4, exportar=tmp_path)
+        columnas = leer_decisiones(tmp_path)
+        assert set(columnas) == set(NOMBRES_COLUMNAS)
+        assert set(columnas["partida"].tolist()) == set(range(6))
+        assert len({len(columna) for columna in columnas.values()}) == 1
+
+        # En la fila de quien cierra, 'resultado' es lo que decidio ArbitroRonda
+        sin_pase = ~columnas["es_pasar"]
+        cantidad = columnas["cantidad_referencia"]
+        dudas = (columnas["accion"] == CODIGO_DUDAR) & sin_pase
+        calces = (columnas["accion"] == CODIGO_CALZAR) & sin_pase
+        assert dudas.any()
+        assert np.array_equal(
+            columnas["resultado"][dudas], columnas["conteo"][dudas] < cantidad[dudas]
+        )
+        assert np.array_equal(
+            columnas["resultado"][calces], columnas["conteo"][calces] == cantidad[calces]
+        )
+
+    def test_igual_con_varios_procesos(self, configuracion, tmp_path):
+        """La exportacion no depende de la cantidad de procesos."""
+        simular_torneo(configuracion, tamano_bloque=2, exportar=tmp_path / "uno")
+        simular_torneo(configuracion, procesos=2, tamano_bloque=2, exportar=tmp_path / "dos")
+        uno = ordenar(leer_decisiones(tmp_path / "uno"))
+        dos = ordenar(leer_decisiones(tmp_path / "dos"))
+        for nombre in NOMBRES_COLUMNAS:
+            assert np.array_equal(uno[nombre], dos[nombre])
+
+    def test_fragmentos_acotados(self, tmp_path):
+        """Se escribe un fragmento por cada 'filas_por_fragmento' filas, sin temporales."""
+        fila = tuple(range(len(NOMBRES_COLUMNAS)))
+        with EscritorColumnas(tmp_path, filas_por_fragmento=10, formato=FORMATO_NPY) as escritor:
+            for _ in range(25):
+                escritor.agregar(fila)
+            assert escritor.fragmentos == 2
+        assert sorted(ruta.name for ruta in tmp_path.iterdir()) == [
+            "decisiones-00000",
+            "decisiones-00001",
+            "decisiones-00002",
+        ]
+        columnas = leer_decisiones(tmp_path)
+        assert len(columnas["partida"]) == 25
+        assert isinstance(
+            np.load(tmp_path / "decisiones-00000" / "accion.npy", mmap_mode="r"), np.memmap
+        )
+
+    def test_reescribir_reemplaza_los_fragmentos(self, configuracion, tmp_path):
+        """Exportar de nuevo al mismo directorio reemplaza la exportacion anterior."""
+        fila = tuple(range(len(NOMBRES_COLUMNAS)))
+        with EscritorColumnas(tmp_path, filas_por_fragmento=2, formato=FORMATO_NPY) as escritor:
+            for _ in range(5):
+                escritor.agregar(fila)
+        (tmp_path / ".decisiones-00007").mkdir()
+        (tmp_path / "decisiones-00008.parquet").touch()
+        (tmp_path / "otro-00000").mkdir()
+        with EscritorColumnas(tmp_path, formato=FORMATO_NPY) as escritor:
+            escritor.agregar(fila)
+        assert sorted(ruta.name for ruta in tmp_path.iterdir()) == [
+            "decisiones-00000",
+            "otro-00000",
+        ]
+        assert len(leer_decisiones(tmp_path)["partida"]) == 1
+
+        simular_torneo(configuracion, tamano_bloque=3, exportar=tmp_path / "torneo")
+        primera = ordenar(leer_decisiones(tmp_path / "torneo"))
+        simular_torneo(configuracion, tamano_bloque=3, exportar=tmp_path / "torneo")
+        segunda = ordenar(leer_decisiones(tmp_path / "torneo"))
+        for nombre in NOMBRES_COLUMNAS:
+            assert np.array_equal(primera[nombre], segunda[nombre])
+
+    def test_directorio_vacio(self, tmp_path):
+        """Sin fragmentos se obtienen columnas vacias con su tipo."""
+        columnas = leer_decisiones(tmp_path)
+        assert columnas["conteo"].dtype == np.int16
+        assert len(columnas["conteo"]) == 0
+
+    def test_formatos_invalidos(self, tmp_path, monkeypatch):
+        """Se rechazan formatos desconocidos y Parquet sin pyarrow."""
+        with pytest.raises(ValueError, match="Formato desconocido"):
+            EscritorColumnas(tmp_path, formato="csv")
+        monkeypatch.setattr(exportador_decisiones, "pyarrow", None)
+        assert exportador_decisiones.formato_por_defecto() == FORMATO_NPY
+        with pytest.raises(ValueError, match="pyarrow"):
+            EscritorColumnas(tmp_path, formato=FORMATO_PARQUET)
+
+    def test_parquet(self, configuracion, tmp_path):
+        """Con pyarrow instalado los fragmentos son Parquet y se leen igual."""
+        pytest.importorskip("pyarrow")
+        simular_torneo(configuracion, tamano_bloque=3, exportar=tmp_path / "parquet")
+        assert all(ruta.suffix == ".parquet" for ruta in (tmp_path / "parquet").iterdir())
+        columnas = leer_decisiones(tmp_path / "parquet")
+        assert set(columnas["partida"].tolist()) == set(range(6))
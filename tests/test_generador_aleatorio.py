@@ -0,0 +1,104 @@
+"""Tests para la clase GeneradorAleatorio del juego Dudo."""
+
+import pytest
+
+from src.game.cacho import Cacho
+from src.services.generador_aleatorio import GeneradorAleatorio, derivar_semilla
+
+
+class TestGeneradorAleatorio:
+    """Tests para la fuente de azar del juego."""
+
+    def test_misma_semilla_misma_secuencia(self):
+        """Dos generadores con la misma semilla producen las mismas caras."""
+        a = GeneradorAleatorio(123)
+        b = GeneradorAleatorio(123)
+        assert [a.lanzar_dado() for _ in range(50)] == [b.lanzar_dado() for _ in range(50)]
+        assert a.lanzar_dados(20) == b.lanzar_dados(20)
+
+    def test_caras_en_rango_y_todas_presentes(self):
+        """Las caras estan entre 1 y 6 y aparecen todas."""
+        caras = GeneradorAleatorio(5).lanzar_dados(3000)
+        assert set(caras) == {1, 2, 3, 4, 5, 6}
+
+    def test_rellena_el_buffer_al_agotarse(self):
+        """Con un buffer pequeño se siguen generando caras al cruzar el borde."""
+        generador = GeneradorAleatorio(9, tamano_buffer=4)
+        caras = generador.lanzar_dados(3) + generador.lanzar_dados(3)
+        caras += bytes(generador.lanzar_dado() for _ in range(10))
+        assert len(caras) == 16
+        assert all(1 <= cara <= 6 for cara in caras)
+
+    def test_derivar_no_depende_del_uso(self):
+        """El flujo derivado depende solo de la semilla y la ruta."""
+        usado = GeneradorAleatorio(1)
+        usado.lanzar_dados(100)
+        nuevo = GeneradorAleatorio(1)
+        assert usado.derivar(4, 2).lanzar_dados(10) == nuevo.derivar(4, 2).lanzar_dados(10)
+        assert nuevo.derivar(4, 2).semilla != nuevo.derivar(2, 4).semilla
+        assert derivar_semilla(1, 4, 2) == nuevo.derivar(4, 2).semilla
+
+    def test_capturar_y_restaurar(self):
+        """Tras restaurar se repiten las mismas caras, tiradas y reales."""
+        generador = GeneradorAleatorio(3, tamano_buffer=8)
+        generador.lanzar_dados(5)
+        estado = generador.capturar()
+        siguientes = (generador.lanzar_dados(12), generador.lanzar_mesa([5, 2]).tolist())
+        siguientes += (generador.aleatorio(),)
+        generador.restaurar(estado)
+        repetidos = (generador.lanzar_dados(12), generador.lanzar_mesa([5, 2]).tolist())
+        assert siguientes == repetidos + (generador.aleatorio(),)
+        with pytest.raises(ValueError, match="semilla"):
+            GeneradorAleatorio().capturar()
+
+    def test_sin_semilla_usa_random_global(self, mocker):
+        """Sin semilla se usa random.randint, igual que el juego interactivo."""
+        mocker.patch("random.randint", side_effect=[6, 5, 4])
+        generador = GeneradorAleatorio()
+        assert generador.lanzar_dado() == 6
+        assert generador.lanzar_dados(2) == bytes([5, 4])
+
+    def test_buffer_invalido(self):
+        """El buffer debe tener tamaño positivo."""
+        with pytest.raises(ValueError, match="El tamaño del buffer debe ser positivo"):
+            GeneradorAleatorio(1, tamano_buffer=0)
+
+    def test_cacho_usa_generador_inyectado(self):
+        """Dos cachos con generadores de la misma semilla obtienen las mismas caras."""
+        a = Cacho(GeneradorAleatorio(77))
+        b = Cacho(GeneradorAleatorio(77))
+        a.agitar(5)
+        b.agitar(5)
+        assert a.get_caras() == b.get_caras()
+
+    def test_lanzar_mesa_respeta_cantidades(self):
+        """Cada fila tiene tantas caras como dados del jugador, con un maximo de 5."""
+        mesa = GeneradorAleatorio(3).lanzar_mesa([5, 2, 0, 7])
+        assert mesa.shape == (4, 5)
+        assert ((mesa >= 1) & (mesa <= 6)).sum(axis=1).tolist() == [5, 2, 0, 5]
+        assert (mesa[1, 2:] == 0).all()
+
+    def test_lanzar_mesa_reproducible(self):
+        """La misma semilla produce la misma mesa."""
+        a = GeneradorAleatorio(11).lanzar_mesa([3, 4])
+        b = GeneradorAleatorio(11).lanzar_mesa([3, 4])
+        assert (a == b).all()
+
+    def test_lanzar_mesa_sin_semilla_sigue_orden_de_jugadores(self, mocker):
+        """Sin semilla se lanza dado a dado, jugador por jugador."""
+        mocker.patch("random.randint", side_effect=[1, 2, 3])
+        mesa = GeneradorAleatorio().lanzar_mesa([2, 1])
+        assert mesa.tolist() == [[1, 2, 0, 0, 0], [3, 0, 0, 0, 0]]
+
+    def test_lanzar_mesa_cantidad_invalida(self):
+        """No se puede agitar una cantidad negativa de dados."""
+        with pytest.raises(ValueError, match="Cantidad a agitar invalida"):
+            GeneradorAleatorio(1).lanzar_mesa([2, -1])
+
+    def test_agitar_mesa_escribe_en_los_cachos(self):
+        """El lanzamiento de la mesa queda en los cachos de cada jugador."""
+        cachos = [Cacho(), Cacho()]
+        Cacho.agitar_mesa(cachos, [5, 3], GeneradorAleatorio(8))
+        esperado = GeneradorAleatorio(8).lanzar_mesa([5, 3])
+        assert cachos[0].get_caras() == esperado[0].tobytes()
+        assert cachos[1].get_caras() == esperado[1, :3].tobytes()
@@ -4,6 +4,7 @@ import pytest
 
 from src.game.dado import NombreDado
 from src.game.gestor_partida import DireccionJuego, GestorPartida, TipoApuesta, TipoRondaEspecial
+from src.game.jugada import JUGADA_CALZAR, JUGADA_DUDAR, JUGADA_PASAR, Jugada
 
 
 @pytest.fixture(scope="function")
@@ -29,14 +30,16 @@ class TestGestorPartida:
 
     def test_definir_primer_jugador(self, mocker, gestor_4_jugadores):
         """Verifica que se defina el primer jugador correctamente."""
-        mocker.patch("src.game.dado.random.randint", side_effect=[2, 2, 5, 2])
+        mocker.patch("src.services.generador_aleatorio.random.randint", side_effect=[2, 2, 5, 2])
         mocker.patch("builtins.input", side_effect=["", "", "", ""])
         gestor_4_jugadores.definir_primer_jugador()
         assert gestor_4_jugadores._turno_actual == 2
 
     def test_definir_primer_jugador_con_empate(self, mocker, gestor_4_jugadores):
         """Verifica la definición del primer jugador en caso de empate."""
-        mocker.patch("src.game.dado.random.randint", side_effect=[1, 2, 5, 5, 3, 6])
+        mocker.patch(
+            "src.services.generador_aleatorio.random.randint", side_effect=[1, 2, 5, 5, 3, 6]
+        )
         mocker.patch("builtins.input", side_effect=["", "", "", "", "", ""])
         gestor_4_jugadores.definir_primer_jugador()
         assert gestor_4_jugadores._turno_actual == 3
@@ -60,17 +63,16 @@ class TestGestorPartida:
             "builtins.input",
             side_effect=[TipoApuesta.SUBIR.value, f"3 {str(NombreDado.CUADRA).lower()}"],
         )
-        assert (
-            gestor_4_jugadores.solicitar_apuesta_a_jugador()
-            == f"{str(TipoApuesta.SUBIR)} 3 {str(NombreDado.CUADRA).lower()}"
+        assert gestor_4_jugadores.solicitar_apuesta_a_jugador() == Jugada.subir(
+            3, NombreDado.CUADRA
         )
-        gestor_4_jugadores._apuesta_actual = "subir 3 tren"
+        gestor_4_jugadores._apuesta_actual = Jugada.subir(3, NombreDado.TREN)
         mocker.patch("builtins.input", return_value=TipoApuesta.PASAR.value)
-        assert gestor_4_jugadores.solicitar_apuesta_a_jugador() == str(TipoApuesta.PASAR)
+        assert gestor_4_jugadores.solicitar_apuesta_a_jugador() == JUGADA_PASAR
         mocker.patch("builtins.input", return_value=TipoApuesta.DUDAR.value)
-        assert gestor_4_jugadores.solicitar_apuesta_a_jugador() == str(TipoApuesta.DUDAR)
+        assert gestor_4_jugadores.solicitar_apuesta_a_jugador() == JUGADA_DUDAR
         mocker.patch("builtins.input", return_value=TipoApuesta.CALZAR.value)
-        assert gestor_4_jugadores.solicitar_apuesta_a_jugador() == str(TipoApuesta.CALZAR)
+        assert gestor_4_jugadores.solicitar_apuesta_a_jugador() == JUGADA_CALZAR
 
     def test_eliminar_jugador(self, gestor_4_jugadores):
         """Verifica que se elimine un jugador cuando se queda sin dados."""
@@ -90,10 +92,7 @@ class TestGestorPartida:
         gestor_4_jugadores._direccion_juego = DireccionJuego.Derecha
         apuesta = gestor_4_jugadores.solicitar_apuesta_a_jugador()
         gestor_4_jugadores.procesar_apuesta(apuesta)
-        assert (
-            gestor_4_jugadores._apuesta_actual
-            == f"{str(TipoApuesta.SUBIR)} 3 {str(NombreDado.QUINA).lower()}"
-        )
+        assert gestor_4_jugadores._apuesta_actual == Jugada.subir(3, NombreDado.QUINA)
 
     @pytest.mark.parametrize(
         "dado1,dado2,resultado,dados_jugador", [(3, 3, True, 4), (3, 2, False, 5), (2, 2, False, 5)]
@@ -104,32 +103,30 @@ class TestGestorPartida:
         """Test para probar los casos de haber dudado exitosamente o incorrectamente."""
         gestor_4_jugadores._direccion_juego = DireccionJuego.Derecha
         gestor_4_jugadores._turno_actual = 1
-        gestor_4_jugadores._apuesta_actual = (
-            f"{str(TipoApuesta.SUBIR)} 4 {str(NombreDado.TONTO).lower()}"
-        )
+        gestor_4_jugadores._apuesta_actual = Jugada.subir(4, NombreDado.TONTO)
         mocker.patch(
-            "src.game.dado.random.randint",
+            "src.services.generador_aleatorio.random.randint",
             side_effect=[3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 2, 2, 2, dado1, dado2],
         )
         for jugador in gestor_4_jugadores._jugadores:
             jugador.agitar_cacho()
-        resultado_dudar = gestor_4_jugadores.procesar_apuesta(str(TipoApuesta.DUDAR))
+        resultado_dudar = gestor_4_jugadores.procesar_apuesta(JUGADA_DUDAR)
         assert resultado_dudar["resultado"] == resultado
-        assert resultado_dudar["accion"] == "dudar"
+        assert resultado_dudar["accion"] is TipoApuesta.DUDAR
         assert gestor_4_jugadores._jugadores[0]._dados_en_posecion == dados_jugador
 
     def test_calzar_exacto_gana_un_dado(self, mocker, gestor_4_jugadores):
         """Si el conteo coincide exactamente con la apuesta, el calzador gana 1 dado."""
         gestor = gestor_4_jugadores
         gestor._turno_actual = 0
-        gestor._apuesta_actual = f"{str(TipoApuesta.SUBIR)} 6 {str(NombreDado.TREN).lower()}"
+        gestor._apuesta_actual = Jugada.subir(6, NombreDado.TREN)
 
         side_effect = [3, 1, 6, 6, 6, 3, 3, 6, 6, 6, 1, 6, 6, 6, 6, 3, 6, 6, 6, 6]
-        mocker.patch("src.game.dado.random.randint", side_effect=side_effect)
+        mocker.patch("src.services.generador_aleatorio.random.randint", side_effect=side_effect)
         for j in gestor._jugadores:
             j.agitar_cacho()
         antes = gestor._jugadores[0].get_cantidad_dados()
-        resultado = gestor.procesar_apuesta(str(TipoApuesta.CALZAR))
+        resultado = gestor.procesar_apuesta(JUGADA_CALZAR)
         despues = gestor._jugadores[0].get_cantidad_dados()
         assert resultado["resultado"] is True
         assert despues == antes + 1
@@ -138,14 +135,14 @@ class TestGestorPartida:
         """Si el conteo no coincide exactamente, el calzador pierde 1 dado."""
         gestor = gestor_4_jugadores
         gestor._turno_actual = 1
-        gestor._apuesta_actual = f"{str(TipoApuesta.SUBIR)} 5 {str(NombreDado.TONTO).lower()}"
+        gestor._apuesta_actual = Jugada.subir(5, NombreDado.TONTO)
 
         side_effect = [1, 3, 4, 5, 6, 2, 2, 1, 6, 6, 1, 1, 4, 5, 6, 1, 1, 4, 5, 6]
-        mocker.patch("src.game.dado.random.randint", side_effect=side_effect)
+        mocker.patch("src.services.generador_aleatorio.random.randint", side_effect=side_effect)
         for j in gestor._jugadores:
             j.agitar_cacho()
         antes = gestor._jugadores[1].get_cantidad_dados()
-        resultado = gestor.procesar_apuesta(str(TipoApuesta.CALZAR))
+        resultado = gestor.procesar_apuesta(JUGADA_CALZAR)
         despues = gestor._jugadores[1].get_cantidad_dados()
         assert resultado["resultado"] is False
         assert despues == antes - 1
@@ -155,16 +152,16 @@ class TestGestorPartida:
         gestor = gestor_4_jugadores
         gestor._direccion_juego = DireccionJuego.Derecha
         gestor._turno_actual = 0
-        gestor._apuesta_actual = f"{str(TipoApuesta.SUBIR)} 6 {str(NombreDado.TREN).lower()}"
+        gestor._apuesta_actual = Jugada.subir(6, NombreDado.TREN)
 
         mocker.patch(
-            "src.game.dado.random.randint",
+            "src.services.generador_aleatorio.random.randint",
             side_effect=[3, 1, 6, 6, 6, 3, 3, 6, 6, 6, 1, 6, 6, 6, 6, 3, 6, 6, 6, 6],
         )
         mocker.patch("builtins.input", side_effect=["1", f"6 {str(NombreDado.TREN).lower()}", "4"])
 
         resultado = gestor.jugar_ronda()
-        assert resultado["accion"] == str(TipoApuesta.CALZAR)
+        assert resultado["accion"] is TipoApuesta.CALZAR
         assert resultado["termino"] is True
         assert resultado["resultado"] is True
 
@@ -173,16 +170,16 @@ class TestGestorPartida:
         gestor = gestor_4_jugadores
         gestor._direccion_juego = DireccionJuego.Derecha
         gestor._turno_actual = 1
-        gestor._apuesta_actual = f"{str(TipoApuesta.SUBIR)} 4 {str(NombreDado.TONTO).lower()}"
+        gestor._apuesta_actual = Jugada.subir(4, NombreDado.TONTO)
 
         mocker.patch(
-            "src.game.dado.random.randint",
+            "src.services.generador_aleatorio.random.randint",
             side_effect=[1, 3, 4, 5, 6, 2, 2, 1, 6, 6, 1, 1, 4, 5, 6, 1, 1, 4, 5, 6],
         )
         mocker.patch("builtins.input", side_effect=["1", f"4 {str(NombreDado.TONTO).lower()}", "3"])
 
         resultado = gestor.jugar_ronda()
-        assert resultado["accion"] == str(TipoApuesta.DUDAR)
+        assert resultado["accion"] is TipoApuesta.DUDAR
         assert resultado["termino"] is True
 
     def test_jugar_ronda_especial_termina_con_dudar_y_obligar_cerrada(
@@ -193,16 +190,16 @@ class TestGestorPartida:
         gestor._direccion_juego = DireccionJuego.Derecha
         gestor._turno_actual = 1
         gestor._jugadores[1]._dados_en_posecion = 1
-        gestor._apuesta_actual = f"{str(TipoApuesta.SUBIR)} 4 {str(NombreDado.TONTO).lower()}"
+        gestor._apuesta_actual = Jugada.subir(4, NombreDado.TONTO)
 
         mocker.patch(
-            "src.game.dado.random.randint",
+            "src.services.generador_aleatorio.random.randint",
             side_effect=[1, 2, 2, 6, 6, 1, 2, 1, 6, 6, 6, 1, 6, 6, 6, 6],
         )
         mocker.patch("builtins.input", side_effect=["5", str(NombreDado.TREN).lower(), "3"])
 
         resultado = gestor.jugar_ronda()
-        assert resultado["accion"] == str(TipoApuesta.DUDAR)
+        assert resultado["accion"] is TipoApuesta.DUDAR
         assert resultado["termino"] is True
         assert isinstance(resultado["resultado"], bool)
 
@@ -214,16 +211,16 @@ class TestGestorPartida:
         gestor._direccion_juego = DireccionJuego.Derecha
         gestor._turno_actual = 0
         gestor._jugadores[0]._dados_en_posecion = 1
-        gestor._apuesta_actual = f"{str(TipoApuesta.SUBIR)} 3 {str(NombreDado.TREN).lower()}"
+        gestor._apuesta_actual = Jugada.subir(3, NombreDado.TREN)
 
         mocker.patch(
-            "src.game.dado.random.randint",
+            "src.services.generador_aleatorio.random.randint",
             side_effect=[3, 3, 6, 6, 6, 6, 1, 6, 6, 6, 6, 3, 6, 6, 6, 6],
         )
         mocker.patch("builtins.input", side_effect=["6", str(NombreDado.TREN).lower(), "4"])
 
         resultado = gestor.jugar_ronda()
-        assert resultado["accion"] == str(TipoApuesta.CALZAR)
+        assert resultado["accion"] is TipoApuesta.CALZAR
         assert resultado["termino"] is True
         assert resultado["resultado"] in (True, False)
 
@@ -232,12 +229,9 @@ class TestGestorPartida:
         gestor = gestor_4_jugadores
         gestor._direccion_juego = DireccionJuego.Derecha
         gestor._jugadores[0]._dados_en_posecion = 1
-        gestor._apuesta_actual = f"pasar 3 {str(NombreDado.TONTO).lower()}"
+        gestor._apuesta_actual = Jugada.subir(3, NombreDado.TONTO)
         gestor._ronda_especial = True
-        assert (
-            gestor.validar_apuesta_subir(False, f"1 3 {str(NombreDado.TREN).lower()}".split(" "))
-            == "continue"
-        )
+        assert gestor.validar_apuesta_subir(False, Jugada.subir(3, NombreDado.TREN)) == "continue"
 
     def test_especial_otro_con_un_dado_puede_cambiar_pinta_si_sube(
         self, mocker, gestor_4_jugadores
@@ -265,7 +259,7 @@ class TestGestorPartida:
                 "4",
             ],
         )
-        mocker.patch("src.game.dado.random.randint", side_effect=[3] * 20)
+        mocker.patch("src.services.generador_aleatorio.random.randint", side_effect=[3] * 20)
 
         resultado = gestor.jugar_ronda()
         assert resultado["termino"] is True
@@ -322,9 +316,11 @@ class TestGestorPartida:
         gestor._direccion_juego = DireccionJuego.Derecha
         gestor._turno_actual = 0
         gestor._jugadores[0]._dados_en_posecion = 1
-        gestor._apuesta_actual = f"{str(TipoApuesta.SUBIR)} 2 {str(NombreDado.TREN).lower()}"
+        gestor._apuesta_actual = Jugada.subir(2, NombreDado.TREN)
 
-        mocker.patch("src.game.dado.random.randint", side_effect=[3, 3, 3, 3, 3] * 4)
+        mocker.patch(
+            "src.services.generador_aleatorio.random.randint", side_effect=[3, 3, 3, 3, 3] * 4
+        )
         mocker.patch("builtins.input", side_effect=["5"])
         with pytest.raises(StopIteration):
             _ = gestor.jugar_ronda()
@@ -334,7 +330,9 @@ class TestGestorPartida:
         assert gestor._ver_propios == {gestor._jugadores[0]._nombre}
         assert gestor._ver_ajenos == set()
 
-        mocker.patch("src.game.dado.random.randint", side_effect=[3, 3, 3, 3, 3] * 4)
+        mocker.patch(
+            "src.services.generador_aleatorio.random.randint", side_effect=[3, 3, 3, 3, 3] * 4
+        )
         mocker.patch("builtins.input", side_effect=["3"])
         _ = gestor.jugar_ronda()
 
@@ -361,7 +359,7 @@ class TestGestorPartida:
         gestor._turno_actual = 1
         gestor._obligar_usado["Martin"] = True
         side_effect = [2, 2, 2, 2, 2, 2]
-        mocker.patch("src.game.dado.random.randint", side_effect=side_effect)
+        mocker.patch("src.services.generador_aleatorio.random.randint", side_effect=side_effect)
         mocker.patch(
             "builtins.input",
             side_effect=[
@@ -385,7 +383,7 @@ class TestGestorPartida:
         gestor._turno_actual = 1
         gestor._obligar_usado["Ricardo"] = True
         side_effect = [4, 4, 4, 2, 2, 2]
-        mocker.patch("src.game.dado.random.randint", side_effect=side_effect)
+        mocker.patch("src.services.generador_aleatorio.random.randint", side_effect=side_effect)
         mocker.patch(
             "builtins.input",
             side_effect=[
@@ -414,19 +412,19 @@ class TestGestorPartida:
         gestor = gestor_4_jugadores
         gestor._direccion_juego = DireccionJuego.Derecha
         gestor._turno_actual = 0
-        gestor._apuesta_anterior = "subir 4 tonto"
-        gestor._apuesta_actual = "pasar"
+        gestor._apuesta_anterior = Jugada.subir(4, NombreDado.TONTO)
+        gestor._apuesta_actual = JUGADA_PASAR
         mocker.patch(
-            "src.game.dado.random.randint",
+            "src.services.generador_aleatorio.random.randint",
             side_effect=numeros * 4,
         )
         for j in gestor._jugadores:
             j.agitar_cacho()
 
-        result = gestor.procesar_apuesta("dudar")
+        result = gestor.procesar_apuesta(JUGADA_DUDAR)
 
         assert result["resultado"] is resultado
-        assert result["accion"] == "dudar"
+        assert result["accion"] is TipoApuesta.DUDAR
 
     def test_juego_completo(self, mocker, gestor_2_jugadores):
         gestor = gestor_2_jugadores
@@ -498,7 +496,7 @@ class TestGestorPartida:
             1,
             3,
         ]
-        mocker.patch("src.game.dado.random.randint", side_effect=side_effect)
+        mocker.patch("src.services.generador_aleatorio.random.randint", side_effect=side_effect)
         side_effect2 = [
             TipoApuesta.SUBIR.value,
             "3 tonto",
@@ -548,3 +546,248 @@ class TestGestorPartida:
         assert len(gestor._jugadores) == 1
         assert gestor._jugadores[0]._nombre == "Pepa"
         assert gestor._jugadores[0]._dados_en_posecion == 6
+
+
+class EstrategiaFija:
+    """Estrategia de prueba que siempre responde la misma jugada."""
+
+    def __init__(self, apuesta):
+        """Guarda la jugada a responder, escrita como en la terminal."""
+        self.apuesta = Jugada.desde_texto(apuesta)
+
+    def decidir_apuesta(self, contexto):
+        """Responde siempre la jugada fija."""
+        return self.apuesta
+
+    def decidir_ronda_especial(self, contexto):
+        """Siempre juega la ronda normal."""
+        return TipoRondaEspecial.NORMAL
+
+    def decidir_direccion(self):
+        """Siempre juega hacia la derecha."""
+        return DireccionJuego.Derecha
+
+
+class EstrategiaSecuencia(EstrategiaFija):
+    """Estrategia de prueba que responde las jugadas indicadas en orden."""
+
+    def __init__(self, *apuestas):
+        """Guarda las jugadas a responder, escritas como en la terminal."""
+        self.apuestas = iter(Jugada.desde_texto(apuesta) for apuesta in apuestas)
+
+    def decidir_apuesta(self, contexto):
+        """Responde la siguiente jugada."""
+        return next(self.apuestas)
+
+
+class TestReglasDeApuesta:
+    """Tests para las jugadas que no se permiten dentro de una ronda."""
+
+    @pytest.mark.parametrize("apertura", ["dudar", "calzar", "pasar"])
+    def test_la_ronda_se_abre_subiendo(self, apertura):
+        """Sin apuesta vigente solo se puede subir."""
+        gestor = GestorPartida(2, [EstrategiaFija(apertura), EstrategiaFija(apertura)])
+        gestor._direccion_juego = DireccionJuego.Derecha
+        gestor._turno_actual = 0
+
+        with pytest.raises(ValueError, match=f"jugador automatico: {apertura}"):
+            gestor.jugar_ronda()
+
+    def test_no_se_pasa_sobre_un_pase(self):
+        """Despues de un pase el siguiente jugador no puede volver a pasar."""
+        gestor = GestorPartida(
+            2,
+            [EstrategiaSecuencia("subir 2 tonto", "pasar"), EstrategiaSecuencia("pasar")],
+        )
+        gestor._direccion_juego = DireccionJuego.Derecha
+        gestor._turno_actual = 0
+
+        with pytest.raises(ValueError, match="jugador automatico: pasar"):
+            gestor.jugar_ronda()
+
+    def test_dudar_un_pase_es_valido(self):
+        """Sobre un pase se puede dudar, y se juzga la mano de quien paso."""
+        gestor = GestorPartida(
+            2,
+            [EstrategiaSecuencia("subir 2 tonto", "dudar"), EstrategiaSecuencia("pasar")],
+        )
+        gestor._direccion_juego = DireccionJuego.Derecha
+        gestor._turno_actual = 0
+
+        assert gestor.jugar_ronda()["accion"] is TipoApuesta.DUDAR
+
+    def test_humano_reingresa_la_jugada(self, mocker, gestor_2_jugadores):
+        """A un jugador humano que abre dudando se le pide otra jugada."""
+        gestor_2_jugadores._direccion_juego = DireccionJuego.Derecha
+        gestor_2_jugadores._turno_actual = 0
+        mocker.patch.object(
+            gestor_2_jugadores,
+            "solicitar_apuesta_a_jugador",
+            side_effect=[JUGADA_DUDAR, Jugada.subir(2, NombreDado.TONTO), JUGADA_DUDAR],
+        )
+        salida = mocker.patch.object(gestor_2_jugadores, "_salida")
+
+        resultado = gestor_2_jugadores.jugar_ronda()
+
+        assert resultado["accion"] is TipoApuesta.DUDAR
+        salida.assert_any_call("\nLa jugada ingresada no es valida, ingrese una nueva jugada.")
+
+
+class TestGestorPartidaSinTerminal:
+    """Tests para las partidas jugadas solo por estrategias."""
+
+    def test_juego_completo_sin_terminal(self, mocker, capsys):
+        """Una partida entre estrategias no usa input() ni imprime y retorna al ganador."""
+        from src.game.estrategias_bot import EstrategiaAleatoria
+        from src.services.generador_aleatorio import GeneradorAleatorio
+
+        mocker.patch("builtins.input", side_effect=AssertionError("No debe pedir input"))
+        mocker.patch("src.game.gestor_partida.limpiar_terminal", side_effect=AssertionError)
+        estrategias = [EstrategiaAleatoria(GeneradorAleatorio(semilla)) for semilla in range(3)]
+        gestor = GestorPartida(3, estrategias)
+
+        ganador = gestor.juego()
+
+        assert len(gestor._jugadores) == 1
+        assert ganador is gestor._jugadores[0]
+        assert capsys.readouterr().out == ""
+
+    def test_salida_personalizada_recibe_mensajes(self, mocker):
+        """Los mensajes de la partida se envian a la salida indicada."""
+        from src.game.estrategias_bot import EstrategiaAleatoria
+        from src.services.generador_aleatorio import GeneradorAleatorio
+
+        mensajes = []
+        estrategias = [EstrategiaAleatoria(GeneradorAleatorio(semilla)) for semilla in range(2)]
+        gestor = GestorPartida(2, estrategias, salida=mensajes.append)
+        ganador = gestor.juego()
+
+        assert f"El juego a finalizado ¡{ganador._nombre} es el ganador!\n" in mensajes
+
+    def test_cantidad_de_estrategias_invalida(self):
+        """Debe existir una estrategia por jugador."""
+        with pytest.raises(ValueError, match="Debe haber una estrategia por jugador"):
+            GestorPartida(3, [EstrategiaFija("dudar")])
+
+    def test_jugada_invalida_de_estrategia_lanza_error(self):
+        """Una estrategia que entrega una subida invalida no queda en un bucle infinito."""
+        gestor = GestorPartida(2, [EstrategiaFija("calzar"), EstrategiaFija("calzar")])
+        gestor._direccion_juego = DireccionJuego.Derecha
+        gestor._turno_actual = 0
+        gestor._jugadores[1]._dados_en_posecion = 2
+        gestor._jugadores[0]._dados_en_posecion = 2
+
+        with pytest.raises(ValueError, match="Jugada invalida de un jugador automatico"):
+            gestor.jugar_ronda()
+
+    def test_contexto_ronda_abierta(self):
+        """En ronda abierta el jugador no ve su cacho pero si los ajenos."""
+        gestor = GestorPartida(2, [EstrategiaFija("dudar"), EstrategiaFija("dudar")])
+        for jugador in gestor._jugadores:
+            jugador.agitar_cacho()
+        gestor._modo_especial = TipoRondaEspecial.ABIERTA
+        gestor._ver_ajenos = {j._nombre for j in gestor._jugadores}
+
+        contexto = gestor.crear_contexto(gestor._jugadores[0], primer_apuesta=True)
+
+        assert contexto.caras_propias is None
+        assert contexto.caras_ajenas_visibles == gestor._jugadores[1]._cacho.get_caras()
+        assert contexto.dados_ocultos == 5
+
+    def test_contexto_informa_rivales_en_orden_de_turno(self):
+        """Los dados y las caras visibles de los rivales van desde el siguiente en turno."""
+        gestor = GestorPartida(4, [EstrategiaFija("dudar") for _ in range(4)])
+        gestor._direccion_juego = DireccionJuego.Izquierda
+        for dados, jugador in zip([2, 5, 3, 1], gestor._jugadores):
+            jugador._dados_en_posecion = dados
+            jugador.agitar_cacho()
+        gestor._modo_especial = TipoRondaEspecial.ABIERTA
+        gestor._ver_ajenos = {j._nombre for j in gestor._jugadores}
+
+        contexto = gestor.crear_contexto(gestor._jugadores[1], primer_apuesta=False)
+
+        assert contexto.dados_rivales == (2, 1, 3)
+        assert contexto.caras_ajenas_visibles == b"".join(
+            gestor._jugadores[indice]._cacho.get_caras() for indice in (0, 3, 2)
+        )
+
+    def test_eliminar_ultimo_jugador_ajusta_turno(self, gestor_4_jugadores):
+        """Si se elimina al jugador del ultimo indice el turno vuelve al inicio."""
+        gestor_4_jugadores._turno_actual = 3
+        gestor_4_jugadores._jugadores[3]._dados_en_posecion = 0
+        gestor_4_jugadores.eliminar_jugador(3)
+        assert gestor_4_jugadores._turno_actual == 0
+
+    def test_eliminar_jugador_anterior_ajusta_turno(self, gestor_4_jugadores):
+        """Eliminar a un jugador antes del turno actual mantiene al mismo jugador en turno."""
+        gestor_4_jugadores._turno_actual = 2
+        en_turno = gestor_4_jugadores._jugadores[2]
+        gestor_4_jugadores._jugadores[0]._dados_en_posecion = 0
+        gestor_4_jugadores.eliminar_jugador(0)
+        assert gestor_4_jugadores._jugadores[gestor_4_jugadores._turno_actual] is en_turno
+
+    def test_dudar_sin_apuesta_vigente_es_invalido(self):
+        """Una estrategia no puede dudar si todavia no hay una apuesta en la ronda."""
+        gestor = GestorPartida(2, [EstrategiaFija("dudar"), EstrategiaFija("dudar")])
+        gestor._direccion_juego = DireccionJuego.Derecha
+        gestor._turno_actual = 0
+
+        with pytest.raises(ValueError, match="Jugada invalida de un jugador automatico: dudar"):
+            gestor.jugar_ronda()
+
+    def test_partida_reproducible_con_semilla(self):
+        """Con el mismo generador sembrado la partida se juega igual."""
+        from src.game.estrategias_bot import EstrategiaAleatoria
+        from src.services.generador_aleatorio import GeneradorAleatorio
+
+        def jugar():
+            generador = GeneradorAleatorio(2024)
+            estrategias = [EstrategiaAleatoria(generador.derivar(i)) for i in range(3)]
+            mensajes = []
+            GestorPartida(3, estrategias, salida=mensajes.append, generador=generador).juego()
+            return mensajes
+
+        assert jugar() == jugar()
+
+    def test_agitar_cachos_cuenta_histogramas(self, gestor_2_jugadores):
+        """Al agitar se cuenta una vez la mesa y la suma coincide con cada jugador."""
+        from src.game.contador_pintas import ContadorPintas
+
+        gestor_2_jugadores.agitar_cachos()
+
+        assert gestor_2_jugadores._histograma_mesa == ContadorPintas.histograma(
+            gestor_2_jugadores._jugadores
+        )
+        for indice, jugador in enumerate(gestor_2_jugadores._jugadores):
+            assert gestor_2_jugadores.histograma_jugador(indice) == ContadorPintas.histograma(
+                [jugador]
+            )
+
+    def test_histograma_no_se_recuenta_en_la_ronda(self, mocker, gestor_2_jugadores):
+        """Resolver la apuesta usa el histograma cacheado sin volver a contar."""
+        gestor_2_jugadores.agitar_cachos()
+        gestor_2_jugadores._apuesta_actual = Jugada.subir(1, NombreDado.TONTO)
+        gestor_2_jugadores._turno_actual = 1
+        gestor_2_jugadores._direccion_juego = DireccionJuego.Derecha
+        contar = mocker.patch("src.game.contador_pintas.ContadorPintas.histograma")
+
+        gestor_2_jugadores.procesar_apuesta(JUGADA_DUDAR)
+
+        contar.assert_not_called()
+
+    def test_resetear_invalida_histogramas(self, gestor_2_jugadores):
+        """Al terminar la ronda el histograma cacheado se descarta."""
+        gestor_2_jugadores.agitar_cachos()
+        gestor_2_jugadores.resetear_atributos()
+
+        assert gestor_2_jugadores._histograma_mesa is None
+        assert gestor_2_jugadores._histogramas_jugadores is None
+
+    def test_contexto_incluye_histograma_visible(self):
+        """El contexto cuenta solo los dados que el jugador puede ver."""
+        gestor = GestorPartida(2, [EstrategiaFija("dudar"), EstrategiaFija("dudar")])
+        gestor.agitar_cachos()
+
+        contexto = gestor.crear_contexto(gestor._jugadores[0], primer_apuesta=True)
+
+        assert contexto.histograma_visible == gestor.histograma_jugador(0)
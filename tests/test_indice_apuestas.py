@@ -0,0 +1,93 @@
+"""Tests para el indice de apuestas y las tablas de subidas legales."""
+
+import pytest
+
+from src.game.indice_apuestas import (
+    MODO_ESPECIAL,
+    MODO_ESPECIAL_UN_DADO,
+    MODO_NORMAL,
+    MODOS,
+    TablaApuestas,
+    apuesta_de_rango,
+    es_subida_legal,
+    modo_subida,
+    rango_apuesta,
+    tabla_apuestas,
+)
+
+
+def puede_subir_por_reglas(actual, nueva, modo):
+    """Reglas de subida escritas caso a caso, para comparar con las tablas."""
+    (cantidad, pinta), (cantidad_nueva, pinta_nueva) = actual, nueva
+    if modo == MODO_NORMAL:
+        if pinta != 1 and pinta_nueva == 1:
+            return cantidad_nueva >= cantidad // 2 + 1
+        if pinta == 1 and pinta_nueva != 1:
+            return cantidad_nueva >= cantidad * 2 + 1
+        return cantidad_nueva > cantidad or (cantidad_nueva == cantidad and pinta_nueva > pinta)
+    misma_pinta = pinta_nueva == pinta or modo == MODO_ESPECIAL_UN_DADO
+    return cantidad_nueva > cantidad and misma_pinta
+
+
+class TestIndiceApuestas:
+    """Tests para el rango de las apuestas y las subidas precalculadas."""
+
+    def test_rango_ida_y_vuelta(self):
+        """El rango es denso y recupera la apuesta original."""
+        rangos = [
+            rango_apuesta(cantidad, pinta) for cantidad in range(1, 4) for pinta in range(1, 7)
+        ]
+        assert rangos == list(range(18))
+        assert all(rango_apuesta(*apuesta_de_rango(rango)) == rango for rango in rangos)
+
+    def test_modo_subida(self):
+        """El modo depende de la ronda especial y de tener un solo dado."""
+        assert modo_subida(False, True) == MODO_NORMAL
+        assert modo_subida(True, False) == MODO_ESPECIAL
+        assert modo_subida(True, True) == MODO_ESPECIAL_UN_DADO
+
+    @pytest.mark.parametrize("modo", MODOS)
+    def test_tablas_coinciden_con_las_reglas(self, modo):
+        """Cada par de apuestas se valida igual que con las reglas caso a caso."""
+        tabla = TablaApuestas(8)
+        for rango in range(tabla.total_rangos()):
+            actual = apuesta_de_rango(rango)
+            esperadas = [
+                nuevo
+                for nuevo in range(tabla.total_rangos())
+                if puede_subir_por_reglas(actual, apuesta_de_rango(nuevo), modo)
+            ]
+            assert list(tabla.subidas_legales(rango, modo)) == esperadas
+            for nuevo in range(tabla.total_rangos()):
+                assert tabla.es_subida_legal(rango, nuevo, modo) == (nuevo in esperadas)
+
+    def test_cambio_a_ases_sobre_la_cantidad_maxima(self):
+        """Sobre una apuesta mayor a la tabla aun se puede cambiar a ases."""
+        tabla = tabla_apuestas(10)
+        subidas = tabla.subidas_legales(rango_apuesta(11, 3), MODO_NORMAL)
+        assert [apuesta_de_rango(rango) for rango in subidas] == [
+            (cantidad, 1) for cantidad in range(6, 11)
+        ]
+
+    def test_aperturas(self):
+        """Sin permiso no se parte con ases."""
+        tabla = tabla_apuestas(2)
+        assert [apuesta_de_rango(r)[1] for r in tabla.aperturas(False)] == [2, 3, 4, 5, 6] * 2
+        assert len(tabla.aperturas(True)) == 12
+
+    def test_subida_minima(self):
+        """La subida minima es la primera legal y None si no queda ninguna."""
+        tabla = tabla_apuestas(5)
+        # Sobre 2 trenes la subida mas baja es cambiar a 2 ases
+        assert tabla.subida_minima(rango_apuesta(2, 3), MODO_NORMAL) == rango_apuesta(2, 1)
+        assert tabla.subida_minima(rango_apuesta(5, 1), MODO_NORMAL) is None
+
+    def test_es_subida_legal_sin_tabla(self):
+        """La validacion puntual no depende de una cantidad maxima."""
+        assert es_subida_legal(40, 2, 21, 1, MODO_NORMAL)
+        assert not es_subida_legal(3, 5, 4, 6, MODO_ESPECIAL)
+
+    def test_cantidad_maxima_invalida(self):
+        """Una tabla necesita al menos un dado."""
+        with pytest.raises(ValueError, match="La cantidad maxima debe ser positiva"):
+            TablaApuestas(0)
@@ -0,0 +1,73 @@
+"""Tests para la clase Jugada del juego Dudo."""
+
+import pytest
+
+from src.game.dado import NombreDado
+from src.game.jugada import (
+    CODIGO_SUBIR,
+    JUGADA_CALZAR,
+    JUGADA_DUDAR,
+    JUGADA_PASAR,
+    Jugada,
+    TipoApuesta,
+    apuesta_de_referencia,
+    codigo_jugada,
+    jugada_de_codigo,
+)
+
+
+class TestJugada:
+    """Tests para la representacion tipada de las jugadas."""
+
+    def test_subir_acepta_nombre_dado(self):
+        """Una subida guarda la pinta como cara entera."""
+        jugada = Jugada.subir(3, NombreDado.TREN)
+        assert jugada == Jugada(TipoApuesta.SUBIR, 3, 3)
+        assert jugada.es_subida()
+
+    @pytest.mark.parametrize(
+        "texto, jugada",
+        [
+            ("subir 5 quina", Jugada.subir(5, NombreDado.QUINA)),
+            ("pasar", JUGADA_PASAR),
+            ("dudar", JUGADA_DUDAR),
+        ],
+    )
+    def test_texto_ida_y_vuelta(self, texto, jugada):
+        """El texto de la terminal se lee y se vuelve a escribir igual."""
+        assert Jugada.desde_texto(texto) == jugada
+        assert str(jugada) == texto
+
+    @pytest.mark.parametrize("texto", ["subir", "subir x tren", "dudar 3 tren", "gritar"])
+    def test_texto_invalido(self, texto):
+        """Un texto que no es una jugada lanza ValueError."""
+        with pytest.raises(ValueError, match="Jugada inválida"):
+            Jugada.desde_texto(texto)
+
+    def test_es_inmutable(self):
+        """Una jugada no se puede modificar una vez creada."""
+        jugada = Jugada.subir(2, NombreDado.AS)
+        with pytest.raises(AttributeError):
+            jugada.cantidad = 3
+
+    def test_a_apuesta(self):
+        """Una subida se convierte en la Apuesta del validador."""
+        apuesta = Jugada.subir(4, NombreDado.SEXTO).a_apuesta()
+        assert apuesta.cantidad == 4
+        assert apuesta.pinta == NombreDado.SEXTO
+
+    def test_referencia_tras_pasar_es_la_anterior(self):
+        """Despues de un pasar se compara contra la apuesta anterior."""
+        anterior = Jugada.subir(4, NombreDado.TONTO)
+        assert apuesta_de_referencia(anterior, JUGADA_PASAR) == anterior
+        assert apuesta_de_referencia(None, anterior) == anterior
+        assert apuesta_de_referencia(None, None) is None
+
+    def test_codigos_enteros(self):
+        """Cada jugada tiene un codigo entero y se recupera desde el."""
+        jugadas = [JUGADA_DUDAR, JUGADA_CALZAR, JUGADA_PASAR, Jugada.subir(1, NombreDado.AS)]
+        assert [codigo_jugada(jugada) for jugada in jugadas] == [0, 1, 2, CODIGO_SUBIR]
+        for codigo in range(60):
+            assert codigo_jugada(jugada_de_codigo(codigo)) == codigo
+        with pytest.raises(ValueError, match="Codigo de jugada inválido"):
+            jugada_de_codigo(-1)
@@ -2,6 +2,7 @@
 
 import pytest
 
+from src.game.cacho import Cacho
 from src.game.dado import NombreDado
 from src.game.jugador import Jugador
 
@@ -34,7 +35,8 @@ class TestJugador:
     )
     def test_ver_cacho(self, mocker, capsys, jugador, parametros_input, impresion_esperada):
         """Verifica la visualización de los resultados del cacho."""
-        mocker.patch.object(jugador._cacho, "get_resultados", return_value=parametros_input)
+        # Cacho usa __slots__, por lo que se reemplaza el metodo en la clase
+        mocker.patch.object(Cacho, "get_resultados", return_value=parametros_input)
         jugador.agitar_cacho()
         jugador.ver_cacho()
         captura = capsys.readouterr()
@@ -0,0 +1,148 @@
+"""Tests para el motor de partidas por lotes."""
+
+import numpy as np
+import pytest
+
+from src.game.gestor_partida import DireccionJuego, GestorPartida
+from src.game.jugada import (
+    CODIGO_CALZAR,
+    CODIGO_DUDAR,
+    CODIGO_PASAR,
+    CODIGO_SUBIR,
+    jugada_de_codigo,
+)
+from src.game.lote_partidas import (
+    ELECCIONES_ESPECIALES,
+    FASE_APUESTA,
+    FASE_RONDA_ESPECIAL,
+    SIN_APUESTA,
+    LotePartidas,
+)
+from src.services.generador_aleatorio import GeneradorAleatorio
+
+
+def elegir_acciones(lote, azar):
+    """Elige una accion legal por partida, prefiriendo dudar y subidas bajas."""
+    puntajes = azar.random((lote.partidas, lote.total_acciones)) * lote.mascara_legal()
+    puntajes[:, CODIGO_DUDAR] *= 2
+    altas = slice(CODIGO_SUBIR + 6 * 4, lote.primera_accion_especial)
+    puntajes[:, altas] *= 0.01
+    return puntajes.argmax(axis=1)
+
+
+class EstrategiaEspejo:
+    """Juega en un GestorPartida las mismas jugadas que se aplican a un lote de 1 partida."""
+
+    def __init__(self, asiento, lote, azar):
+        """Guarda el asiento que representa en el lote."""
+        self.asiento = asiento
+        self.lote = lote
+        self.azar = azar
+
+    def _jugar(self):
+        """Comprueba que el lote espera a este asiento y le aplica una accion legal."""
+        assert self.lote.jugador_en_turno()[0] == self.asiento
+        accion = int(elegir_acciones(self.lote, self.azar)[0])
+        self.lote.paso(np.array([accion]))
+        return accion
+
+    def decidir_apuesta(self, contexto):
+        """Aplica la accion en el lote y la entrega como Jugada al gestor."""
+        return jugada_de_codigo(self._jugar())
+
+    def decidir_ronda_especial(self, contexto):
+        """Aplica la eleccion del obligador en el lote."""
+        return ELECCIONES_ESPECIALES[self._jugar() - self.lote.primera_accion_especial]
+
+    def decidir_direccion(self):
+        """Usa la direccion sorteada por el lote."""
+        return DireccionJuego.Derecha if self.lote.direccion[0] == 1 else DireccionJuego.Izquierda
+
+
+class TestLotePartidas:
+    """Tests para LotePartidas."""
+
+    @pytest.mark.parametrize("semilla", range(6))
+    def test_juega_igual_que_gestor_partida(self, semilla):
+        """Con los mismos dados y jugadas, el lote y GestorPartida llegan al mismo final."""
+        jugadores = 3
+        lote = LotePartidas(1, jugadores, GeneradorAleatorio(semilla))
+        azar = np.random.default_rng(semilla)
+        estrategias = [EstrategiaEspejo(asiento, lote, azar) for asiento in range(jugadores)]
+        gestor = GestorPartida(jugadores, estrategias)
+        asientos = {jugador._nombre: i for i, jugador in enumerate(gestor._jugadores)}
+        todos = list(gestor._jugadores)
+
+        def agitar_como_el_lote():
+            for jugador in gestor._jugadores:
+                asiento = asientos[jugador._nombre]
+                jugador._cacho._caras[:] = bytes(lote.caras[0, asiento])
+                jugador._cacho._cantidad_agitada = min(jugador.get_cantidad_dados(), 5)
+            gestor._calcular_histogramas()
+
+        def definir_primer_jugador():
+            gestor._turno_actual = int(lote.turno[0])
+
+        gestor.agitar_cachos = agitar_como_el_lote
+        gestor.definir_primer_jugador = definir_primer_jugador
+
+        ganador = gestor.juego()
+
+        assert lote.terminadas()[0]
+        assert asientos[ganador._nombre] == lote.ganador[0]
+        assert gestor._rondas_jugadas == lote.rondas[0]
+        assert [j._dados_perdidos for j in todos] == list(lote.dados_perdidos[0])
+
+    def test_inicio_solo_permite_subir(self):
+        """Al partir la ronda solo se puede subir, y sin ases con mas de un dado."""
+        lote = LotePartidas(4, 2, GeneradorAleatorio(0))
+        mascara = lote.mascara_legal()
+        assert (lote.fase == FASE_APUESTA).all()
+        assert not mascara[:, [CODIGO_DUDAR, CODIGO_CALZAR, CODIGO_PASAR]].any()
+        sin_ases = slice(CODIGO_SUBIR + 1, lote.primera_accion_especial)
+        assert mascara[:, sin_ases].any(axis=1).all()
+        assert not mascara[:, CODIGO_SUBIR].any()
+
+    def test_jugada_invalida(self):
+        """Una accion ilegal se rechaza indicando la partida."""
+        lote = LotePartidas(2, 2, GeneradorAleatorio(0))
+        with pytest.raises(ValueError, match=r"Jugada invalida en las partidas: \[0, 1\]"):
+            lote.paso(np.array([CODIGO_DUDAR, -5]))
+
+    def test_calzar_exacto_gana_un_dado(self):
+        """Quien calza la cantidad exacta gana un dado y parte la siguiente ronda."""
+        lote = LotePartidas(1, 2, GeneradorAleatorio(3))
+        lote.turno[0] = 0
+        lote.direccion[0] = 1
+        lote.paso(np.array([CODIGO_SUBIR + 6 * 2 + 2]))
+        lote.histograma_mesa[0] = [0, 1, 0, 2, 0, 0, 0]
+        lote.paso(np.array([CODIGO_CALZAR]))
+        assert lote.gano_dado[0] == 1
+        assert list(lote.dados[0]) == [5, 6]
+        assert lote.turno[0] == 1
+        assert lote.apuesta_actual[0] == SIN_APUESTA
+
+    def test_obligar_con_un_dado(self):
+        """Quien queda con un dado elige el tipo de ronda antes de apostar."""
+        lote = LotePartidas(1, 3, GeneradorAleatorio(0))
+        lote.dados[0] = [1, 4, 5]
+        lote._iniciar_rondas(np.array([0]))
+        assert lote.fase[0] == FASE_RONDA_ESPECIAL
+        assert lote.jugador_en_turno()[0] == 0
+        lote.paso(np.array([lote.primera_accion_especial]))
+        assert lote.ronda_especial[0]
+        assert lote.obligar_usado[0, 0]
+
+    def test_reproducible_con_semilla(self):
+        """Con la misma semilla y las mismas jugadas el lote termina igual."""
+
+        def jugar():
+            lote = LotePartidas(50, 4, GeneradorAleatorio(11))
+            azar = np.random.default_rng(11)
+            while not lote.terminadas().all():
+                lote.paso(elegir_acciones(lote, azar))
+            return lote.ganador.copy(), lote.rondas.copy()
+
+        (ganadores, rondas), (ganadores_2, rondas_2) = jugar(), jugar()
+        assert (ganadores == ganadores_2).all()
+        assert (rondas == rondas_2).all()
@@ -0,0 +1,139 @@
+"""Tests para las mascaras de acciones legales precalculadas."""
+
+import numpy as np
+import pytest
+
+from src.game import mascaras_legales
+from src.game.dado import NombreDado
+from src.game.estrategias_bot import subidas_legales
+from src.game.indice_apuestas import MODO_ESPECIAL, MODO_NORMAL, MODOS, apuesta_de_rango
+from src.game.jugada import (
+    CODIGO_CALZAR,
+    CODIGO_DUDAR,
+    CODIGO_PASAR,
+    CODIGO_SUBIR,
+    JUGADA_PASAR,
+    Jugada,
+    codigo_jugada,
+)
+from src.game.mascaras_legales import (
+    TablaMascaras,
+    mascara_contexto,
+    tabla_mascaras,
+    usar_mascaras_externas,
+)
+from src.game.validador_apuesta import Apuesta, ValidadorApuesta
+from tests.contextos import crear_contexto
+
+
+class TestTablaMascaras:
+    """Tests para TablaMascaras."""
+
+    @pytest.mark.parametrize("modo", MODOS)
+    def test_subidas_coinciden_con_validador(self, modo):
+        """Cada subida marcada es exactamente una subida valida segun ValidadorApuesta."""
+        tabla = tabla_mascaras(3)
+        total_rangos = tabla.total_acciones - CODIGO_SUBIR
+        for rango in range(total_rangos):
+            actual = Apuesta(*_apuesta(rango))
+            mascara = tabla.mascara(rango, modo=modo)
+            for nuevo in range(total_rangos):
+                esperado = ValidadorApuesta.puede_subir(
+                    actual, Apuesta(*_apuesta(nuevo)), modo != MODO_NORMAL, modo == 2
+                )
+                assert mascara[CODIGO_SUBIR + nuevo] == esperado
+
+    def test_acciones_fijas(self):
+        """Dudar siempre, calzar segun el umbral y pasar solo si la vigente no es pasar."""
+        tabla = tabla_mascaras(10)
+        assert list(tabla.mascara(4, es_pasar=False, puede_calzar=True)[:CODIGO_SUBIR]) == [
+            True,
+            True,
+            True,
+        ]
+        mascara = tabla.mascara(4, es_pasar=True, modo=MODO_ESPECIAL, puede_calzar=False)
+        assert mascara[CODIGO_DUDAR]
+        assert not mascara[CODIGO_CALZAR]
+        assert not mascara[CODIGO_PASAR]
+
+    def test_aperturas(self):
+        """Al partir solo se sube, y los ases dependen de poder partir con ellos."""
+        tabla = tabla_mascaras(10)
+        sin_ases = tabla.mascara(None)
+        con_ases = tabla.mascara(None, con_ases=True)
+        assert not sin_ases[:CODIGO_SUBIR].any()
+        assert not sin_ases[CODIGO_SUBIR]
+        assert con_ases[CODIGO_SUBIR:].all()
+
+    def test_mascaras_compartidas_y_de_solo_lectura(self):
+        """La tabla se comparte por cantidad maxima y sus mascaras no se pueden modificar."""
+        assert tabla_mascaras(10) is tabla_mascaras(10)
+        mascara = tabla_mascaras(10).mascara(7, puede_calzar=True)
+        assert np.shares_memory(mascara, tabla_mascaras(10).mascaras)
+        with pytest.raises(ValueError):
+            mascara[CODIGO_DUDAR] = False
+
+    def test_mascaras_externas(self, monkeypatch):
+        """Las mascaras ya armadas se usan sin copiar y deben calzar con la cantidad."""
+        monkeypatch.setattr(mascaras_legales, "_MASCARAS_EXTERNAS", {})
+        externas = TablaMascaras(10).mascaras.copy()
+        usar_mascaras_externas({10: externas})
+        try:
+            assert tabla_mascaras(10).mascaras is externas
+        finally:
+            tabla_mascaras.cache_clear()
+        with pytest.raises(ValueError, match="cantidad maxima"):
+            TablaMascaras(15, externas)
+
+    def test_referencia_fuera_de_la_tabla(self):
+        """Sobre una apuesta mayor a los dados de la tabla solo queda cambiar a ases."""
+        tabla = tabla_mascaras(5)
+        mascara = tabla.mascara(7 * 6 + 2)
+        assert not mascara.flags.writeable
+        subidas = np.flatnonzero(mascara[CODIGO_SUBIR:])
+        assert [apuesta_de_rango(rango) for rango in subidas] == [(5, 1)]
+
+    def test_filas_lote(self):
+        """Las filas calculadas en lote coinciden con las de una situacion a la vez."""
+        tabla = tabla_mascaras(10)
+        filas = tabla.filas_lote(
+            np.array([-1, -1, 5, 12]),
+            np.array([False, False, True, False]),
+            np.array([0, 0, MODO_ESPECIAL, MODO_NORMAL]),
+            np.array([False, False, False, True]),
+            np.array([False, True, False, False]),
+        )
+        assert list(filas) == [
+            0,
+            1,
+            tabla.fila(5, True, MODO_ESPECIAL, False),
+            tabla.fila(12, False, MODO_NORMAL, True),
+        ]
+
+
+class TestMascaraContexto:
+    """Tests para mascara_contexto."""
+
+    def test_coincide_con_subidas_legales(self):
+        """Las subidas de la mascara son las que lista estrategias_bot."""
+        contexto = crear_contexto(
+            primer_apuesta=False,
+            apuesta_anterior=Jugada.subir(3, NombreDado.TREN),
+            apuesta_actual=JUGADA_PASAR,
+            puede_calzar=False,
+        )
+        mascara = mascara_contexto(contexto)
+        esperadas = [codigo_jugada(jugada) for jugada in subidas_legales(contexto)]
+        assert list(np.flatnonzero(mascara[CODIGO_SUBIR:]) + CODIGO_SUBIR) == esperadas
+        assert list(mascara[:CODIGO_SUBIR]) == [True, False, False]
+
+    def test_sin_apuesta_vigente(self):
+        """Fuera de la primera apuesta debe haber una apuesta de referencia."""
+        with pytest.raises(ValueError, match="No hay una apuesta vigente"):
+            mascara_contexto(crear_contexto(primer_apuesta=False))
+
+
+def _apuesta(rango):
+    """Cantidad y NombreDado del rango."""
+    cantidad, pinta = apuesta_de_rango(rango)
+    return cantidad, NombreDado(pinta)
@@ -0,0 +1,67 @@
+"""Tests para la medicion y comparacion de benchmarks."""
+
+import pytest
+
+from src.benchmarks.medicion import (
+    Medicion,
+    cargar_mediciones,
+    comparar,
+    guardar_mediciones,
+    medir,
+)
+
+
+def medicion(caso, operaciones, asientos=2):
+    """Medicion con 'operaciones' por segundo y percentiles fijos."""
+    return Medicion(caso, asientos, operaciones, 1.0, 2.0, 3.0, 10, 100)
+
+
+class TestMedicion:
+    """Tests para medir, comparar y la persistencia de mediciones."""
+
+    def test_medir_llama_la_operacion_y_ordena_percentiles(self):
+        """Cada muestra llama 'repeticiones' veces, mas la muestra de calentamiento."""
+        llamadas = []
+        resultado = medir("caso", 3, lambda: llamadas.append(1), repeticiones=7, muestras=4)
+        assert len(llamadas) == 7 * 5
+        assert resultado.caso == "caso" and resultado.asientos == 3
+        assert (resultado.muestras, resultado.repeticiones) == (4, 7)
+        assert 0 < resultado.p50 <= resultado.p90 <= resultado.p99
+        assert resultado.operaciones_por_segundo == pytest.approx(1e9 / max(resultado.p50, 1.0))
+
+    @pytest.mark.parametrize(
+        "repeticiones, muestras, calentamiento", [(0, 1, 0), (1, 0, 0), (1, 1, -1)]
+    )
+    def test_medir_rechaza_parametros_invalidos(self, repeticiones, muestras, calentamiento):
+        """Las repeticiones y muestras deben ser positivas."""
+        with pytest.raises(ValueError):
+            medir("caso", 2, lambda: None, repeticiones, muestras, calentamiento)
+
+    def test_comparar_detecta_regresiones_sobre_el_umbral(self):
+        """Solo se informan los casos que perdieron mas que el umbral."""
+        base = [medicion("a", 1000), medicion("b", 1000), medicion("c", 1000)]
+        actuales = [
+            medicion("a", 950),
+            medicion("b", 800),
+            medicion("c", 1500),
+            medicion("a", 10, asientos=6),
+        ]
+        regresiones = comparar(actuales, base, umbral=0.1)
+        assert len(regresiones) == 1
+        regresion = regresiones[0]
+        assert (regresion.caso, regresion.asientos) == ("b", 2)
+        assert (regresion.base, regresion.actual) == (1000, 800)
+        assert regresion.cambio == pytest.approx(-0.2)
+        assert [r.caso for r in comparar(actuales, base, umbral=0.0)] == ["a", "b"]
+
+    def test_comparar_rechaza_umbral_invalido(self):
+        """El umbral es una fraccion en [0, 1)."""
+        with pytest.raises(ValueError):
+            comparar([], [], umbral=1.0)
+
+    def test_guardar_y_cargar(self, tmp_path):
+        """Las mediciones guardadas se leen iguales."""
+        ruta = tmp_path / "base.json"
+        mediciones = [medicion("a", 1000), medicion("b", 2.5, asientos=50)]
+        guardar_mediciones(ruta, mediciones)
+        assert cargar_mediciones(ruta) == mediciones
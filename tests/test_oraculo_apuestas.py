@@ -0,0 +1,72 @@
+"""Tests para las probabilidades de las apuestas."""
+
+from itertools import product
+
+import pytest
+
+from src.game.oraculo_apuestas import (
+    cuenta_conocida,
+    es_comodin,
+    probabilidades_apuesta,
+    tabla_binomial,
+    tabla_probabilidades,
+)
+from tests.contextos import crear_contexto
+
+
+def contar_casos(ocultos, comodin, conocidos, cantidad):
+    """Probabilidad de 'al menos' y 'exacta' recorriendo todas las tiradas ocultas."""
+    favorables = {1, 3} if comodin else {3}
+    al_menos = exacta = 0
+    for tirada in product(range(1, 7), repeat=ocultos):
+        total = conocidos + sum(cara in favorables for cara in tirada)
+        al_menos += total >= cantidad
+        exacta += total == cantidad
+    casos = 6**ocultos
+    return al_menos / casos, exacta / casos
+
+
+class TestOraculoApuestas:
+    """Tests para las tablas binomiales del oraculo."""
+
+    @pytest.mark.parametrize("comodin", [False, True])
+    @pytest.mark.parametrize("conocidos", [0, 2])
+    def test_coincide_con_enumeracion(self, comodin, conocidos):
+        """Las tablas coinciden con contar todas las tiradas posibles."""
+        tabla = tabla_probabilidades(4, comodin, conocidos)
+        for cantidad in range(0, 8):
+            al_menos, exacta = contar_casos(4, comodin, conocidos, cantidad)
+            assert tabla.al_menos(cantidad) == pytest.approx(al_menos)
+            assert tabla.exacta(cantidad) == pytest.approx(exacta)
+
+    def test_colas_son_monotonas(self):
+        """La probabilidad de 'al menos' nunca crece con la cantidad."""
+        _, colas = tabla_binomial(30, True)
+        assert colas[0] == 1.0
+        assert all(a >= b for a, b in zip(colas, colas[1:]))
+
+    def test_tablas_se_reutilizan(self):
+        """Los mismos parametros entregan la misma tabla del cache."""
+        assert tabla_probabilidades(10, False, 1) is tabla_probabilidades(10, False, 1)
+
+    def test_ases_solo_son_comodin_fuera_de_ronda_especial(self):
+        """Los ases cuentan para las otras pintas solo en ronda normal."""
+        histograma = [0, 2, 0, 1, 0, 0, 0]
+        assert es_comodin(3, False)
+        assert not es_comodin(3, True)
+        assert not es_comodin(1, False)
+        assert cuenta_conocida(histograma, 3, True) == 3
+        assert cuenta_conocida(histograma, 3, False) == 1
+
+    def test_desde_contexto(self):
+        """El contexto aporta los dados vistos y los ocultos."""
+        contexto = crear_contexto(caras_propias=bytes([1, 3, 3, 5, 6]), dados_ocultos=5)
+        tabla = probabilidades_apuesta(contexto, 3)
+        assert tabla.conocidos == 3
+        assert tabla.ocultos == 5
+        assert tabla.esperada() == pytest.approx(3 + 5 / 3)
+
+    def test_ocultos_negativos(self):
+        """No puede haber una cantidad negativa de dados ocultos."""
+        with pytest.raises(ValueError, match="no puede ser negativa"):
+            tabla_binomial(-1, False)
@@ -0,0 +1,115 @@
+"""Tests para el registro binario de partidas."""
+
+import numpy as np
+import pytest
+
+from src.game.estrategias_bot import EstrategiaAleatoria
+from src.game.eventos_partida import (
+    EVENTO_AGITAR,
+    EVENTO_ELIMINADO,
+    EVENTO_FIN,
+    EVENTO_INICIO,
+    EVENTO_SUBIR,
+    EventoPartida,
+    desempaquetar_caras,
+)
+from src.game.gestor_partida import GestorPartida
+from src.services.generador_aleatorio import GeneradorAleatorio
+from src.services.registro_partidas import (
+    CABECERA,
+    REGISTRO,
+    EscritorRegistro,
+    LectorRegistro,
+    ruta_indice,
+)
+
+
+def jugar(asientos, semilla, registro):
+    """Juega una partida automatica informando sus eventos a 'registro'."""
+    generador = GeneradorAleatorio(semilla)
+    estrategias = [EstrategiaAleatoria(generador.derivar(i)) for i in range(asientos)]
+    return GestorPartida(asientos, estrategias, None, generador, registro).juego()
+
+
+class TestRegistroPartidas:
+    """Tests para EscritorRegistro y LectorRegistro."""
+
+    def test_eventos_de_una_partida(self):
+        """La partida informa inicio, cachos agitados, eliminaciones y ganador."""
+        eventos = []
+        ganador = jugar(3, 1, lambda *evento: eventos.append(EventoPartida(*evento)))
+        assert eventos[0].tipo == EVENTO_INICIO and eventos[0].valor == 3
+        assert eventos[-1].tipo == EVENTO_FIN
+        assert eventos[-1].asiento == int(ganador._nombre.split()[-1]) - 1
+        assert sum(evento.tipo == EVENTO_ELIMINADO for evento in eventos) == 2
+        agitados = [evento for evento in eventos if evento.tipo == EVENTO_AGITAR]
+        assert len(desempaquetar_caras(agitados[0].valor)) == 5
+
+    def test_ida_y_vuelta(self, tmp_path):
+        """Las partidas leidas coinciden con los eventos informados."""
+        ruta = tmp_path / "partidas.bin"
+        esperados = []
+        with EscritorRegistro(ruta, tamano_buffer=64) as escritor:
+            for semilla in range(5):
+                eventos = []
+
+                def registrar(tipo, asiento, valor, eventos=eventos):
+                    eventos.append(EventoPartida(tipo, asiento, valor))
+                    escritor(tipo, asiento, valor)
+
+                jugar(2 + semilla % 3, semilla, registrar)
+                esperados.append(eventos)
+            assert escritor.partidas == 5
+
+        lector = LectorRegistro(ruta)
+        assert len(lector) == 5
+        for partida in (3, 0, 4):
+            assert lector.eventos(partida) == esperados[partida]
+        total = sum(len(eventos) for eventos in esperados)
+        assert ruta.stat().st_size == len(CABECERA) + total * REGISTRO.itemsize
+
+    def test_subidas_con_diferencias_de_rango(self, tmp_path):
+        """Las subidas se guardan como diferencia con la anterior de la ronda."""
+        ruta = tmp_path / "partidas.bin"
+        with EscritorRegistro(ruta) as escritor:
+            escritor(EVENTO_AGITAR, 0, 9)
+            for rango in (40, 43, 21):
+                escritor(EVENTO_SUBIR, 0, rango)
+            escritor(EVENTO_FIN, 0, 1)
+        lector = LectorRegistro(ruta)
+        assert lector.registros(0)["valor"].tolist() == [9, 40, 3, -22, 1]
+        assert [evento.valor for evento in lector.eventos(0)] == [9, 40, 43, 21, 1]
+
+    def test_reabrir_descarta_partida_incompleta(self, tmp_path):
+        """Al reabrir se agregan partidas y se descarta la que quedo a medias."""
+        ruta = tmp_path / "partidas.bin"
+        with EscritorRegistro(ruta) as escritor:
+            jugar(2, 0, escritor)
+            escritor(EVENTO_INICIO, 0, 2)
+        # Simula una escritura interrumpida del registro y de su indice
+        with open(ruta, "ab") as archivo:
+            archivo.write(bytes(10))
+        with open(ruta_indice(ruta), "ab") as archivo:
+            archivo.write(bytes(3))
+
+        with EscritorRegistro(ruta) as escritor:
+            assert escritor.partidas == 1
+            jugar(3, 1, escritor)
+        lector = LectorRegistro(ruta)
+        assert len(lector) == 2
+        inicio = lector.eventos(1)[0]
+        assert (inicio.tipo, inicio.valor) == (EVENTO_INICIO, 3)
+        assert isinstance(lector.registros(1), np.memmap)
+
+    def test_errores(self, tmp_path):
+        """Se rechazan archivos ajenos y partidas inexistentes."""
+        ajeno = tmp_path / "ajeno.bin"
+        ajeno.write_bytes(b"no es un registro")
+        with pytest.raises(ValueError, match="registro"):
+            LectorRegistro(ajeno)
+        ruta = tmp_path / "vacio.bin"
+        EscritorRegistro(ruta).cerrar()
+        lector = LectorRegistro(ruta)
+        assert len(lector) == 0
+        with pytest.raises(IndexError):
+            lector.registros(0)
@@ -0,0 +1,107 @@
+"""Tests para la repeticion de partidas registradas."""
+
+import pytest
+
+from src.game.estrategias_bot import EstrategiaAleatoria
+from src.game.eventos_partida import EventoPartida
+from src.game.gestor_partida import GestorPartida
+from src.services.generador_aleatorio import GeneradorAleatorio
+from src.services.repeticion_partidas import RepeticionPartida
+
+
+class EstrategiaObservada(EstrategiaAleatoria):
+    """Estrategia aleatoria que guarda el estado de la partida antes de cada apuesta."""
+
+    def __init__(self, generador, estados):
+        """Agrega a 'estados' el estado del gestor en cada apuesta."""
+        super().__init__(generador)
+        self.estados = estados
+        self.gestor = None
+
+    def decidir_apuesta(self, contexto):
+        """Guarda el estado y decide al azar."""
+        self.estados.append(self.gestor.capturar())
+        return super().decidir_apuesta(contexto)
+
+
+def jugar_registrada(asientos, semilla):
+    """Juega una partida y retorna sus eventos, sus estados por turno y su estado final."""
+    generador = GeneradorAleatorio(semilla)
+    eventos = []
+    estados = []
+    estrategias = [EstrategiaObservada(generador.derivar(i), estados) for i in range(asientos)]
+    gestor = GestorPartida(
+        asientos,
+        list(estrategias),
+        None,
+        generador,
+        lambda *evento: eventos.append(EventoPartida(*evento)),
+    )
+    for estrategia in estrategias:
+        estrategia.gestor = gestor
+    gestor.juego()
+    return eventos, estados, gestor.capturar()
+
+
+@pytest.fixture(scope="module")
+def partida():
+    """Partida de 4 asientos registrada con su semilla."""
+    return (11, *jugar_registrada(4, 11))
+
+
+class TestRepeticionPartida:
+    """Tests para RepeticionPartida."""
+
+    def test_verificar_llega_al_estado_final(self, partida):
+        """Repetir toda la partida reproduce el estado final y guarda puntos de control."""
+        semilla, eventos, estados, final = partida
+        repeticion = RepeticionPartida(semilla, eventos, intervalo=2)
+        assert repeticion.total_turnos == len(estados)
+        assert repeticion.verificar() == final
+        puntos = repeticion.puntos_control()
+        assert len(puntos) > 1
+        assert [punto.estado.rondas_jugadas % 2 for punto in puntos] == [0] * len(puntos)
+
+    def test_estado_en_cualquier_turno(self, partida):
+        """El estado reconstruido coincide con el de la partida original."""
+        semilla, eventos, estados, final = partida
+        repeticion = RepeticionPartida(semilla, eventos, intervalo=2)
+        turnos = [0, 1, len(estados) // 2, len(estados) - 1]
+        for turno in turnos:
+            assert repeticion.estado_en(turno) == estados[turno]
+        assert repeticion.estado_en(len(estados)) == final
+
+    def test_puntos_de_control_no_cambian_el_resultado(self, partida):
+        """Buscar desde un punto de control da lo mismo que repetir desde el comienzo."""
+        semilla, eventos, estados, _ = partida
+        repeticion = RepeticionPartida(semilla, eventos, intervalo=1)
+        repeticion.verificar()
+        for turno in range(len(estados) - 1, 0, -7):
+            assert repeticion.estado_en(turno) == estados[turno]
+
+    def test_rondas_especiales_desde_un_punto_de_control(self, partida):
+        """Retomar desde un punto de control conserva las rondas especiales ya jugadas."""
+        semilla, eventos, _, final = partida
+        repeticion = RepeticionPartida(semilla, eventos, intervalo=1)
+        repeticion.verificar()
+        ultimo = repeticion.puntos_control()[-1]
+        assert ultimo.estado.rondas_especiales == final.rondas_especiales > 0
+        assert repeticion.estado_en(repeticion.total_turnos) == final
+
+    def test_semilla_equivocada(self, partida):
+        """Con otra semilla las caras no coinciden con el registro."""
+        semilla, eventos, _, _ = partida
+        with pytest.raises(ValueError, match="se aparto del registro"):
+            RepeticionPartida(semilla + 1, eventos).verificar()
+
+    def test_errores(self, partida):
+        """Se validan el registro, el intervalo y el turno buscado."""
+        semilla, eventos, estados, _ = partida
+        with pytest.raises(ValueError, match="inicio"):
+            RepeticionPartida(semilla, eventos[1:])
+        with pytest.raises(ValueError, match="intervalo"):
+            RepeticionPartida(semilla, eventos, intervalo=0)
+        with pytest.raises(ValueError, match="termina antes"):
+            RepeticionPartida(semilla, eventos[:-20]).verificar()
+        with pytest.raises(IndexError):
+            RepeticionPartida(semilla, eventos).estado_en(len(estados) + 1)
@@ -0,0 +1,95 @@
+"""Tests para el simulador de torneos de Dudo."""
+
+import pytest
+
+from src.game.eventos_partida import EVENTO_FIN
+from src.services.exportador_decisiones import leer_decisiones
+from src.services.generador_aleatorio import GeneradorAleatorio
+from src.services.registro_partidas import LectorRegistro
+from src.services.repeticion_partidas import RepeticionPartida
+from src.services.simulador_torneo import (
+    ConfiguracionTorneo,
+    ResultadosTorneo,
+    ruta_registro_bloque,
+    simular_torneo,
+)
+
+
+@pytest.fixture
+def configuracion():
+    """Fixture con un torneo pequeño de dos estrategias."""
+    return ConfiguracionTorneo(
+        partidas=12, asientos=[2, 3], estrategias=["aleatoria", "conservadora"], semilla=7
+    )
+
+
+class TestSimuladorTorneo:
+    """Tests para simular_torneo y sus agregados."""
+
+    def test_torneo_registra_todas_las_partidas(self, configuracion):
+        """Cada partida suma exactamente un ganador y sus participaciones."""
+        resultados = simular_torneo(configuracion, tamano_bloque=5)
+        assert resultados.partidas == 12
+        assert sum(resultados.victorias.values()) == 12
+        assert sum(resultados.rondas_por_partida.values()) == 12
+        # 6 partidas de 2 asientos y 6 de 3 asientos
+        assert sum(resultados.participaciones.values()) == 30
+
+    def test_torneo_reproducible_con_varios_procesos(self, configuracion):
+        """La semilla maestra determina el resultado sin importar los procesos."""
+        secuencial = simular_torneo(configuracion, procesos=1, tamano_bloque=4)
+        paralelo = simular_torneo(configuracion, procesos=2, tamano_bloque=4)
+        assert secuencial.a_diccionario() == paralelo.a_diccionario()
+
+    def test_al_combinar_recibe_agregados_incrementales(self, configuracion):
+        """Se informa el acumulado despues de combinar cada bloque."""
+        avances = []
+        simular_torneo(
+            configuracion, tamano_bloque=5, al_combinar=lambda r: avances.append(r.partidas)
+        )
+        assert avances == [5, 10, 12]
+
+    def test_combinar_resultados(self):
+        """Combinar agregados equivale a registrar todas las partidas en uno solo."""
+        a = ResultadosTorneo()
+        a.registrar_partida(["x", "y"], 0, 3, [1, 5])
+        b = ResultadosTorneo()
+        b.registrar_partida(["y", "x"], 0, 4, [2, 5])
+        a.combinar(b)
+
+        assert a.partidas == 2
+        assert a.tasas_victoria() == {"x": 0.5, "y": 0.5}
+        assert a.rondas_promedio() == 3.5
+        assert a.dados_perdidos["x"] == {1: 1, 5: 1}
+
+    def test_estrategia_desconocida(self):
+        """No se aceptan estrategias que no esten registradas."""
+        with pytest.raises(ValueError, match="Estrategia desconocida: otra"):
+            ConfiguracionTorneo(partidas=1, asientos=[2], estrategias=["otra"], semilla=0)
+
+    def test_registro_por_bloque_se_repite(self, configuracion, tmp_path):
+        """Cada bloque guarda sus partidas en un registro que se repite con la semilla."""
+        directorio = tmp_path / "registro"
+        resultados = simular_torneo(
+            configuracion,
+            procesos=2,
+            tamano_bloque=5,
+            registro=directorio,
+            exportar=tmp_path / "decisiones",
+        )
+        # Repetir el torneo reemplaza los registros en vez de agregar partidas
+        simular_torneo(configuracion, tamano_bloque=5, registro=directorio)
+
+        rondas = 0
+        for inicio in (0, 5, 10):
+            lector = LectorRegistro(ruta_registro_bloque(directorio, inicio))
+            assert len(lector) == min(5, configuracion.partidas - inicio)
+            for partida in range(len(lector)):
+                eventos = lector.eventos(partida)
+                semilla = GeneradorAleatorio(configuracion.semilla).derivar(inicio + partida)
+                assert semilla.semilla is not None
+                RepeticionPartida(semilla.semilla, eventos).verificar()
+                assert eventos[-1].tipo == EVENTO_FIN
+                rondas += eventos[-1].valor
+        assert rondas == pytest.approx(resultados.rondas_promedio() * configuracion.partidas)
+        assert len(leer_decisiones(tmp_path / "decisiones")["accion"]) > 0
@@ -0,0 +1,201 @@
+"""Tests para el solucionador de finales y sus tablas en disco."""
+
+import numpy as np
+import pytest
+
+from src.game.dado import NombreDado
+from src.game.estrategias_bot import EstrategiaConservadora
+from src.game.gestor_partida import GestorPartida, TipoRondaEspecial
+from src.game.jugada import CODIGO_DUDAR, CODIGO_PASAR, CODIGO_SUBIR, JUGADA_DUDAR, Jugada
+from src.game.solucionador_finales import (
+    FINAL_ABIERTA,
+    FINAL_CERRADA_PROPIA,
+    FINAL_CERRADA_RIVAL,
+    FINAL_NORMAL,
+    ConfiguracionFinal,
+    EstrategiaFinales,
+    TablasFinales,
+    configuraciones_finales,
+    manos_final,
+    resolver_final,
+)
+from src.services.generador_aleatorio import GeneradorAleatorio
+from tests.contextos import crear_contexto
+
+
+@pytest.fixture(scope="module")
+def tablas():
+    """Finales de un dado por jugador, con pocas iteraciones."""
+    return TablasFinales.calcular(maximo_dados=1, iteraciones=60)
+
+
+def contexto_final(**cambios):
+    """Contexto de un final de un dado contra un dado."""
+    valores = dict(
+        caras_propias=bytes([3]),
+        dados_ocultos=1,
+        dados_propios=1,
+        dados_en_juego=2,
+        puede_calzar=True,
+        jugadores_en_juego=2,
+    )
+    valores.update(cambios)
+    return crear_contexto(**valores)
+
+
+class TestConfiguracionFinal:
+    """Tests para ConfiguracionFinal y la enumeracion de finales."""
+
+    def test_finales_de_un_dado(self):
+        """Con un dado cada uno hay ronda normal, cerradas de cada obligador y abierta."""
+        finales = configuraciones_finales(1)
+        assert len(finales) == 7
+        assert {final.tipo for final in finales} == {
+            FINAL_NORMAL,
+            FINAL_CERRADA_PROPIA,
+            FINAL_CERRADA_RIVAL,
+            FINAL_ABIERTA,
+        }
+        assert ConfiguracionFinal(1, 1, FINAL_CERRADA_PROPIA, partir_con_ases=True) not in finales
+
+    @pytest.mark.parametrize(
+        "configuracion",
+        [
+            ConfiguracionFinal(2, 2, FINAL_ABIERTA),
+            ConfiguracionFinal(2, 1, FINAL_CERRADA_PROPIA),
+            ConfiguracionFinal(2, 1, FINAL_NORMAL, partir_con_ases=True),
+            ConfiguracionFinal(1, 2, FINAL_NORMAL, calzar_libre=True),
+        ],
+    )
+    def test_finales_imposibles(self, configuracion):
+        """Los finales que no pueden darse no se resuelven."""
+        assert not configuracion.es_valida()
+        with pytest.raises(ValueError, match="Final invalido"):
+            resolver_final(configuracion)
+
+    def test_desde_contexto(self):
+        """El final se arma desde lo que ve quien decide, solo con dos jugadores."""
+        contexto = contexto_final(
+            caras_propias=None,
+            ronda_especial=True,
+            modo_especial=TipoRondaEspecial.CERRADA,
+            dados_en_juego=3,
+        )
+        assert ConfiguracionFinal.desde_contexto(contexto) == ConfiguracionFinal(
+            1, 2, FINAL_CERRADA_RIVAL
+        )
+        assert ConfiguracionFinal.desde_contexto(contexto_final(jugadores_en_juego=3)) is None
+
+    def test_manos_final(self):
+        """Las manos de tres dados son los 56 multiconjuntos y sus probabilidades suman 1."""
+        histogramas, probabilidades, posiciones = manos_final(3)
+        assert histogramas.shape == (56, 7)
+        assert probabilidades.sum() == pytest.approx(1.0)
+        assert probabilidades.max() == pytest.approx(6 / 216)
+        assert sorted(posiciones.values()) == list(range(56))
+
+
+class TestResolverFinal:
+    """Tests para resolver_final."""
+
+    def test_estrategias_son_distribuciones(self):
+        """Cada fila con acciones legales suma 1 y la ronda simetrica vale cero."""
+        tabla, valor = resolver_final(ConfiguracionFinal(1, 1, FINAL_NORMAL), iteraciones=60)
+        assert tabla.shape == (13, 2, 6, CODIGO_SUBIR + 12)
+        sumas = tabla.sum(axis=-1)
+        assert np.allclose(sumas[sumas > 0], 1.0, atol=1e-5)
+        assert (sumas[0, 0] > 0).all()
+        assert valor == pytest.approx(0.0, abs=0.05)
+
+    def test_no_sube_sobre_una_apuesta_improbable(self):
+        """Con un tren propio, 2 quinas solo son ciertas si el rival tiene quina o as.
+
+        Con un dado el pase siempre es valido, asi que se duda o se pasa, pero no se sube.
+        """
+        tabla, _ = resolver_final(ConfiguracionFinal(1, 1, FINAL_NORMAL), iteraciones=60)
+        vista = manos_final(1)[2][6**2]
+        fila = tabla[(2 - 1) * 6 + (5 - 1) + 1, 0, vista]
+        assert fila[CODIGO_DUDAR] > 0.5
+        assert fila[CODIGO_DUDAR] + fila[CODIGO_PASAR] == pytest.approx(1.0, abs=0.01)
+
+    def test_ver_mas_dados_da_ventaja(self):
+        """En la abierta quien ve tres dados rivales gana mas rondas que quien ve uno."""
+        _, valor = resolver_final(ConfiguracionFinal(1, 3, FINAL_ABIERTA), iteraciones=30)
+        assert valor > 0.5
+
+
+class TestTablasFinales:
+    """Tests para TablasFinales."""
+
+    def test_guardar_y_cargar_con_mmap(self, tablas, tmp_path):
+        """Las tablas cargadas son mapas de memoria de solo lectura con los mismos datos."""
+        tablas.guardar(tmp_path)
+        cargadas = TablasFinales.cargar(tmp_path)
+        assert len(cargadas) == len(tablas) == 7
+        contexto = contexto_final()
+        distribucion = cargadas.distribucion(contexto)
+        assert isinstance(distribucion, np.memmap)
+        assert not distribucion.flags.writeable
+        assert np.array_equal(distribucion, tablas.distribucion(contexto))
+        final = ConfiguracionFinal(1, 1, FINAL_ABIERTA)
+        assert cargadas.valor(final) == tablas.valor(final)
+
+    def test_cargar_o_calcular_no_recalcula(self, tablas, tmp_path, monkeypatch):
+        """Si el directorio ya tiene tablas solo se cargan."""
+        tablas.guardar(tmp_path)
+
+        def calcular(*args):
+            raise AssertionError("No se debia recalcular")
+
+        monkeypatch.setattr(TablasFinales, "calcular", calcular)
+        assert len(TablasFinales.cargar_o_calcular(tmp_path, maximo_dados=1)) == 7
+
+    def test_sin_tabla(self, tablas):
+        """Fuera de los finales resueltos no hay distribucion."""
+        assert tablas.distribucion(contexto_final(jugadores_en_juego=None)) is None
+        grande = contexto_final(caras_propias=bytes([3, 4]), dados_propios=2, dados_en_juego=3)
+        assert tablas.distribucion(grande) is None
+        fuera = contexto_final(
+            primer_apuesta=False, apuesta_actual=Jugada.subir(3, NombreDado.QUINA)
+        )
+        assert tablas.distribucion(fuera) is None
+
+
+class TestEstrategiaFinales:
+    """Tests para EstrategiaFinales."""
+
+    def test_delega_fuera_de_los_finales(self, tablas):
+        """Sin tabla decide la estrategia de respaldo."""
+        estrategia = EstrategiaFinales(
+            tablas, EstrategiaConservadora(GeneradorAleatorio(0)), GeneradorAleatorio(0)
+        )
+        contexto = crear_contexto(
+            primer_apuesta=False, apuesta_actual=Jugada.subir(9, NombreDado.TREN)
+        )
+        assert estrategia.decidir_apuesta(contexto) == JUGADA_DUDAR
+
+    def test_elige_ronda_especial_por_valor(self, tablas):
+        """Como obligador elige el tipo de ronda de mayor valor en las tablas."""
+        estrategia = EstrategiaFinales(tablas, EstrategiaConservadora(GeneradorAleatorio(1)))
+        eleccion = estrategia.decidir_ronda_especial(contexto_final(puede_partir_con_ases=True))
+        valores = {
+            TipoRondaEspecial.NORMAL: tablas.valor(ConfiguracionFinal(1, 1, FINAL_NORMAL)),
+            TipoRondaEspecial.CERRADA: tablas.valor(ConfiguracionFinal(1, 1, FINAL_CERRADA_PROPIA)),
+            TipoRondaEspecial.ABIERTA: tablas.valor(ConfiguracionFinal(1, 1, FINAL_ABIERTA)),
+        }
+        assert valores[eleccion] == max(valores.values())
+
+    def test_juega_partidas_completas(self, tablas):
+        """Las jugadas sorteadas de las tablas siempre son aceptadas por GestorPartida."""
+        generador = GeneradorAleatorio(2)
+        for partida in range(5):
+            estrategias = [
+                EstrategiaFinales(
+                    tablas,
+                    EstrategiaConservadora(generador.derivar(partida, indice)),
+                    generador.derivar(partida, indice, 1),
+                )
+                for indice in range(2)
+            ]
+            ganador = GestorPartida(2, estrategias, None, generador.derivar(partida)).juego()
+            assert ganador.get_cantidad_dados() > 0